@@ -34,7 +34,7 @@ ART uses the following APIs:
 
 from .utils.basics import open_file as open
 from .importers.crossref import lookup_doi, lookup_dois, lookup_journal, lookup_journals, search_journals, get_journal_entries, search_journal_entries, lookup_funder, lookup_funders, search_funders, get_funder_works, search_funder_works
-from .importers.crossref import search_works as search_crossref
+from .importers.crossref import search_works as search_crossref, iter_search_works as iter_search_crossref
 # from .importers.wos import search as search_wos
 from .importers.scopus import search as search_scopus, lookup as lookup_scopus
 from .importers.orcid import lookup_orcid, search as search_orcid
@@ -1,4 +1,4 @@
-from ..utils.cleaners import deduplicate
+from ..utils.cleaners import deduplicate, deduplicate_changed
 from ..datasets.stopwords.stopwords import all_stopwords
 from ..importers.crossref import lookup_funder
 
@@ -11,6 +11,18 @@ import numpy as np
 from geopy.geocoders import Nominatim # type: ignore
 from nltk.tokenize import word_tokenize # type: ignore
 
+affiliation_cols = [
+                'affiliation_id',
+                'name',
+                'location',
+                'address',
+                'email',
+                'uri',
+                'crossref_id',
+                'website',
+                'other_links'
+                ]
+
 def generate_affiliation_id(affiliation_data: pd.Series):
 
         """
@@ -129,6 +141,10 @@ class Affiliation(Entity):
             a Results dataframe containing data on the Funder's publications.
     """
 
+    __slots__ = ()
+
+    columns = affiliation_cols
+
     def __init__(self,
                  affiliation_id: str = None, # type: ignore
                  name: str = None, # type: ignore
@@ -202,30 +218,15 @@ class Affiliation(Entity):
             other_links = [i.strip() for i in other_links]
         
 
-        self.summary = pd.DataFrame(columns = [
-                                'affiliation_id',
-                                'name',
-                                'location',
-                                'address',
-                                'email',
-                                'uri',
-                                'crossref_id',
-                                'website',
-                                'other_links'
-                                ],
-                                dtype = object)
-        
-        
-        self.summary.loc[0] = pd.Series(dtype=object)
-        self.summary.loc[0, 'affiliation_id'] = affiliation_id
-        self.summary.loc[0, 'name'] = name
-        self.summary.loc[0, 'location'] = location
-        self.summary.loc[0, 'address'] = address
-        self.summary.loc[0, 'email'] = email
-        self.summary.loc[0, 'uri'] = uri
-        self.summary.loc[0, 'crossref_id'] = crossref_id
-        self.summary.loc[0, 'website'] = website
-        self.summary.at[0, 'other_links'] = other_links
+        self.set_value('affiliation_id', affiliation_id)
+        self.set_value('name', name)
+        self.set_value('location', location)
+        self.set_value('address', address)
+        self.set_value('email', email)
+        self.set_value('uri', uri)
+        self.set_value('crossref_id', crossref_id)
+        self.set_value('website', website)
+        self.set_value('other_links', other_links)
 
         if use_api == True:
             
@@ -250,13 +251,13 @@ class Affiliation(Entity):
                 loc = None
             
             if loc != None:
-                self.summary.loc[0, 'address'] = loc.address
+                self.set_value('address', loc.address)
 
-                if self.summary.loc[0, 'name'] == None:
-                    self.summary.loc[0, 'name'] = loc.name
+                if self.get_value('name') == None:
+                    self.set_value('name', loc.name)
                 
-                if self.summary.loc[0, 'location'] == None:
-                    self.summary.loc[0, 'location'] = loc.display_name
+                if self.get_value('location') == None:
+                    self.set_value('location', loc.display_name)
 
         self.update_id()
 
@@ -271,7 +272,7 @@ class Affiliation(Entity):
             an affiliation ID.
         """
 
-        affiliation_data = self.summary.loc[0]
+        affiliation_data = self.to_series()
 
         affiliation_id = generate_affiliation_id(affiliation_data) # type: ignore
         return affiliation_id
@@ -282,11 +283,11 @@ class Affiliation(Entity):
         Replaces the Affiliation's existing unique identifier with a newly generated unique identifier based on the Affiliation's data.
         """
 
-        current_id = str(self.summary.loc[0, 'affiliation_id'])
+        current_id = str(self.get_value('affiliation_id'))
 
         if (current_id == None) or (current_id == 'None') or (current_id == '') or (current_id == 'AFFIL:000') or ('no_name_given' in current_id):
             auth_id = self.generate_id()
-            self.summary.loc[0, 'affiliation_id'] = auth_id
+            self.set_value('affiliation_id', auth_id)
         
     
     def __getitem__(self, key):
@@ -305,11 +306,14 @@ class Affiliation(Entity):
             an object associated with the inputted key.
         """
         
+        if key == 'summary':
+            return self.summary
+
         if key in self.__dict__.keys():
             return self.__dict__[key]
 
-        if key in self.summary.columns:
-            return self.summary.loc[0, key]
+        if key in self.store.columns:
+            return self.get_value(key)
 
     def __repr__(self) -> str:
         
@@ -317,7 +321,7 @@ class Affiliation(Entity):
         Defines how Affiliation objects are represented in string form.
         """
 
-        return str(self.summary.loc[0, 'name'])
+        return str(self.get_value('name'))
 
     def has_uri(self) -> bool:
         
@@ -325,7 +329,7 @@ class Affiliation(Entity):
         Returns True if the Affilation has a URI associated. Else, returns False.
         """
 
-        uri = self.summary.loc[0, 'uri']
+        uri = self.get_value('uri')
 
         if (type(uri) == str) and (uri != ''):
             return True
@@ -340,39 +344,39 @@ class Affiliation(Entity):
 
         if 'name' in data.keys():
             name = data['name']
-            self.summary.loc[0, 'name'] = name
+            self.set_value('name', name)
         
         if 'location' in data.keys():
             location = data['location']
-            self.summary.loc[0, 'location'] = location
+            self.set_value('location', location)
 
         if 'address' in data.keys():
             address = data['address']
-            self.summary.loc[0, 'address'] = address
+            self.set_value('address', address)
         
         if 'crossref_id' in data.keys():
             crossref_id = data['crossref_id']
-            self.summary.loc[0, 'crossref_id'] = crossref_id
+            self.set_value('crossref_id', crossref_id)
 
         if 'DOI' in data.keys():
             uri = data['DOI'].replace('http', '').replace('https', '').replace('dx.', '').replace('doi.org/', '').strip()
-            self.summary.loc[0, 'uri'] = 'https://doi.org/' + uri
+            self.set_value('uri', 'https://doi.org/' + uri)
         else:
             if 'uri' in data.keys():
                 uri = data['DOI'].replace('http', '').replace('https', '').replace('dx.', '').replace('doi.org/', '').strip()
-                self.summary.loc[0, 'uri'] = 'https://doi.org/' + uri
+                self.set_value('uri', 'https://doi.org/' + uri)
 
         if 'url' in data.keys():
             website = data['url']
-            self.summary.loc[0, 'website'] = website
+            self.set_value('website', website)
         else:
             if 'link' in data.keys():
                 website = data['link']
-                self.summary.loc[0, 'website'] = website
+                self.set_value('website', website)
             else:
                 if 'website' in data.keys():
                     website = data['website']
-                    self.summary.loc[0, 'website'] = website
+                    self.set_value('website', website)
 
     def from_dict(data: dict, use_api=False): # type: ignore
 
@@ -453,14 +457,6 @@ class Affiliation(Entity):
 
         return affiliation
         
-    def add_series(self, series: pd.Series):
-
-        """
-        Adds a Pandas Series object to the Affiliation's summary dataframe.
-        """
-
-        self.summary.loc[0] = series
-
     def from_series(data: pd.Series): # type: ignore
 
         """
@@ -531,33 +527,33 @@ class Affiliation(Entity):
         if 'name' in crossref_result.index:
             name = crossref_result['name']
         else:
-            name = self.summary.loc[0, 'name']
+            name = self.get_value('name')
 
         if 'location' in crossref_result.index:
             location = crossref_result['location']
         else:
-            location = self.summary.loc[0, 'location']
+            location = self.get_value('location')
 
         if 'email' in crossref_result.index:
             email = crossref_result['email']
         else:
-            email = self.summary.loc[0, 'email']
+            email = self.get_value('email')
 
         if 'uri' in crossref_result.index:
             uri  =crossref_result['uri']
         else:
-            uri = self.summary.loc[0, 'uri']
+            uri = self.get_value('uri')
 
         if 'id' in crossref_result.index:
             crossref_id = crossref_result['id']
         else:
-            crossref_id = self.summary.loc[0, 'crossref_id']
+            crossref_id = self.get_value('crossref_id')
         
-        self.summary.loc[0, 'name'] = name
-        self.summary.loc[0, 'location'] = location
-        self.summary.loc[0, 'email'] = email
-        self.summary.loc[0, 'uri'] = uri
-        self.summary.loc[0, 'crossref_id'] = crossref_id
+        self.set_value('name', name)
+        self.set_value('location', location)
+        self.set_value('email', email)
+        self.set_value('uri', uri)
+        self.set_value('crossref_id', crossref_id)
 
     def from_crossref_result(crossref_result: pd.Series, use_api: bool = False): # type: ignore
         
@@ -690,18 +686,18 @@ class Affiliation(Entity):
         Updates the Affiliation's street address by looking up its name, location, and/or existing address data using geopy.
         """
 
-        if self.summary.loc[0, 'name'] != None:
-            name = str(self.summary.loc[0, 'name']).strip().replace('{','').replace('}','').replace('[','').replace(']','').replace(',',' ').replace('  ',' ').strip()
+        if self.get_value('name') != None:
+            name = str(self.get_value('name')).strip().replace('{','').replace('}','').replace('[','').replace(']','').replace(',',' ').replace('  ',' ').strip()
         else:
             name = ''
         
-        if self.summary.loc[0, 'location'] != None:
-            location = str(self.summary.loc[0, 'location']).strip().replace('{','').replace('}','').replace('[','').replace(']','').replace('  ',' ').strip()
+        if self.get_value('location') != None:
+            location = str(self.get_value('location')).strip().replace('{','').replace('}','').replace('[','').replace(']','').replace('  ',' ').strip()
         else:
             location = ''
 
-        if self.summary.loc[0, 'address'] != None:
-            address = str(self.summary.loc[0, 'address']).strip().replace('{','').replace('}','').replace('[','').replace(']','').replace('  ',' ').strip()
+        if self.get_value('address') != None:
+            address = str(self.get_value('address')).strip().replace('{','').replace('}','').replace('[','').replace(']','').replace('  ',' ').strip()
         else:
             address = ''
 
@@ -720,13 +716,13 @@ class Affiliation(Entity):
             
         if loc != None:
                 
-                self.summary.loc[0, 'address'] = loc.address
+                self.set_value('address', loc.address)
 
-                if self.summary.loc[0, 'name'] == None:
-                    self.summary.loc[0, 'name'] = loc.name
+                if self.get_value('name') == None:
+                    self.set_value('name', loc.name)
                 
-                if self.summary.loc[0, 'location'] == None:
-                    self.summary.loc[0, 'location'] = loc.display_name
+                if self.get_value('location') == None:
+                    self.set_value('location', loc.display_name)
 
     def update_from_crossref(self, timeout = 60):
 
@@ -739,9 +735,9 @@ class Affiliation(Entity):
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         """
 
-        uid = self.summary.loc[0,'crossref_id']
+        uid = self.get_value('crossref_id')
         if uid == None:
-            uid = self.summary.loc[0,'uri']
+            uid = self.get_value('uri')
             if uid == None:
                 uid = ''
 
@@ -760,9 +756,9 @@ class Affiliation(Entity):
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         """
 
-        uid = self.summary.loc[0, 'uri']
+        uid = self.get_value('uri')
         if uid == None:
-            uid = self.summary.loc[0, 'crossref']
+            uid = self.get_value('crossref')
             if uid == None:
                 uid = ''
 
@@ -827,7 +823,7 @@ class Affiliations(Entities):
         if (type(affiliations_data) == list) and (type(affiliations_data[0]) == Affiliation):
 
             for a in affiliations_data:
-                affil_details = a.summary.copy(deep=True)
+                affil_details = a.to_dataframe()
                 affil_id = affil_details.loc[0, 'affiliation_id']
                 self.summary = pd.concat([self.summary, affil_details])
                 self.all[affil_id] = a
@@ -840,8 +836,8 @@ class Affiliations(Entities):
 
                 for i in affiliations_data:
                     a = Affiliation.from_dict(i) # type: ignore
-                    affil_id = a.summary.loc[0, 'affiliation_id']
-                    affil_details = a.summary.copy(deep=True)
+                    affil_id = a.get_value('affiliation_id')
+                    affil_details = a.to_dataframe()
                     self.summary = pd.concat([self.summary, affil_details])
                     self.all[affil_id] = a
 
@@ -856,8 +852,8 @@ class Affiliations(Entities):
                     if type(values[0]) == Affiliation:
 
                         for a in affiliations_data.keys():
-                            affil_id = a.summary.loc[0, 'affiliation_id']
-                            affil_details = a.summary.copy(deep=True)
+                            affil_id = a.get_value('affiliation_id')
+                            affil_details = a.to_dataframe()
                             self.summary = pd.concat([self.summary, affil_details])
                             self.all[affil_id] = a
 
@@ -922,13 +918,15 @@ class Affiliations(Entities):
         df['name'] = df['name'].replace('no_name_given', None)
         df = df.dropna(axis=0, how='all')
         drop_cols = [c for c in df.columns if c not in ignore_cols]
-        df = df.dropna(axis=0, how='all', subset=drop_cols).reset_index().drop('index', axis=1)
+        df = df.dropna(axis=0, how='all', subset=drop_cols)
+        self.change_tracker().relabel(df.index.to_list())
+        df = df.reset_index().drop('index', axis=1)
 
         self.summary = df
 
         return self
     
-    def remove_duplicates(self, drop_empty_rows = True, sync = False):
+    def remove_duplicates(self, drop_empty_rows = True, sync = False, changed_only = False):
 
         """
         Removes duplicate Affiliation entries from the Affiliations collection.
@@ -939,6 +937,8 @@ class Affiliations(Entities):
             whether to remove rows which do not contain any data. Defaults to True.
         sync : bool
             whether to synchronise the Affiliations.summary dataframe with the Affiliations.all dictionary. Defaults to False.
+        changed_only : bool
+            whether to only compare entries which are new or have changed since duplicates were last removed, and entries which share an identifier or name with them. Defaults to False.
         
         Returns
         -------
@@ -953,10 +953,20 @@ class Affiliations(Entities):
         df['uri'] = df['uri'].str.replace('http://', '', regex=False).str.replace('https://', '', regex=False).str.replace('wwww.', '', regex=False).str.replace('dx.', '', regex=False).str.replace('doi.org/', '', regex=False).str.strip('/')
         
         df = df.sort_values(by = ['uri', 'crossref_id', 'website', 'name', 'location', 'address']).reset_index().drop('index', axis=1)
-        self.summary = deduplicate(self.summary)
+
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            deduplicated = deduplicate_changed(self.summary, changed = tracker.pending(self.summary, 'dedup'))
+        else:
+            deduplicated = deduplicate(self.summary, reset_index = False)
+
+        tracker.relabel(deduplicated.index.to_list())
+        self.summary = deduplicated.reset_index().drop('index', axis=1)
+        tracker.done(self.summary, 'dedup')
 
         if sync == True:
-            self.sync_summary(drop_duplicates=False, drop_empty_rows=False)
+            self.sync_summary(drop_duplicates=False, drop_empty_rows=False, changed_only=changed_only)
 
         return self
 
@@ -976,7 +986,7 @@ class Affiliations(Entities):
         for i in self.all.keys():
             affil = self.all[i]
             affil.update_id()
-            series = affil.summary.copy(deep=True).loc[0]
+            series = affil.to_series()
             all = self.summary.copy(deep=True).astype(str)
             indexes = all[all['affiliation_id'] == i].index.to_list()
             if len(indexes) > 0:
@@ -991,7 +1001,7 @@ class Affiliations(Entities):
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=drop_empty_rows)
 
-    def sync_summary(self, drop_duplicates = False, drop_empty_rows=False):
+    def sync_summary(self, drop_duplicates = False, drop_empty_rows=False, changed_only = False):
 
         """
         Updates all Affiliation objects in the Affiliations.all dictionary using the Affiliations.summary dataframe.
@@ -1002,17 +1012,31 @@ class Affiliations(Entities):
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to False.
+        changed_only : bool
+            whether to only update Affiliation objects for rows which are new or have changed since the last sync. Defaults to False.
         """
 
-        self.update_ids(sync=False)
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            indexes = tracker.pending(self.summary, 'sync')
+        else:
+            indexes = None
+
+        self.update_ids(sync=False, indexes=indexes)
 
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=changed_only)
 
-        for i in self.summary.index:
+        if changed_only == True:
+            indexes = tracker.pending(self.summary, 'sync')
+        else:
+            indexes = self.summary.index.to_list()
+
+        for i in indexes:
 
             a_data = self.summary.loc[i]
             a_id = a_data['affiliation_id']
@@ -1028,18 +1052,20 @@ class Affiliations(Entities):
                 self.all[a_id] = a
         
         keys = list(self.all.keys())
+        a_ids = set(self.summary['affiliation_id'].to_list())
         for key in keys:
-            a_ids = self.summary['affiliation_id'].to_list()
             if key not in a_ids:
                 del self.all[key]
 
+        tracker.done(self.summary, 'sync')
+
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=drop_empty_rows)
 
-    def sync(self, drop_duplicates = False, drop_empty_rows=False):
+    def sync(self, drop_duplicates = False, drop_empty_rows=False, changed_only = False):
         
         """
         Synchronises the Affiliations.summary dataframe with the Affiliation objects in the Affiliations.all dictionary.
@@ -1050,19 +1076,21 @@ class Affiliations(Entities):
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to False.
+        changed_only : bool
+            whether to only update Affiliation objects for summary rows which are new or have changed since the last sync. Defaults to False.
         """
 
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=changed_only)
 
         all_len = len(self.summary)
         details_len = len(self.all)
 
         if all_len > details_len:
-            self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
+            self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows, changed_only=changed_only)
             return
         else:
             if details_len > all_len:
@@ -1192,7 +1220,7 @@ class Affiliations(Entities):
 
         affiliation.update_id()
 
-        affiliation_id = str(affiliation.summary.loc[0, 'affiliation_id'])
+        affiliation_id = str(affiliation.get_value('affiliation_id'))
 
         # if affiliation_id in self.summary['affiliation_id'].to_list():
         #     all_copy = self.summary.copy(deep=True).astype(str)
@@ -1200,13 +1228,13 @@ class Affiliations(Entities):
         #     affiliation_id = affiliation_id + f'#{id_count + 1}'
         #     affiliation.summary.loc[0, 'affiliation_id'] = affiliation_id
 
-        self.summary = pd.concat([self.summary, affiliation.summary])
+        self.summary = pd.concat([self.summary, affiliation.to_dataframe()])
         self.summary = self.summary.reset_index().drop('index', axis=1)
 
         self.all[affiliation_id] = affiliation
 
         if data is None:
-            data = affiliation.summary.to_dict(orient='index')
+            data = {0: affiliation.to_dict()}
         
         self.data.append(data)
 
@@ -1255,7 +1283,7 @@ class Affiliations(Entities):
 
         self.update_ids()
 
-    def update_ids(self, sync=False, drop_duplicates = False, drop_empty_rows=False):
+    def update_ids(self, sync=False, drop_duplicates = False, drop_empty_rows=False, indexes = None):
 
         """
         Updates affiliation IDs for all rows in the Affiliations.summary dataframe.
@@ -1264,6 +1292,8 @@ class Affiliations(Entities):
         ----------
         sync : bool
             whether to synchronise the Affiliations.summary dataframe with the Affiliation objects in the Affiliations.all dictionary. Defaults to False.
+        indexes : list
+            index labels of rows to update. Defaults to all rows.
         drop_empty_rows : bool
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
@@ -1273,7 +1303,10 @@ class Affiliations(Entities):
         if sync == True:
             self.sync()
 
-        for i in self.summary.index:
+        if indexes is None:
+            indexes = self.summary.index
+
+        for i in indexes:
             
             data = self.summary.loc[i].copy(deep=True)
             old_id = self.summary.loc[i, 'affiliation_id']
@@ -1289,12 +1322,12 @@ class Affiliations(Entities):
             self.summary.at[i, 'affiliation_id'] = new_id
             if old_id in self.all.keys():
                 self.all[new_id] = self.all[old_id]
-                self.all[new_id].summary.loc[0, 'affiliation_id'] = new_id
+                self.all[new_id].set_value('affiliation_id', new_id)
                 del self.all[old_id]
 
             else:
                 affiliation = Affiliation.from_series(data) # type: ignore
-                affiliation.summary.loc[0, 'affiliation_id'] = new_id
+                affiliation.set_value('affiliation_id', new_id)
                 self.all[new_id] = affiliation
 
         if drop_empty_rows == True:
@@ -1326,7 +1359,7 @@ class Affiliations(Entities):
         for a in affiliation_ids:
 
             self.all[a].update_address()
-            details = self.all[a].summary.loc[0]
+            details = self.all[a].to_series()
             
             df_index = self.summary[self.summary['affiliation_id'] == a].index.to_list()[0]
             self.summary.loc[df_index] = details
@@ -1356,7 +1389,7 @@ class Affiliations(Entities):
         for a in affiliation_ids:
 
             self.all[a].update_from_crossref()
-            details = self.all[a].summary.loc[0]
+            details = self.all[a].to_series()
             
             df_index = self.summary[self.summary['affiliation_id'] == a].index.to_list()[0]
             self.summary.loc[df_index] = details
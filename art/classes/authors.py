@@ -1,5 +1,9 @@
 
-from ..utils.cleaners import deduplicate
+from ..utils.cleaners import deduplicate, deduplicate_changed
+from ..utils.changes import set_column_values
+from ..utils.indexes import EntityIndex
+from ..utils.lazy import materialize
+from ..utils.parallel import parallel_map
 from ..importers.orcid import lookup_orcid, get_author, get_author_works
 from ..importers.orcid import search as search_orcid # type: ignore
 from .entities import Entity, Entities
@@ -214,6 +218,10 @@ class Author(Entity):
         a Results dataframe containing data on the Author's publications.
     """
 
+    __slots__ = ()
+
+    columns = author_cols
+
     def __init__(self,
                  author_id: str = None, # type: ignore
                  full_name = None, # type: ignore
@@ -273,32 +281,33 @@ class Author(Entity):
             given_name = split_name[0].strip()
             family_name = split_name[1].strip()
 
-        
-        global author_cols
-
-        self.summary = pd.DataFrame(columns = author_cols,
-                                dtype = object)
-        
-        
-        self.summary.loc[0] = pd.Series(dtype=object)
-        self.summary.loc[0, 'author_id'] = author_id
-        self.summary.loc[0, 'full_name'] = full_name
-        self.summary.loc[0, 'given_name'] = given_name
-        self.summary.loc[0, 'family_name'] = family_name
-        self.summary.loc[0, 'email'] = email
-        self.summary.loc[0, 'affiliations'] = affiliations
-        self.summary.loc[0, 'publications'] = publications
-        self.summary.loc[0, 'orcid'] = orcid
-        self.summary.loc[0, 'google_scholar'] = google_scholar
-        self.summary.loc[0, 'scopus'] = scopus
-        self.summary.loc[0, 'crossref'] = crossref
-        self.summary.loc[0, 'other_links'] = other_links
+        self.set_value('author_id', author_id)
+        self.set_value('full_name', full_name)
+        self.set_value('given_name', given_name)
+        self.set_value('family_name', family_name)
+        self.set_value('email', email)
+        self.set_value('affiliations', affiliations)
+        self.set_value('publications', publications)
+        self.set_value('orcid', orcid)
+        self.set_value('google_scholar', google_scholar)
+        self.set_value('scopus', scopus)
+        self.set_value('crossref', crossref)
+        self.set_value('other_links', other_links)
 
         full_name = self.full_name()
-        if full_name != self.summary.loc[0, 'full_name']:
-            self.summary.loc[0, 'full_name'] = full_name
+        if full_name != self.get_value('full_name'):
+            self.set_value('full_name', full_name)
 
-        self.publications = Results()
+    def attributes(self) -> dict:
+
+        """
+        Returns the Author's attributes as a dictionary. Used when exporting.
+        """
+
+        attrs = super().attributes()
+        attrs['publications'] = self.publications
+
+        return attrs
 
     def generate_id(self):
 
@@ -311,7 +320,7 @@ class Author(Entity):
             an author identifier.
         """
 
-        author_data = self.summary.loc[0]
+        author_data = self.to_series()
 
         author_id = generate_author_id(author_data) # type: ignore
         return author_id
@@ -322,11 +331,11 @@ class Author(Entity):
         Replaces the Author's existing unique identifier with a newly generated unique identifier based on the Author's data.
         """
 
-        current_id = self.summary.loc[0, 'author_id']
+        current_id = self.get_value('author_id')
         new_id = self.generate_id()
 
         if (current_id != new_id) or (current_id == None) or (current_id == 'None') or (current_id == '') or (current_id == 'A:#NA#'):
-            self.summary.loc[0, 'author_id'] = new_id
+            self.set_value('author_id', new_id)
         
     
     def __getitem__(self, key) -> object:
@@ -345,11 +354,17 @@ class Author(Entity):
             an object associated with the inputted key.
         """
         
+        if key == 'summary':
+            return self.summary
+
+        if key == 'publications':
+            return self.publications
+
         if key in self.__dict__.keys():
             return self.__dict__[key]
         
-        if key in self.summary.columns:
-            return self.summary.loc[0, key]
+        if key in self.store.columns:
+            return self.get_value(key)
         
         if key in self.publications.columns:
             return self.publications[key]
@@ -360,7 +375,7 @@ class Author(Entity):
         Defines how Author objects are represented in string form.
         """
 
-        return str(self.summary.loc[0, 'full_name'])
+        return str(self.get_value('full_name'))
     
     def full_name(self) -> str:
 
@@ -373,8 +388,15 @@ class Author(Entity):
             the Author's name data in full name ("{given_name} {family_name}") format.
         """
 
-        series = self.summary.loc[0]
-        return get_full_name(series=series) # type: ignore
+        series = self.to_series()
+        full_name = get_full_name(series=series) # type: ignore
+
+        # get_full_name may split a "{family_name}, {given_name}" entry
+        for c in ['given_name', 'family_name']:
+            if series[c] is not self.get_value(c):
+                self.set_value(c, series[c])
+
+        return full_name
 
 
     def update_full_name(self):
@@ -384,7 +406,7 @@ class Author(Entity):
             """
 
             full_name = self.full_name()
-            self.summary.loc[0, 'full_name'] = full_name
+            self.set_value('full_name', full_name)
 
     def name_set(self) -> set:
 
@@ -392,8 +414,8 @@ class Author(Entity):
         Returns the Author's given name and family name as a set.
         """
 
-        given = str(self.summary.loc[0, 'given_name'])
-        family = str(self.summary.loc[0, 'family_name'])
+        given = str(self.get_value('given_name'))
+        family = str(self.get_value('family_name'))
 
         return set([given, family])
 
@@ -403,7 +425,7 @@ class Author(Entity):
         Returns True if the Author has an Orcid ID associated. Else, returns False.
         """
 
-        orcid = self.summary.loc[0, 'orcid']
+        orcid = self.get_value('orcid')
 
         if (type(orcid) == str) and (orcid != ''):
             return True
@@ -416,17 +438,9 @@ class Author(Entity):
         Formats the Author's affiliations data as an Affiliations object.
         """
 
-        affils_data = self.summary.loc[0, 'affiliations']
+        affils_data = self.get_value('affiliations')
         affiliations = format_affiliations(affils_data)
-        self.summary.at[0, 'affiliations'] = affiliations
-
-    def add_series(self, series: pd.Series):
-
-        """
-        Adds a Pandas Series object to the Author's summary data.
-        """
-
-        self.summary.loc[0] = series
+        self.set_value('affiliations', affiliations)
 
     def from_series(series: pd.Series): # type: ignore
 
@@ -494,29 +508,29 @@ class Author(Entity):
         """
 
         if 'given' in crossref_result.keys():
-            self.summary.loc[0, 'given_name'] = crossref_result['given']
+            self.set_value('given_name', crossref_result['given'])
         
         if 'family' in crossref_result.keys():
-            self.summary.loc[0, 'family_name'] = crossref_result['family']
+            self.set_value('family_name', crossref_result['family'])
         
         if 'email' in crossref_result.keys():
-            self.summary.loc[0, 'email'] = crossref_result['email']
+            self.set_value('email', crossref_result['email'])
 
         if 'affiliation' in crossref_result.keys():
             if (type(crossref_result['affiliation']) == list) and (len(crossref_result['affiliation']) > 0):
-                self.summary.at[0, 'affiliations'] = crossref_result['affiliation'][0]
+                self.set_value('affiliations', crossref_result['affiliation'][0])
 
             else:
                 if (type(crossref_result['affiliation']) == dict) and (len(crossref_result['affiliation'].keys()) > 0):
                     key = list(crossref_result['affiliation'].keys())[0]
-                    self.summary.at[0, 'affiliations'] = crossref_result['affiliation'][key]
+                    self.set_value('affiliations', crossref_result['affiliation'][key])
 
         if 'ORCID' in crossref_result.keys():
-            self.summary.loc[0, 'orcid'] = crossref_result['ORCID']
+            self.set_value('orcid', crossref_result['ORCID'])
         
         else:
             if 'orcid' in crossref_result.keys():
-                self.summary.loc[0, 'orcid'] = crossref_result['orcid']
+                self.set_value('orcid', crossref_result['orcid'])
 
         # self.summary.loc[0, 'google_scholar'] = google_scholar
         # self.summary.loc[0, 'crossref'] = crossref
@@ -552,22 +566,22 @@ class Author(Entity):
                     author_details = auth_df.loc[0]
 
                     if 'name' in cols:
-                        self.summary.loc[0, 'given_name'] = author_details['name']
+                        self.set_value('given_name', author_details['name'])
                     
                     if 'family name' in cols:
-                        self.summary.loc[0, 'family_name'] = author_details['family name']
+                        self.set_value('family_name', author_details['family name'])
                     
                     if 'emails' in cols:
-                        self.summary.at[0, 'email'] = author_details['emails']
+                        self.set_value('email', author_details['emails'])
                     
                     if 'employment' in cols:
-                        self.summary.at[0, 'affiliations'] = author_details['employment']
+                        self.set_value('affiliations', author_details['employment'])
                     
                     if 'works' in cols:
-                        self.summary.at[0, 'publications'] = author_details['works']
+                        self.set_value('publications', author_details['works'])
                     
-                    self.summary.loc[0, 'orcid'] = orcid_id
-                    self.summary.loc[0, 'orcid'] = orcid_id
+                    self.set_value('orcid', orcid_id)
+                    self.set_value('orcid', orcid_id)
                     self.update_full_name()
 
                     return
@@ -588,12 +602,12 @@ class Author(Entity):
             if 'given-names' in author_details['name']:
                 given_list = list(author_details['name']['given-names'].values())
                 given = ' '.join(given_list)
-                self.summary.loc[0, 'given_name'] = given
+                self.set_value('given_name', given)
 
             if 'family-name' in author_details['name']:
                 family_list = list(author_details['name']['family-name'].values())
                 family = ' '.join(family_list)
-                self.summary.loc[0, 'family_name'] = family
+                self.set_value('family_name', family)
             
         if 'emails' in details_keys:
             emails_dict = author_details['emails']
@@ -607,7 +621,7 @@ class Author(Entity):
                             email_addr = i['email']
                             emails_list.append(email_addr)
 
-                    self.summary.at[0, 'email'] = emails_list
+                    self.set_value('email', emails_list)
         
         if 'keywords' in details_keys:
             kws_dict = author_details['keywords']
@@ -621,7 +635,7 @@ class Author(Entity):
                             kwd = i['content']
                             kws_list.append(kwd)
 
-                    self.summary.at[0, 'keywords'] = kws_list
+                    self.set_value('keywords', kws_list)
 
         if 'external-identifiers' in details_keys:
             ext_ids_dict = author_details['external-identifiers']
@@ -637,11 +651,11 @@ class Author(Entity):
                             url = i['external-id-url']
                             ext_ids_formatted[id_type] = {'id': value, 'url': url}
 
-                    self.summary.at[0, 'keywords'] = ext_ids_formatted
+                    self.set_value('keywords', ext_ids_formatted)
 
         
         
-        self.summary.loc[0, 'orcid'] = orcid_id
+        self.set_value('orcid', orcid_id)
 
         if type(auth_res) == Orcid:
             try:
@@ -716,12 +730,12 @@ class Author(Entity):
         Looks up Author's ORCID author ID. If one is found, uses to update the Author object.
         """
 
-        orcid = self.summary.loc[0, 'orcid']
+        orcid = self.get_value('orcid')
 
         if (orcid != None) and (orcid != '') and (orcid != 'None'):
             
             orcid = str(orcid).replace('https://', '').replace('http://', '').replace('orcid.org/', '')
-            self.summary.loc[0, 'orcid'] = orcid
+            self.set_value('orcid', orcid)
 
             self.import_orcid(orcid_id = orcid)
 
@@ -745,7 +759,7 @@ class Authors(Entities):
         a list of any unformatted data associated with Author objects in the collection.
     """
 
-    def __init__(self, authors_data = []):
+    def __init__(self, authors_data = None):
         
         """
         Initialises Authors instance.
@@ -758,6 +772,10 @@ class Authors(Entities):
         """
 
         super().__init__()
+
+        # Creating a new list for each instance, so that authors data added to one Authors object is not shared with others
+        if authors_data is None:
+            authors_data = []
         
         global author_cols
         self.summary = pd.DataFrame(columns = author_cols,
@@ -768,7 +786,7 @@ class Authors(Entities):
         if (type(authors_data) == list) and (len(authors_data)>0) and (type(authors_data[0]) == Author):
 
             for i in authors_data:
-                auth = i.summary.copy(deep=True)
+                auth = i.to_dataframe()
                 self.summary = pd.concat([self.summary, auth])
 
             self.summary = self.summary.reset_index().drop('index',axis=1)
@@ -784,7 +802,7 @@ class Authors(Entities):
                     for a in authors_data.keys():
                         
                         index = len(self.summary)
-                        auth = a.summary.copy(deep=True)
+                        auth = a.to_dataframe()
                         self.summary = pd.concat([self.summary, auth])
                         self.summary.loc[index, 'author_id'] = a
 
@@ -832,7 +850,7 @@ class Authors(Entities):
 
         return len(self.all.keys())
 
-    def remove_duplicates(self, drop_empty_rows = True, sync=True):
+    def remove_duplicates(self, drop_empty_rows = True, sync=True, changed_only = False):
 
         """
         Removes duplicate Author entries.
@@ -843,6 +861,8 @@ class Authors(Entities):
             whether to remove rows which do not contain any data. Defaults to True.
         sync : bool
             whether to synchronise the Authors.summary dataframe with the Authors.all dictionary. Defaults to True.
+        changed_only : bool
+            whether to only compare entries which are new or have changed since duplicates were last removed, and entries which share an identifier or name with them. Defaults to False.
         
         Returns
         -------
@@ -858,10 +878,20 @@ class Authors(Entities):
         df['google_scholar'] = df['google_scholar'].str.replace('http://', '', regex=False).str.replace('https://', '', regex=False).str.replace('scholar.google.com/', '', regex=False).str.replace('citations?', '', regex=False).str.replace('user=', '', regex=False).str.strip('/')
        
         df = df.sort_values(by = ['orcid', 'google_scholar', 'crossref', 'full_name']).reset_index().drop('index', axis=1)
-        self.summary = deduplicate(self.summary)
+
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            deduplicated = deduplicate_changed(self.summary, changed = tracker.pending(self.summary, 'dedup'))
+        else:
+            deduplicated = deduplicate(self.summary, reset_index = False)
+
+        tracker.relabel(deduplicated.index.to_list())
+        self.summary = deduplicated.reset_index().drop('index', axis=1)
+        tracker.done(self.summary, 'dedup')
 
         if sync == True:
-            self.sync_summary()
+            self.sync_summary(changed_only = changed_only)
 
         return self
         
@@ -968,31 +998,21 @@ class Authors(Entities):
         """
 
         if update_from_orcid == True:
-            orcid = author.summary.loc[0,'orcid']
+            orcid = author.get_value('orcid')
             if (orcid != None) and (orcid != '') and (orcid != 'None'):
                 author.update_from_orcid()
 
         author.update_id()
 
-        author_id = str(author.summary.loc[0, 'author_id'])
-
-        if (author_id in self.all.keys()) or (author_id in self.summary['author_id'].to_list()):
-            print(f'Warning: {author_id} is already in authors')
-
         # if author_id in self.summary['author_id'].to_list():
         #     id_count = len(self.summary[self.summary['author_id'].str.contains(author_id)]) # type: ignore
         #     author_id = author_id + f'#{id_count + 1}'
         #     author.summary.loc[0, 'author_id'] = author_id
 
-        self.summary = pd.concat([self.summary, author.summary])
-        self.summary = self.summary.reset_index().drop('index', axis=1)
-
-        self.all[author_id] = author
-
-        if data == None:
-            data = author.summary.to_dict(orient='index')
-        
-        self.data.append(data)
+        if data is None:
+            self.add_entities([author])
+        else:
+            self.add_entities([author], data = [data])
 
         if drop_empty_rows == True:
             self.drop_empty_rows()
@@ -1001,7 +1021,7 @@ class Authors(Entities):
             self.remove_duplicates(drop_empty_rows=drop_empty_rows)
 
 
-    def add_authors_list(self, authors_list: list, drop_duplicates = False, drop_empty_rows = False):
+    def add_authors_list(self, authors_list: list, drop_duplicates = False, drop_empty_rows = False, data = None):
         
         """
         Adds a list containing Author objects to the Authors collection.
@@ -1014,11 +1034,16 @@ class Authors(Entities):
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to False.
+        data : list
+            Optional: a list containing each author's data. Defaults to the Authors' summary data.
         """
 
+        authors_list = [i for i in authors_list if type(i) == Author]
+
         for i in authors_list:
-            if type(i) == Author:
-                self.add_author(author = i, drop_duplicates=False)
+            i.update_id()
+
+        self.add_entities(authors_list, data = data)
         
         if drop_empty_rows == True:
             self.drop_empty_rows()
@@ -1026,6 +1051,26 @@ class Authors(Entities):
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=drop_empty_rows)
 
+    def entity_index(self, column: str = 'affiliations', ignore_case: bool = True) -> EntityIndex:
+
+        """
+        Builds an index mapping identifiers of the Authors' affiliations (e.g. affiliation IDs, names, URIs) to the authors who have them, in a single pass over the Authors summary.
+
+        Parameters
+        ----------
+        column : str
+            name of column to index. Defaults to 'affiliations'.
+        ignore_case : bool
+            whether to ignore the case of identifiers. Defaults to True.
+
+        Returns
+        -------
+        entity_index : EntityIndex
+            the entity index.
+        """
+
+        return EntityIndex(self.summary[column], id_column = 'affiliation_id', ignore_case = ignore_case)
+
     def mask_entities(self, column, query: str = 'request_input', ignore_case: bool = True):
 
         """
@@ -1065,13 +1110,21 @@ class Authors(Entities):
 
         return masked
 
-    def update_author_ids(self):
+    def update_author_ids(self, indexes = None):
         
         """
         Updates author IDs for all rows in the Authors.summary dataframe.
+
+        Parameters
+        ----------
+        indexes : list
+            index labels of rows to update. Defaults to all rows.
         """
 
-        for i in self.summary.index:
+        if indexes is None:
+            indexes = self.summary.index
+
+        for i in indexes:
             author_data = self.summary.loc[i]
             author_id = generate_author_id(author_data)
             self.summary.loc[i, 'author_id'] = author_id
@@ -1091,12 +1144,18 @@ class Authors(Entities):
             whether to remove duplicated rows. Defaults to False.
         """
 
+        # Mapping author IDs to summary rows once, rather than for each author
+        all_ids = self.summary['author_id'].astype(str)
+        id_rows = dict()
+        for index, author_id in zip(all_ids.index, all_ids.values):
+            if author_id not in id_rows:
+                id_rows[author_id] = index
+
         for i in self.all.keys():
             author = self.all[i]
             author.update_id()
-            series = author.summary.loc[0]
-            all = self.summary.copy(deep=True).astype(str)
-            auth_index = all[all['author_id'] == i].index.to_list()[0]
+            series = author.to_series()
+            auth_index = id_rows[str(i)]
             self.summary.loc[auth_index] = series
 
         if drop_empty_rows == True:
@@ -1105,7 +1164,7 @@ class Authors(Entities):
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=drop_empty_rows)
 
-    def sync_summary(self, drop_duplicates = False, drop_empty_rows=False):
+    def sync_summary(self, drop_duplicates = False, drop_empty_rows=False, changed_only = False):
 
         """
         Updates all Author objects in the Authors.all dictionary using the Authors.summary dataframe.
@@ -1116,11 +1175,20 @@ class Authors(Entities):
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to False.
+        changed_only : bool
+            whether to only update Author objects for rows which are new or have changed since the last sync. Defaults to False.
         """
 
-        self.update_author_ids()
+        tracker = self.change_tracker()
 
-        for i in self.summary.index:
+        if changed_only == True:
+            indexes = tracker.pending(self.summary, 'sync')
+        else:
+            indexes = self.summary.index.to_list()
+
+        self.update_author_ids(indexes = indexes)
+
+        for i in indexes:
 
             auth_data = self.summary.loc[i]
             auth_id = auth_data['author_id']
@@ -1136,18 +1204,20 @@ class Authors(Entities):
                 self.all[auth_id] = auth
         
         keys = list(self.all.keys())
+        auth_ids = set(self.summary['author_id'].to_list())
         for key in keys:
-            auth_ids = self.summary['author_id'].to_list()
             if key not in auth_ids:
                 del self.all[key]
 
+        tracker.done(self.summary, 'sync')
+
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=changed_only)
 
-    def sync(self, drop_duplicates = False, drop_empty_rows=False):
+    def sync(self, drop_duplicates = False, drop_empty_rows=False, changed_only = False):
         
         """
         Synchronises the Authors.summary dataframe with the Author objects in the Authors.all dictionary.
@@ -1158,20 +1228,22 @@ class Authors(Entities):
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to False.
+        changed_only : bool
+            whether to only update Author objects for summary rows which are new or have changed since the last sync. Defaults to False.
         """
 
         all_len = len(self.summary)
         details_len = len(self.all)
 
         if all_len > details_len:
-            self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
+            self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows, changed_only=changed_only)
             return
         else:
             if details_len > all_len:
                 self.sync_all(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
                 return
             else:
-                self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
+                self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows, changed_only=changed_only)
                 self.sync_all(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
                 return
 
@@ -1193,14 +1265,16 @@ class Authors(Entities):
         df['full_name'] = df['full_name'].replace('no_name_given', None)
         df = df.dropna(axis=0, how='all')
         drop_cols = [c for c in df.columns if c not in ignore_cols]
-        df = df.dropna(axis=0, how='all', subset=drop_cols).reset_index().drop('index', axis=1)
+        df = df.dropna(axis=0, how='all', subset=drop_cols)
+        self.change_tracker().relabel(df.index.to_list())
+        df = df.reset_index().drop('index', axis=1)
 
         self.summary = df
-        self.sync_summary()
+        self.sync_summary(changed_only=True)
 
         return self
 
-    def format_affiliations(self, drop_empty_rows=False):
+    def format_affiliations(self, drop_empty_rows=False, changed_only = False, workers = None, executor = None):
 
         """
         Formats authors' affiliations data as Affiliations objects and stores in Review's Affiliations attribute.
@@ -1209,14 +1283,31 @@ class Authors(Entities):
         ----------
         drop_empty_rows : bool
             whether to remove rows which do not contain any data. Defaults to False.
+        changed_only : bool
+            whether to only format rows which are new or have changed since affiliations were last formatted. Defaults to False.
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
-        affils = self.summary['affiliations'].apply(func=format_affiliations) # type: ignore
-        self.summary['affiliations'] = affils
-        self.sync_summary()
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            indexes = tracker.pending(self.summary, 'affiliations', columns = ['affiliations'])
+        else:
+            indexes = self.summary.index.to_list()
+
+        if len(indexes) > 0:
+            affils = parallel_map(format_affiliations, self.summary.loc[indexes, 'affiliations'].to_list(), workers = workers, executor = executor)
+            set_column_values(self.summary, 'affiliations', indexes, affils)
+            self.mark_changed(indexes)
+        
+        self.sync_summary(changed_only = changed_only)
+        tracker.done(self.summary, 'affiliations', columns = ['affiliations'])
 
     def update_from_orcid(self, drop_duplicates = False, drop_empty_rows=False):
 
@@ -1238,7 +1329,7 @@ class Authors(Entities):
         for a in author_ids:
 
             self.all[a].update_from_orcid()
-            details = self.all[a].summary.loc[0]
+            details = self.all[a].to_series()
             
             df_index = self.summary[self.summary['author_id'] == a].index.to_list()[0]
             self.summary.loc[df_index] = details
@@ -1269,10 +1360,8 @@ class Authors(Entities):
             whether to remove duplicated rows. Defaults to False.
         """
 
-        for i in orcid_ids:
-
-            auth = Author.from_orcid(i) # type: ignore
-            self.add_author(author = auth, data = i)
+        authors_list = [Author.from_orcid(i) for i in orcid_ids] # type: ignore
+        self.add_authors_list(authors_list, data = orcid_ids)
         
         if drop_empty_rows == True:
             self.drop_empty_rows()
@@ -1328,10 +1417,8 @@ class Authors(Entities):
             whether to remove duplicated rows. Defaults to False.
         """
 
-        for i in crossref_result:
-
-            auth = Author.from_crossref(i) # type: ignore
-            self.add_author(author = auth, data = i)
+        authors_list = [Author.from_crossref(i) for i in crossref_result] # type: ignore
+        self.add_authors_list(authors_list, data = list(crossref_result))
         
         if drop_empty_rows == True:
             self.drop_empty_rows()
@@ -1469,7 +1556,7 @@ class Authors(Entities):
         output = {}
         for auth_id in self.all.keys():
             auth = self.all[auth_id]
-            affiliation = auth.summary.loc[0, 'affiliations']
+            affiliation = auth.get_value('affiliations')
             output[auth_id] = affiliation
         
         return output
@@ -1521,6 +1608,7 @@ def format_authors(author_data, drop_duplicates = False, drop_empty_rows=False):
             whether to remove duplicated rows. Defaults to False.
         """
 
+        author_data = materialize(author_data)
         result = Authors()
 
         if (author_data == None) or (author_data == ''):
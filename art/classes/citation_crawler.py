@@ -6,6 +6,7 @@ from ..internet.crawlers import check_crawl_permission
 from ..internet.crawlers import correct_seed_errors as correct_seed_url_errors
 from .authors import format_authors
 from .references import format_references
+from .results import Results
 
 import queue
 import time
@@ -365,7 +366,10 @@ def citation_crawler_engine(
     """
     
     # Intiailising variables to store the pages already visited
-    data = data.copy(deep=True)
+    data = Results.from_dataframe(data)
+
+    # New rows are staged and added in batches (see Results.start_batch), rather than concatenated onto the data once per entry crawled
+    data.start_batch(drop_empty_rows = False, drop_duplicates = False, update_work_ids = False)
     
     crawled_entries = []
     iteration = 1
@@ -396,7 +400,11 @@ def citation_crawler_engine(
         if current_index in crawled_entries:
             continue
         
-        old_len = len(data)
+        # Adding staged rows if the entry is one of them
+        if current_index not in data.index:
+            data.flush()
+
+        old_len = len(data) + data.staged_count()
 
         # Retreiving entry data
         entry = pd.Series(data.loc[current_index])
@@ -416,12 +424,12 @@ def citation_crawler_engine(
 
         data.loc[current_index] = entry
         refs_df = refs.copy(deep=True) # type: ignore
-        data = pd.concat([data, refs_df]).reset_index().drop('index', axis=1) # type: ignore
+        data.stage_rows(refs_df)
 
         # Adding current current index to list of indexes already processed
         crawled_entries.append(current_index)
 
-        new_len = len(data)
+        new_len = len(data) + data.staged_count()
         new_indexes = list(range(old_len, new_len))
 
         added_in_cycle = added_in_cycle + len(refs_df)
@@ -444,13 +452,15 @@ def citation_crawler_engine(
             depth += 1
             added_in_cycle = 0
             processed_in_cycle = 0
-            depth_marker = len(data)
+            depth_marker = len(data) + data.staged_count()
             
 
         # Incrementing iteration count
         iteration += 1
         processed_in_cycle += 1
 
+    data.end_batch()
+
     # Updating newly added entries
     if use_api == True:
         index = set(data.index)
@@ -504,6 +514,9 @@ def citation_crawler(
 
         # See https://www.zenrows.com/blog/web-crawler-python#transitioning-to-a-real-world-web-crawler
 
+        # Converting to a Results object with a range index, so that rows added during the crawl follow on from the seeds
+        data = Results.from_dataframe(data)
+
         seeds = data.index.to_list()
         
         # Storing seed indexes to crawl in a specific order
@@ -1,28 +1,443 @@
 from ..exporters.general_exporters import art_class_to_folder
+from ..utils.changes import ChangeTracker
+from ..utils.indexes import StringView
 
+import weakref
 import pandas as pd
 
+# Change trackers are held outside of Entities objects' attributes so that they are not exported with them
+change_trackers = weakref.WeakKeyDictionary()
+string_views = weakref.WeakKeyDictionary()
+
+class EntityStore:
+
+    """
+    This is an EntityStore object. It is a columnar table which holds the data of many Entity objects (e.g. all Author objects), so that each Entity does not need its own dataframe. Each Entity is a row in the store.
+
+    Parameters
+    ----------
+    columns : list
+        names of the store's columns.
+
+    Attributes
+    ----------
+    columns : list
+        names of the store's columns.
+    data : dict
+        a dictionary mapping column names to lists of values. Each list holds one value per row.
+    free : list
+        rows which are no longer in use and can be reused.
+    views : dict
+        a dictionary mapping rows to one-row dataframes returned by Entity.summary. Edits made to a view are copied into the store when the row is next accessed, and changes made through the store are copied into the view. Views are kept until their rows are released.
+    """
+
+    def __init__(self, columns = []):
+
+        """
+        Initialises EntityStore instance.
+
+        Parameters
+        ----------
+        columns : list
+            names of the store's columns.
+        """
+
+        self.columns = list(columns)
+        self.data = {c: [] for c in self.columns}
+        self.free = []
+        self.views = dict()
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how EntityStore objects are represented in string form.
+        """
+
+        return f'EntityStore of {len(self)} rows: {self.columns}'
+
+    def __len__(self) -> int:
+
+        """
+        Returns the number of rows in use.
+        """
+
+        if len(self.columns) == 0:
+            return 0
+
+        return len(self.data[self.columns[0]]) - len(self.free)
+
+    def add_column(self, column: str):
+
+        """
+        Adds an empty column to the store.
+        """
+
+        if column in self.data:
+            return self
+
+        self.columns.append(column)
+
+        if len(self.columns) > 1:
+            length = len(self.data[self.columns[0]])
+        else:
+            length = 0
+
+        self.data[column] = [None] * length
+
+        return self
+
+    def add_row(self) -> int:
+
+        """
+        Adds an empty row to the store and returns its position.
+        """
+
+        if len(self.free) > 0:
+            return self.free.pop()
+
+        if len(self.columns) == 0:
+            self.add_column('entity_id')
+
+        for c in self.columns:
+            self.data[c].append(None)
+
+        return len(self.data[self.columns[0]]) - 1
+
+    def release(self, row: int):
+
+        """
+        Clears a row so that it can be reused.
+        """
+
+        self.views.pop(row, None)
+
+        for c in self.columns:
+            self.data[c][row] = None
+
+        self.free.append(row)
+
+    def absorb(self, row: int):
+
+        """
+        Copies a row's data from its summary dataframe back into the store. The dataframe is kept, so that later edits made to it are also copied.
+        """
+
+        view = self.views.get(row)
+
+        if (view is None) or (len(view) == 0):
+            return
+
+        record = view.iloc[0]
+
+        for key in record.keys():
+            if key not in self.data:
+                self.add_column(key)
+
+        for c in self.columns:
+            if c in record.keys():
+                self.data[c][row] = record[c]
+            else:
+                self.data[c][row] = None
+
+    def update_view(self, row: int, columns: list):
+
+        """
+        Copies cells from the store into a row's summary dataframe, if the row has one.
+        """
+
+        view = self.views.get(row)
+
+        if (view is None) or (len(view) == 0):
+            return
+
+        for c in columns:
+            view[c] = pd.Series([self.data[c][row]], index=view.index[:1], dtype=object)
+
+    def get(self, row: int, column: str):
+
+        """
+        Returns the value of a cell.
+        """
+
+        if row in self.views:
+            self.absorb(row)
+
+        if column not in self.data:
+            raise KeyError(column)
+
+        return self.data[column][row]
+
+    def set(self, row: int, column: str, value):
+
+        """
+        Sets the value of a cell. Adds the column if it does not exist.
+        """
+
+        if row in self.views:
+            self.absorb(row)
+
+        if column not in self.data:
+            self.add_column(column)
+
+        self.data[column][row] = value
+
+        self.update_view(row, [column])
+
+    def record(self, row: int) -> dict:
+
+        """
+        Returns a row's data as a dictionary.
+        """
+
+        if row in self.views:
+            self.absorb(row)
+
+        return {c: self.data[c][row] for c in self.columns}
+
+    def set_record(self, row: int, record):
+
+        """
+        Replaces a row's data using a dictionary or Pandas Series. Store columns which are not in the record are set to None.
+        """
+
+        for key in record.keys():
+            if key not in self.data:
+                self.add_column(key)
+
+        for c in self.columns:
+            if c in record.keys():
+                self.data[c][row] = record[c]
+            else:
+                self.data[c][row] = None
+
+        self.update_view(row, self.columns)
+
+    def series(self, row: int) -> pd.Series:
+
+        """
+        Returns a row's data as a Pandas Series.
+        """
+
+        return pd.Series(self.record(row), index=self.columns, dtype=object, name=0)
+
+    def frame(self, row: int) -> pd.DataFrame:
+
+        """
+        Returns a row's data as a one-row dataframe with the index 0.
+        """
+
+        record = self.record(row)
+
+        return pd.DataFrame({c: [record[c]] for c in self.columns}, columns=self.columns, index=[0], dtype=object)
+
+    def view(self, row: int) -> pd.DataFrame:
+
+        """
+        Returns a one-row dataframe of a row's data. Changes made to the dataframe are copied back into the store whenever the row is accessed through the store.
+        """
+
+        view = self.views.get(row)
+
+        if view is None:
+            view = self.frame(row)
+            self.views[row] = view
+
+        return view
+
+# Entity data is held in one store per Entity class, rather than in a dataframe per Entity
+entity_stores = dict()
+
+def get_entity_store(entity_class, columns = []) -> EntityStore:
+
+    """
+    Returns the EntityStore used by an Entity class. Creates the store if it does not exist.
+
+    Parameters
+    ----------
+    entity_class : type
+        an Entity class (e.g. Author).
+    columns : list
+        names of the store's columns, used if the store is created.
+    """
+
+    global entity_stores
+
+    name = entity_class.__name__
+
+    if name not in entity_stores:
+        entity_stores[name] = EntityStore(columns)
+
+    return entity_stores[name]
+
 class Entity:
 
     """
     This is an Entity object. It is intended as a superclass for Author, Funder, and Affiliation classes.
+
+    Entity objects are lightweight views: their data is stored as a row in an EntityStore shared by all Entities of the same class.
     
     Attributes
     ----------
     summary : pandas.DataFrame
         a dataframe summarising the Entity's data.
+    store : EntityStore
+        the store holding the Entity's data.
+    row : int
+        the position of the Entity's data in the store.
     """
 
+    # Attributes other than the store, row and publications (e.g. coauthors) are kept in __dict__, which is only created when first used
+    __slots__ = ('store', 'row', '_publications', '__dict__', '__weakref__')
+
+    # Names of the columns in the Entity's summary dataframe
+    columns = []
+
     def __init__(self):
         
         """
         Initialises Entity instance.
         """
 
+        self.store = get_entity_store(type(self), columns = type(self).columns)
+        self.row = self.store.add_row()
+        self._publications = None
 
-        self.summary = pd.DataFrame(dtype = object)
+    def __del__(self):
+
+        """
+        Frees the Entity's row in the store when the Entity is deleted.
+        """
+
+        try:
+            self.store.release(self.row)
+        except (AttributeError, IndexError, TypeError):
+            pass
 
+    def __getstate__(self):
 
+        """
+        Returns the Entity's data for pickling. Only the Entity's own row is pickled, not the whole store.
+        """
+
+        return {'record': self.to_dict(), 'publications': self._publications, 'attrs': dict(self.__dict__)}
+
+    def fingerprint_state(self) -> dict:
+
+        """
+        Returns a stand-in for the Entity's data, used to detect changes when a Review is saved (see art.utils.reviewfile.object_fingerprint). Publications which are rows of a shared dataframe are represented by the dataframe's identity and the rows, rather than by the dataframe itself.
+        """
+
+        publications = self._publications
+
+        if type(publications) == tuple:
+            dataframe, rows = publications
+            publications = (id(dataframe), len(dataframe), list(rows))
+
+        return {'record': self.to_dict(), 'publications': publications, 'attrs': dict(self.__dict__)}
+
+    def __setstate__(self, state):
+
+        """
+        Restores a pickled Entity by adding its data to the store.
+        """
+
+        self.store = get_entity_store(type(self), columns = type(self).columns)
+        self.row = self.store.add_row()
+        self.store.set_record(self.row, state['record'])
+        self._publications = state.get('publications')
+        self.__dict__.update(state.get('attrs', dict()))
+
+    def set_publication_rows(self, dataframe: pd.DataFrame, rows: list):
+
+        """
+        Sets the Entity's publications to a selection of rows from a dataframe. The Results dataframe is only created when the publications are first accessed.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe of results. This should not be modified afterwards (e.g. it may be a copy of a Review's results).
+        rows : list
+            index labels of the Entity's publications.
+        """
+
+        self._publications = (dataframe, rows)
+
+        return self
+
+    @property
+    def summary(self) -> pd.DataFrame:
+
+        """
+        A one-row dataframe summarising the Entity's data. Edits made to the dataframe are kept.
+        """
+
+        return self.store.view(self.row)
+
+    @summary.setter
+    def summary(self, dataframe: pd.DataFrame):
+
+        if len(dataframe) > 0:
+            self.store.set_record(self.row, dataframe.iloc[0])
+        else:
+            self.store.set_record(self.row, dict())
+
+    def get_value(self, column: str):
+
+        """
+        Returns a datapoint from the Entity's data. Returns None if the column does not exist.
+        """
+
+        try:
+            return self.store.get(self.row, column)
+        except KeyError:
+            return None
+
+    def set_value(self, column: str, value):
+
+        """
+        Sets a datapoint in the Entity's data.
+        """
+
+        self.store.set(self.row, column, value)
+
+    def to_dict(self) -> dict:
+
+        """
+        Returns the Entity's data as a dictionary.
+        """
+
+        return self.store.record(self.row)
+
+    def to_series(self) -> pd.Series:
+
+        """
+        Returns the Entity's data as a Pandas Series.
+        """
+
+        return self.store.series(self.row)
+
+    def to_dataframe(self) -> pd.DataFrame:
+
+        """
+        Returns the Entity's data as a new one-row dataframe.
+        """
+
+        return self.store.frame(self.row)
+
+    def attributes(self) -> dict:
+
+        """
+        Returns the Entity's attributes as a dictionary. Used when exporting.
+        """
+
+        attrs = {'summary': self.summary}
+
+        if self._publications is not None:
+            attrs['publications'] = self.publications # type: ignore
+
+        attrs.update(self.__dict__)
+
+        return attrs
     
     def __getitem__(self, key):
         
@@ -30,11 +445,14 @@ class Entity:
         Retrieves Entity attribute using a key.
         """
         
+        if key == 'summary':
+            return self.summary
+
         if key in self.__dict__.keys():
             return self.__dict__[key]
         
-        if key in self.summary.columns:
-            return self.summary.loc[0, key]
+        if key in self.store.columns:
+            return self.get_value(key)
 
     def get(self, key):
 
@@ -50,7 +468,7 @@ class Entity:
         Defines how Entity objects are represented in string form.
         """
 
-        return str(self.summary.loc[0])
+        return str(self.to_series())
 
     def search(self, query: str = 'request_input', ignore_case: bool = True) -> pd.Series:
 
@@ -75,7 +493,8 @@ class Entity:
         
         query = query.strip().lower()
         
-        self_str = self.summary.copy(deep=True).loc[0].astype(str)
+        series = self.to_series()
+        self_str = series.astype(str)
 
         if ignore_case == True:
             query = query.lower()
@@ -83,7 +502,7 @@ class Entity:
 
         masked = self_str[self_str.str.contains(query)].index
         
-        return self.summary.loc[0][masked]
+        return series[masked]
         
 
     def has_uri(self) -> bool:
@@ -92,13 +511,10 @@ class Entity:
         Returns True if the Entity has a URI associated.
         """
 
-        if 'uri' in self.summary.columns:
-            uri = self.summary.loc[0, 'uri']
+        uri = self.get_value('uri')
 
-            if (type(uri) == str) and (uri != ''):
-                return True
-            else:
-                return False
+        if (type(uri) == str) and (uri != ''):
+            return True
         else:
             return False
 
@@ -113,17 +529,17 @@ class Entity:
             a dictionary with keys that match the names of columns in the Entity's summary dataframe.
         """
 
-        cols = self.summary.columns.to_list()
+        cols = list(self.store.columns)
 
         for c in cols:
 
             if c in data.keys():
                 value = data[c]
-                self.summary.loc[0, c] = value
+                self.set_value(c, value)
 
         if 'DOI' in data.keys():
             uri = data['DOI'].replace('http', '').replace('https', '').replace('dx.', '').replace('doi.org/', '').strip()
-            self.summary.loc[0, 'uri'] = 'https://doi.org/' + uri
+            self.set_value('uri', 'https://doi.org/' + uri)
     
     def from_dict(data: dict): # type: ignore
 
@@ -157,7 +573,8 @@ class Entity:
             a Pandas Series with indices that match the names of columns in the Entity's summary dataframe.
         """
 
-        self.summary.loc[0] = series
+        record = {c: series[c] for c in self.store.columns if c in series.index}
+        self.store.set_record(self.row, record)
 
     def from_series(data: pd.Series): # type: ignore
 
@@ -469,6 +886,125 @@ class Entities:
             self.summary.drop(labels=i_to_drop, axis=0)
 
 
+    def add_entities(self, entities: list, data = None):
+
+        """
+        Adds a list of Entity objects to the collection using a single concatenation, rather than one per Entity.
+
+        Parameters
+        ----------
+        entities : list
+            a list of Entity objects.
+        data : list
+            Optional: a list of data associated with each Entity. Defaults to the Entities' summary data.
+        """
+
+        id_col = None
+        if 'author_id' in self.summary.columns:
+            id_col = 'author_id'
+        if 'funder_id' in self.summary.columns:
+            id_col = 'funder_id'
+        if 'affiliation_id' in self.summary.columns:
+            id_col = 'affiliation_id'
+
+        existing_ids = set(self.all.keys())
+        if id_col is not None:
+            existing_ids.update(self.summary[id_col].astype(str).to_list())
+
+        records = []
+
+        for i in range(0, len(entities)):
+
+            entity = entities[i]
+            record = entity.to_dict()
+            entity_id = str(record.get(id_col))
+
+            if entity_id in existing_ids:
+                print(f'Warning: {entity_id} is already in {type(self).__name__.lower()}')
+
+            existing_ids.add(entity_id)
+            self.all[entity_id] = entity
+            records.append(record)
+
+            if (data is not None) and (i < len(data)):
+                self.data.append(data[i])
+            else:
+                self.data.append({0: record})
+
+        if len(records) > 0:
+            columns = list(self.summary.columns) + [c for c in records[0].keys() if c not in self.summary.columns]
+            new_rows = pd.DataFrame(records, columns = columns, dtype = object)
+            self.summary = pd.concat([self.summary, new_rows])
+            self.summary = self.summary.reset_index().drop('index', axis=1)
+
+        return self
+
+    def change_tracker(self) -> ChangeTracker:
+
+        """
+        Returns the Entities collection's change tracker, which records the summary rows that are new or have changed since syncing, formatting and deduplication last ran.
+        """
+
+        global change_trackers
+
+        if self not in change_trackers:
+
+            id_col = None
+            if 'author_id' in self.summary.columns:
+                id_col = 'author_id'
+            if 'funder_id' in self.summary.columns:
+                id_col = 'funder_id'
+            if 'affiliation_id' in self.summary.columns:
+                id_col = 'affiliation_id'
+
+            change_trackers[self] = ChangeTracker(key_column = id_col)
+
+        return change_trackers[self]
+
+    def string_view(self) -> StringView:
+
+        """
+        Returns the Entities collection's string view, which caches the summary dataframe's columns as strings for matching. Cells are converted again when they change.
+        """
+
+        global string_views
+
+        if self not in string_views:
+            string_views[self] = StringView()
+
+        return string_views[self]
+
+    def mark_changed(self, indexes):
+
+        """
+        Marks summary rows as changed, so that syncing, formatting and deduplication process them again.
+
+        Parameters
+        ----------
+        indexes : list
+            index labels of the changed rows.
+        """
+
+        if type(indexes) != list:
+            indexes = [indexes]
+
+        self.change_tracker().mark(indexes)
+
+        return self
+
+    def changed_rows(self, name: str) -> list:
+
+        """
+        Returns the index labels of summary rows which are new or have changed since a processing pass last ran.
+
+        Parameters
+        ----------
+        name : str
+            name of the processing pass (e.g. 'sync', 'dedup', 'affiliations').
+        """
+
+        return self.change_tracker().pending(self.summary, name)
+
     def merge(self, entities):
 
         """
@@ -566,57 +1102,22 @@ class Entities:
             query = input('Search query').strip()
 
         query = query.strip()
-
-        all_str = self.summary.copy(deep=True).astype(str)
         
         if ignore_case == True:
             query = query.lower()
-            for c in all_str.columns:
-                all_str[c] = all_str[c].str.lower()
-            
 
-        cols = self.summary.columns
+        view = self.string_view()
 
-        for c in cols:
+        for c in self.summary.columns:
 
-            if '_id' in c:
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if (c == 'name') or (c == 'full_name'):
-                res = all_str[all_str[c] == query]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'uri':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'orcid':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'google_scholar':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'scopus':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if (c == 'crossref_id') or (c == 'crossref'):
-                res = all_str[all_str[c] == query]
-                if len(res) > 0:
+            if ('_id' in c) or (c in ['uri', 'orcid', 'google_scholar', 'scopus']):
+                col_str = view.column(self.summary, c, ignore_case=ignore_case)
+                if col_str.str.contains(query).any() == True:
                     return True
             
-            if (c == 'website') or (c == 'link'):
-                res = all_str[all_str[c] == query]
-                if len(res) > 0:
+            if c in ['name', 'full_name', 'crossref_id', 'crossref', 'website', 'link']:
+                col_str = view.column(self.summary, c, ignore_case=ignore_case)
+                if (col_str == query).any() == True:
                     return True
             
         return False
@@ -645,15 +1146,13 @@ class Entities:
 
         cols = [c for c in self.summary.columns if (('_id' in c) or (c == 'uri'))]
 
-        masked_indexes = []
+        view = self.string_view()
+        mask = pd.Series(False, index=self.summary.index)
+
         for col in cols:
-                col_str = self.summary[col].copy(deep=True).astype(str).str.lower()
-                indexes = col_str[col_str.str.contains(query)].index.to_list()
-                masked_indexes = masked_indexes + indexes
+            mask = mask | view.column(self.summary, col).str.contains(query)
         
-        masked_indexes = list(set(masked_indexes))
-        all_res = self.summary.loc[masked_indexes].copy(deep=True)
-        final_indexes = all_res.astype(str).drop_duplicates().index
+        final_indexes = view.frame(self.summary, ignore_case=False)[mask].drop_duplicates().index
         result = self.summary.loc[final_indexes]
 
         return result
@@ -708,14 +1207,12 @@ class Entities:
         
         else:
             query = query.lower()
-            masked_indexes = []
+
+            view = self.string_view()
+            mask = pd.Series(False, index=self.summary.index)
+
             for col in self.summary.columns:
-                col_str = self.summary[col].copy(deep=True).astype(str).str.lower()
-                indexes = col_str[col_str.str.contains(query)].index.to_list()
-                masked_indexes = masked_indexes + indexes
-                
-            masked_indexes = list(set(masked_indexes))
-            all_res = self.summary.loc[masked_indexes].copy(deep=True)
+                mask = mask | view.column(self.summary, col).str.contains(query)
 
             if 'affiliations' in self.summary.columns:
 
@@ -725,15 +1222,14 @@ class Entities:
                     
                     a = affils[i]
                     
-                    if 'search' in a.__dir__():
+                    if (mask[i] == False) and ('search' in a.__dir__()):
 
                         a_res = a.search(query)
                         val = len(a_res)
                         if val > 0:
-                            series = self.summary.loc[i]
-                            all_res.loc[i] = series
+                            mask[i] = True
                 
-            final_indexes = all_res.astype(str).drop_duplicates().index
+            final_indexes = view.frame(self.summary, ignore_case=False)[mask].drop_duplicates().index
             
             result = self.summary.loc[final_indexes]
 
@@ -1,4 +1,5 @@
-from ..utils.cleaners import deduplicate
+from ..utils.cleaners import deduplicate, deduplicate_changed
+from ..utils.lazy import materialize
 from ..importers.crossref import search_funder_works, lookup_funder
 from ..datasets.stopwords.stopwords import all_stopwords
 
@@ -13,6 +14,20 @@ import numpy as np
 
 from nltk.tokenize import word_tokenize # type: ignore
 
+funder_cols = [
+                'funder_id',
+                'name',
+                'alt_names',
+                'location',
+                'email',
+                'uri',
+                'crossref_id',
+                'work_count',
+                'tokens',
+                'website',
+                'other_links'
+                ]
+
 def generate_funder_id(funder_data: pd.Series):
 
         """
@@ -122,6 +137,10 @@ class Funder(Entity):
         a Results dataframe containing data on the Funder's publications.
     """
 
+    __slots__ = ()
+
+    columns = funder_cols
+
     def __init__(self,
                  funder_id: str = None, # type: ignore
                  name: str = None, # type: ignore
@@ -194,34 +213,17 @@ class Funder(Entity):
             tokens = [i.strip() for i in tokens]
         
 
-        self.summary = pd.DataFrame(columns = [
-                                'funder_id',
-                                'name',
-                                'alt_names',
-                                'location',
-                                'email',
-                                'uri',
-                                'crossref_id',
-                                'work_count',
-                                'tokens',
-                                'website',
-                                'other_links'
-                                ],
-                                dtype = object)
-        
-        
-        self.summary.loc[0] = pd.Series(dtype=object)
-        self.summary.loc[0, 'funder_id'] = funder_id
-        self.summary.loc[0, 'name'] = name
-        self.summary.at[0, 'alt_names'] = alt_names
-        self.summary.loc[0, 'location'] = location
-        self.summary.loc[0, 'email'] = email
-        self.summary.loc[0, 'uri'] = uri
-        self.summary.loc[0, 'crossref_id'] = crossref_id
-        self.summary.loc[0, 'work_count'] = work_count   
-        self.summary.at[0, 'tokens'] = tokens
-        self.summary.loc[0, 'website'] = website
-        self.summary.at[0, 'other_links'] = other_links
+        self.set_value('funder_id', funder_id)
+        self.set_value('name', name)
+        self.set_value('alt_names', alt_names)
+        self.set_value('location', location)
+        self.set_value('email', email)
+        self.set_value('uri', uri)
+        self.set_value('crossref_id', crossref_id)
+        self.set_value('work_count', work_count)
+        self.set_value('tokens', tokens)
+        self.set_value('website', website)
+        self.set_value('other_links', other_links)
 
         # self.publications = Results()
 
@@ -241,7 +243,7 @@ class Funder(Entity):
             a funder ID.
         """
 
-        funder_data = self.summary.loc[0]
+        funder_data = self.to_series()
 
         funder_id = generate_funder_id(funder_data) # type: ignore
         return funder_id
@@ -252,11 +254,11 @@ class Funder(Entity):
         Replaces the Funder's existing unique identifier with a newly generated unique identifier based on the Funder's data.
         """
 
-        current_id = self.summary.loc[0, 'funder_id']
+        current_id = self.get_value('funder_id')
 
         if (current_id == None) or (current_id == 'None') or (current_id == '') or (current_id == 'F:000'):
             auth_id = self.generate_id()
-            self.summary.loc[0, 'funder_id'] = auth_id
+            self.set_value('funder_id', auth_id)
         
     
     def __getitem__(self, key):
@@ -275,11 +277,14 @@ class Funder(Entity):
             an object associated with the inputted key.
         """
         
+        if key == 'summary':
+            return self.summary
+
         if key in self.__dict__.keys():
             return self.__dict__[key]
         
-        if key in self.summary.columns:
-            return self.summary.loc[0, key]
+        if key in self.store.columns:
+            return self.get_value(key)
         
         # if key in self.publications.columns:
         #     return self.publications[key]
@@ -290,7 +295,7 @@ class Funder(Entity):
         Defines how Funder objects are represented in string form.
         """
 
-        return str(self.summary.loc[0, 'name'])
+        return str(self.get_value('name'))
 
     def has_uri(self) -> bool:
 
@@ -298,7 +303,7 @@ class Funder(Entity):
         Returns True if the Funder has a URI associated. Else, returns False.
         """
 
-        uri = self.summary.loc[0, 'uri']
+        uri = self.get_value('uri')
 
         if (type(uri) == str) and (uri != ''):
             return True
@@ -313,11 +318,11 @@ class Funder(Entity):
 
         if 'name' in data.keys():
             name = data['name']
-            self.summary.loc[0, 'name'] = name
+            self.set_value('name', name)
 
         if 'doi' in data.keys():
             uri = data['doi'].replace('http', '').replace('https', '').replace('dx.', '').replace('doi.org/', '').strip()
-            self.summary.loc[0, 'uri'] = 'https://doi.org/' + uri
+            self.set_value('uri', 'https://doi.org/' + uri)
     
     def from_dict(data: dict, use_api=False): # type: ignore
 
@@ -345,14 +350,6 @@ class Funder(Entity):
 
         return funder
         
-    def add_series(self, series: pd.Series):
-
-        """
-        Adds a Pandas Series object to the Funder's summary dataframe.
-        """
-
-        self.summary.loc[0] = series
-
     def from_series(data: pd.Series): # type: ignore
 
         """
@@ -423,51 +420,51 @@ class Funder(Entity):
         if 'name' in crossref_result.index:
             name = crossref_result['name']
         else:
-            name = self.summary.loc[0, 'name']
+            name = self.get_value('name')
 
         if 'alt-names' in crossref_result.index:
             alt_names = crossref_result['alt-names']
         else:
-            alt_names = self.summary.loc[0, 'alt_names']
+            alt_names = self.get_value('alt_names')
 
         if 'location' in crossref_result.index:
             location = crossref_result['location']
         else:
-            location = self.summary.loc[0, 'location']
+            location = self.get_value('location')
 
         if 'email' in crossref_result.index:
             email = crossref_result['email']
         else:
-            email = self.summary.loc[0, 'email']
+            email = self.get_value('email')
 
         if 'uri' in crossref_result.index:
             uri  =crossref_result['uri']
         else:
-            uri = self.summary.loc[0, 'uri']
+            uri = self.get_value('uri')
 
         if 'id' in crossref_result.index:
             crossref_id = crossref_result['id']
         else:
-            crossref_id = self.summary.loc[0, 'crossref_id']
+            crossref_id = self.get_value('crossref_id')
 
         if 'work-count' in crossref_result.index:
             work_count = crossref_result['work-count']
         else:
-            work_count = self.summary.loc[0, 'work_count']
+            work_count = self.get_value('work_count')
 
         if 'tokens' in crossref_result.index:
             tokens = crossref_result['tokens']
         else:
-            tokens = self.summary.loc[0, 'tokens']
+            tokens = self.get_value('tokens')
         
-        self.summary.loc[0, 'name'] = name
-        self.summary.loc[0, 'alt_names'] = alt_names
-        self.summary.loc[0, 'location'] = location
-        self.summary.loc[0, 'email'] = email
-        self.summary.loc[0, 'uri'] = uri
-        self.summary.loc[0, 'crossref_id'] = crossref_id
-        self.summary.loc[0, 'work_count'] = work_count
-        self.summary.loc[0, 'tokens'] = tokens
+        self.set_value('name', name)
+        self.set_value('alt_names', alt_names)
+        self.set_value('location', location)
+        self.set_value('email', email)
+        self.set_value('uri', uri)
+        self.set_value('crossref_id', crossref_id)
+        self.set_value('work_count', work_count)
+        self.set_value('tokens', tokens)
     
     def from_crossref_result(crossref_result: pd.Series): # type: ignore
 
@@ -579,9 +576,9 @@ class Funder(Entity):
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         """
 
-        uid = self.summary.loc[0,'crossref_id']
+        uid = self.get_value('crossref_id')
         if uid == None:
-            uid = self.summary.loc[0,'uri']
+            uid = self.get_value('uri')
             if uid == None:
                 uid = ''
 
@@ -600,9 +597,9 @@ class Funder(Entity):
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         """
 
-        uid = self.summary.loc[0,'uri']
+        uid = self.get_value('uri')
         if uid == None:
-            uid = self.summary.loc[0,'crossref']
+            uid = self.get_value('crossref')
             if uid == None:
                 uid = ''
 
@@ -680,9 +677,9 @@ class Funder(Entity):
             results from CrossRef API search.
         """
 
-        uid = self.summary.loc[0, 'crossref_id']
+        uid = self.get_value('crossref_id')
         if (uid == None) or (uid == ''):
-            uid = self.summary.loc[0, 'uri']
+            uid = self.get_value('uri')
             if (uid == None) or (uid == ''):
                 uid = ''
         
@@ -770,7 +767,7 @@ class Funders(Entities):
         if (type(funders_data) == list) and (type(funders_data[0]) == Funder):
 
             for i in funders_data:
-                fu = i.summary.copy(deep=True)
+                fu = i.to_dataframe()
                 self.summary = pd.concat([self.summary, fu])
 
             self.summary = self.summary.reset_index().drop('index',axis=1)
@@ -786,7 +783,7 @@ class Funders(Entities):
                     for f in funders_data.keys():
                         
                         index = len(self.summary)
-                        fu = f.summary.copy(deep=True)
+                        fu = f.to_dataframe()
                         self.summary = pd.concat([self.summary, fu])
                         self.summary.loc[index, 'funder_id'] = f
 
@@ -958,20 +955,20 @@ class Funders(Entities):
 
         funder.update_id()
 
-        funder_id = str(funder.summary.loc[0, 'funder_id'])
+        funder_id = str(funder.get_value('funder_id'))
 
         # if funder_id in self.summary['funder_id'].to_list():
         #     id_count = len(self.summary[self.summary['funder_id'].str.contains(funder_id)]) # type: ignore
         #     funder_id = funder_id + f'#{id_count + 1}'
         #     funder.summary.loc[0, 'funder_id'] = funder_id
 
-        self.summary = pd.concat([self.summary, funder.summary])
+        self.summary = pd.concat([self.summary, funder.to_dataframe()])
         self.summary = self.summary.reset_index().drop('index', axis=1)
 
         self.all[funder_id] = funder
 
         if data is None:
-            data = funder.summary.to_dict(orient='index')
+            data = {0: funder.to_dict()}
         
         self.data.append(data)
 
@@ -1025,13 +1022,15 @@ class Funders(Entities):
         df['name'] = df['name'].replace('no_name_given', None)
         df = df.dropna(axis=0, how='all')
         drop_cols = [c for c in df.columns if c not in ignore_cols]
-        df = df.dropna(axis=0, how='all', subset=drop_cols).reset_index().drop('index', axis=1)
+        df = df.dropna(axis=0, how='all', subset=drop_cols)
+        self.change_tracker().relabel(df.index.to_list())
+        df = df.reset_index().drop('index', axis=1)
 
         self.summary = df
 
         return self
 
-    def remove_duplicates(self, drop_empty_rows = True, sync = False):
+    def remove_duplicates(self, drop_empty_rows = True, sync = False, changed_only = False):
 
         """
         Removes duplicate Funder entries from the Funders collection.
@@ -1042,6 +1041,8 @@ class Funders(Entities):
             whether to remove rows which do not contain any data. Defaults to True.
         sync : bool
             whether to synchronise the Funders.summary dataframe with the Funders.all dictionary. Defaults to False.
+        changed_only : bool
+            whether to only compare entries which are new or have changed since duplicates were last removed, and entries which share an identifier or name with them. Defaults to False.
         
         Returns
         -------
@@ -1056,10 +1057,20 @@ class Funders(Entities):
         df['uri'] = df['uri'].str.replace('http://', '', regex=False).str.replace('https://', '', regex=False).str.replace('wwww.', '', regex=False).str.replace('dx.', '', regex=False).str.replace('doi.org/', '', regex=False).str.strip('/')
         
         df = df.sort_values(by = ['uri', 'crossref_id', 'website', 'name']).reset_index().drop('index', axis=1)
-        self.summary = deduplicate(self.summary)
+
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            deduplicated = deduplicate_changed(self.summary, changed = tracker.pending(self.summary, 'dedup'))
+        else:
+            deduplicated = deduplicate(self.summary, reset_index = False)
+
+        tracker.relabel(deduplicated.index.to_list())
+        self.summary = deduplicated.reset_index().drop('index', axis=1)
+        tracker.done(self.summary, 'dedup')
 
         if sync == True:
-            self.sync_summary(drop_duplicates=False, drop_empty_rows=False)
+            self.sync_summary(drop_duplicates=False, drop_empty_rows=False, changed_only=changed_only)
 
         return self
 
@@ -1079,7 +1090,7 @@ class Funders(Entities):
         for i in self.all.keys():
             funder = self.all[i]
             funder.update_id()
-            series = funder.summary.copy(deep=True).loc[0]
+            series = funder.to_series()
             all = self.summary.copy(deep=True).astype(str)
             indexes = all[all['funder_id'] == i].index.to_list()
             if len(indexes) > 0:
@@ -1094,7 +1105,7 @@ class Funders(Entities):
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=drop_empty_rows)
 
-    def sync_summary(self, drop_duplicates = False, drop_empty_rows=False):
+    def sync_summary(self, drop_duplicates = False, drop_empty_rows=False, changed_only = False):
 
         """
         Updates all Funder objects in the Funders.all dictionary using the Funders.summary dataframe.
@@ -1105,17 +1116,31 @@ class Funders(Entities):
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to False.
+        changed_only : bool
+            whether to only update Funder objects for rows which are new or have changed since the last sync. Defaults to False.
         """
 
-        self.update_ids(sync=False)
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            indexes = tracker.pending(self.summary, 'sync')
+        else:
+            indexes = None
+
+        self.update_ids(sync=False, indexes=indexes)
 
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=changed_only)
 
-        for i in self.summary.index:
+        if changed_only == True:
+            indexes = tracker.pending(self.summary, 'sync')
+        else:
+            indexes = self.summary.index.to_list()
+
+        for i in indexes:
 
             f_data = self.summary.loc[i]
             f_id = f_data['funder_id']
@@ -1131,18 +1156,20 @@ class Funders(Entities):
                 self.all[f_id] = f
         
         keys = list(self.all.keys())
+        f_ids = set(self.summary['funder_id'].to_list())
         for key in keys:
-            f_ids = self.summary['funder_id'].to_list()
             if key not in f_ids:
                 del self.all[key]
 
+        tracker.done(self.summary, 'sync')
+
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=drop_empty_rows)
 
-    def sync(self, drop_duplicates = False, drop_empty_rows=False):
+    def sync(self, drop_duplicates = False, drop_empty_rows=False, changed_only = False):
         
         """
         Synchronises the Funders.summary dataframe with the Funder objects in the Funders.all dictionary.
@@ -1153,19 +1180,21 @@ class Funders(Entities):
             whether to remove rows which do not contain any data. Defaults to False.
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to False.
+        changed_only : bool
+            whether to only update Funder objects for summary rows which are new or have changed since the last sync. Defaults to False.
         """
 
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=changed_only)
 
         all_len = len(self.summary)
         details_len = len(self.all)
 
         if all_len > details_len:
-            self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
+            self.sync_summary(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows, changed_only=changed_only)
             return
         else:
             if details_len > all_len:
@@ -1176,7 +1205,7 @@ class Funders(Entities):
                 self.sync_all(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
                 return
 
-    def update_ids(self, sync=False):
+    def update_ids(self, sync=False, indexes = None):
         
         """
         Updates funder IDs for all rows in the Funders.summary dataframe.
@@ -1185,12 +1214,17 @@ class Funders(Entities):
         ----------
         sync : bool
             whether to synchronise the Funders.summary dataframe with the Funder objects in the Funders.all dictionary. Defaults to False.
+        indexes : list
+            index labels of rows to update. Defaults to all rows.
         """
 
         if sync == True:
             self.sync()
 
-        for i in self.summary.index:
+        if indexes is None:
+            indexes = self.summary.index
+
+        for i in indexes:
             all_copy = self.summary.copy(deep=True)
             data = all_copy.loc[i]
             old_id = all_copy.loc[i, 'funder_id']
@@ -1208,12 +1242,12 @@ class Funders(Entities):
 
             if old_id in self.all.keys():
                 self.all[new_id] = self.all[old_id]
-                self.all[new_id].summary.loc[0, 'funder_id'] = new_id
+                self.all[new_id].set_value('funder_id', new_id)
                 del self.all[old_id]
 
             else:
                 funder = Funder.from_series(data) # type: ignore
-                funder.summary.loc[0, 'funder_id'] = new_id
+                funder.set_value('funder_id', new_id)
                 self.all[new_id] = funder
 
     def update_from_crossref(self, drop_duplicates = False, drop_empty_rows=False):
@@ -1234,7 +1268,7 @@ class Funders(Entities):
         for a in funder_ids:
 
             self.all[a].update_from_crossref()
-            details = self.all[a].summary.loc[0]
+            details = self.all[a].to_series()
             
             df_index = self.summary[self.summary['funder_id'] == a].index.to_list()[0]
             self.summary.loc[df_index] = details
@@ -1545,6 +1579,7 @@ def format_funders(funder_data, use_api = False, drop_duplicates = False, drop_e
             whether to remove duplicated rows. Defaults to False.
         """
 
+        funder_data = materialize(funder_data)
         result = Funders()
 
         funder_type = type(funder_data)
@@ -1,5 +1,6 @@
 from ..utils.basics import results_cols
 from ..importers.crossref import references_to_df
+from ..utils.lazy import materialize
 from .results import Results
 
 import pandas as pd
@@ -187,6 +188,7 @@ def format_references(references_data, add_work_ids = True, update_from_doi = Fa
             whether to update the References data using the CrossRef API. Defaults to False.
     """
 
+    references_data = materialize(references_data)
     refs = References()
 
     if type(references_data) == References:
@@ -1,9 +1,17 @@
 from ..utils.basics import results_cols
-from ..utils.cleaners import strip_list_str, deduplicate
+from ..utils.cleaners import strip_list_str, deduplicate, deduplicate_changed, find_near_duplicate_pairs, merge_near_duplicates, merge_cells, is_empty_cell
+from ..utils.indexes import IdentifierIndex, KeywordIndex, EntityIndex, StringView, id_cols
+from ..utils.ranking import BM25Index
+from ..utils.changes import ChangeTracker, set_column_values, changed_labels, TrackedLocIndexer, TrackedILocIndexer, TrackedAtIndexer, TrackedIAtIndexer
+from ..utils.lazy import LazyValue, use_lazy, materialize, materialize_column
+from ..utils.parallel import parallel_map
+from ..utils import storage
 from ..importers.pdf import read_pdf_to_table
-from ..importers.jstor import import_jstor
-from ..importers.bibtex import import_bibtex
-from ..importers.crossref import lookup_doi, lookup_dois
+from ..importers.jstor import import_jstor, read_jstor_chunks, jstor_file_type
+from ..importers.bibtex import import_bibtex, read_bibtex_chunks
+from ..exporters.bibtex_exporters import row_to_pybtex, write_bibtex
+from ..importers.chunked import read_csv_chunks, read_json_chunks, read_excel_chunks
+from ..importers.crossref import lookup_doi, lookup_dois, resolve_dois, items_to_df
 from ..datasets import stopwords
 
 from .entities import Entity, Entities
@@ -14,7 +22,7 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from nltk.tokenize import word_tokenize # type: ignore
-# from pybtex.database import BibliographyData, Entry #type: ignore
+from pybtex.database import BibliographyData # type: ignore
 
 def generate_work_id(work_data: pd.Series):
     
@@ -37,15 +45,16 @@ def generate_work_id(work_data: pd.Series):
         work_id = 'W:'
         
         if 'authors' in work_data.index:
-            auths_type = type(work_data['authors'])
+            authors = materialize(work_data['authors'])
+            auths_type = type(authors)
             auths_type_str = str(auths_type)
 
             if auths_type == list:
-                work_data['authors'] = pd.Series(work_data['authors'],  dtype=object).sort_values().to_list()
+                work_data['authors'] = pd.Series(authors,  dtype=object).sort_values().to_list()
             
             else:
                 if '.Authors' in auths_type_str:
-                    work_data['authors'] = work_data['authors'].summary['full_name'].sort_values().to_list()
+                    work_data['authors'] = authors.summary['full_name'].sort_values().to_list()
             
 
         work_data = work_data.astype(str).str.lower()
@@ -122,6 +131,119 @@ def generate_work_id(work_data: pd.Series):
 
         return work_id
 
+def generate_work_ids(dataframe: pd.DataFrame) -> pd.Series:
+
+        """
+            Takes a Pandas DataFrame containing details about published works and returns a unique identifier code (work ID) for every row.
+
+            Produces the same work IDs as applying generate_work_id to each row, but processes each column in a single pass. Titles are tokenized once per unique title.
+
+            Parameters
+            ----------
+            dataframe : pandas.DataFrame
+                a dataframe containing data on published works.
+
+            Returns
+            -------
+            work_ids : pandas.Series
+                a series of work IDs with the same index as the dataframe.
+        """
+
+        index = dataframe.index
+
+        if len(index) == 0:
+            return pd.Series(dtype=object, index=index)
+
+        def get_column(name, prepare = None):
+
+            # Returns a mask of rows with data in the column, and the column's data as lowercase strings
+            if name not in dataframe.columns:
+                return pd.Series(False, index=index), pd.Series('', index=index, dtype=object)
+
+            col = dataframe[name]
+            present = ~col.isna()
+            col = col.astype(object).where(present, '')
+
+            if prepare is not None:
+                col = col.map(prepare)
+
+            col_str = col.map(str).str.lower().where(present, '')
+
+            return present, col_str
+
+        def sort_authors(authors):
+
+            authors = materialize(authors)
+
+            if type(authors) == list:
+                return pd.Series(authors,  dtype=object).sort_values().to_list()
+
+            if '.Authors' in str(type(authors)):
+                return authors.summary['full_name'].sort_values().to_list()
+
+            return authors
+
+        title_cache = {}
+
+        def shorten_title(title):
+
+            if title in title_cache:
+                return title_cache[title]
+
+            title_words = list(word_tokenize(title.strip().lower()))
+            title_first2 = '-'.join(title_words[:2])
+            if len(title_words) > 3:
+                title_last = title_words[-1]
+            else:
+                title_last = ''
+            title_shortened = (title_first2 + '-' + title_last)[:15] # capping at 15 characters to avoid overly long UIDs
+
+            title_cache[title] = title_shortened
+
+            return title_shortened
+
+        has_authors, authors = get_column('authors', prepare = sort_authors)
+        has_title, titles = get_column('title')
+        has_date, dates = get_column('date')
+        has_doi, dois = get_column('doi')
+        has_isbn, isbns = get_column('isbn')
+        has_issn, issns = get_column('issn')
+        has_link, links = get_column('link')
+
+        work_ids = pd.Series('W:', index=index, dtype=object)
+
+        # First author's surname
+        has_authors = has_authors & (authors != '') & (authors != '[]')
+        first_authors = authors.str.strip().str.replace('[','', regex=False).str.replace(']','', regex=False).str.replace("'", "", regex=False).str.replace('"', '', regex=False)
+        first_authors = first_authors.str.split(',').str[0].str.strip().str.split(' ').str[-1]
+        work_ids = work_ids + ('-' + first_authors).where(has_authors, '')
+
+        # Shortened title
+        has_title = has_title & (titles != '')
+        titles_shortened = titles.where(has_title, '').map(shorten_title)
+        work_ids = work_ids + ('-' + titles_shortened).where(has_title, '')
+
+        # Date
+        has_date = has_date & (dates != '')
+        work_ids = work_ids + ('-' + dates).where(has_date, '')
+
+        # Unique identifier: DOI, falling back to ISBN, ISSN, and link when a DOI entry is blank
+        uids = dois.where(has_doi, '')
+        uids = uids.where(~(has_doi & (uids == '') & has_isbn), isbns)
+        uids = uids.where(~(has_doi & (uids == '') & has_issn), issns)
+        uids = uids.where(~(has_doi & (uids == '') & has_link), links.str[:15]) # keeping URLs short as these can produce very long IDs
+
+        uids_shortened = uids.str.replace('https://', '', regex=False).str.replace('http://', '', regex=False).str.replace('www.', '', regex=False).str.replace('doi.org.','', regex=False).str.replace('scholar.google.com/','', regex=False).str[:23] # DOIs are 23 characters long
+
+        work_ids = work_ids + '-' + uids_shortened
+
+        for old, new in [('W:-', 'W:'), ("'s", ''), ('\r', ''), ('\n', ''), ("'", ""), ('"', ''), ('(',''), (')',''), ('`',''), ('.', ''), ('’',''), ('--', '-'), ('W:-', 'W:')]:
+            work_ids = work_ids.str.replace(old, new, regex=False)
+
+        work_ids = work_ids.str.strip('-').astype(object)
+
+        return work_ids
+
 class Results(pd.DataFrame):
 
     """
@@ -217,6 +339,10 @@ class Results(pd.DataFrame):
     * **link**: a URL or other link to the result.
     """
 
+    # Storing the identifier index as an internal attribute so that Pandas does not treat it as a column
+    _internal_names = pd.DataFrame._internal_names + ['_id_index', '_text_index', '_rank_index', '_string_view', '_staged', '_batch', '_changes', '_compact']
+    _internal_names_set = set(_internal_names)
+
     def __init__(self, dataframe = None, index = []):
         
         """
@@ -239,211 +365,1195 @@ class Results(pd.DataFrame):
                             ) 
             
             self.replace(np.nan, None)
+
+            if storage.compact_default == True:
+                self._compact = True
+        
+        else:
+            df = dataframe
+            if type(dataframe) == pd.DataFrame:
+                self = Results.from_dataframe(dataframe = df)
+
+    def drop_empty_rows(self):
+
+        """
+        Drops rows that contain no data.
+        """
+
+
+        ignore_cols = ['work_id', 'authors', 'funder', 'citations']
+
+        id_index = self.id_index(build=False)
+        text_indexes = self.text_indexes()
+
+        df = self.dropna(axis=0, how='all')
+        drop_cols = [c for c in df.columns if c not in ignore_cols]
+        df = df.dropna(axis=0, how='all', subset=drop_cols)
+        kept_rows = df.index.to_list()
+        df = df.reset_index().drop('index', axis=1)
+
+        results = Results.from_dataframe(dataframe=df, drop_duplicates=False) # type: ignore
+
+        self.__dict__.update(results.__dict__)
+
+        if id_index is not None:
+            self._id_index = id_index.relabel(kept_rows).stamp(self)
+
+        for text_index in text_indexes:
+            text_index.relabel(kept_rows)
+
+        self.change_tracker().relabel(kept_rows)
+        self.update_storage()
+
+        return self
+
+    def remove_duplicates(self, drop_empty_rows = True, use_api = False, changed_only = False):
+
+        """
+        Removes duplicate results.
+
+        Parameters
+        ----------
+        drop_empty_rows : bool
+            whether to remove rows which do not contain any data. Defaults to True.
+        use_api : bool
+            whether to update the results data using all available APIs. Defaults to False.
+        changed_only : bool
+            whether to only compare results which are new or have changed since duplicates were last removed, and results which share an identifier or title with them. Defaults to False.
+        
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
+
+        if drop_empty_rows == True:
+            self.drop_empty_rows()
+
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            changed = tracker.pending(self, 'dedup')
+            if len(changed) == 0:
+                return self
+
+        self['doi'] = self['doi'].str.replace('https://', '', regex = False).str.replace('http://', '', regex = False).str.replace('dx.', '', regex = False).str.replace('doi.org/', '', regex = False).str.replace('doi/', '', regex = False)
+
+        if changed_only == True:
+            df = deduplicate_changed(self, changed = changed)
+        else:
+            df = deduplicate(self, reset_index = False)
+
+        kept_rows = df.index.to_list()
+        tracker.relabel(kept_rows)
+        self._changes = tracker
+
+        text_indexes = self.text_indexes()
+        for text_index in text_indexes:
+            text_index.relabel(kept_rows)
+
+        results = Results.from_dataframe(dataframe = df, drop_duplicates=False)
+        results._changes = tracker
+
+        if use_api == True:
+            results.update_from_dois()
+        
+        results.update_work_ids(changed_only = changed_only)
+        df2 = results.drop_duplicates(subset='work_id')
+        kept_rows = df2.index.to_list()
+        df2 = df2.reset_index().drop('index',axis=1)
+
+        results2 = Results.from_dataframe(dataframe=df2, drop_duplicates=False) # type: ignore
+        
+        self.__dict__.update(results2.__dict__)
+        self._id_index = None
+        self._changes = tracker.relabel(kept_rows).done(self, 'dedup')
+
+        for text_index in text_indexes:
+            text_index.relabel(kept_rows)
+        self.update_storage()
+
+        return self
+
+    def find_near_duplicates(self, threshold: float = 0.8, num_perm: int = 128) -> pd.DataFrame:
+
+        """
+        Finds pairs of results which are likely to be the same work despite small differences (e.g. punctuation, subtitles, abbreviated author lists).
+
+        Parameters
+        ----------
+        threshold : float
+            minimum similarity (0 to 1) of the results' titles and first authors. Defaults to 0.8.
+        num_perm : int
+            number of MinHash permutations. More permutations improve accuracy at the cost of speed. Defaults to 128.
+        
+        Returns
+        -------
+        pairs : pandas.DataFrame
+            a dataframe of near-duplicate pairs, sorted by similarity.
+        
+        Notes
+        -----
+        Uses MinHash locality-sensitive hashing to find candidate pairs without comparing every pair of results. Candidates are verified using the Jaccard similarity of their character shingles.
+        """
+
+        pairs = find_near_duplicate_pairs(self, threshold = threshold, num_perm = num_perm)
+        cols = ['index_1', 'work_id_1', 'title_1', 'index_2', 'work_id_2', 'title_2', 'similarity']
+
+        if len(pairs) == 0:
+            return pd.DataFrame(columns = cols)
+
+        positions_1 = [i for i, j, similarity in pairs]
+        positions_2 = [j for i, j, similarity in pairs]
+
+        df = pd.DataFrame({
+                        'index_1': self.index[positions_1],
+                        'work_id_1': self['work_id'].iloc[positions_1].to_list(),
+                        'title_1': self['title'].iloc[positions_1].to_list(),
+                        'index_2': self.index[positions_2],
+                        'work_id_2': self['work_id'].iloc[positions_2].to_list(),
+                        'title_2': self['title'].iloc[positions_2].to_list(),
+                        'similarity': [similarity for i, j, similarity in pairs]
+                        })
+        
+        df = df.sort_values('similarity', ascending=False).reset_index().drop('index', axis=1)
+
+        return df
+
+    def remove_near_duplicates(self, threshold: float = 0.8, num_perm: int = 128):
+
+        """
+        Merges results which are likely to be the same work despite small differences (e.g. punctuation, subtitles, abbreviated author lists).
+
+        Parameters
+        ----------
+        threshold : float
+            minimum similarity (0 to 1) of the results' titles and first authors for them to be merged. Defaults to 0.8.
+        num_perm : int
+            number of MinHash permutations. Defaults to 128.
         
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
+
+        df = merge_near_duplicates(self, threshold = threshold, num_perm = num_perm)
+        results = Results.from_dataframe(dataframe = df, drop_duplicates=False)
+        results.update_work_ids()
+
+        self.__dict__.update(results.__dict__)
+        self._id_index = None
+        self.record_edit(self.index.to_list())
+
+        return self
+
+    def get(self, work_id: str):
+
+        """
+        Retrieves result using a work ID.
+        """
+
+        indexes = self.lookup_ids(query=work_id, columns=['work_id'], ignore_case=False)
+        if len(indexes) > 0:
+            index = indexes[0]
+            return self.loc[index]
+        else:
+            raise KeyError('work_id not found')
+
+    def id_index(self, build: bool = True):
+
+        """
+        Returns the Results DataFrame's identifier index, which maps work IDs, DOIs, ISBNs, ISSNs, Scopus IDs, WoS IDs, PubMed IDs and links to rows. Rows whose identifiers have been edited in place (e.g. with .loc or .at) since the index was last used are re-indexed before it is returned (see Results.record_edit).
+
+        Parameters
+        ----------
+        build : bool
+            whether to build a new index if the existing index is missing or out of date. If False, returns None instead. Defaults to True.
+
+        Returns
+        -------
+        id_index : IdentifierIndex
+            the identifier index.
+        """
+
+        id_index = self.__dict__.get('_id_index')
+        tracker = self.change_tracker()
+        since = tracker.stamps.get('id_index')
+
+        if (id_index is None) or (since is None) or (id_index.is_current(self) == False):
+
+            if build == False:
+                return None
+
+            id_index = IdentifierIndex(self)
+            self._id_index = id_index
+
+        else:
+            edited = tracker.edited(since, columns = id_index.columns)
+
+            if len(edited) > 0:
+
+                current = [i for i in edited if i in self.index]
+                removed = [i for i in edited if i not in self.index]
+
+                if len(removed) > 0:
+                    id_index.drop_rows(removed)
+
+                if len(current) > 0:
+                    id_index.update_rows(self.loc[current])
+
+                id_index.stamp(self)
+
+        tracker.stamps['id_index'] = tracker.edit_counter
+
+        return id_index
+
+    def lookup_ids(self, query, columns = None, ignore_case: bool = True) -> list:
+
+        """
+        Uses the identifier index to find results with an identifier that matches a query.
+
+        Parameters
+        ----------
+        query : str
+            an identifier to look up.
+        columns : list
+            names of identifier columns to search. Defaults to all indexed columns.
+        ignore_case : bool
+            whether to ignore the case of string data. Defaults to True.
+
+        Returns
+        -------
+        indexes : list
+            index positions of matching results, in the order they appear in the Results DataFrame.
+        """
+
+        query_str = str(query)
+
+        for attempt in range(2):
+
+            id_index = self.id_index(build=True)
+            matches = id_index.lookup(query_str, columns=columns)
+
+            indexes = []
+            stale = False
+
+            for c, i in matches:
+
+                try:
+                    value = str(self.at[i, c])
+                except KeyError:
+                    stale = True
+                    break
+
+                if value.lower() != query_str.lower():
+                    stale = True
+                    break
+
+                if ((ignore_case == True) or (value == query_str)) and (i not in indexes):
+                    indexes.append(i)
+
+            if stale == False:
+                break
+
+            # Rebuilding index if identifiers were changed without updating it
+            self._id_index = None
+
+        positions = self.index.get_indexer(indexes)
+        indexes = [i for _, i in sorted(zip(positions, indexes))]
+
+        return indexes
+
+    def text_index(self, build: bool = True, update: bool = True):
+
+        """
+        Returns the Results DataFrame's keyword index, which maps the words in its text columns (e.g. titles, abstracts, keywords, sources, authors and publishers) to rows. The index is brought up to date with any rows edited since it was last used before it is returned (see Results.refresh_index).
+
+        Parameters
+        ----------
+        build : bool
+            whether to build a new index if none exists. If False, returns None instead. Defaults to True.
+        update : bool
+            whether to bring the index up to date before returning it. Defaults to True.
+
+        Returns
+        -------
+        text_index : KeywordIndex
+            the keyword index.
+        """
+
+        text_index = self.__dict__.get('_text_index')
+
+        if text_index is None:
+
+            if build == False:
+                return None
+
+            text_index = KeywordIndex()
+            self._text_index = text_index
+            self.change_tracker().stamps.pop('text_index', None)
+
+        if update == True:
+            self.refresh_index('text_index', text_index)
+
+        return text_index
+
+    def rank_index(self, fields = None, build: bool = True, update: bool = True):
+
+        """
+        Returns the Results DataFrame's BM25 index, which is used to rank results by relevance. By default, the abstract, description, extract and full text columns are indexed. The index is saved with the Results DataFrame when it is pickled (e.g. as part of a .review file), so that it can be reused in later sessions.
+
+        Parameters
+        ----------
+        fields : list
+            names of columns which must be indexed. If the existing index does not cover them, a new index is built. Defaults to None.
+        build : bool
+            whether to build a new index if none exists. If False, returns None instead. Defaults to True.
+        update : bool
+            whether to bring the index up to date before returning it. Defaults to True.
+
+        Returns
+        -------
+        rank_index : BM25Index
+            the BM25 index.
+        """
+
+        rank_index = self.__dict__.get('_rank_index')
+
+        if fields is None:
+            fields = []
+
+        if (rank_index is None) or (len([c for c in fields if c not in rank_index.columns]) > 0):
+
+            if build == False:
+                return None
+
+            columns = None
+            if rank_index is not None:
+                columns = rank_index.columns + [c for c in fields if c not in rank_index.columns]
+            elif len(fields) > 0:
+                columns = fields
+
+            global stopwords
+            rank_index = BM25Index(columns = columns, stopwords = stopwords['en'])
+            self._rank_index = rank_index
+            self.change_tracker().stamps.pop('rank_index', None)
+
+        if update == True:
+            self.refresh_index('rank_index', rank_index)
+
+        return rank_index
+
+    def string_view(self) -> StringView:
+
+        """
+        Returns the Results DataFrame's string view, which caches its columns as strings for matching. Cells edited since the view was last used are converted again (see Results.refresh_index).
+        """
+
+        string_view = self.__dict__.get('_string_view')
+
+        if string_view is None:
+            string_view = StringView(refresh = False)
+            self._string_view = string_view
+            self.change_tracker().stamps.pop('string_view', None)
+
+        self.refresh_index('string_view', string_view)
+
+        return string_view
+
+    def refresh_index(self, name: str, index):
+
+        """
+        Brings one of the Results DataFrame's indexes up to date, using the change tracker's record of edited cells (see Results.record_edit). Only rows edited in the index's columns since it was last refreshed are re-indexed. Rows which are added, removed or relabelled are handled as the Results DataFrame changes (see Results.text_indexes).
+
+        The whole dataframe is compared with the index when the index has not been refreshed with the current change tracker, or when its number of rows does not match.
+
+        Parameters
+        ----------
+        name : str
+            name of the index, used to record when it was last refreshed.
+        index : KeywordIndex, BM25Index or StringView
+            the index.
+
+        Returns
+        -------
+        index : KeywordIndex, BM25Index or StringView
+            the index.
+        """
+
+        self.flush()
+
+        tracker = self.change_tracker()
+        since = tracker.stamps.get(name)
+
+        if (since is None) or (len(index) != len(self)):
+            index.sync(self)
+
+        else:
+            edited = tracker.edited(since, columns = index.columns)
+
+            if len(edited) > 0:
+
+                current = [i for i in edited if i in self.index]
+                removed = [i for i in edited if i not in self.index]
+
+                if len(removed) > 0:
+                    index.drop_rows(removed)
+
+                if len(current) > 0:
+                    index.update_rows(self.loc[current])
+
+        tracker.stamps[name] = tracker.edit_counter
+
+        return index
+
+    def text_indexes(self) -> list:
+
+        """
+        Returns the Results DataFrame's keyword and BM25 indexes and string view (if they have been built), so that they can be updated when rows are added, removed or relabelled.
+        """
+
+        return [i for i in [self.__dict__.get('_text_index'), self.__dict__.get('_rank_index'), self.__dict__.get('_string_view')] if i is not None]
+
+    def __getstate__(self):
+
+        """
+        Returns the Results DataFrame's state for pickling. Includes the BM25 index, so that it can be reused when the Results DataFrame is reloaded. Rows in the staging buffer are added first (see Results.start_batch).
+        """
+
+        self.flush()
+
+        state = super().__getstate__()
+
+        rank_index = self.__dict__.get('_rank_index')
+        if rank_index is not None:
+            state['_rank_index'] = rank_index
+
+        return state
+
+    def change_tracker(self) -> ChangeTracker:
+
+        """
+        Returns the Results DataFrame's change tracker, which records the rows that are new or have changed since formatting, work ID generation and deduplication last ran.
+        """
+
+        tracker = self.__dict__.get('_changes')
+
+        if tracker is None:
+            tracker = ChangeTracker(key_column = 'work_id', tracks_edits = True)
+            self._changes = tracker
+
+        return tracker
+
+    def record_edit(self, labels, columns = None):
+
+        """
+        Records that cells have been edited in the change tracker, so that indexes and incremental saves can update only the edited rows (see ChangeTracker.record_edit). Cells set with .loc, .iloc, .at, .iat or by assigning to columns are recorded automatically.
+
+        Edits are only recorded once the change tracker has been created: passes, indexes and snapshots which use it process every row when they first run.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the edited rows.
+        columns : list
+            names of the edited columns. Defaults to None (all columns).
+
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
+
+        tracker = self.__dict__.get('_changes')
+
+        if tracker is not None:
+            tracker.record_edit(labels, columns)
+
+        return self
+
+    @property
+    def loc(self):
+        return TrackedLocIndexer('loc', self)
+
+    @property
+    def iloc(self):
+        return TrackedILocIndexer('iloc', self)
+
+    @property
+    def at(self):
+        return TrackedAtIndexer('at', self)
+
+    @property
+    def iat(self):
+        return TrackedIAtIndexer('iat', self)
+
+    def __setitem__(self, key, value):
+
+        """
+        Sets one or more columns, recording the rows whose values have changed in the change tracker (see Results.record_edit).
+        """
+
+        if self.__dict__.get('_changes') is None:
+            super().__setitem__(key, value)
+
+        elif (type(key) == str) or ((type(key) == list) and all(type(c) == str for c in key)):
+
+            columns = [key] if type(key) == str else key
+            unique = self.columns.is_unique
+            old_values = {c: self[c].to_numpy(dtype=object, copy=True) for c in columns if (unique == True) and (c in self.columns)}
+
+            super().__setitem__(key, value)
+
+            for c in dict.fromkeys(columns):
+                if c in old_values:
+                    labels = changed_labels(self.index, old_values[c], self[c].to_numpy(dtype=object))
+                else:
+                    labels = self.index.to_list()
+                if len(labels) > 0:
+                    self.record_edit(labels, [c])
+
+        else:
+            super().__setitem__(key, value)
+            self.record_edit(self.index.to_list())
+
+    def mark_changed(self, indexes):
+
+        """
+        Marks results as changed, so that formatting, work ID generation and deduplication process them again. Objects changed in place (e.g. an Authors object which an author is added to) are only found by these passes if their rows are marked, unless rehashing is enabled (see art.utils.changes.set_rehash_sources).
+
+        Parameters
+        ----------
+        indexes : list
+            index labels of the changed rows.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
+
+        if type(indexes) != list:
+            indexes = [indexes]
+
+        self.change_tracker().mark(indexes)
+
+        return self
+
+    def changed_rows(self, name: str) -> list:
+
+        """
+        Returns the index labels of results which are new or have changed since a processing pass last ran.
+
+        Parameters
+        ----------
+        name : str
+            name of the processing pass (e.g. 'work_ids', 'dedup', 'authors', 'funders', 'citations').
+
+        Returns
+        -------
+        result : list
+            a list of index labels.
+        """
+
+        return self.change_tracker().pending(self, name)
+
+    def is_compact(self) -> bool:
+
+        """
+        Returns True if the Results DataFrame uses compact storage.
+        """
+
+        return self.__dict__.get('_compact', False) == True
+
+    def compact(self):
+
+        """
+        Switches the Results DataFrame to compact storage. Low-cardinality columns (e.g. type, repository, language) are stored as categoricals; counts and scores as nullable integers and floats; and text columns as Arrow-backed strings (if PyArrow is installed). Compact storage is kept when rows are imported or added.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
+
+        Notes
+        -----
+        Categorical columns only accept values from their existing categories. Use Results.expand() before editing them directly.
+        """
+
+        self._compact = True
+        storage.compact_dataframe(self)
+
+        return self
+
+    def expand(self):
+
+        """
+        Switches the Results DataFrame back to object storage.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
+
+        self._compact = False
+        storage.expand_dataframe(self)
+
+        return self
+
+    def update_storage(self):
+
+        """
+        Re-applies compact storage to columns which have been rebuilt as objects (e.g. after rows were added). Has no effect if the Results DataFrame does not use compact storage.
+        """
+
+        if self.is_compact() == True:
+            storage.compact_dataframe(self)
+
+        return self
+
+    def memory_report(self) -> pd.DataFrame:
+
+        """
+        Returns a report of each column's memory usage in object storage and compact storage, and the memory saved by compact storage.
+
+        Returns
+        -------
+        report : pandas.DataFrame
+            a dataframe indexed by column name, with the columns: 'object_dtype', 'compact_dtype', 'object_bytes', 'compact_bytes', 'saved_bytes', 'saved_pct'.
+        """
+
+        return storage.memory_report(self)
+
+    def add_pdf(self, path = 'request_input'):
+        
+        """
+        Reads a PDF file from a file path or URL and adds its data to the Results DataFrame.
+
+        Parameters
+        ----------
+        path : str
+            a filepath or URL that directs to a PDF file. Defaults to requesting from user input.
+        """
+
+        if path == 'request_input':
+            path = input('Path to PDF (URL or filepath): ')
+
+        table = read_pdf_to_table(path)
+        table = table.replace(np.nan, None).astype(object)
+
+        series = table.loc[0]
+        work_id = generate_work_id(series) # type: ignore
+        series['work_id'] = work_id
+
+        index = len(self)
+        self.loc[index] = series
+
+        return self
+    
+    def add_row(self, data: pd.Series, drop_duplicates: bool = True):
+
+        """
+        Adds a Pandas Series to the Results DataFrame as a new row.
+
+        Parameters
+        ----------
+        data : pandas.Series
+            a row to add.
+        drop_duplicates : bool
+            whether to remove duplicated rows. Defaults to True.
+        """
+
+        if type(data) != pd.Series:
+            raise TypeError(f'Results must be a Pandas.Series, not {type(data)}')
+
+        if self.__dict__.get('_batch') is not None:
+            self.stage_rows(data)
+            return
+
+        data.index = data.index.astype(str).str.lower().str.replace(' ', '_')
+        if len(data) != len(self.columns):
+            for c in data.index:
+                if c not in self.columns:
+                    self[c] = pd.Series(dtype=object)
+
+        index = len(self)
+
+        work_id = generate_work_id(data)
+        # work_id = self.get_unique_id(work_id, index)
+        data['work_id'] = work_id
+
+        id_index = self.id_index(build=False)
+        
+        self.loc[index] = data
+
+        if id_index is not None:
+            self._id_index = id_index.add_rows(self.loc[[index]]).stamp(self)
+
+        for text_index in self.text_indexes():
+            text_index.add_rows(self.loc[[index]])
+
+        self.mark_changed(index)
+
+        if drop_duplicates == True:
+            self.remove_duplicates(drop_empty_rows=False, changed_only=True)
+        
+    def get_unique_id(self, work_id, index):
+
+        """
+        Checks whether work ID is used more than once in the Results DataFrame. If yes, returns a unique ID.
+        """
+
+        if (type(work_id) == str) and (work_id != ''):
+            try:
+                work_id = str(work_id.split('#')[0])
+                if work_id in self['work_id'].to_list():
+                
+                    df = self.copy(deep=True).astype(str)
+                    df['work_id'] = df['work_id'].dropna()
+                    masked = df[df['work_id'].str.contains(work_id)]
+                    masked_indexes = masked.index.to_list()
+                    if index not in masked_indexes:
+                        id_count = len(masked) # type: ignore
+                        work_id = work_id + f'#{id_count + 1}'
+            except:
+                pass
+        return work_id
+
+    def add_dataframe(self, dataframe: pd.DataFrame, drop_empty_rows = True, drop_duplicates = False, update_work_ids = True):
+        
+        """
+        Adds a Pandas DataFrame to the Results DataFrame.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a Pandas DataFrame to add to the Results DataFrame.
+        drop_empty_rows : bool
+            whether to remove rows which do not contain any data. Defaults to True.
+        drop_duplicates : bool
+            whether to remove duplicated rows. Defaults to False.
+        update_work_ids : bool
+            whether to update results entries' work IDs. Defaults to True.
+        """
+
+        if (type(dataframe) != pd.DataFrame) and (type(dataframe) != pd.Series):
+            raise TypeError(f'Results must be a Pandas.Series or Pandas.DataFrame, not {type(dataframe)}')
+
+        if self.__dict__.get('_batch') is not None:
+            self.stage_rows(dataframe)
+            return
+
+        dataframe = dataframe.reset_index().drop('index', axis=1)
+        dataframe.columns = dataframe.columns.astype(str).str.lower().str.replace(' ', '_')
+
+        if (self.columns.to_list()) != (dataframe.columns.to_list()):
+            for c in dataframe.columns:
+                if c not in self.columns:
+                    self[c] = pd.Series(dtype=object)
+        
+        id_index = self.id_index(build=False)
+        old_rows = self.index.to_list()
+
+        self_copy = self.copy(deep=True)
+        concat_df = pd.concat([self_copy, dataframe])
+        concat_df = concat_df.reset_index().drop('index', axis=1)
+
+        new_results = Results()
+
+        for c in concat_df.columns:
+            new_results[c] = concat_df[c]
+        
+        self.__dict__.update(new_results.__dict__)
+
+        if id_index is not None:
+            id_index.relabel(old_rows)
+            id_index.add_rows(self.iloc[len(old_rows):])
+            self._id_index = id_index.stamp(self)
+
+        for text_index in self.text_indexes():
+            text_index.relabel(old_rows)
+            text_index.add_rows(self.iloc[len(old_rows):])
+
+        self.change_tracker().relabel(old_rows)
+
+        if drop_empty_rows == True:
+            self.drop_empty_rows()
+
+        if update_work_ids == True:
+            self.update_work_ids(drop_duplicates=False, changed_only=True)
+
+        if drop_duplicates == True:
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=True)
+
+        self.update_storage()
+
+    def start_batch(self, batch_size: int = 10000, drop_empty_rows = True, drop_duplicates = False, update_work_ids = True):
+
+        """
+        Starts batched ingestion. While batching, add_row and add_dataframe collect new rows in a staging buffer instead of rebuilding the Results DataFrame on every call. The buffer is flushed automatically once it holds batch_size rows or as many rows as the Results DataFrame, whichever is larger.
+
+        Parameters
+        ----------
+        batch_size : int
+            minimum number of staged rows before the buffer is flushed. Defaults to 10000.
+        drop_empty_rows : bool
+            whether to remove new rows which do not contain any data when flushing. Defaults to True.
+        drop_duplicates : bool
+            whether to merge new rows which duplicate each other or existing rows when flushing. Defaults to False.
+        update_work_ids : bool
+            whether to generate work IDs for new rows when flushing. Defaults to True.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
+        
+        Notes
+        -----
+        Staged rows are not visible in the Results DataFrame until they are flushed. Call end_batch or flush to add them. Staged rows are also added before the Results DataFrame is searched or pickled, and before a Review holding it is formatted, searched or saved.
+        """
+
+        self._batch = {
+                        'batch_size': batch_size,
+                        'drop_empty_rows': drop_empty_rows,
+                        'drop_duplicates': drop_duplicates,
+                        'update_work_ids': update_work_ids
+                        }
+        
+        if self.__dict__.get('_staged') is None:
+            self._staged = []
+
+        return self
+
+    def end_batch(self):
+
+        """
+        Flushes the staging buffer and ends batched ingestion.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
+
+        self.flush()
+        self._batch = None
+
+        return self
+
+    def staged_count(self) -> int:
+
+        """
+        Returns the number of rows waiting in the staging buffer.
+        """
+
+        staged = self.__dict__.get('_staged')
+
+        if staged is None:
+            return 0
+
+        return len(staged)
+
+    def stage_rows(self, data):
+
+        """
+        Adds a Pandas Series or DataFrame to the staging buffer. Flushes the buffer if batched ingestion is on and the buffer is full.
+
+        Parameters
+        ----------
+        data : pandas.Series or pandas.DataFrame
+            rows to stage.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
+
+        if self.__dict__.get('_staged') is None:
+            self._staged = []
+
+        if type(data) == pd.Series:
+            self._staged.append(data.to_dict())
         else:
-            df = dataframe
-            if type(dataframe) == pd.DataFrame:
-                self = Results.from_dataframe(dataframe = df)
+            self._staged.extend(data.to_dict('records'))
 
-    def drop_empty_rows(self):
+        batch = self.__dict__.get('_batch')
+
+        if (batch is not None) and (len(self._staged) >= max(batch['batch_size'], len(self))):
+            self.flush()
+
+        return self
+
+    def flush(self, drop_empty_rows = None, drop_duplicates = None, update_work_ids = None):
 
         """
-        Drops rows that contain no data.
+        Adds all rows in the staging buffer to the Results DataFrame in a single operation.
+
+        Parameters
+        ----------
+        drop_empty_rows : bool
+            whether to remove new rows which do not contain any data. Defaults to the batch setting, or True.
+        drop_duplicates : bool
+            whether to merge new rows which duplicate each other or existing rows. Defaults to the batch setting, or False.
+        update_work_ids : bool
+            whether to generate work IDs for new rows. Defaults to the batch setting, or True.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
         """
 
+        batch = self.__dict__.get('_batch')
+        if batch is None:
+            batch = {'drop_empty_rows': True, 'drop_duplicates': False, 'update_work_ids': True}
 
-        ignore_cols = ['work_id', 'authors', 'funder', 'citations']
+        if drop_empty_rows is None:
+            drop_empty_rows = batch['drop_empty_rows']
+        
+        if drop_duplicates is None:
+            drop_duplicates = batch['drop_duplicates']
 
-        df = self.dropna(axis=0, how='all')
-        drop_cols = [c for c in df.columns if c not in ignore_cols]
-        df = df.dropna(axis=0, how='all', subset=drop_cols).reset_index().drop('index', axis=1)
+        if update_work_ids is None:
+            update_work_ids = batch['update_work_ids']
 
-        results = Results.from_dataframe(dataframe=df, drop_duplicates=False) # type: ignore
+        staged = self.__dict__.get('_staged')
 
-        self.__dict__.update(results.__dict__)
+        if (staged is None) or (len(staged) == 0):
+            return self
 
-        return self
+        self._staged = []
+        new_rows = pd.DataFrame.from_records(staged)
+
+        return self.append_rows(new_rows, drop_empty_rows = drop_empty_rows, drop_duplicates = drop_duplicates, update_work_ids = update_work_ids)
 
-    def remove_duplicates(self, drop_empty_rows = True, use_api = False):
+    def append_rows(self, dataframe: pd.DataFrame, drop_empty_rows = True, drop_duplicates = False, update_work_ids = True):
 
         """
-        Removes duplicate results.
+        Appends a Pandas DataFrame to the Results DataFrame. Unlike add_dataframe, empty row removal, work ID generation and deduplication are only run on the new rows.
 
         Parameters
         ----------
+        dataframe : pandas.DataFrame
+            a Pandas DataFrame to append.
         drop_empty_rows : bool
-            whether to remove rows which do not contain any data. Defaults to True.
-        use_api : bool
-            whether to update the results data using all available APIs. Defaults to False.
-        
+            whether to remove new rows which do not contain any data. Defaults to True.
+        drop_duplicates : bool
+            whether to merge new rows which duplicate each other or share identifiers with existing rows. Defaults to False.
+        update_work_ids : bool
+            whether to generate work IDs for new rows. Defaults to True.
+
         Returns
         -------
         self : Results
             a Results object.
         """
 
+        dataframe = dataframe.reset_index().drop('index', axis=1)
+        dataframe.columns = dataframe.columns.astype(str).str.lower().str.replace(' ', '_')
+
+        for c in dataframe.columns:
+            if c not in self.columns:
+                self[c] = pd.Series(dtype=object)
+
+        for c in self.columns:
+            if c not in dataframe.columns:
+                dataframe[c] = None
+
+        dataframe = dataframe[self.columns]
+
         if drop_empty_rows == True:
-            self.drop_empty_rows()
+            ignore_cols = ['work_id', 'authors', 'funder', 'citations']
+            drop_cols = [c for c in dataframe.columns if c not in ignore_cols]
+            dataframe = dataframe.dropna(axis=0, how='all', subset=drop_cols)
 
-        self['doi'] = self['doi'].str.replace('https://', '', regex = False).str.replace('http://', '', regex = False).str.replace('dx.', '', regex = False).str.replace('doi.org/', '', regex = False).str.replace('doi/', '', regex = False)
+        if update_work_ids == True:
+            dataframe['work_id'] = generate_work_ids(dataframe)
 
-        df = deduplicate(self)
-        results = Results.from_dataframe(dataframe = df, drop_duplicates=False)
+        id_index = self.id_index(build=False)
 
-        if use_api == True:
-            results.update_from_dois()
-        
-        results.update_work_ids()
-        df2 = results.drop_duplicates(subset='work_id').reset_index().drop('index',axis=1)
+        if drop_duplicates == True:
 
-        results2 = Results.from_dataframe(dataframe=df2, drop_duplicates=False) # type: ignore
-        
-        self.__dict__.update(results2.__dict__)
+            dataframe = deduplicate(dataframe)
 
-        return self
+            # Merging new rows into existing rows that share identifiers
+            id_index = self.id_index()
+            merged_rows = []
+            updated_rows = set()
 
-    def get(self, work_id: str):
+            for pos in range(len(dataframe)):
 
-        """
-        Retrieves result using a work ID.
-        """
+                row = dataframe.iloc[pos]
+                matches = []
+                for c in id_index.columns:
+                    if (c in row.index) and (is_empty_cell(row[c]) == False):
+                        matches = id_index.lookup(row[c], columns=[c])
+                        if len(matches) > 0:
+                            break
+                
+                if len(matches) == 0:
+                    continue
 
-        indexes = self[self['work_id'] == work_id].index.to_list()
-        if len(indexes) > 0:
-            index = indexes[0]
-            return self.loc[index]
-        else:
-            raise KeyError('work_id not found')
+                label = matches[0][1]
+                for c in self.columns:
+                    data = self.at[label, c]
+                    merged = merge_cells(data, row[c])
+                    if merged is not data:
+                        storage.set_value(self, label, c, merged)
+                        updated_rows.add(label)
 
-    def add_pdf(self, path = 'request_input'):
+                merged_rows.append(pos)
+
+            if len(merged_rows) > 0:
+                dataframe = dataframe.drop(index=dataframe.index[merged_rows])
+            
+            id_index = self.id_index(build=False)
+            if (id_index is not None) and (len(updated_rows) > 0):
+                id_index.update_rows(self.loc[list(updated_rows)])
+
+            self.mark_changed(list(updated_rows))
+
+        if len(dataframe) == 0:
+            if id_index is not None:
+                self._id_index = id_index.stamp(self)
+            return self
+
+        old_rows = self.index.to_list()
+        concat_df = pd.concat([self, dataframe], ignore_index = True)
+
+        new_results = Results(index = concat_df.index)
+        for c in concat_df.columns:
+            new_results[c] = concat_df[c]
         
+        self.__dict__.update(new_results.__dict__)
+
+        if id_index is not None:
+            id_index.relabel(old_rows)
+            id_index.add_rows(self.iloc[len(old_rows):])
+            self._id_index = id_index.stamp(self)
+
+        for text_index in self.text_indexes():
+            text_index.relabel(old_rows)
+            text_index.add_rows(self.iloc[len(old_rows):])
+
+        self.change_tracker().relabel(old_rows)
+        self.update_storage()
+
+        return self
+
+    def import_chunk(self, chunk: pd.DataFrame, drop_empty_rows = True, drop_duplicates = False, update_work_ids = True):
+
         """
-        Reads a PDF file from a file path or URL and adds its data to the Results DataFrame.
+        Adds a chunk of imported rows (e.g. from a CSV file) to the Results DataFrame. Column names are normalised, and authors and keywords stored as list strings are split into lists, for the new rows only. Rows are added using Results.append_rows.
 
         Parameters
         ----------
-        path : str
-            a filepath or URL that directs to a PDF file. Defaults to requesting from user input.
+        chunk : pandas.DataFrame
+            the rows to add.
+        drop_empty_rows : bool
+            whether to remove new rows which do not contain any data. Defaults to True.
+        drop_duplicates : bool
+            whether to merge new rows which duplicate each other or share identifiers with existing rows. Defaults to False.
+        update_work_ids : bool
+            whether to generate work IDs for new rows. Defaults to True.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
         """
 
-        if path == 'request_input':
-            path = input('Path to PDF (URL or filepath): ')
+        chunk = chunk.copy()
+        chunk.columns = chunk.columns.astype(str).str.lower().str.replace(' ', '_')
 
-        table = read_pdf_to_table(path)
-        table = table.replace(np.nan, None).astype(object)
+        # Work IDs are generated before list strings are split, as when whole files are imported, so that both give the same IDs
+        if update_work_ids == True:
+            chunk['work_id'] = generate_work_ids(chunk)
 
-        series = table.loc[0]
-        work_id = generate_work_id(series) # type: ignore
-        series['work_id'] = work_id
+        for col in ['authors', 'keywords']:
+            if col in chunk.columns:
+                chunk[col] = pd.Series([strip_list_str(i) if type(i) == str else i for i in chunk[col].to_list()], index = chunk.index, dtype = object)
 
-        index = len(self)
-        self.loc[index] = series
+        return self.append_rows(chunk, drop_empty_rows = drop_empty_rows, drop_duplicates = drop_duplicates, update_work_ids = False)
 
-        return self
-    
-    def add_row(self, data: pd.Series, drop_duplicates: bool = True):
+    def import_chunks(self, chunks, drop_empty_rows = True, drop_duplicates = False, update_work_ids = True, progress = None):
 
         """
-        Adds a Pandas Series to the Results DataFrame as a new row.
+        Adds chunks of imported rows to the Results DataFrame one at a time (see Results.import_chunk), so that only one chunk of a file is held in memory alongside the Results DataFrame. Used by chunked imports (e.g. Results.import_csv with a chunk_size).
 
         Parameters
         ----------
-        data : pandas.Series
-            a row to add.
+        chunks : iterable
+            (pandas.DataFrame, fraction) tuples: chunks of rows, and the fraction of the file read once each has been read (or None if unknown). See art.importers.chunked.
+        drop_empty_rows : bool
+            whether to remove new rows which do not contain any data. Defaults to True.
         drop_duplicates : bool
-            whether to remove duplicated rows. Defaults to True.
-        """
-
-        if type(data) != pd.Series:
-            raise TypeError(f'Results must be a Pandas.Series, not {type(data)}')
+            whether to merge new rows which duplicate each other or share identifiers with existing rows. Defaults to False.
+        update_work_ids : bool
+            whether to generate work IDs for new rows. Defaults to True.
+        progress : callable
+            a function called after each chunk with the number of rows read so far and the fraction of the file read. Defaults to None.
 
-        data.index = data.index.astype(str).str.lower().str.replace(' ', '_')
-        if len(data) != len(self.columns):
-            for c in data.index:
-                if c not in self.columns:
-                    self[c] = pd.Series(dtype=object)
+        Returns
+        -------
+        self : Results
+            a Results object.
+        """
 
-        index = len(self)
+        rows = 0
 
-        work_id = generate_work_id(data)
-        # work_id = self.get_unique_id(work_id, index)
-        data['work_id'] = work_id
+        for chunk, fraction in chunks:
 
-        
-        self.loc[index] = data
+            rows += len(chunk)
+            self.import_chunk(chunk, drop_empty_rows = drop_empty_rows, drop_duplicates = drop_duplicates, update_work_ids = update_work_ids)
 
-        if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=False)
-        
-    def get_unique_id(self, work_id, index):
+            if progress is not None:
+                progress(rows, fraction)
 
-        """
-        Checks whether work ID is used more than once in the Results DataFrame. If yes, returns a unique ID.
-        """
+        return self
 
-        if (type(work_id) == str) and (work_id != ''):
-            try:
-                work_id = str(work_id.split('#')[0])
-                if work_id in self['work_id'].to_list():
-                
-                    df = self.copy(deep=True).astype(str)
-                    df['work_id'] = df['work_id'].dropna()
-                    masked = df[df['work_id'].str.contains(work_id)]
-                    masked_indexes = masked.index.to_list()
-                    if index not in masked_indexes:
-                        id_count = len(masked) # type: ignore
-                        work_id = work_id + f'#{id_count + 1}'
-            except:
-                pass
-        return work_id
+    def drop_rows(self, indexes):
 
-    def add_dataframe(self, dataframe: pd.DataFrame, drop_empty_rows = True, drop_duplicates = False, update_work_ids = True):
-        
         """
-        Adds a Pandas DataFrame to the Results DataFrame.
+        Removes rows from the Results DataFrame using their index positions. Keeps the identifier index up to date.
 
         Parameters
         ----------
-        dataframe : pandas.DataFrame
-            a Pandas DataFrame to add to the Results DataFrame.
-        drop_empty_rows : bool
-            whether to remove rows which do not contain any data. Defaults to True.
-        drop_duplicates : bool
-            whether to remove duplicated rows. Defaults to False.
-        update_work_ids : bool
-            whether to update results entries' work IDs. Defaults to True.
+        indexes : list
+            index positions of rows to remove.
+
+        Returns
+        -------
+        self : Results
+            a Results object.
         """
 
-        if (type(dataframe) != pd.DataFrame) and (type(dataframe) != pd.Series):
-            raise TypeError(f'Results must be a Pandas.Series or Pandas.DataFrame, not {type(dataframe)}')
+        if type(indexes) != list:
+            indexes = [indexes]
 
-        dataframe = dataframe.reset_index().drop('index', axis=1)
-        dataframe.columns = dataframe.columns.astype(str).str.lower().str.replace(' ', '_')
+        id_index = self.id_index(build=False)
 
-        if (self.columns.to_list()) != (dataframe.columns.to_list()):
-            for c in dataframe.columns:
-                if c not in self.columns:
-                    self[c] = pd.Series(dtype=object)
-        
-        self_copy = self.copy(deep=True)
-        concat_df = pd.concat([self_copy, dataframe])
-        concat_df = concat_df.reset_index().drop('index', axis=1)
+        df = self.drop(labels=indexes, axis=0)
+        results = Results(index = df.index)
 
-        new_results = Results()
+        for c in df.columns:
+            results[c] = df[c]
 
-        for c in concat_df.columns:
-            new_results[c] = concat_df[c]
-        
-        self.__dict__.update(new_results.__dict__)
+        self.__dict__.update(results.__dict__)
 
-        if drop_empty_rows == True:
-            self.drop_empty_rows()
+        if id_index is not None:
+            self._id_index = id_index.drop_rows(indexes).stamp(self)
 
-        if update_work_ids == True:
-            self.update_work_ids(drop_duplicates=False)
+        for text_index in self.text_indexes():
+            text_index.drop_rows(indexes)
 
-        if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+        self.change_tracker().drop(indexes)
+
+        return self
 
     def add_doi(self, doi: str = 'request_input', drop_empty_rows = True, drop_duplicates = False, timeout: int = 60):
 
@@ -472,10 +1582,10 @@ class Results(pd.DataFrame):
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
-    def add_dois(self, dois_list: list = [], drop_empty_rows = True, rate_limit: float = 0.05, timeout = 60):
+    def add_dois(self, dois_list: list = [], drop_empty_rows = True, rate_limit: float = 0.05, timeout = 60, max_workers: int = None, batch_size: int = None):
 
         """
-        Looks up a list of DOIs using the CrossRef API and adds to Results DataFrame.
+        Looks up a list of DOIs using the CrossRef API and adds to Results DataFrame. DOIs are looked up concurrently; results are added in the order of dois_list.
 
         Parameters
         ----------
@@ -484,12 +1594,16 @@ class Results(pd.DataFrame):
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         drop_empty_rows : bool
             whether to remove rows which do not contain any data.
+        max_workers : int
+            the maximum number of requests in flight at once. Defaults to None: the default is used (see art.importers.crossref.set_max_concurrent_requests).
+        batch_size : int
+            the number of DOIs per request. Defaults to None: the default is used (see art.importers.crossref.set_doi_batch_size).
         """
 
-        df = lookup_dois(dois_list=dois_list, rate_limit=rate_limit, timeout=timeout)
+        df = lookup_dois(dois_list=dois_list, rate_limit=rate_limit, timeout=timeout, max_workers=max_workers, batch_size=batch_size)
         self.add_dataframe(dataframe=df, drop_empty_rows = drop_empty_rows)
 
     def correct_dois(self, drop_duplicates = False):
@@ -507,10 +1621,18 @@ class Results(pd.DataFrame):
         has_link = no_doi[~no_doi['link'].isna()]
         doi_in_link = has_link[has_link['link'].str.contains('doi.org')]
 
+        id_index = self.id_index(build=False)
+
         for i in doi_in_link.index:
             link = str(doi_in_link.loc[i, 'link'])
             doi = link.replace('http://', '').replace('https://', '').replace('www.', '').replace('dx.', '').replace('doi.org/', '').strip('/').strip()
             self.loc[i, 'doi'] = doi
+
+        if (id_index is not None) and (len(doi_in_link) > 0):
+            self._id_index = id_index.update_rows(self.loc[doi_in_link.index]).stamp(self)
+
+        if len(doi_in_link) > 0:
+            self.mark_changed(doi_in_link.index.to_list())
         
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=False)
@@ -521,11 +1643,14 @@ class Results(pd.DataFrame):
         Assigns a unique identifier (work ID) for each published work in the Results DataFrame.
         """
 
-        for i in self.index:
-            work_id = generate_work_id(self.loc[i])
-            self.loc[i, 'work_id'] = work_id
+        id_index = self.id_index(build=False)
+
+        self['work_id'] = generate_work_ids(self)
 
-    def update_work_ids(self, drop_duplicates = False):
+        if id_index is not None:
+            self._id_index = id_index.update_rows(self).stamp(self)
+
+    def update_work_ids(self, drop_duplicates = False, changed_only = False):
 
         """
         Checks each published work in the Results DataFrame to ensure the work ID is up-to-date. If not, generates and assigns a new work ID.
@@ -534,16 +1659,104 @@ class Results(pd.DataFrame):
         ----------
         drop_duplicates : bool
             whether to remove duplicated rows. Defaults to True.
+        changed_only : bool
+            whether to only check results which are new or have changed since work IDs were last updated. Defaults to False.
         """
 
-        for i in self.index:
-            work_id = generate_work_id(self.loc[i])
-            if self.loc[i, 'work_id'] != work_id:
-                # work_id = self.get_unique_id(work_id, i)
-                self.loc[i, 'work_id'] = work_id
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            rows = tracker.pending(self, 'work_ids')
+            current_ids = self.loc[rows, 'work_id']
+            work_ids = generate_work_ids(self.loc[rows])
+        else:
+            current_ids = self['work_id']
+            work_ids = generate_work_ids(self)
+        
+        changed = current_ids != work_ids
+
+        if changed.any():
+            id_index = self.id_index(build=False)
+            changed_rows = changed[changed].index
+
+            # work_id = self.get_unique_id(work_id, i)
+            self.loc[changed_rows, 'work_id'] = work_ids[changed]
+
+            if id_index is not None:
+                self._id_index = id_index.update_rows(self.loc[changed_rows]).stamp(self)
         
+        tracker.done(self, 'work_ids')
+
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=False)
+            self.remove_duplicates(drop_empty_rows=False, changed_only=changed_only)
+
+    def update_from_record(self, index, record: pd.Series) -> bool:
+
+        """
+        Updates a result using another record of the same work (e.g. from a CrossRef API lookup). Values are replaced where the record's value is not empty and the result's is empty or shorter; columns which the Results DataFrame lacks are added.
+
+        Parameters
+        ----------
+        index : int or str
+            row index label for the result to update.
+        record : pandas.Series
+            the new record.
+
+        Returns
+        -------
+        changed : bool
+            whether the result was changed.
+        """
+
+        old_series = self.loc[index]
+        changed = False
+
+        for col in record.index:
+
+            new_val = record[col]
+
+            if is_empty_cell(new_val):
+                continue
+
+            if col in old_series.index:
+                if (is_empty_cell(old_series[col]) == False) and (len(str(new_val)) <= len(str(old_series[col]))):
+                    continue
+            else:
+                self[col] = pd.Series(dtype=object)
+
+            storage.set_value(self, index, col, new_val)
+            changed = True
+
+        return changed
+
+    def update_from_records(self, indexes: list, records: list):
+
+        """
+        Updates results using other records of the same works (see Results.update_from_record), keeping the identifier index up to date and marking changed results.
+
+        Parameters
+        ----------
+        indexes : list
+            row index labels for the results to update.
+        records : list
+            the new records (pandas.Series), one per label. None values are skipped.
+        """
+
+        changed = []
+
+        for index, record in zip(indexes, records):
+            if (record is not None) and (self.update_from_record(index, record) == True):
+                changed.append(index)
+
+        if len(changed) > 0:
+
+            id_index = self.id_index(build=False)
+            if id_index is not None:
+                self._id_index = id_index.update_rows(self.loc[changed]).stamp(self)
+
+            self.mark_changed(changed)
+
+        return self
 
     def update_from_doi(self, index, drop_empty_rows = True, drop_duplicates = False, timeout: int = 60):
         
@@ -563,21 +1776,13 @@ class Results(pd.DataFrame):
         """
 
         try:
-            old_series = self.loc[index]
-            doi = old_series['doi']
-
-            if (type(doi) != None) and (type(doi) != '') and (type(doi) != 'None'):
-                new_series = lookup_doi(doi=doi, timeout=timeout).loc[0]
-
-                for i in new_series.index:
-                    if i in old_series.index:
-                        old_val = old_series[i]
-                        new_val = new_series[i]
-                        if (new_val != None) and (new_val != np.nan) and (new_val != '') and (len(str(new_val)) > len(str(old_val))):
-                            old_series[i] = new_val
-                    
-                    else:
-                        old_series[i] = new_val
+            doi = self.loc[index, 'doi']
+
+            if is_empty_cell(doi) == False:
+                new_df = lookup_doi(doi=doi, timeout=timeout)
+
+                if len(new_df) > 0:
+                    self.update_from_records([index], [new_df.loc[0]])
         except:
             pass
 
@@ -586,11 +1791,11 @@ class Results(pd.DataFrame):
         
         if drop_empty_rows == True:
             self.drop_empty_rows()
-        
-    def update_from_dois(self, drop_empty_rows = True, drop_duplicates = False, timeout: int = 60):
+
+    def update_from_dois(self, drop_empty_rows = True, drop_duplicates = False, timeout: int = 60, max_workers: int = None, batch_size: int = None):
 
         """
-        Updates results that have DOIs associated using the CrossRef API.
+        Updates results that have DOIs associated using the CrossRef API. DOIs are looked up in batches of multi-DOI requests, made concurrently with a shared rate limit and retries (see art.importers.crossref.resolve_dois).
 
         Parameters
         ----------
@@ -600,12 +1805,25 @@ class Results(pd.DataFrame):
             whether to remove duplicated rows.
         drop_empty_rows : bool
             whether to remove rows which do not contain any data.
+        max_workers : int
+            the maximum number of requests in flight at once. Defaults to None: the default is used (see art.importers.crossref.set_max_concurrent_requests).
+        batch_size : int
+            the number of DOIs per request. If 1, each DOI is requested individually. Defaults to None: the default is used (see art.importers.crossref.set_doi_batch_size).
         """
 
         self.correct_dois(drop_duplicates=False)
 
-        for i in self.index:
-            self.update_from_doi(index = i, drop_duplicates = False, timeout=timeout)
+        rows = [i for i, doi in zip(self.index, self['doi'].to_list()) if is_empty_cell(doi) == False]
+        items, unresolved = resolve_dois(self.loc[rows, 'doi'].to_list(), timeout=timeout, max_workers=max_workers, batch_size=batch_size, return_unresolved=True)
+
+        if len(unresolved) > 0:
+            print(f'{len(unresolved)} DOIs could not be resolved')
+
+        found = [(i, item) for i, item in zip(rows, items) if item is not None]
+
+        if len(found) > 0:
+            new_df = items_to_df([item for i, item in found])
+            self.update_from_records([i for i, item in found], [new_df.iloc[pos] for pos in range(len(new_df))])
         
         if drop_duplicates == True:
             self.remove_duplicates(drop_empty_rows=False)
@@ -652,7 +1870,7 @@ class Results(pd.DataFrame):
 
         return self.copy(deep=True)
     
-    def from_dataframe(dataframe, drop_empty_rows = False, drop_duplicates = False): # type: ignore
+    def from_dataframe(dataframe, drop_empty_rows = False, drop_duplicates = False, compact = None): # type: ignore
         
         """
         Converts a Pandas DataFrame to a Results object.
@@ -665,6 +1883,8 @@ class Results(pd.DataFrame):
             whether to remove duplicated rows. Defaults to False.
         drop_empty_rows : bool
             whether to remove rows which do not contain any data. Defaults to False.
+        compact : bool
+            whether to use compact storage. Defaults to None: compact storage is used if the dataframe is a compact Results object or if compact storage is the default.
         
         Returns
         -------
@@ -672,6 +1892,9 @@ class Results(pd.DataFrame):
             a Results object.
         """
 
+        if compact is None:
+            compact = (dataframe.__dict__.get('_compact', False) == True) or (storage.compact_default == True)
+
         dataframe = dataframe.copy(deep=True).reset_index().drop('index', axis=1)
         results_table = Results(index = dataframe.index)
         results_table.columns = results_table.columns.astype(str).str.lower().str.replace(' ', '_')
@@ -680,6 +1903,9 @@ class Results(pd.DataFrame):
         for c in dataframe.columns:
             results_table[c] = dataframe[c]
 
+        if compact == True:
+            results_table.compact()
+
         if drop_duplicates == True:
             results_table.remove_duplicates(drop_empty_rows=False)
         
@@ -701,129 +1927,8 @@ class Results(pd.DataFrame):
 
         res_dict = {}
 
-        for i in self.index:
-            
-            row = self.loc[i].copy(deep=True).dropna()
-
-            if 'type' in row.index:
-                entry_type = row['type']
-            else:
-                entry_type = 'misc'
-            
-            if 'title' in row.index:
-                title = str(row['title'])
-            else:
-                title = ''
-            
-            if 'authors' in row.index:
-                authors = row['authors']
-            else:
-                authors = ''
-            
-            if ('__dict__' in authors.__dir__()) and ('summary' in authors.__dict__.keys()):
-                if (type(authors.summary) == pd.DataFrame) and ('full_name' in authors.summary.columns):
-                    authors_str = ', '.join(authors.summary['full_name'].to_list())
-                else:
-                    authors_str = ''
-            
-            if type(authors) == list:
-                authors_str = ', '.join(authors)
-            else:
-                authors_str = ''
-            
-            if 'date' in row.index:
-                year = str(row['date'])
-            else:
-                year = ''
-            
-            if 'keywords' in row.index:
-                keywords = ', '.join(row['keywords'])
-            else:
-                keywords = ''
-
-            if 'doi' in row.index:
-                doi = str(row['doi'])
-            else:
-                doi = ''
-            
-            if 'publisher' in row.index:
-                publisher = str(row['publisher'])
-            else:
-                publisher = ''
-            
-            if 'link' in row.index:
-                link = str(row['link'])
-            else:
-                link = ''
-            
-            if 'isbn' in row.index:
-                isbn = str(row['isbn'])
-            else:
-                isbn = ''
-
-            if 'work_id' in row.index:
-                key = row['work_id']
-            else:
-                key = str(title).lower() + '_' + str(authors_str)[:10].lower() + '_' + str(year).lower()
-
-            entry_list = []
-
-            if (authors_str is not None) and (authors_str != '') and (type(authors_str) == str):
-                authors_tuple = ('author', authors_str)
-                entry_list.append(authors_tuple)
-            
-            if (title is not None) and (title != '') and (type(title) == str):
-                title_tuple = ('title', title)
-                entry_list.append(title_tuple)
-            
-            if (year is not None) and (year != '') and (type(year) == str):
-                year_tuple = ('year', year)
-                entry_list.append(year_tuple)
-            
-            if (doi is not None) and (doi != '') and (type(doi) == str):
-                doi_tuple = ('doi', doi)
-                entry_list.append(doi_tuple)
-            
-            if (publisher is not None) and (publisher != '') and (type(publisher) == str):
-                publisher_tuple = ('publisher', publisher)
-                entry_list.append(publisher_tuple)
-            
-            if (link is not None) and (link != '') and (type(link) == str):
-                link_tuple = ('url', link)
-                entry_list.append(link_tuple)
-            
-            if (isbn is not None) and (isbn != '') and (type(isbn) == str):
-                isbn_tuple = ('isbn', isbn)
-                entry_list.append(isbn_tuple)
-            
-            if (keywords is not None) and (keywords != '') and (type(keywords) == str):
-                keywords_tuple = ('keywords', keywords)
-                entry_list.append(keywords_tuple)
-            
-            if 'article' in entry_type:
-
-                entry_type = 'article'
-
-                if 'source' in row.index:
-                    journal = row['source']
-                    if (journal is not None) and (journal != '') and (type(journal) == str):
-                        journal_tuple = ('journal', journal)
-                        entry_list.append(journal_tuple)
-
-            if ('book' in entry_type) and ('chapter' in entry_type):
-
-                entry_type = 'incollection'
-
-                if 'source' in row.index:
-                    booktitle = row['source']
-                    if (booktitle is not None) and (booktitle != '') and (type(booktitle) == str):
-                        booktitle_tuple = ('journal', booktitle)
-                        entry_list.append(booktitle_tuple)
-            
-            if 'book' in entry_type:
-                entry_type = 'book'
-
-            entry = Entry(entry_type, entry_list)
+        for i, row in self.iterrows():
+            key, entry = row_to_pybtex(row)
             res_dict[key] = entry
         
         bib_data = BibliographyData(res_dict)
@@ -858,10 +1963,10 @@ class Results(pd.DataFrame):
         bib_data = self.to_pybtex()
         return bib_data.to_string('yaml')
     
-    def export_bibtex(self, file_name = 'request_input', folder_path = 'request_input'):
+    def export_bibtex(self, file_name = 'request_input', folder_path = 'request_input', chunk_size: int = None):
 
         """
-        Exports the Results DataFrame as a Bibtex-formatted (.bib) bibliography file.
+        Exports the Results DataFrame as a Bibtex-formatted (.bib) bibliography file. Entries are converted and written chunk_size rows at a time, so the whole bibliography is never held in memory.
 
         Parameters
         ----------
@@ -869,6 +1974,8 @@ class Results(pd.DataFrame):
             name of file to create. Defaults to requesting from user input.
         folder_path : str
             location to create file. Defaults to requesting from user input.
+        chunk_size : int
+            the number of rows to write at a time. Defaults to 1000.
         """
 
         if file_name == 'request_input':
@@ -880,14 +1987,10 @@ class Results(pd.DataFrame):
         if Path(folder_path).exists() == False:
             raise ValueError('Folder does not exist')
 
-        bib = self.to_bibtex()
-
         filepath = folder_path + '/' + file_name + '.bib'
 
-        bib_bytes = bytes(bib, "utf-8").decode("unicode_escape")
-
         with open(filepath, 'w') as file:
-            file.write(bib_bytes)
+            write_bibtex(self, file, chunk_size = chunk_size)
     
     def export_yaml(self, file_name = 'request_input', folder_path = 'request_input'):
 
@@ -936,7 +2039,7 @@ class Results(pd.DataFrame):
 
         return self
 
-    def import_bibtex(self, file_path = 'request_input'):
+    def import_bibtex(self, file_path = 'request_input', chunk_size = None, progress = None):
 
         """
         Reads a Bibtex (.bib) bibliography file and adds its data to the Results DataFrame.
@@ -945,8 +2048,18 @@ class Results(pd.DataFrame):
         ----------
         file_path : str
             location of the Bibtex (.bib) bibliography file to read.
+        chunk_size : int
+            if given, the file is streamed and added this many entries at a time (see Results.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is added at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of entries read so far and the fraction of the file read. Defaults to None.
         """
 
+        if file_path == 'request_input':
+            file_path = input('File path: ')
+
+        if chunk_size is not None:
+            return self.import_chunks(read_bibtex_chunks(file_path, chunk_size = chunk_size), drop_empty_rows = False, progress = progress)
+
         df = import_bibtex(file_path = file_path)
         self.add_dataframe(dataframe=df, drop_duplicates=False, drop_empty_rows=False)
     
@@ -971,7 +2084,7 @@ class Results(pd.DataFrame):
 
         return results
 
-    def import_excel(self, file_path = 'request_input', sheet_name = None):
+    def import_excel(self, file_path = 'request_input', sheet_name = None, chunk_size = None, progress = None):
 
         """
         Reads an Excel (.xlsx) file and adds its data to the Results DataFrame.
@@ -982,6 +2095,10 @@ class Results(pd.DataFrame):
             directory path of file to import. Defaults to requesting from user input.
         sheet_name : str
             optional: name of Excel sheet to read.
+        chunk_size : int
+            if given, the sheet is streamed and added this many rows at a time (see Results.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is read at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read (or None if unknown). Defaults to None.
 
         Returns
         -------
@@ -992,6 +2109,9 @@ class Results(pd.DataFrame):
         if file_path == 'request_input':
             file_path = input('File path: ')
 
+        if chunk_size is not None:
+            return self.import_chunks(read_excel_chunks(file_path, sheet_name = sheet_name, chunk_size = chunk_size), progress = progress)
+
         if sheet_name == None:
             sheet_name = 0
         
@@ -1037,7 +2157,7 @@ class Results(pd.DataFrame):
 
         return results_table
 
-    def import_csv(self, file_path = 'request_input'):
+    def import_csv(self, file_path = 'request_input', chunk_size = None, progress = None):
 
             """
             Reads a CSV (.csv) file and adds its data to the Results DataFrame.
@@ -1046,6 +2166,10 @@ class Results(pd.DataFrame):
             ----------
             file_path : str
                 directory path of file to import. Defaults to requesting from user input.
+            chunk_size : int
+                if given, the file is streamed and added this many rows at a time (see Results.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is read at once.
+            progress : callable
+                for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read. Defaults to None.
 
             Returns
             -------
@@ -1055,6 +2179,9 @@ class Results(pd.DataFrame):
 
             if file_path == 'request_input':
                 file_path = input('File path: ')
+
+            if chunk_size is not None:
+                return self.import_chunks(read_csv_chunks(file_path, chunk_size = chunk_size), progress = progress)
                 
             csv_import = pd.read_csv(file_path, header = 0, index_col = 0).replace({np.nan: None, 'none': None})
             self.add_dataframe(csv_import)
@@ -1093,7 +2220,7 @@ class Results(pd.DataFrame):
 
         return results_table
 
-    def import_json(self, file_path = 'request_input'):
+    def import_json(self, file_path = 'request_input', chunk_size = None, progress = None):
 
         """
         Reads a JSON (.json) file and adds its data to the Results DataFrame.
@@ -1102,6 +2229,10 @@ class Results(pd.DataFrame):
         ----------
         file_path : str
             directory path of file to import. Defaults to requesting from user input.
+        chunk_size : int
+            if given, the file's rows are added this many at a time (see Results.import_chunks). JSON Lines (.jsonl) files are streamed. If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is read at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read. Defaults to None.
 
         Returns
         -------
@@ -1112,6 +2243,9 @@ class Results(pd.DataFrame):
         if file_path == 'request_input':
                 file_path = input('File path: ')
 
+        if chunk_size is not None:
+            return self.import_chunks(read_json_chunks(file_path, chunk_size = chunk_size), progress = progress)
+
         json_import = pd.read_json(file_path)
         self.add_dataframe(json_import)
 
@@ -1151,7 +2285,7 @@ class Results(pd.DataFrame):
         
         return results_table
     
-    def import_file(self, file_path = 'request_input', sheet_name = None):
+    def import_file(self, file_path = 'request_input', sheet_name = None, chunk_size = None, progress = None):
 
         """
         Reads a file, determines its file type, and adds its data to the Results object.
@@ -1162,6 +2296,10 @@ class Results(pd.DataFrame):
             directory path of file to import. Defaults to requesting from user input.
         sheet_name : str
             optional: name of an Excel sheet to read (if one exists).
+        chunk_size : int
+            for Excel, CSV and JSON files: if given, the file is streamed and added this many rows at a time (see Results.import_chunks). Defaults to None: the whole file is read at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read. Defaults to None.
 
         Notes
         -----
@@ -1181,13 +2319,13 @@ class Results(pd.DataFrame):
         if path_obj.exists() == True:
 
             if suffix.strip('.') == 'xlsx':
-                return self.import_excel(file_path, sheet_name)
+                return self.import_excel(file_path, sheet_name, chunk_size = chunk_size, progress = progress)
             
             if suffix.strip('.') == 'csv':
-                return self.import_csv(file_path)
+                return self.import_csv(file_path, chunk_size = chunk_size, progress = progress)
             
             if suffix.strip('.') == 'json':
-                return self.import_json(file_path)
+                return self.import_json(file_path, chunk_size = chunk_size, progress = progress)
 
             if suffix.strip('.') == 'bib':
                 return self.import_bibtex(file_path)
@@ -1238,7 +2376,7 @@ class Results(pd.DataFrame):
         else:
             raise ValueError('File does not exist')
 
-    def import_jstor(self, file_path = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_work_ids = True):
+    def import_jstor(self, file_path = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_work_ids = True, full_text = True, chunk_size = None, progress = None):
 
         """
         Reads a file outputted by JSTOR's Constellate portal and adds its data to the Results DataFrame.
@@ -1253,15 +2391,29 @@ class Results(pd.DataFrame):
             whether to remove rows which do not contain any data. Defaults to False.
         update_work_ids : bool
             whether to add and/or update work IDs. Defaults to True.
+        full_text : bool or str
+            for JSON files: whether to import documents' full texts. If True, full texts are imported; if False, they are skipped; if a file path, they are written to a full text store at that path and read back from it when first accessed. Defaults to True.
+        chunk_size : int
+            for JSON files: if given, the file is streamed and added this many documents at a time (see Results.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is added at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of documents read so far and the fraction of the file read. Defaults to None.
         
         Notes
         -----
         Can read:
             * .csv
             * .json
+            * .jsonl
+            * .jsonl.gz
         """
 
-        df = import_jstor(file_path = file_path)
+        if file_path == 'request_input':
+            file_path = input('File path: ')
+
+        if (chunk_size is not None) and (jstor_file_type(file_path) == 'json'):
+            return self.import_chunks(read_jstor_chunks(file_path, chunk_size = chunk_size, full_text = full_text), drop_empty_rows = drop_empty_rows, drop_duplicates = drop_duplicates, update_work_ids = update_work_ids, progress = progress)
+
+        df = import_jstor(file_path = file_path, full_text = full_text)
         self.add_dataframe(dataframe=df, drop_empty_rows = drop_empty_rows, drop_duplicates = drop_duplicates, update_work_ids = update_work_ids)
 
     def from_jstor(self, file_path = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_work_ids = True):
@@ -1321,90 +2473,24 @@ class Results(pd.DataFrame):
         -------
         output : Results or pandas.DataFrame
             search results.
+        
+        Notes
+        -----
+        Keywords wrapped in double quotes (e.g. '"machine learning"') are treated as phrases, and only match whole words in sequence. Other keywords match any part of the field's text.
         """
 
         if field == 'request_input':
             field = input('Field: ')
-        
-        if any_kwds == 'request_input':
-            any_kwds = input('Any keywords: ')
-            any_kwds = any_kwds.strip().split(',')
-            any_kwds = [i.strip() for i in any_kwds]
 
-        contains_df = pd.DataFrame()
-        not_kwds_df= pd.DataFrame()
-        
-        df = self.copy(deep=True)
-        
-        df[field] =  df[field].astype('str')
-
-        if case_sensitive == False:
-            df[field] = df[field].str.lower()
-        
-        if any_kwds != None:
-                
-            if (type(any_kwds) != list) and (type(any_kwds) != str):
-                raise TypeError('"any_kwds" must be a string or list')
-
-            if type(any_kwds) == str:
-                any_kwds = [any_kwds]
-
-            if case_sensitive == False:
-                any_kwds = pd.Series(any_kwds).str.lower().to_list()
-
-            for item in any_kwds:
-
-                rows = df[df[field].str.contains(item) == True]
-                contains_df = pd.concat([contains_df, rows])
-                
-        if not_kwds != None:
-
-                if type(not_kwds) == str:
-                    not_kwds = [not_kwds]
-
-                if type(not_kwds) != list:
-                    raise TypeError('"not_kwds" must be a string or list')
-
-                if case_sensitive == False:
-                    not_kwds = pd.Series(not_kwds).str.lower().to_list()
-
-                for item in not_kwds:
-                    
-                        rows = df[df[field].str.contains(item) == False]
-                        not_kwds = pd.concat([not_kwds, rows]) # type: ignore
-        
-        
-        combined_df = pd.concat([contains_df, not_kwds_df])
-        
-        if all_kwds != None:
-                
-            if (type(all_kwds) != list) and (type(all_kwds) != str):
-                raise TypeError('"all_kwds" must be a string or list')
-
-            if type(all_kwds) == str:
-                any_kwds = any_kwds.strip().split(',') # type: ignore
-                any_kwds = [i.strip() for i in any_kwds]
-
-            if case_sensitive == False:
-                all_kwds = pd.Series(all_kwds).str.lower().to_list()
-            
-            for item in all_kwds:
-                    
-                combined_df = combined_df[combined_df[field].str.contains(item)]
-        
-        if output.lower() == 'results':
+        if type(field) == list:
+            field = field[0]
 
-            masked = self.loc[combined_df.index]
-            return masked
-
-        else:
-            if (output.lower() == 'dataframe') or (output.lower() == 'pandas.dataframe') or (output.lower() == 'pd.dataframe'):
-                return combined_df
+        return self.search(fields = [field], any_kwds = any_kwds, all_kwds = all_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive, output = output)
 
     def search(self, fields = 'all', any_kwds = 'request_input', all_kwds = None, not_kwds = None, case_sensitive = False, output = 'Results'):
 
         """
-        Searches for a string throughout the Results DataFrame.
+        Searches for a string throughout the Results DataFrame. Uses the Results DataFrame's keyword index, which is built on the first search and kept up to date afterwards.
 
         Parameters
         ----------
@@ -1425,69 +2511,106 @@ class Results(pd.DataFrame):
         -------
         output : Results or pandas.DataFrame
             search results.
+
+        Notes
+        -----
+        Keywords wrapped in double quotes (e.g. '"machine learning"') are treated as phrases, and only match whole words in sequence. Other keywords match any part of a field's text.
         """
 
         if any_kwds == 'request_input':
             any_kwds = input('Any keywords: ')
             any_kwds = any_kwds.strip().split(',')
             any_kwds = [i.strip() for i in any_kwds]
-    
+
+        self.flush()
+
+        if any_kwds != None:
+                
+            if (type(any_kwds) != list) and (type(any_kwds) != str):
+                raise TypeError('"any_kwds" must be a string or list')
+
+            if type(any_kwds) == str:
+                any_kwds = [any_kwds]
+
         if all_kwds != None:
                 
             if (type(all_kwds) != list) and (type(all_kwds) != str):
                 raise TypeError('"all_kwds" must be a string or list')
 
             if type(all_kwds) == str:
-                any_kwds = any_kwds.strip().split(',') # type: ignore
-                any_kwds = [i.strip() for i in any_kwds]
+                all_kwds = all_kwds.strip().split(',')
+                all_kwds = [i.strip() for i in all_kwds]
 
-            if case_sensitive == False:
-                all_kwds = pd.Series(all_kwds).str.lower().to_list()
+        if not_kwds != None:
 
-        global results_cols
+            if type(not_kwds) == str:
+                not_kwds = [not_kwds]
 
-        output_df = pd.DataFrame(columns = results_cols, dtype=object)
+            if type(not_kwds) != list:
+                raise TypeError('"not_kwds" must be a string or list')
 
         if fields == 'all':
-            
-            output_df = pd.DataFrame(columns = self.columns.to_list(), dtype=object)
-            
-            for col in self.columns:
-                rows = self.search_field(field = col, any_kwds = any_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive, output = 'pandas.dataframe') # type: ignore
-                output_df = pd.concat([output_df, rows])
-            
-            output_df = output_df[~output_df.index.duplicated(keep = 'first') == True]
-            
-            if all_kwds != None:
-                
-                for item in all_kwds:
-                    for i in output_df.index:
-                        if True not in (output_df.loc[i].str.contains(item) == True).to_list():
-                            output_df = output_df.drop(i)
-    
-        else:
-            
-            if (type(fields) == str) or ((type(fields) == list) and (len(fields) == 1)):
+            fields = self.columns.to_list()
 
-                output_df = self.search_field(field = fields, any_kwds = any_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive) # type: ignore
-                output_df = output_df[~output_df.index.duplicated(keep = 'first') == True] # type: ignore
-                
-                if all_kwds != None:
-                    
-                    for item in all_kwds:
-                        
-                        for i in output_df.index:
-                            if True not in (output_df.loc[i].str.contains(item) == True).to_list():
-                                output_df = output_df.drop(i)
+        if type(fields) == str:
+            fields = [fields]
+
+        # Searched fields which are not yet indexed are added by the index
+        text_index = self.text_index(update = True)
+        indexes = text_index.search(self, columns = fields, any_kwds = any_kwds, all_kwds = all_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive)
         
         if output.lower() == 'results':
-            masked = self.loc[output_df.index]
+            masked = self.loc[indexes]
             return masked
 
         else:
             if (output.lower() == 'dataframe') or (output.lower() == 'pandas.dataframe') or (output.lower() == 'pd.dataframe'):
-                return output_df
+                return pd.DataFrame(self.loc[indexes])
     
+    def rank(self, query: str = 'request_input', fields = None, top_k: int = 10, output = 'Results'):
+
+        """
+        Ranks results by their relevance to a query using the BM25 scoring function. Uses the Results DataFrame's BM25 index, which is built on the first query and kept up to date afterwards.
+
+        Parameters
+        ----------
+        query : str
+            a search query. Defaults to requesting from user input.
+        fields : str or list
+            names of one or more fields to rank on. Their text is treated as a single document. Defaults to the abstract, description, extract and full text columns.
+        top_k : int
+            maximum number of results to return. If None, returns all matching results. Defaults to 10.
+        output : str
+            the type of object to return. Defaults to Results.
+
+        Returns
+        -------
+        output : Results, pandas.DataFrame or pandas.Series
+            matching results in descending order of relevance. Results and DataFrame outputs include a 'relevance' column containing BM25 scores. If output is 'scores', returns a Pandas Series of scores indexed by row.
+        """
+
+        if query == 'request_input':
+            query = input('Query: ')
+
+        if type(fields) == str:
+            fields = [fields]
+
+        rank_index = self.rank_index(fields = fields)
+        scores = rank_index.top(str(query), columns = fields, top_k = top_k)
+
+        if output.lower() == 'scores':
+            return scores
+
+        ranked = self.loc[scores.index.to_list()].copy(deep=True)
+        ranked['relevance'] = scores.to_list()
+
+        if output.lower() == 'results':
+            return ranked
+
+        else:
+            if (output.lower() == 'dataframe') or (output.lower() == 'pandas.dataframe') or (output.lower() == 'pd.dataframe'):
+                return pd.DataFrame(ranked)
+
     def get_keywords(self):
         
         """
@@ -1729,72 +2852,28 @@ class Results(pd.DataFrame):
 
         query = str(query).strip()
 
-        all_str = self.copy(deep=True).astype(str)
+        # Checking identifiers using the identifier index before scanning for partial matches
+        id_matches = self.lookup_ids(query=query, columns=['work_id', 'doi', 'isbn', 'issn', 'link'], ignore_case=ignore_case)
+        if len(id_matches) > 0:
+            return True
+
+        # ISBNs, ISSNs and links are matched exactly, so are fully covered by the identifier index
+        cols = [c for c in ['work_id', 'title', 'date', 'source', 'publisher', 'funder', 'keywords', 'doi'] if c in self.columns]
+        view = self.string_view()
         
         if ignore_case == True:
             query = query.lower()
-            
-
-        cols = all_str.columns
 
         for c in cols:
 
-            if ignore_case == True:
-                all_str[c] = all_str[c].str.lower()
+            col_str = view.column(self, c, ignore_case=ignore_case)
 
-            if c == 'work_id':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
             if c == 'title':
-                res = all_str[all_str[c] == query]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'date':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'source':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'publisher':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'funder':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'keywords':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'doi':
-                res = all_str[all_str[c].str.contains(query)]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'isbn':
-                res = all_str[all_str[c] == query]
-                if len(res) > 0:
-                    return True
-            
-            if c == 'issn':
-                res = all_str[all_str[c] == query]
-                if len(res) > 0:
+                if (col_str == query).any() == True:
                     return True
             
-            if c == 'link':
-                res = all_str[all_str[c] == query]
-                if len(res) > 0:
+            else:
+                if col_str.str.contains(query).any() == True:
                     return True
 
         return False
@@ -1802,7 +2881,7 @@ class Results(pd.DataFrame):
     def mask_affiliations(self, query: str = 'request_input', ignore_case: bool = True):
 
         """
-        Filters the Results DataFrame for entries which contain an inputted string in their affiliations data.
+        Filters the Results DataFrame for entries with an author affiliation that matches an inputted identifier (e.g. an affiliation ID, name or URI).
 
         Parameters
         ----------
@@ -1822,20 +2901,76 @@ class Results(pd.DataFrame):
 
         query = str(query).strip()
 
-        def affil_masker(authors):
-            if 'mask_entities' in authors.__dir__():
-                masked = authors.mask_entities(column='affiliations', query=query, ignore_case=ignore_case)
-                res = len(masked) > 0
-                
-            else:
-                res = False
+        affils_index = self.entity_index(column = 'affiliations', ignore_case = ignore_case)
+        masked = self.loc[affils_index.lookup(query)]
 
-            return res
+        return masked
 
-        
-        masked = self[self['authors'].apply(affil_masker)]
+    def entity_indexes(self, columns = None, ignore_case: bool = True) -> dict:
 
-        return masked
+        """
+        Builds indexes mapping entity identifiers (e.g. author IDs, ORCIDs, names, funder URIs) to the results whose entities contain them, and results to their entities. All indexes are built in a single pass over the authors and funder columns.
+
+        Parameters
+        ----------
+        columns : list
+            the indexes to build. Options: 'authors' (authors to works), 'funder' (funders to works), and 'affiliations' (authors' affiliations to works). Defaults to all three.
+        ignore_case : bool
+            whether to ignore the case of identifiers. Defaults to True.
+
+        Returns
+        -------
+        entity_indexes : dict
+            a dictionary of EntityIndex objects, keyed by column name.
+        """
+
+        if columns is None:
+            columns = ['authors', 'funder', 'affiliations']
+
+        id_columns = {'authors': 'author_id', 'funder': 'funder_id', 'affiliations': 'affiliation_id'}
+        indexes = {c: EntityIndex(id_column = id_columns[c], ignore_case = ignore_case) for c in columns}
+
+        authors_col = self['authors'].to_numpy(dtype=object) if 'authors' in self.columns else np.full(len(self), None, dtype=object)
+        funders_col = self['funder'].to_numpy(dtype=object) if 'funder' in self.columns else np.full(len(self), None, dtype=object)
+
+        for label, authors, funders in zip(self.index, authors_col, funders_col):
+
+            authors_summary = getattr(authors, 'summary', None)
+            if type(authors_summary) == pd.DataFrame:
+
+                if 'authors' in indexes:
+                    indexes['authors'].add_row(label, authors_summary)
+
+                if ('affiliations' in indexes) and ('affiliations' in authors_summary.columns):
+                    affil_summaries = [getattr(affils, 'summary', None) for affils in authors_summary['affiliations'].to_list()]
+                    affil_summaries = [i for i in affil_summaries if type(i) == pd.DataFrame]
+                    indexes['affiliations'].add_row(label, affil_summaries)
+
+            funders_summary = getattr(funders, 'summary', None)
+            if ('funder' in indexes) and (type(funders_summary) == pd.DataFrame):
+                indexes['funder'].add_row(label, funders_summary)
+
+        return indexes
+
+    def entity_index(self, column: str = 'authors', ignore_case: bool = True) -> EntityIndex:
+
+        """
+        Builds an index mapping entity identifiers (e.g. author IDs, ORCIDs, names) to the results whose entities contain them, and results to their entities, in a single pass over the Results DataFrame.
+
+        Parameters
+        ----------
+        column : str
+            the index to build. Options: 'authors' (authors to works), 'funder' (funders to works), and 'affiliations' (authors' affiliations to works). Defaults to 'authors'.
+        ignore_case : bool
+            whether to ignore the case of identifiers. Defaults to True.
+
+        Returns
+        -------
+        entity_index : EntityIndex
+            the entity index.
+        """
+
+        return self.entity_indexes(columns = [column], ignore_case = ignore_case)[column]
 
     def mask_entities(self, column, query: str = 'request_input', ignore_case: bool = True):
 
@@ -1874,20 +3009,102 @@ class Results(pd.DataFrame):
 
         return masked
 
-    def format_funders(self, use_api: bool = False):
+    def format_funders(self, use_api: bool = False, changed_only: bool = True, lazy = None, workers = None, executor = None):
 
         """
         Formats all funders data as Funders objects.
+
+        Parameters
+        ----------
+        changed_only : bool
+            whether to only format results which are new or have changed since funders were last formatted. Defaults to True.
+        lazy : bool
+            whether to defer formatting until each entry's funders are first accessed. Defaults to None: formatting is deferred if lazy formatting is the default (see art.utils.lazy.set_lazy_default).
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
-        try:
-            funders = self['funder'].apply(format_funders) # type: ignore
-        except:
-            funders = self['funder']
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            rows = tracker.pending(self, 'funders', columns = ['funder'])
+        else:
+            rows = self.index.to_list()
+
+        if len(rows) > 0:
+            
+            try:
+                if use_lazy(lazy) == True:
+                    funders = [i if type(i) in [Funders, LazyValue] else LazyValue(format_funders, i) for i in self.loc[rows, 'funder'].to_list()]
+                    set_column_values(self, 'funder', rows, funders)
+                else:
+                    funders = parallel_map(format_funders, self.loc[rows, 'funder'].to_list(), workers = workers, executor = executor)
+                    set_column_values(self, 'funder', rows, funders)
+            except:
+                pass
+
+        tracker.done(self, 'funders', columns = ['funder'])
+
+    def materialize(self, columns = None):
+
+        """
+        Formats any authors, funders and citations data whose formatting has been deferred, and replaces the deferred values with the formatted objects.
+
+        Parameters
+        ----------
+        columns : list
+            names of columns to process. Defaults to the 'authors', 'funder' and 'citations' columns.
+        """
+
+        if columns is None:
+            columns = ['authors', 'funder', 'citations']
+
+        if type(columns) == str:
+            columns = [columns]
+
+        for c in columns:
+
+            if (c == 'citations') and ('citation_count' in self.columns):
+
+                labels = [label for label, value in zip(self.index, self['citations'].to_list()) if type(value) == LazyValue]
+
+                for label in labels:
+
+                    refs = self.at[label, 'citations'].get()
+                    refs_count = refs.__dict__.get('refs_count')
+
+                    if refs_count is None:
+                        try:
+                            refs_count = len(refs)
+                        except:
+                            refs_count = 0
+
+                    storage.set_value(self, label, 'citation_count', refs_count)
+
+            materialize_column(self, c)
+
+        return self
+
+def get_entity_publications(self) -> Results:
+
+    """
+    A Results dataframe containing data on the Entity's publications. Created when first accessed.
+    """
+
+    if self._publications is None:
+        self._publications = Results()
+
+    if type(self._publications) == tuple:
+        dataframe, rows = self._publications
+        self._publications = Results.from_dataframe(dataframe.loc[rows]) # type: ignore
+
+    return self._publications
 
-        self['funder'] = funders
+def set_entity_publications(self, results: Results):
+    self._publications = results
 
-Entity.publications = Results() # type: ignore
-Funder.publications = Results() # type: ignore
+Entity.publications = property(get_entity_publications, set_entity_publications) # type: ignore
 
 
@@ -1,8 +1,16 @@
 from ..utils.basics import Iterator, results_cols
 from ..utils.cleaners import deduplicate
+from ..utils.changes import set_column_values
+from ..utils.lazy import LazyValue, use_lazy, materialize
+from ..utils.parallel import parallel_map, worker_pool
+from ..utils.reviewfile import ReviewFile, TableSnapshot, StateSnapshot, is_review_file, write_review_file, append_review_file, journal_size, base_size
+from ..utils import reviewfile
+from ..utils.database import ReviewDatabase, is_review_database, write_review_database
 from ..exporters.general_exporters import obj_to_folder, art_class_to_folder
 
 from ..importers.pdf import read_pdf_to_table
+from ..importers.chunked import read_csv_chunks, read_json_chunks, read_excel_chunks, read_file_chunks, chunked_file_types
+from ..importers.bibtex import read_bibtex_chunks
 from ..importers.crossref import search_works, lookup_doi, lookup_dois, lookup_journal, lookup_journals, search_journals, get_journal_entries, search_journal_entries, lookup_funder, lookup_funders, search_funders, get_funder_works, search_funder_works
 from ..importers.crossref import query_builder as crossref_query_builder
 from ..importers.scopus import query_builder as scopus_query_builder, search as search_scopus, lookup as lookup_scopus
@@ -22,8 +30,10 @@ from .authors import Author, Authors, format_authors as orig_format_authors
 from .networks import Network, Networks
 from .citation_crawler import citation_crawler, academic_scraper
 
+import os
 import copy
 import pickle
+import weakref
 from pathlib import Path
 
 import pandas as pd
@@ -31,6 +41,324 @@ import numpy as np
 
 from igraph import Graph # type: ignore
 
+# Deferred formatting passes are held outside of Review objects' attributes so that they are not exported with them
+pending_formats = weakref.WeakKeyDictionary()
+
+# Sections of Reviews opened from sectioned .review files or databases which have not yet been loaded, with the files to load them from
+pending_sections = weakref.WeakKeyDictionary()
+
+# Snapshots of Reviews' sections when they were last saved to, or loaded from, sectioned .review files, with the files' manifests
+saved_states = weakref.WeakKeyDictionary()
+
+# Sections of sectioned .review files, in the order they are written
+review_sections = ['results', 'authors', 'funders', 'affiliations', 'networks', 'activity_log']
+
+# Results columns holding formatted objects, which are only unpickled when first used
+lazy_results_cols = ['authors', 'funder', 'citations']
+
+# Entity collection types, by Review attribute
+entities_types = {
+                    'authors': Authors,
+                    'funders': Funders,
+                    'affiliations': Affiliations
+                    }
+
+def network_sections(name: str, network) -> list:
+
+    """
+    Returns the (name, kind, value) sections used to store a network: vertex and edge tables, and any graph attributes. Objects other than graphs are pickled.
+    """
+
+    prefix = f'networks/{name}'
+
+    if isinstance(network, Graph) == False:
+        return [(f'{prefix}/object', 'object', network)]
+
+    vertices = pd.DataFrame({attr: network.vs[attr] for attr in network.vs.attributes()}, index = range(network.vcount()))
+    edges = pd.DataFrame(network.get_edgelist(), columns = ['source', 'target'], dtype = 'int64')
+
+    for attr in network.es.attributes():
+        edges[attr] = network.es[attr]
+
+    sections = [(f'{prefix}/vertices', 'frame', vertices), (f'{prefix}/edges', 'frame', edges)]
+
+    if len(network.attributes()) > 0:
+        sections.append((f'{prefix}/graph', 'object', {attr: network[attr] for attr in network.attributes()}))
+
+    return sections
+
+def iter_review_sections(review):
+
+    """
+    Yields the (name, kind, value) sections written to a sectioned .review file: results and entity summaries as tables; networks as vertex and edge tables; and the activity log as JSON.
+    """
+
+    results = review.results
+    yield 'results', 'frame', results
+
+    for name in entities_types.keys():
+        entities = getattr(review, name)
+        state = {k: v for k, v in entities.__dict__.items() if k != 'summary'}
+        yield f'{name}/summary', 'frame', entities.summary
+        yield f'{name}/state', 'object', state
+
+    for name, network in review.networks.__dict__.items():
+        for section in network_sections(name, network):
+            yield section
+
+    activity_log = review.activity_log
+    yield 'activity_log', 'json', activity_log.to_dict(orient = 'split')
+
+def snapshot_review_section(review, name: str, previous = None) -> dict:
+
+    """
+    Records the state of one of a Review's sections when it is saved or loaded, so that incremental saves only write what has changed since (see Review.save).
+
+    Parameters
+    ----------
+    review : Review
+        the Review.
+    name : str
+        name of the section: 'results', 'authors', 'funders', 'affiliations', 'networks' or 'activity_log'.
+    previous : dict
+        the section's previous snapshots, whose fingerprints are reused where possible. Defaults to None.
+
+    Returns
+    -------
+    snapshots : dict
+        snapshots of the section's parts, by name.
+    """
+
+    if previous is None:
+        previous = dict()
+
+    value = review.__dict__[name]
+
+    if name == 'results':
+        if isinstance(value, Results) == True:
+            tracker = value.change_tracker()
+            tracker.done(value, 'save')
+            return {'results': TableSnapshot(value, tracker = tracker)}
+        return {'results': TableSnapshot(value)}
+
+    if name in entities_types.keys():
+        value.change_tracker().done(value.summary, 'save')
+        state = {k: v for k, v in value.__dict__.items() if k != 'summary'}
+        return {f'{name}/summary': TableSnapshot(value.summary, previous = previous.get(f'{name}/summary')), f'{name}/state': StateSnapshot(state, previous = previous.get(f'{name}/state'))}
+
+    if name == 'networks':
+        return {'networks': {network_name: (network, network.vcount(), network.ecount()) if isinstance(network, Graph) else (network, None, None) for network_name, network in value.__dict__.items()}}
+
+    return {name: TableSnapshot(value, previous = previous.get(name))}
+
+def iter_review_changes(review, snapshots: dict):
+
+    """
+    Yields the (name, mode, kind, value) changes to a Review's sections since they were saved or loaded, for appending to a sectioned .review file (see append_review_file). Sections which have not been loaded have not changed, and are skipped.
+
+    Parameters
+    ----------
+    review : Review
+        the Review.
+    snapshots : dict
+        snapshots of the Review's sections, from snapshot_review_section.
+    """
+
+    pending = pending_sections.get(review, dict())
+
+    for name in review_sections:
+
+        if (name in pending.keys()) and (name not in review.__dict__.keys()):
+            continue
+
+        if name == 'results':
+
+            results = review.results
+
+            # Pandas operations return DataFrames rather than Results objects (e.g. review.results = review.results.drop(...)); these are converted and saved in full
+            if isinstance(results, Results) == False:
+                yield 'results', 'replace', 'frame', Results.from_dataframe(results)
+                continue
+
+            tracker = results.change_tracker()
+            changed = tracker.pending(results, 'save') if 'save' in tracker.passes else None
+
+            if 'results' not in snapshots:
+                yield 'results', 'replace', 'frame', results
+                continue
+
+            diff = snapshots['results'].diff(results, changed = changed, tracker = tracker)
+            if diff is not None:
+                yield 'results', diff[0], 'frame', diff[1]
+
+        if name in entities_types.keys():
+
+            entities = getattr(review, name)
+            summary = entities.summary
+            state = {k: v for k, v in entities.__dict__.items() if k != 'summary'}
+
+            if f'{name}/summary' not in snapshots:
+                yield f'{name}/summary', 'replace', 'frame', summary
+                yield f'{name}/state', 'replace', 'object', state
+                continue
+
+            tracker = entities.change_tracker()
+            changed = tracker.pending(summary, 'save') if 'save' in tracker.passes else None
+
+            diff = snapshots[f'{name}/summary'].diff(summary, changed = changed)
+            if diff is not None:
+                yield f'{name}/summary', diff[0], 'frame', diff[1]
+
+            state_diff = snapshots[f'{name}/state'].diff(state)
+            if state_diff is not None:
+                yield f'{name}/state', 'state', 'object', state_diff
+
+        if name == 'networks':
+
+            networks = review.networks.__dict__
+            saved = snapshots.get('networks', dict())
+
+            for network_name, network in networks.items():
+
+                if network_name in saved.keys():
+                    saved_network, vertex_count, edge_count = saved[network_name]
+                    if (saved_network is network) and ((isinstance(network, Graph) == False) or ((network.vcount() == vertex_count) and (network.ecount() == edge_count))):
+                        continue
+
+                sections = network_sections(network_name, network)
+                section_names = [section[0] for section in sections]
+
+                for section_name, kind, value in sections:
+                    yield section_name, 'replace', kind, value
+
+                for suffix in ['vertices', 'edges', 'graph', 'object']:
+                    if f'networks/{network_name}/{suffix}' not in section_names:
+                        yield f'networks/{network_name}/{suffix}', 'delete', None, None
+
+            for network_name in saved.keys():
+                if network_name not in networks.keys():
+                    for suffix in ['vertices', 'edges', 'graph', 'object']:
+                        yield f'networks/{network_name}/{suffix}', 'delete', None, None
+
+        if name == 'activity_log':
+
+            activity_log = review.activity_log
+
+            if 'activity_log' not in snapshots:
+                yield 'activity_log', 'replace', 'json', activity_log.to_dict(orient = 'split')
+                continue
+
+            diff = snapshots['activity_log'].diff(activity_log)
+
+            if diff is None:
+                continue
+
+            if diff[0] == 'rows':
+
+                order, rows = diff[1]
+                source = order['source'].to_numpy()
+                saved_length = len(snapshots['activity_log'].index)
+
+                # Entries which have only been added to the end of the log are appended
+                if (len(source) >= saved_length) and (source[:saved_length] == np.arange(saved_length)).all() and (source[saved_length:] < 0).all() and order.index[:saved_length].equals(snapshots['activity_log'].index):
+                    records = rows.to_dict(orient = 'split')
+                    yield 'activity_log', 'append', 'json', {'index': records['index'], 'data': records['data']}
+                    continue
+
+            yield 'activity_log', 'replace', 'json', activity_log.to_dict(orient = 'split')
+
+def frame_to_results(frame: pd.DataFrame, compact: bool = False) -> Results:
+
+    """
+    Converts a dataframe read from a sectioned .review file or a Review database to a Results DataFrame.
+    """
+
+    results = Results()
+    results.__dict__.update(frame.__dict__)
+
+    if compact == True:
+        results._compact = True
+
+    return results
+
+def read_review_section(review_file: ReviewFile, name: str):
+
+    """
+    Reads one of a Review's sections from a sectioned .review file or a Review database.
+
+    Parameters
+    ----------
+    review_file : ReviewFile or ReviewDatabase
+        the file to read from.
+    name : str
+        name of the section: 'results', 'authors', 'funders', 'affiliations', 'networks' or 'activity_log'.
+
+    Returns
+    -------
+    value : object
+        the section's Results, Authors, Funders, Affiliations, Networks or ActivityLog object.
+    """
+
+    metadata = review_file.metadata
+
+    if name == 'results':
+        return frame_to_results(review_file.read('results'), compact = metadata.get('results', dict()).get('compact') == True)
+
+    if name in entities_types.keys():
+
+        entities_type = entities_types[name]
+        entities = entities_type.__new__(entities_type)
+        entities.__dict__.update(review_file.read(f'{name}/state'))
+        entities.summary = review_file.read(f'{name}/summary')
+
+        return entities
+
+    if name == 'networks':
+
+        networks = Networks()
+
+        for network_name, network_metadata in metadata.get('networks', dict()).items():
+
+            prefix = f'networks/{network_name}'
+
+            if f'{prefix}/object' in review_file:
+                networks.__dict__[network_name] = review_file.read(f'{prefix}/object')
+                continue
+
+            vertices = review_file.read(f'{prefix}/vertices')
+            edges = review_file.read(f'{prefix}/edges')
+            edge_list = list(zip(edges['source'].to_list(), edges['target'].to_list()))
+
+            if network_metadata.get('type') == 'Network':
+                network = Network(n = network_metadata['vertices'], edges = edge_list, directed = network_metadata.get('directed', False))
+            else:
+                network = Graph(n = network_metadata['vertices'], edges = edge_list, directed = network_metadata.get('directed', False))
+
+            for attr in vertices.columns:
+                network.vs[attr] = vertices[attr].to_list()
+
+            for attr in edges.columns.drop(['source', 'target']):
+                network.es[attr] = edges[attr].to_list()
+
+            if f'{prefix}/graph' in review_file:
+                for attr, value in review_file.read(f'{prefix}/graph').items():
+                    network[attr] = value
+
+            networks.__dict__[network_name] = network
+
+        return networks
+
+    if name == 'activity_log':
+
+        log_dict = review_file.read('activity_log')
+        activity_log = ActivityLog()
+        frame = pd.DataFrame(log_dict['data'], index = log_dict['index'], columns = log_dict['columns'], dtype = object)
+        activity_log.__dict__.update(frame.__dict__)
+
+        return activity_log
+
+    raise KeyError(name)
+
 
 def add_pdf(self, path = 'request_input'):
         
@@ -87,6 +415,9 @@ def add_row(self, data):
         if type(data) != pd.Series:
             raise TypeError(f'Results must be a pandas.Series, not {type(data)}')
 
+        if self.__dict__.get('_batch') is not None:
+            return self.stage_rows(data)
+
         data.index = data.index.astype(str).str.lower().str.replace(' ', '_')
         if len(data) != len(self.columns):
             for c in data.index:
@@ -98,8 +429,18 @@ def add_row(self, data):
         work_id = generate_work_id(data)
         work_id = self.get_unique_id(work_id, index)
         data['work_id'] = work_id
+
+        id_index = self.id_index(build=False)
         
         self.loc[index] = data
+
+        if id_index is not None:
+            self._id_index = id_index.add_rows(self.loc[[index]]).stamp(self)
+
+        for text_index in self.text_indexes():
+            text_index.add_rows(self.loc[[index]])
+
+        self.mark_changed(index)
         self.format_authors()
 
 Results.add_row = add_row # type: ignore
@@ -131,6 +472,9 @@ def add_dataframe(self,  dataframe: pd.DataFrame, drop_duplicates = False, drop_
         if (type(dataframe) != pd.DataFrame) and (type(dataframe) != pd.Series):
             raise TypeError(f'Results must be a pandas.Series or pandas.DataFrame, not {type(dataframe)}')
 
+        if self.__dict__.get('_batch') is not None:
+            return self.stage_rows(dataframe)
+
         dataframe = dataframe.reset_index().drop('index', axis=1)
         dataframe.columns = dataframe.columns.astype(str).str.lower().str.replace(' ', '_')
 
@@ -139,6 +483,9 @@ def add_dataframe(self,  dataframe: pd.DataFrame, drop_duplicates = False, drop_
                 if c not in self.columns:
                     self[c] = pd.Series(dtype=object)
         
+        id_index = self.id_index(build=False)
+        old_rows = self.index.to_list()
+
         self_copy = self.copy(deep=True)
         concat_df = pd.concat([self_copy, dataframe])
         concat_df = concat_df.reset_index().drop('index', axis=1)
@@ -150,18 +497,31 @@ def add_dataframe(self,  dataframe: pd.DataFrame, drop_duplicates = False, drop_
         
         self.__dict__.update(new_results.__dict__)
 
+        if id_index is not None:
+            id_index.relabel(old_rows)
+            id_index.add_rows(self.iloc[len(old_rows):])
+            self._id_index = id_index.stamp(self)
+
+        for text_index in self.text_indexes():
+            text_index.relabel(old_rows)
+            text_index.add_rows(self.iloc[len(old_rows):])
+
+        self.change_tracker().relabel(old_rows)
+
         if drop_empty_rows == True:
             self.drop_empty_rows()
 
         if update_work_ids == True:
-            self.update_work_ids(drop_duplicates=False)
+            self.update_work_ids(drop_duplicates=False, changed_only=True)
 
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=True)
 
         if format_authors == True:
             self.format_authors()
 
+        self.update_storage()
+
 Results.add_dataframe = add_dataframe # type: ignore
 
 def has_formatted_citations(self):
@@ -184,7 +544,27 @@ def lacks_formatted_citations(self):
 
 Results.lacks_formatted_citations = lacks_formatted_citations # type: ignore
 
-def format_citations(self, add_work_ids = False, update_from_doi = False, verbose = True):
+def format_references_with_count(references_data, add_work_ids = False, update_from_doi = False) -> tuple:
+
+        """
+        Formats citations data as a References object and counts the citations. Returns a (References, count) tuple.
+        """
+
+        refs = format_references(references_data, add_work_ids = add_work_ids, update_from_doi = update_from_doi)
+        refs_count  = None
+
+        if 'refs_count' in refs.__dict__.keys():
+            refs_count  = refs.refs_count
+        
+        if refs_count is None:
+            try:
+                refs_count = len(refs) # type: ignore
+            except:
+                refs_count = 0
+
+        return refs, refs_count
+
+def format_citations(self, add_work_ids = False, update_from_doi = False, verbose = True, changed_only = True, lazy = None, workers = None, executor = None):
         
         """
         Formats all results entries' citations data as References objects.
@@ -197,6 +577,14 @@ def format_citations(self, add_work_ids = False, update_from_doi = False, verbos
             whether to update results data from DOI's.
         verbose : bool
             whether to print dialogue during formatting.
+        changed_only : bool
+            whether to only check results entries which are new or have changed since citations were last formatted. Defaults to True.
+        lazy : bool
+            whether to defer formatting until each entry's citations are first accessed. Citation counts are updated when deferred citations are materialised (see Results.materialize). Defaults to None: formatting is deferred if lazy formatting is the default.
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
         self['citations'] = self['citations'].replace({np.nan: None})
@@ -205,8 +593,25 @@ def format_citations(self, add_work_ids = False, update_from_doi = False, verbos
         if len(self[self['citations_data'].isna()]) == len(self['citations_data']):
             self['citations_data'] = self['citations'].copy(deep=True)
 
-        unformatted = self.lacks_formatted_citations()
+        tracker = self.change_tracker()
+
+        if changed_only == True:
+            rows = tracker.pending(self, 'citations')
+            unformatted = self.loc[rows]
+            unformatted = unformatted[~unformatted['citations'].apply(is_formatted_reference)]
+        else:
+            unformatted = self.lacks_formatted_citations()
+
         length = len(unformatted)
+
+        if (length > 0) and (use_lazy(lazy) == True):
+
+            indices = [i for i in unformatted.index if type(self.at[i, 'citations']) != LazyValue]
+            kwargs = {'add_work_ids': add_work_ids, 'update_from_doi': update_from_doi}
+            refs = [LazyValue(format_references, self.at[i, 'citations_data'], kwargs) for i in indices]
+            set_column_values(self, 'citations', indices, refs)
+            length = 0
+
         if length > 0:
             
             if verbose == True:
@@ -218,19 +623,11 @@ def format_citations(self, add_work_ids = False, update_from_doi = False, verbos
                 print(intro_message)
 
             indices = unformatted.index
-            processing_count = 0
-            for i in indices:
-                refs = format_references(self.loc[i, 'citations_data'], add_work_ids = add_work_ids, update_from_doi = update_from_doi)
-                refs_count  = None
+            kwargs = {'add_work_ids': add_work_ids, 'update_from_doi': update_from_doi}
+            formatted = parallel_map(format_references_with_count, self.loc[indices, 'citations_data'].to_list(), workers = workers, executor = executor, kwargs = kwargs)
 
-                if 'refs_count' in refs.__dict__.keys():
-                    refs_count  = refs.refs_count
-                
-                if refs_count is None:
-                    try:
-                        refs_count = len(refs) # type: ignore
-                    except:
-                        refs_count = 0
+            processing_count = 0
+            for i, (refs, refs_count) in zip(indices, formatted):
 
                 processing_count = processing_count + refs_count
                 self.at[i, 'citations'] = refs
@@ -243,23 +640,49 @@ def format_citations(self, add_work_ids = False, update_from_doi = False, verbos
                     outro_message = f'{processing_count} citations formatted\n'
                 print(outro_message)
 
+        tracker.done(self, 'citations')
+
 Results.format_citations = format_citations # type: ignore
 
-def format_authors(self):
+def format_authors(self, changed_only = True, lazy = None, workers = None, executor = None):
 
         """
         Formats all results entries' authors data as Authors objects.
+
+        Parameters
+        ----------
+        changed_only : bool
+            whether to only format results entries which are new or have changed since authors were last formatted. Defaults to True.
+        lazy : bool
+            whether to defer formatting until each entry's authors are first accessed. Defaults to None: formatting is deferred if lazy formatting is the default.
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
         if len(self[self['authors_data'].isna()]) < len(self['authors_data']):
-            authors_data = self['authors_data']
+            source = 'authors_data'
         
         else:
-            authors_data = self['authors']
+            source = 'authors'
+
+        authors_data = self[source]
+        tracker = self.change_tracker()
 
-        new_series = authors_data.apply(orig_format_authors) # type: ignore
+        if changed_only == True:
+            rows = tracker.pending(self, 'authors', columns = [source])
+            authors_data = authors_data.loc[rows]
 
-        self['authors'] = new_series
+        if (len(authors_data) > 0) and (use_lazy(lazy) == True):
+            new_values = [i if type(i) in [Authors, LazyValue] else LazyValue(orig_format_authors, i) for i in authors_data.to_list()]
+            set_column_values(self, 'authors', authors_data.index.to_list(), new_values)
+
+        elif len(authors_data) > 0:
+            new_values = parallel_map(orig_format_authors, authors_data.to_list(), workers = workers, executor = executor)
+            set_column_values(self, 'authors', authors_data.index.to_list(), new_values)
+
+        tracker.done(self, 'authors', columns = [source])
 
         return self['authors']
 
@@ -291,13 +714,13 @@ def add_citations_to_results(self, add_work_ids = False, update_from_doi = False
             self.drop_empty_rows()
 
         if drop_duplicates == True:
-            self.remove_duplicates()
+            self.remove_duplicates(changed_only=True)
 
         unformatted = self.lacks_formatted_citations()
         if len(unformatted) > 0:
             self.format_citations(add_work_ids = add_work_ids, update_from_doi = update_from_doi)
 
-        citations = self['citations'].to_list()
+        citations = [materialize(i) for i in self['citations'].to_list()]
         existing_ids = set(self['work_id'].to_list())
         
         for i in citations:
@@ -312,7 +735,7 @@ def add_citations_to_results(self, add_work_ids = False, update_from_doi = False
                     self.add_dataframe(dataframe=df, drop_empty_rows = False)
         
         self.drop_empty_rows()
-        self.update_work_ids()
+        self.update_work_ids(changed_only=True)
         self.format_authors()
 
 
@@ -352,8 +775,6 @@ class Review:
         metadata logging changes to the Review, including: additions, deletions, crawling, and searches.
     """
 
-    results = Results()
-    activity_log = ActivityLog()
     description = ''
 
     def __init__(self, review_name = None, file_location = None):
@@ -382,6 +803,240 @@ class Review:
         self.networks = Networks()
         self.format()
         self.update_properties()
+
+    def __getstate__(self):
+
+        """
+        Returns the Review's state for pickling. Any deferred formatting of authors, funders and affiliations is run first, so that saved Reviews are complete.
+        """
+
+        self.load_sections()
+        self.flush_results()
+        self.format_pending()
+
+        return self.__dict__
+
+    @property
+    def results(self) -> Results:
+
+        """
+        A Results object containing data on publications. If the Review was opened from a sectioned .review file, results are loaded when first accessed.
+        """
+
+        self.load_sections(['results'])
+        return self.__dict__['results']
+
+    @results.setter
+    def results(self, results: Results):
+        self.__dict__['results'] = results
+
+    @property
+    def authors(self) -> Authors:
+
+        """
+        An Authors object containing data on the Review's authors. If formatting has been deferred, authors are formatted when first accessed.
+        """
+
+        self.load_sections(['authors'])
+        self.format_pending(['authors'])
+        return self.__dict__['authors']
+
+    @authors.setter
+    def authors(self, authors: Authors):
+        self.__dict__['authors'] = authors
+
+    @property
+    def funders(self) -> Funders:
+
+        """
+        A Funders object containing data on the Review's funders. If formatting has been deferred, funders are formatted when first accessed.
+        """
+
+        self.load_sections(['funders'])
+        self.format_pending(['funders'])
+        return self.__dict__['funders']
+
+    @funders.setter
+    def funders(self, funders: Funders):
+        self.__dict__['funders'] = funders
+
+    @property
+    def affiliations(self) -> Affiliations:
+
+        """
+        An Affiliations object containing data on authors' affiliate organisations. If formatting has been deferred, affiliations are formatted when first accessed.
+        """
+
+        self.load_sections(['affiliations'])
+        self.format_pending(['affiliations'])
+        return self.__dict__['affiliations']
+
+    @affiliations.setter
+    def affiliations(self, affiliations: Affiliations):
+        self.__dict__['affiliations'] = affiliations
+
+    @property
+    def networks(self) -> Networks:
+
+        """
+        A Networks object containing network objects derived from Review data. If the Review was opened from a sectioned .review file, networks are loaded when first accessed.
+        """
+
+        self.load_sections(['networks'])
+        return self.__dict__['networks']
+
+    @networks.setter
+    def networks(self, networks: Networks):
+        self.__dict__['networks'] = networks
+
+    @property
+    def activity_log(self) -> ActivityLog:
+
+        """
+        An ActivityLog object logging changes to the Review. If the Review was opened from a sectioned .review file, the activity log is loaded when first accessed.
+        """
+
+        self.load_sections(['activity_log'])
+
+        if 'activity_log' not in self.__dict__.keys():
+            self.__dict__['activity_log'] = ActivityLog()
+
+        return self.__dict__['activity_log']
+
+    @activity_log.setter
+    def activity_log(self, activity_log: ActivityLog):
+        self.__dict__['activity_log'] = activity_log
+
+    def load_sections(self, sections = None):
+
+        """
+        Loads any sections of the Review which have not yet been read from the sectioned .review file it was opened from (see Review.open).
+
+        Parameters
+        ----------
+        sections : list
+            names of the sections to load ('results', 'authors', 'funders', 'affiliations', 'networks' and/or 'activity_log'). Defaults to all sections.
+        """
+
+        global pending_sections, saved_states
+
+        pending = pending_sections.get(self)
+
+        if (pending is None) or (len(pending) == 0):
+            return self
+
+        if sections is None:
+            sections = list(pending.keys())
+
+        for name in sections:
+
+            if name not in pending.keys():
+                continue
+
+            review_file = pending[name]
+
+            # Sections which have been replaced since the Review was opened are not loaded
+            if name not in self.__dict__.keys():
+
+                self.__dict__[name] = read_review_section(review_file, name)
+
+                state = saved_states.get(self)
+                if (state is not None) and (state['file_path'] == os.path.abspath(review_file.file_path)):
+                    state['snapshots'].update(snapshot_review_section(self, name))
+
+            del pending[name]
+
+            if review_file not in pending.values():
+                review_file.close()
+
+        if len(pending) == 0:
+            del pending_sections[self]
+
+        return self
+
+    def pending_database(self, name: str = 'results'):
+
+        """
+        Returns the database a section of the Review will be loaded from, if the Review was opened from a database (see Review.open_database) and the section has not yet been loaded. Otherwise, returns None.
+
+        Parameters
+        ----------
+        name : str
+            name of the section. Defaults to 'results'.
+
+        Returns
+        -------
+        database : ReviewDatabase or None
+            the database.
+        """
+
+        global pending_sections
+
+        pending = pending_sections.get(self, dict())
+
+        if (name not in pending.keys()) or (name in self.__dict__.keys()):
+            return None
+
+        if type(pending[name]) != ReviewDatabase:
+            return None
+
+        return pending[name]
+
+    def flush_results(self):
+
+        """
+        Adds any rows staged for batched ingestion to the Review's results (see Results.start_batch). Results which have not yet been loaded are not loaded.
+        """
+
+        results = self.__dict__.get('results')
+
+        if isinstance(results, Results) == True:
+            results.flush()
+
+        return self
+
+    def format_pending(self, entities = None):
+
+        """
+        Runs any formatting of the Review's funders, authors and affiliations which has been deferred (see Review.format).
+
+        Parameters
+        ----------
+        entities : list
+            names of the entities to format ('funders', 'authors' and/or 'affiliations'). Affiliations are formatted from authors data, so formatting affiliations also formats authors. Defaults to all entities.
+        """
+
+        global pending_formats
+
+        pending = pending_formats.get(self)
+
+        if (pending is None) or (len(pending) == 0):
+            return self
+
+        if entities is None:
+            entities = ['funders', 'authors', 'affiliations']
+
+        if 'affiliations' in entities:
+            entities = entities + ['authors']
+
+        for name in ['funders', 'authors', 'affiliations']:
+
+            if (name not in entities) or (name not in pending):
+                continue
+            
+            # Removing the pass before running it, as formatting accesses the entity being formatted
+            kwargs = pending.pop(name)
+
+            if name == 'funders':
+                self.format_funders(**kwargs)
+
+            if name == 'authors':
+                self.format_authors(**kwargs)
+
+            if name == 'affiliations':
+                self.format_affiliations(**kwargs)
+
+        return self
     
     def update_properties(self):
         
@@ -416,6 +1071,9 @@ class Review:
         Implements iteration functionality for Review objects.
         """
         
+        self.load_sections()
+        self.format_pending()
+
         return Iterator(self)
     
     def __getitem__(self, key):
@@ -429,10 +1087,10 @@ class Review:
             item associated with the inputted key.
         """
         
-        if key in self.__dict__.keys():
-            return self.__dict__[key]
+        if (key in self.__dict__.keys()) or (key in pending_sections.get(self, dict()).keys()):
+            return getattr(self, key)
 
-        if key in self.results['work_id'].to_list():
+        if (type(key) == str) and (len(self.results.lookup_ids(query=key, columns=['work_id'], ignore_case=False)) > 0):
             return self.results.get(key)
         
         if key in self.authors.all.keys():
@@ -460,7 +1118,7 @@ class Review:
         Deletes entry from results using its index.
         """
         
-        self.results = self.results.drop(index)
+        self.results.drop_rows(index)
         self.update_properties()
     
     def contents(self):
@@ -474,6 +1132,8 @@ class Review:
             the names of the Review object's attributes.
         """
         
+        self.load_sections()
+
         return self.__dict__.keys()
     
     def __len__(self):
@@ -526,6 +1186,9 @@ class Review:
             Review object formatted as a dictionary.
         """
         
+        self.load_sections()
+        self.format_pending()
+
         output_dict = {}
         for index in self.__dict__.keys():
             output_dict[index] = self.__dict__[index]
@@ -548,7 +1211,7 @@ class Review:
 
         return self.results.to_yaml()
     
-    def export_bibtex(self, file_name = 'request_input', folder_path= 'request_input'):
+    def export_bibtex(self, file_name = 'request_input', folder_path= 'request_input', chunk_size: int = None):
 
         """
         Exports Results data as a .bib file.
@@ -559,9 +1222,11 @@ class Review:
             name for export file. Defaults to requesting from user input.
         folder_path : str
             directory path for folder to export to. Defaults to requesting from user input.
+        chunk_size : int
+            the number of rows to write at a time. Defaults to 1000.
         """
 
-        return self.results.export_bibtex(file_name=file_name, folder_path=folder_path)
+        return self.results.export_bibtex(file_name=file_name, folder_path=folder_path, chunk_size=chunk_size)
 
     def export_yaml(self, file_name = 'request_input', folder_path= 'request_input'):
 
@@ -609,7 +1274,25 @@ class Review:
             return self.results.loc[index_position]
         else:
             return self.results.loc[index_position, column_position]
-    
+
+    def get_work(self, work_id: str):
+
+        """
+        Retrieves result using a work ID. Equivalent to Results.get. If the Review was opened from a database and its results have not been loaded, only the matching result is read.
+        """
+
+        database = self.pending_database('results')
+
+        if database is None:
+            return self.results.get(work_id)
+
+        matches = database.select_keys('results', 'work_id', [work_id])
+
+        if len(matches) > 0:
+            return frame_to_results(matches, compact = database.metadata.get('results', dict()).get('compact') == True).iloc[0]
+        else:
+            raise KeyError('work_id not found')
+
     def get_affiliations_dict(self):
 
         """
@@ -764,15 +1447,30 @@ class Review:
 
         return review
 
-    def format_funders(self):
+    def format_funders(self, changed_only = True, workers = None, executor = None):
 
         """
         Formats results entries' funders data into Funders objects and stores in Review's Funders attribute.
+
+        Parameters
+        ----------
+        changed_only : bool
+            whether to only process results entries which are new or have changed since funders were last formatted. Defaults to True.
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
-        self.results.format_funders() # type: ignore
+        self.results.format_funders(changed_only=changed_only, workers=workers, executor=executor) # type: ignore
 
-        funders_data = self.results['funder'].to_list()
+        tracker = self.results.change_tracker() # type: ignore
+        if changed_only == True:
+            rows = tracker.pending(self.results, 'review_funders', columns = ['funder'])
+        else:
+            rows = self.results.index.to_list()
+
+        funders_data = [materialize(i) for i in self.results.loc[rows, 'funder'].to_list()]
 
         for i in funders_data:
 
@@ -801,15 +1499,32 @@ class Review:
                     self.funders.merge(funders)
                     continue
 
-    def format_affiliations(self):
+        tracker.done(self.results, 'review_funders', columns = ['funder'])
+
+    def format_affiliations(self, changed_only = True, workers = None, executor = None):
 
         """
         Formats authors' affiliations data as Affiliations objects and stores in Review's Affiliations attribute.
+
+        Parameters
+        ----------
+        changed_only : bool
+            whether to only process authors which are new or have changed since affiliations were last formatted. Defaults to True.
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
-        self.authors.format_affiliations()
+        self.authors.format_affiliations(changed_only=changed_only, workers=workers, executor=executor)
+
+        tracker = self.authors.change_tracker()
+        if changed_only == True:
+            rows = tracker.pending(self.authors.summary, 'review_affiliations', columns = ['affiliations'])
+        else:
+            rows = self.authors.summary.index.to_list()
 
-        affils_data = self.authors.summary['affiliations'].to_list()
+        affils_data = self.authors.summary.loc[rows, 'affiliations'].to_list()
 
         for i in affils_data:
 
@@ -841,7 +1556,9 @@ class Review:
                     self.affiliations.merge(affiliations=affils)
                     continue
 
-    def format_citations(self, add_work_ids = False, update_from_doi = False, verbose=True):
+        tracker.done(self.authors.summary, 'review_affiliations', columns = ['affiliations'])
+
+    def format_citations(self, add_work_ids = False, update_from_doi = False, verbose=True, changed_only = True, lazy = None, workers = None, executor = None):
 
         """
         Formats results entries' citations data into References objects.
@@ -850,11 +1567,19 @@ class Review:
         ----------
         add_work_ids : bool
             whether to add work ID's to References entries.
+        changed_only : bool
+            whether to only process results entries which are new or have changed since citations were last formatted. Defaults to True.
+        lazy : bool
+            whether to defer formatting until each entry's citations are first accessed. Defaults to None: formatting is deferred if lazy formatting is the default.
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
-        self.results.format_citations(add_work_ids = add_work_ids, update_from_doi=update_from_doi, verbose=verbose) # type: ignore
+        self.results.format_citations(add_work_ids = add_work_ids, update_from_doi=update_from_doi, verbose=verbose, changed_only=changed_only, lazy=lazy, workers=workers, executor=executor) # type: ignore
 
-    def format_authors(self, drop_duplicates = False, drop_empty_rows=True):
+    def format_authors(self, drop_duplicates = False, drop_empty_rows=True, changed_only = True, workers = None, executor = None):
 
         """
         Formats results entries' authors data into Authors objects and stores in Review's Authors attribute.
@@ -865,11 +1590,23 @@ class Review:
             whether to remove duplicated rows.
         drop_empty_rows : bool
             whether to remove rows which do not contain any data.
+        changed_only : bool
+            whether to only process results entries which are new or have changed since authors were last formatted. Defaults to True.
+        workers : int
+            the number of worker processes to format rows across. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with. Defaults to None.
         """
 
-        self.results.format_authors() # type: ignore
+        self.results.format_authors(changed_only=changed_only, workers=workers, executor=executor) # type: ignore
+
+        tracker = self.results.change_tracker() # type: ignore
+        if changed_only == True:
+            rows = tracker.pending(self.results, 'review_authors', columns = ['authors'])
+        else:
+            rows = self.results.index.to_list()
 
-        authors_data = self.results['authors'].to_list()
+        authors_data = [materialize(i) for i in self.results.loc[rows, 'authors'].to_list()]
 
         for i in authors_data:
 
@@ -881,12 +1618,12 @@ class Review:
 
             if (type(i) == list) and (len(i) > 0):
                 auths = Authors()
-                for a in i:
-                    auth = Author(full_name=a.strip())
-                    auths.add_author(auth)
+                auths.add_authors_list([Author(full_name=a.strip()) for a in i])
                 self.authors.merge(auths)
         
-        self.authors.sync(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
+        tracker.done(self.results, 'review_authors', columns = ['authors'])
+
+        self.authors.sync(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows, changed_only=changed_only)
     
     def update_author_attrs(self, ignore_case: bool = True, drop_duplicates = False, drop_empty_rows=True):
 
@@ -908,54 +1645,33 @@ class Review:
         auths_data = self.authors.summary[['author_id', 'orcid', 'google_scholar', 'crossref', 'scopus', 'full_name']]
         auths_data = auths_data.dropna(axis=1, how='all')
 
-        global results_cols
+        # Indexing the results' authors in a single pass, so that each author's works can be looked up directly
+        works_index = self.results.entity_index(column = 'authors', ignore_case = ignore_case) # type: ignore
+        results = self.results.copy(deep=True) # type: ignore
+        work_ids = results['work_id'].to_dict()
+        titles = results['title'].to_dict()
 
-        for i in auths_data.index:
-            
-            author_id = auths_data.loc[i, 'author_id']
-            author_pubs = pd.DataFrame(columns=results_cols, dtype=object)
-
-            for c in auths_data.columns:
-
-                datapoint = auths_data.loc[i, c]
-
-                if (datapoint != None) and (datapoint != '') and (datapoint != 'None'):
+        if 'publications' not in self.authors.summary.columns:
+            self.authors.summary['publications'] = pd.Series(dtype=object)
 
-                    data_matches = self.results.mask_entities(column = 'authors', query=datapoint, ignore_case=ignore_case) # type: ignore
-                    
-                    match_ids = set(data_matches['work_id'])
-                    current_ids = set(author_pubs['work_id'])
-                    diff = match_ids.difference(current_ids)
-                    
-                    if (len(author_pubs) == 0) or (len(diff) > 0):
-                        author_pubs = pd.concat([author_pubs, data_matches])
+        for i, author_data in zip(auths_data.index, auths_data.to_dict(orient='records')):
             
-            deduplicated = author_pubs.copy(deep=True)
-            deduplicated_indexes = deduplicated.drop_duplicates(subset='work_id').index.to_list()
-            if len(deduplicated_indexes) > 0:
-                author_pubs_deduplicated = author_pubs.loc[deduplicated_indexes]
-            else:
-                author_pubs_deduplicated = author_pubs
-
-            # deduplicated2 = author_pubs_deduplicated.copy(deep=True).astype(str).drop_duplicates(subset=['title', 'doi'], ignore_index = True).index
-            # author_pubs_deduplicated2 = author_pubs.loc[deduplicated2]
-
-            # deduplicated3 = author_pubs_deduplicated2.copy(deep=True).astype(str).drop_duplicates(subset=['title', 'doi'], ignore_index = True).index
-            # author_pubs_deduplicated3 = author_pubs.loc[deduplicated3]
-
-            results = Results.from_dataframe(author_pubs_deduplicated) # type: ignore
-            self.authors.all[author_id].publications = results
+            author_id = self.authors.summary.loc[i, 'author_id']
             
+            rows = []
             pubs_dict = {}
-            for work in results.index:
-                key = results.loc[work, 'work_id']
-                pubs_dict[key] = results.loc[work, 'title']
-            
-            if 'publications' not in self.authors.summary.columns:
-                self.authors.summary['publications'] = pd.Series(dtype=object)
+            for work in works_index.lookup(list(author_data.values())):
+                key = work_ids[work]
+                if key not in pubs_dict:
+                    pubs_dict[key] = titles[work]
+                    rows.append(work)
 
             self.authors.summary.at[i, 'publications'] = pubs_dict
-            self.authors.all[author_id].affiliations = self.authors.all[author_id].details.loc[0, 'affiliations']
+
+            if author_id in self.authors.all.keys():
+                author = self.authors.all[author_id]
+                author.set_publication_rows(results, rows)
+                author.affiliations = author.get_value('affiliations')
         
     def update_funder_attrs(self, ignore_case: bool = True):
 
@@ -973,54 +1689,32 @@ class Review:
         f_data = self.funders.summary[['funder_id', 'uri', 'crossref_id', 'website','name']]
         f_data = f_data.dropna(axis=1, how='all')
 
-        global results_cols
+        # Indexing the results' funders in a single pass, so that each funder's works can be looked up directly
+        works_index = self.results.entity_index(column = 'funder', ignore_case = ignore_case) # type: ignore
+        results = self.results.copy(deep=True) # type: ignore
+        work_ids = results['work_id'].to_dict()
+        titles = results['title'].to_dict()
 
-        for i in f_data.index:
-            
-            f_id = f_data.loc[i, 'funder_id']
-            f_pubs = pd.DataFrame(columns=results_cols, dtype=object)
+        if 'publications' not in self.funders.summary.columns:
+            self.funders.summary['publications'] = pd.Series(dtype=object)
 
-            for c in f_data.columns:
-
-                datapoint = f_data.loc[i, c]
-
-                if (datapoint != None) and (datapoint != '') and (datapoint != 'None'):
-
-                    data_matches = self.results.mask_entities(column = 'funder', query=datapoint, ignore_case=ignore_case) # type: ignore
-                    
-                    match_ids = set(data_matches['work_id'])
-                    current_ids = set(f_pubs['work_id'])
-                    diff = match_ids.difference(current_ids)
-                    
-                    if (len(f_pubs) == 0) or (len(diff) > 0):
-                        f_pubs = pd.concat([f_pubs, data_matches])
+        for i, f_info in zip(f_data.index, f_data.to_dict(orient='records')):
             
-            deduplicated = f_pubs.copy(deep=True)
-            deduplicated_indexes = deduplicated.drop_duplicates(subset='work_id').index.to_list()
-
-            if len(deduplicated_indexes) > 0:
-                f_pubs_deduplicated = f_pubs.loc[deduplicated_indexes]
-            else:
-                f_pubs_deduplicated = f_pubs
-
-            # deduplicated2 = f_pubs_deduplicated.copy(deep=True).astype(str).drop_duplicates(subset=['title', 'doi'], ignore_index = True).index
-            # f_pubs_deduplicated2 = f_pubs.loc[deduplicated2]
-
-            # deduplicated3 = f_pubs_deduplicated2.copy(deep=True).astype(str).drop_duplicates(subset=['title', 'doi'], ignore_index = True).index
-            # f_pubs_deduplicated3 = f_pubs.loc[deduplicated3]
+            f_id = self.funders.summary.loc[i, 'funder_id']
 
-            results = Results.from_dataframe(f_pubs_deduplicated) # type: ignore
-            
+            rows = []
             pubs_dict = {}
-            for work in results.index:
-                key = results.loc[work, 'work_id']
-                pubs_dict[key] = results.loc[work, 'title']
+            for work in works_index.lookup(list(f_info.values())):
+                key = work_ids[work]
+                if key not in pubs_dict:
+                    pubs_dict[key] = titles[work]
+                    rows.append(work)
 
-            self.funders.all[f_id].publications = results
-            if 'publications' not in self.funders.summary.columns:
-                self.funders.summary['publications'] = pd.Series(dtype=object)
             self.funders.summary.at[i, 'publications'] = pubs_dict
 
+            if f_id in self.funders.all.keys():
+                self.funders.all[f_id].set_publication_rows(results, rows)
+
     def update_affiliation_attrs(self, update_authors: bool = True, ignore_case: bool = True):
         
         """
@@ -1038,56 +1732,37 @@ class Review:
         affils_data = self.affiliations.summary[['affiliation_id', 'name', 'uri', 'website']]
         affils_data = affils_data.dropna(axis=1, how='all')
 
-        global results_cols
+        # Indexing authors' affiliations and the results' affiliations in a single pass each
+        authors_index = self.authors.entity_index(column = 'affiliations', ignore_case = ignore_case)
+        works_index = self.results.entity_index(column = 'affiliations', ignore_case = ignore_case) # type: ignore
+        results = self.results.copy(deep=True) # type: ignore
+        work_ids = results['work_id'].to_dict()
+        titles = results['title'].to_dict()
+
+        if 'publications' not in self.affiliations.summary.columns:
+            self.affiliations.summary['publications'] = pd.Series(dtype=object)
 
-        for i in affils_data.index:
+        for i, affil_info in zip(affils_data.index, affils_data.to_dict(orient='records')):
 
-            affil_id = affils_data.loc[i, 'affiliation_id']
+            affil_id = self.affiliations.summary.loc[i, 'affiliation_id']
             if (affil_id == None) or (affil_id == '') or (affil_id == 'None'):
                 affil_id = ''
             affil_id = str(affil_id)
-            
-            affil_auths = self.authors.mask_entities(column='affiliations', query=affil_id, ignore_case=ignore_case)
-
-            if (affil_id != None) and (affil_id != '') and (affil_id != 'None'):
-                self.affiliations.all[affil_id].authors = affil_auths
-
-            affil_pubs = pd.DataFrame(columns=results_cols, dtype=object)
-            for c in affils_data.columns:
-                affil_info = affils_data.loc[i, c]
-
-                if (affil_info != None) and (affil_info != '') and (affil_info != 'None'):
-                    affil_info = str(affil_info)
-                
-                    masked_pubs = self.results.mask_affiliations(query=affil_info, ignore_case=ignore_case).copy(deep=True) # type: ignore
-
-                    match_ids = set(masked_pubs['work_id'])
-                    current_ids = set(affil_pubs['work_id'])
-                    diff = match_ids.difference(current_ids)
-                        
-                    if (len(affil_pubs) == 0) or (len(diff) > 0):
-                        affil_pubs = pd.concat([affil_pubs, masked_pubs])
-                    
-            deduplicated = affil_pubs.copy(deep=True)
-            deduplicated_indexes = deduplicated.drop_duplicates(subset='work_id').index.to_list()
-
-            if len(deduplicated_indexes) > 0:
-                        affil_pubs_deduplicated = affil_pubs.loc[deduplicated_indexes]
-            else:
-                        affil_pubs_deduplicated = affil_pubs
-
-            results = Results.from_dataframe(affil_pubs_deduplicated) # type: ignore
 
+            rows = []
             pubs_dict = {}
-            for work in results.index:
-                key = results.loc[work, 'work_id']
-                pubs_dict[key] = results.loc[work, 'title']
+            for work in works_index.lookup(list(affil_info.values())):
+                key = work_ids[work]
+                if key not in pubs_dict:
+                    pubs_dict[key] = titles[work]
+                    rows.append(work)
 
-            self.affiliations.all[affil_id].publications = results
-            
-            if 'publications' not in self.affiliations.summary.columns:
-                self.affiliations.summary['publications'] = pd.Series(dtype=object)
             self.affiliations.summary.at[i, 'publications'] = pubs_dict
+
+            if affil_id in self.affiliations.all.keys():
+                affil = self.affiliations.all[affil_id]
+                affil.authors = self.authors.summary.loc[authors_index.lookup(affil_id)]
+                affil.set_publication_rows(results, rows)
                 
     def update_entity_attrs(self, ignore_case: bool = True):
         
@@ -1143,34 +1818,41 @@ class Review:
 
         cols = Authors().summary.columns.to_list()
 
-        for a in auth_ids:
+        # Indexing the results' authors in a single pass, then combining all works' author entries into one dataframe
+        works_index = self.results.entity_index(column = 'authors', ignore_case = ignore_case) # type: ignore
+        all_entries = works_index.entity_rows()
 
-            auth_pubs = self.results.mask_entities(column = 'authors', query=a, ignore_case=ignore_case) # type: ignore
-            
-            all_coauthors = pd.DataFrame(columns=cols, dtype=object)
-            all_coauthors['frequency'] = pd.Series(dtype=object)
+        entry_positions = {}
+        for pos, row in enumerate(all_entries['row'].to_list()):
+            if row in entry_positions:
+                entry_positions[row].append(pos)
+            else:
+                entry_positions[row] = [pos]
 
-            for i in auth_pubs.index:
+        entry_ids = all_entries['author_id'].to_list() if 'author_id' in all_entries.columns else [None] * len(all_entries)
+        entry_cols = [c for c in cols if c in all_entries.columns]
 
-                work_coauthors = auth_pubs.loc[i, 'authors']
-                if type(work_coauthors) == Authors:
-                    work_coauthors = work_coauthors.summary
-                if (type(work_coauthors) == pd.DataFrame) or (type(work_coauthors) == pd.Series):
-                    all_coauthors = pd.concat([all_coauthors, work_coauthors])
-            
-            all_coauthors = all_coauthors.reset_index().drop('index', axis=1)
-            
-            a_entries = all_coauthors[(all_coauthors['author_id'].str.contains(a)) | (all_coauthors['orcid'].str.contains(a)) | (all_coauthors['google_scholar'].str.contains(a)) | (all_coauthors['crossref'].str.contains(a))].index.to_list()
-            all_coauthors = all_coauthors.drop(labels = a_entries, axis=0)
+        for a in auth_ids:
 
-            coauthor_counts = all_coauthors['author_id'].value_counts().sort_index().reset_index().drop('index', axis=1)
-            
-            all_coauthors_str = all_coauthors.copy(deep=True).astype(str)
-            deduplicated_index = all_coauthors_str.drop_duplicates().index.to_list()
-            all_coauthors = all_coauthors.loc[deduplicated_index]
-            
+            a_key = str(a).strip().lower()
+
+            coauthor_counts = {}
+            first_positions = {}
+            for work in works_index.lookup(a):
+                for pos in entry_positions.get(work, []):
+                    coauthor_id = entry_ids[pos]
+                    if (coauthor_id is None) or (coauthor_id != coauthor_id) or (str(coauthor_id).strip().lower() == a_key):
+                        continue
+                    if coauthor_id in coauthor_counts:
+                        coauthor_counts[coauthor_id] += 1
+                    else:
+                        coauthor_counts[coauthor_id] = 1
+                        first_positions[coauthor_id] = pos
+
+            all_coauthors = all_entries.iloc[list(first_positions.values())][entry_cols]
+            all_coauthors = pd.DataFrame(all_coauthors, columns=cols, dtype=object)
+            all_coauthors['frequency'] = [coauthor_counts[c] for c in first_positions.keys()]
             all_coauthors = all_coauthors.sort_values('author_id').reset_index().drop('index', axis=1)
-            all_coauthors['frequency'] = coauthor_counts
 
             output[a] = all_coauthors
 
@@ -1218,34 +1900,41 @@ class Review:
 
         cols = Funders().summary.columns.to_list()
 
-        for f in f_ids:
+        # Indexing the results' funders in a single pass, then combining all works' funder entries into one dataframe
+        works_index = self.results.entity_index(column = 'funder', ignore_case = ignore_case) # type: ignore
+        all_entries = works_index.entity_rows()
 
-            f_pubs = self.results.mask_entities(column = 'funder', query=f, ignore_case=ignore_case) # type: ignore
-            
-            all_cofunders = pd.DataFrame(columns=cols, dtype=object)
-            all_cofunders['frequency'] = pd.Series(dtype=object)
+        entry_positions = {}
+        for pos, row in enumerate(all_entries['row'].to_list()):
+            if row in entry_positions:
+                entry_positions[row].append(pos)
+            else:
+                entry_positions[row] = [pos]
 
-            for i in f_pubs.index:
+        entry_ids = all_entries['funder_id'].to_list() if 'funder_id' in all_entries.columns else [None] * len(all_entries)
+        entry_cols = [c for c in cols if c in all_entries.columns]
 
-                work_cofunders = f_pubs.loc[i, 'funder']
-                if type(work_cofunders) == Funders:
-                    work_cofunders = work_cofunders.summary
-                if (type(work_cofunders) == pd.DataFrame) or (type(work_cofunders) == pd.Series):
-                    all_cofunders = pd.concat([all_cofunders, work_cofunders])
-            
-            all_cofunders = all_cofunders.reset_index().drop('index', axis=1)
-            
-            f_entries = all_cofunders[(all_cofunders['funder_id'].str.contains(f)) | (all_cofunders['uri'].str.contains(f)) | (all_cofunders['crossref_id'].str.contains(f))].index.to_list()
-            all_cofunders = all_cofunders.drop(labels = f_entries, axis=0)
+        for f in f_ids:
 
-            cofunder_counts = all_cofunders['funder_id'].value_counts().sort_index().reset_index().drop('index', axis=1)
-            
-            all_cofunders_str = all_cofunders.copy(deep=True).astype(str)
-            deduplicated_index = all_cofunders_str.drop_duplicates().index.to_list()
-            all_cofunders = all_cofunders.loc[deduplicated_index]
-            
+            f_key = str(f).strip().lower()
+
+            cofunder_counts = {}
+            first_positions = {}
+            for work in works_index.lookup(f):
+                for pos in entry_positions.get(work, []):
+                    cofunder_id = entry_ids[pos]
+                    if (cofunder_id is None) or (cofunder_id != cofunder_id) or (str(cofunder_id).strip().lower() == f_key):
+                        continue
+                    if cofunder_id in cofunder_counts:
+                        cofunder_counts[cofunder_id] += 1
+                    else:
+                        cofunder_counts[cofunder_id] = 1
+                        first_positions[cofunder_id] = pos
+
+            all_cofunders = all_entries.iloc[list(first_positions.values())][entry_cols]
+            all_cofunders = pd.DataFrame(all_cofunders, columns=cols, dtype=object)
+            all_cofunders['frequency'] = [cofunder_counts[c] for c in first_positions.keys()]
             all_cofunders = all_cofunders.sort_values('funder_id').reset_index().drop('index', axis=1)
-            all_cofunders['frequency'] = cofunder_counts
 
             output[f] = all_cofunders
 
@@ -1254,7 +1943,7 @@ class Review:
 
         return output
  
-    def remove_duplicates(self, drop_empty_rows=True, use_api=False):
+    def remove_duplicates(self, drop_empty_rows=True, use_api=False, changed_only=False):
 
         """
         Removes duplicate data entries from results, authors, funders, and affiliations datasets.
@@ -1265,25 +1954,27 @@ class Review:
             whether to remove rows which do not contain any data.
         use_api : bool
             whether to update data using CrossRef, Orcid, and other APIs.
+        changed_only : bool
+            whether to only compare entries which are new or have changed since duplicates were last removed. Defaults to False.
         """
 
         orig_res_len = len(self.results)
-        self.results.remove_duplicates(drop_empty_rows=drop_empty_rows, update_from_api=use_api) # type: ignore
+        self.results.remove_duplicates(drop_empty_rows=drop_empty_rows, use_api=use_api, changed_only=changed_only) # type: ignore
         new_res_len = len(self.results)
         res_diff = new_res_len - orig_res_len
 
         orig_auths_len = len(self.authors.summary)
-        self.authors.remove_duplicates(drop_empty_rows=drop_empty_rows, sync=True)
+        self.authors.remove_duplicates(drop_empty_rows=drop_empty_rows, sync=True, changed_only=changed_only)
         new_auths_len = len(self.authors.summary)
         auths_diff = new_auths_len - orig_auths_len
 
         orig_funders_len = len(self.funders.summary)
-        self.funders.remove_duplicates(drop_empty_rows=drop_empty_rows, sync=True)
+        self.funders.remove_duplicates(drop_empty_rows=drop_empty_rows, sync=True, changed_only=changed_only)
         new_funders_len = len(self.funders.summary)
         funders_diff = new_funders_len - orig_funders_len
 
         orig_affils_len = len(self.affiliations.summary)
-        self.affiliations.remove_duplicates(drop_empty_rows=drop_empty_rows, sync=True)
+        self.affiliations.remove_duplicates(drop_empty_rows=drop_empty_rows, sync=True, changed_only=changed_only)
         new_affils_len = len(self.affiliations.summary)
         affils_diff = new_affils_len - orig_affils_len
 
@@ -1295,7 +1986,7 @@ class Review:
         self.activity_log.add_activity(type='data cleaning', activity='deduplication', location = ['results', 'authors', 'funders', 'affiliations'], changes_dict=changes)
 
 
-    def format(self, update_entities = False, drop_duplicates = False, drop_empty_rows=True, verbose=False):
+    def format(self, update_entities = False, drop_duplicates = False, drop_empty_rows=True, verbose=False, changed_only=True, lazy = None, workers = None, executor = None):
 
         """
         Parses and formats all datasets (i.e., results, authors, funders and affiliations).
@@ -1310,12 +2001,45 @@ class Review:
             whether to remove rows which do not contain any data.
         verbose : bool
             whether to print formatting dialogue.
+        changed_only : bool
+            whether to only format and deduplicate entries which are new or have changed since the last pass. Defaults to True.
+        lazy : bool
+            whether to defer formatting. If True, results entries' authors, funders and citations are formatted when each is first accessed, and the Review's authors, funders and affiliations are formatted when they are first accessed. Defaults to None: formatting is deferred if lazy formatting is the default (see art.utils.lazy.set_lazy_default).
+        workers : int
+            the number of worker processes to format rows across. Rows are formatted in parallel, and the formatted entities are then merged in row order, so the result is the same as formatting serially. If zero or negative, one per CPU is used. Defaults to None (no parallel processing).
+        executor : concurrent.futures.Executor
+            an existing executor to format rows with (e.g. a ProcessPoolExecutor). Defaults to None.
         """
 
-        self.format_funders()
-        self.format_citations(verbose=verbose)
-        self.format_authors(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
-        self.format_affiliations()
+        global pending_formats
+
+        self.flush_results()
+
+        if use_lazy(lazy) == True:
+
+            self.results.format_funders(changed_only=changed_only, lazy=True) # type: ignore
+            self.format_citations(verbose=verbose, changed_only=changed_only, lazy=True)
+            self.results.format_authors(changed_only=changed_only, lazy=True) # type: ignore
+
+            pending = pending_formats.setdefault(self, dict())
+
+            pending['funders'] = {'changed_only': changed_only}
+            pending['affiliations'] = {'changed_only': changed_only}
+
+            # Keeping any row removal requested when authors formatting was previously deferred
+            authors_kwargs = pending.get('authors', {'drop_duplicates': False, 'drop_empty_rows': False})
+            pending['authors'] = {
+                                    'drop_duplicates': (drop_duplicates == True) or (authors_kwargs['drop_duplicates'] == True),
+                                    'drop_empty_rows': (drop_empty_rows == True) or (authors_kwargs['drop_empty_rows'] == True),
+                                    'changed_only': changed_only
+                                    }
+
+        else:
+            with worker_pool(workers=workers, executor=executor) as pool:
+                self.format_funders(changed_only=changed_only, workers=workers, executor=pool)
+                self.format_citations(verbose=verbose, changed_only=changed_only, lazy=False, workers=workers, executor=pool)
+                self.format_authors(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows, changed_only=changed_only, workers=workers, executor=pool)
+                self.format_affiliations(changed_only=changed_only, workers=workers, executor=pool)
 
         if update_entities == True:
             self.update_entity_attrs()
@@ -1327,10 +2051,13 @@ class Review:
             new_res_len = len(self.results)
             res_diff = new_res_len - orig_res_len
 
-            orig_auths_len = len(self.authors.summary)
-            self.authors.drop_empty_rows() # type: ignore
-            new_auths_len = len(self.authors.summary)
-            auths_diff = new_auths_len - orig_auths_len
+            # Deferred authors formatting removes empty rows when it runs
+            auths_diff = 0
+            if 'authors' not in pending_formats.get(self, dict()):
+                orig_auths_len = len(self.authors.summary)
+                self.authors.drop_empty_rows() # type: ignore
+                new_auths_len = len(self.authors.summary)
+                auths_diff = new_auths_len - orig_auths_len
 
             changes = {'results': res_diff,
                    'authors': auths_diff}
@@ -1339,7 +2066,7 @@ class Review:
 
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = changed_only)
 
     def add_citations_to_results(self, update_formatting: bool = True, drop_duplicates = False, drop_empty_rows = True):
         
@@ -1376,7 +2103,7 @@ class Review:
             self.activity_log.add_activity(type='data cleaning', activity='removed empty rows', location=list(changes.keys()), changes_dict=changes)
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if update_formatting == True:
             self.format(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -1454,14 +2181,14 @@ class Review:
             self.activity_log.add_activity(type='data cleaning', activity='removed empty rows', location=['results'], changes_dict=changes)
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if update_formatting == True:
             self.format(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
         
         return self
 
-    def import_bibtex(self, file_path = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_formatting: bool = False, update_entities = False):
+    def import_bibtex(self, file_path = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_formatting: bool = False, update_entities = False, chunk_size = None, progress = None):
         
         """
         Reads a Bibtex (.bib) bibliography file and adds its data to Review object.
@@ -1478,13 +2205,20 @@ class Review:
             whether to format author, funder, affiliations, and citations data.
         update_entities : bool
             whether to update entity attributes.
+        chunk_size : int
+            if given, the file is streamed this many entries at a time, and each chunk is added (and formatted, if update_formatting is True) before the next is read (see Review.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is added at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of entries read so far and the fraction of the file read. Defaults to None.
         """
 
         if file_path == 'request_input':
             file_path = input('File path: ')
 
         orig_len = len(self.results)
-        self.results.import_bibtex(file_path=file_path)
+        if chunk_size is None:
+            self.results.import_bibtex(file_path=file_path)
+        else:
+            self.import_chunks(read_bibtex_chunks(file_path, chunk_size = chunk_size), update_formatting = update_formatting, progress = progress)
         new_len = len(self.results)
         len_diff = new_len - orig_len
 
@@ -1495,7 +2229,7 @@ class Review:
         self.properties.update_file_type()
 
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if update_formatting == True:
             self.format(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -1527,15 +2261,54 @@ class Review:
             a Review object.
         """
 
-        if file_path == 'request_input':
-            file_path = input('File path: ')
+        if file_path == 'request_input':
+            file_path = input('File path: ')
+
+        review = Review(file_location=file_path)
+        review.import_bibtex(file_path=file_path, drop_empty_rows = drop_empty_rows, drop_duplicates = drop_duplicates, update_formatting=update_formatting, update_entities=update_entities)
+
+        return review
+
+    def import_chunks(self, chunks, update_formatting: bool = True, progress = None):
+
+        """
+        Adds chunks of imported rows to the Review's results one at a time (see Results.import_chunk). If update_formatting is True, each chunk's authors, funders, affiliations and citations are formatted before the next chunk is read, so that only one chunk of unformatted data is held in memory at a time. Used by chunked imports (e.g. Review.import_csv with a chunk_size).
+
+        Parameters
+        ----------
+        chunks : iterable
+            (pandas.DataFrame, fraction) tuples: chunks of rows, and the fraction of the file read once each has been read (or None if unknown). See art.importers.chunked.
+        update_formatting : bool
+            whether to format author, funder, affiliations, and citations data for each chunk. Defaults to True.
+        progress : callable
+            a function called after each chunk with the number of rows read so far and the fraction of the file read. Defaults to None.
+
+        Returns
+        -------
+        self : Review
+            a Review object.
+
+        Notes
+        -----
+        Removing empty rows and duplicates, and updating entity attributes, are left to the caller, so that they are run once rather than for every chunk.
+        """
+
+        rows = 0
+
+        for chunk, fraction in chunks:
+
+            rows += len(chunk)
+            self.results.import_chunk(chunk) # type: ignore
+
+            if update_formatting == True:
+                self.format(drop_empty_rows = False)
 
-        review = Review(file_location=file_path)
-        review.import_bibtex(file_path=file_path, drop_empty_rows = drop_empty_rows, drop_duplicates = drop_duplicates, update_formatting=update_formatting, update_entities=update_entities)
+            if progress is not None:
+                progress(rows, fraction)
 
-        return review
+        return self
 
-    def import_excel(self, file_path = 'request_input', sheet_name = None, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False):
+    def import_excel(self, file_path = 'request_input', sheet_name = None, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False, chunk_size = None, progress = None):
         
         """
         Reads an Excel (.xlsx) file and adds its data to the Review object.
@@ -1554,6 +2327,10 @@ class Review:
             whether to format author, funder, affiliations, and citations data.
         update_entities : bool
             whether to update entity attributes.
+        chunk_size : int
+            if given, the file is streamed this many rows at a time, and each chunk is added and formatted before the next is read (see Review.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is read at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read (or None if unknown). Defaults to None.
 
         Returns
         -------
@@ -1565,7 +2342,11 @@ class Review:
             file_path = input('File path: ')
 
         orig_len = len(self.results)
-        self.results.import_excel(file_path, sheet_name) # type: ignore
+        if chunk_size is None:
+            self.results.import_excel(file_path, sheet_name) # type: ignore
+        else:
+            self.import_chunks(read_excel_chunks(file_path, sheet_name = sheet_name, chunk_size = chunk_size), update_formatting = update_formatting, progress = progress)
+
         new_len = len(self.results)
         len_diff = new_len - orig_len
 
@@ -1590,7 +2371,7 @@ class Review:
             self.activity_log.add_activity(type='data cleaning', activity='removed empty rows', location=list(changes.keys()), changes_dict=changes)
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if update_formatting == True:
             self.format(update_entities=update_entities, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -1639,7 +2420,7 @@ class Review:
         
         return review
 
-    def import_csv(self, file_path = 'request_input', update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False):
+    def import_csv(self, file_path = 'request_input', update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False, chunk_size = None, progress = None):
         
         """
         Reads a CSV (.csv) file and adds its data to the Review object.
@@ -1656,6 +2437,10 @@ class Review:
             whether to format author, funder, affiliations, and citations data.
         update_entities : bool
             whether to update entity attributes.
+        chunk_size : int
+            if given, the file is streamed this many rows at a time, and each chunk is added and formatted before the next is read (see Review.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is read at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read (or None if unknown). Defaults to None.
 
         Returns
         -------
@@ -1667,7 +2452,11 @@ class Review:
             file_path = input('File path: ')
 
         orig_len = len(self.results)
-        self.results.import_csv(file_path) # type: ignore
+        if chunk_size is None:
+            self.results.import_csv(file_path) # type: ignore
+        else:
+            self.import_chunks(read_csv_chunks(file_path, chunk_size = chunk_size), update_formatting = update_formatting, progress = progress)
+
         new_len = len(self.results)
         len_diff = new_len - orig_len
 
@@ -1692,7 +2481,7 @@ class Review:
             self.activity_log.add_activity(type='data cleaning', activity='removed empty rows', location=list(changes.keys()), changes_dict=changes)
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if update_formatting == True:
             self.format(update_entities=update_entities, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -1739,7 +2528,7 @@ class Review:
 
         return review
 
-    def import_json(self, file_path = 'request_input', update_formatting: bool = True):
+    def import_json(self, file_path = 'request_input', update_formatting: bool = True, chunk_size = None, progress = None):
 
         """
         Reads a JSON (.json) file and adds its data to the Review object.
@@ -1750,6 +2539,10 @@ class Review:
             directory path of file to import. Defaults to requesting from user input.
         update_formatting : bool
             whether to format author, funder, affiliations, and citations data.
+        chunk_size : int
+            if given, the file's rows are added this many at a time (JSON Lines files are streamed), and each chunk is added and formatted before the next is read (see Review.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is read at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read (or None if unknown). Defaults to None.
 
         Returns
         -------
@@ -1760,7 +2553,10 @@ class Review:
         if file_path == 'request_input':
             file_path = input('File path: ')
 
-        self.results.import_json(file_path) # type: ignore
+        if chunk_size is None:
+            self.results.import_json(file_path) # type: ignore
+        else:
+            self.import_chunks(read_json_chunks(file_path, chunk_size = chunk_size), update_formatting = update_formatting, progress = progress)
 
         if update_formatting == True:
             self.format()
@@ -1795,7 +2591,7 @@ class Review:
 
         return review
     
-    def import_file(self, file_path = 'request_input', sheet_name = None, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False):
+    def import_file(self, file_path = 'request_input', sheet_name = None, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False, chunk_size = None, progress = None):
         
         """
         Reads a file, determines its file type, and adds its data to the Review object.
@@ -1814,6 +2610,10 @@ class Review:
             whether to format author, funder, affiliations, and citations data.
         update_entities : bool
             whether to update entity attributes.
+        chunk_size : int
+            if given, Excel, CSV and JSON files are streamed this many rows at a time, and each chunk is added and formatted before the next is read (see Review.import_chunks). If 'default', the default chunk size is used (see art.importers.chunked.set_default_chunk_size). Defaults to None: the whole file is read at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of rows read so far and the fraction of the file read (or None if unknown). Defaults to None.
 
         Notes
         -----
@@ -1830,7 +2630,10 @@ class Review:
         if file_path == 'request_input':
             file_path = input('File path: ')
 
-        self.results.import_file(file_path, sheet_name) # type: ignore
+        if (chunk_size is not None) and (Path(file_path).suffix.strip('.').lower() in chunked_file_types):
+            self.import_chunks(read_file_chunks(file_path, sheet_name = sheet_name, chunk_size = chunk_size), update_formatting = update_formatting, progress = progress)
+        else:
+            self.results.import_file(file_path, sheet_name) # type: ignore
 
         if update_formatting == True:
             self.format(update_entities=update_entities, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -1840,7 +2643,7 @@ class Review:
             self.authors.drop_empty_rows() # type: ignore
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         self.properties.file_location = file_path
         self.properties.update_file_type()
@@ -1892,7 +2695,7 @@ class Review:
 
         return review
 
-    def import_jstor(self, file_path = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_work_ids = True, format_citations=True, format_authors = True, format_funders = True, format_affiliations=True):
+    def import_jstor(self, file_path = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_work_ids = True, format_citations=True, format_authors = True, format_funders = True, format_affiliations=True, full_text = True, chunk_size = None, progress = None):
         
         """
         Reads a file outputted by JSTOR's Constellate portal and adds its data to the Review object.
@@ -1909,6 +2712,12 @@ class Review:
             whether to format author, funder, affiliations, and citations data.
         update_entities : bool
             whether to update entity attributes.
+        full_text : bool or str
+            for JSON files: whether to import documents' full texts. If True, full texts are imported; if False, they are skipped; if a file path, they are written to a full text store at that path and read back from it when first accessed. Defaults to True.
+        chunk_size : int
+            for JSON files: if given, the file is streamed and added this many documents at a time (see Results.import_jstor). Defaults to None: the whole file is added at once.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of documents read so far and the fraction of the file read. Defaults to None.
 
         Returns
         -------
@@ -1920,13 +2729,15 @@ class Review:
         Can read:
             * .csv
             * .json
+            * .jsonl
+            * .jsonl.gz
         """
 
         if file_path == 'request_input':
             file_path = input('File path: ')
 
         old_len = len(self.results)
-        self.results.import_jstor(file_path = file_path, drop_empty_rows=drop_empty_rows,drop_duplicates=drop_duplicates, update_work_ids=update_work_ids) # type: ignore
+        self.results.import_jstor(file_path = file_path, drop_empty_rows=drop_empty_rows,drop_duplicates=drop_duplicates, update_work_ids=update_work_ids, full_text=full_text, chunk_size=chunk_size, progress=progress) # type: ignore
         new_len = len(self.results)
 
         len_diff = new_len - old_len
@@ -1948,7 +2759,7 @@ class Review:
         self.properties.file_location = file_path
         self.properties.update_file_type()
 
-    def from_jstor(file_path: str = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_work_ids = True, format_citations=True, format_authors = True, format_funders = True, format_affiliations=True): # type: ignore
+    def from_jstor(file_path: str = 'request_input', drop_empty_rows = False, drop_duplicates = False, update_work_ids = True, format_citations=True, format_authors = True, format_funders = True, format_affiliations=True, full_text = True, chunk_size = None, progress = None): # type: ignore
 
         """
         Reads a file outputted by JSTOR's Constellate portal and returns its data as a Review object.
@@ -1965,19 +2776,27 @@ class Review:
             whether to format author, funder, affiliations, and citations data.
         update_entities : bool
             whether to update entity attributes.
+        full_text : bool or str
+            for JSON files: whether to import documents' full texts: True to import them, False to skip them, or the file path of a full text store. Defaults to True.
+        chunk_size : int
+            for JSON files: if given, the file is streamed and added this many documents at a time. Defaults to None.
+        progress : callable
+            for chunked imports, a function called after each chunk with the number of documents read so far and the fraction of the file read. Defaults to None.
 
         Notes
         -----
         Can read:
             * .csv
             * .json
+            * .jsonl
+            * .jsonl.gz
         """
 
         if file_path == 'request_input':
             file_path = input('File path: ')
         
         review = Review(file_location=file_path)
-        review.import_jstor(file_path=file_path, drop_empty_rows=drop_empty_rows, drop_duplicates=drop_duplicates, update_work_ids=update_work_ids, format_citations=format_citations, format_authors = format_authors, format_funders = format_funders, format_affiliations=format_affiliations)
+        review.import_jstor(file_path=file_path, drop_empty_rows=drop_empty_rows, drop_duplicates=drop_duplicates, update_work_ids=update_work_ids, format_citations=format_citations, format_authors = format_authors, format_funders = format_funders, format_affiliations=format_affiliations, full_text=full_text, chunk_size=chunk_size, progress=progress)
 
         return review
 
@@ -2009,6 +2828,30 @@ class Review:
         
         return self.results.search_field(field = field, any_kwds = any_kwds, all_kwds = all_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive, output = output) # type: ignore
 
+    def rank(self, query: str = 'request_input', fields = None, top_k: int = 10, output = 'Results'):
+
+        """
+        Ranks the Review's results by their relevance to a query using the BM25 scoring function.
+
+        Parameters
+        ----------
+        query : str
+            a search query. Defaults to requesting from user input.
+        fields : str or list
+            names of one or more fields to rank on. Defaults to the abstract, description, extract and full text columns.
+        top_k : int
+            maximum number of results to return. If None, returns all matching results. Defaults to 10.
+        output : str
+            the type of object to return. Defaults to Results.
+
+        Returns
+        -------
+        output : Results, pandas.DataFrame or pandas.Series
+            matching results in descending order of relevance.
+        """
+
+        return self.results.rank(query = query, fields = fields, top_k = top_k, output = output) # type: ignore
+
     def search(self, any_kwds = 'request_input', all_kwds = None, not_kwds = None, fields = 'all', case_sensitive = False):
 
         """
@@ -2031,27 +2874,63 @@ class Review:
         -------
         output : pandas.DataFrame
             search results.
+
+        Notes
+        -----
+        If the Review was opened from a database (see Review.open_database), sections which have not been loaded are searched in the database, and only matching rows are read.
         """
 
+        if any_kwds == 'request_input':
+            any_kwds = input('Any keywords: ')
+            any_kwds = any_kwds.strip().split(',')
+            any_kwds = [i.strip() for i in any_kwds]
+
+        self.flush_results()
+
         combined_query = str(any_kwds)
         if all_kwds is not None:
             combined_query = combined_query + str(all_kwds)
 
         combined_query = combined_query.replace(']','').replace('[','').replace('{','').replace('}','')
 
-        results_search = self.results.search(fields = fields, any_kwds = any_kwds, all_kwds = all_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive) # type: ignore
+        database = self.pending_database('results')
+
+        if database is None:
+            results_search = self.results.search(fields = fields, any_kwds = any_kwds, all_kwds = all_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive) # type: ignore
+        
+        else:
+            if type(any_kwds) == str:
+                any_kwds = [any_kwds]
+            if type(all_kwds) == str:
+                all_kwds = [i.strip() for i in all_kwds.strip().split(',')]
+            if type(not_kwds) == str:
+                not_kwds = [not_kwds]
+
+            results_search = database.search('results', fields = fields, any_kwds = any_kwds, all_kwds = all_kwds, not_kwds = not_kwds, case_sensitive = case_sensitive)
+
         results_search = results_search.copy(deep=True).rename(columns={'work_id':'id', 'title': 'name/title'}) # type: ignore
         results_search['type'] = 'work'
+
+        entities_searches = dict()
+
+        for name in entities_types.keys():
+
+            database = self.pending_database(name)
+
+            if database is None:
+                entities_searches[name] = getattr(self, name).search(query = combined_query)
+            else:
+                entities_searches[name] = database.search_entities(name, combined_query)
         
-        authors_search = self.authors.search(query = combined_query)
+        authors_search = entities_searches['authors']
         authors_search = authors_search.copy(deep=True).rename(columns={'author_id':'id', 'full_name': 'name/title'})
         authors_search['type'] = 'author'
 
-        funders_search = self.funders.search(query = combined_query)
+        funders_search = entities_searches['funders']
         funders_search = funders_search.copy(deep=True).rename(columns={'funder_id':'id', 'name': 'name/title'})
         funders_search['type'] = 'funder'
 
-        affils_search = self.affiliations.search(query=combined_query)
+        affils_search = entities_searches['affiliations']
         affils_search = affils_search.copy(deep=True).rename(columns={'affiliation_id':'id', 'name': 'name/title'})
         affils_search['type'] = 'affiliation'
 
@@ -2065,6 +2944,46 @@ class Review:
 
         return output
 
+    def keyword_frequencies(self) -> pd.Series:
+
+        """
+        Returns a Pandas Series containing the frequencies of all keywords associated with the Review's results. Equivalent to Results.keyword_frequencies. If the Review was opened from a database and its results have not been loaded, frequencies are counted in the database.
+        """
+
+        database = self.pending_database('results')
+
+        if database is None:
+            return self.results.keyword_frequencies()
+
+        return database.keyword_frequencies()
+
+    def filter_by_keyword_frequency(self, cutoff = 3):
+
+        """
+        Filters the Review's results to show only results which contain keywords that meet a frequency cutoff. Equivalent to Results.filter_by_keyword_frequency. If the Review was opened from a database and its results have not been loaded, only matching results are read.
+
+        Parameters
+        ----------
+        cutoff : int
+            a frequency cutoff for keywords.
+
+        Returns
+        -------
+        output : Results
+            the filtered results.
+        """
+
+        database = self.pending_database('results')
+
+        if database is None:
+            return self.results.filter_by_keyword_frequency(cutoff = cutoff)
+
+        output, frequent_kws = database.filter_by_keyword_frequency(cutoff = cutoff)
+
+        print(f'Keywords: {frequent_kws}')
+
+        return frame_to_results(output, compact = database.metadata.get('results', dict()).get('compact') == True)
+
     def export_folder(self, folder_name = 'request_input', folder_address = 'request_input', export_str_as = 'txt', export_dict_as = 'json', export_pandas_as = 'csv', export_network_as = 'graphML'):
         
         """
@@ -2111,6 +3030,10 @@ class Review:
         if folder_name.endswith('_Review') == False:
             folder_name = folder_name + '_Review'
         
+        self.load_sections()
+        self.flush_results()
+        self.format_pending()
+
         art_class_to_folder(self, folder_name = folder_name, folder_address = folder_address, export_str_as = export_str_as, export_dict_as = export_dict_as, export_pandas_as = export_pandas_as, export_network_as = export_network_as)
 
     def export_txt(self, new_file = True, file_name: str = 'request_input', folder_address:str = 'request_input'):
@@ -2148,10 +3071,12 @@ class Review:
         with open(file_address, 'wb') as f:
             pickle.dump(self, f) 
     
-    def export_review(self, new_file = True, file_name: str = 'request_input', folder_address:str = 'request_input'):
+    def export_review(self, new_file = True, file_name: str = 'request_input', folder_address:str = 'request_input', incremental: bool = False):
         
         """
-        Exports the Review to a pickled text file with a custom suffix (.review).
+        Exports the Review to a .review file.
+
+        Results and entity summaries are stored as tables, networks as vertex and edge tables, and the Review's properties and activity log as metadata, each in its own section of the file. This means that Reviews opened from .review files only read the sections they use (see Review.open). Tables are stored in Arrow format if PyArrow is installed; otherwise, they are pickled.
         
         Parameters
         ----------
@@ -2159,8 +3084,16 @@ class Review:
             name of file to create. Defaults to requesting from user input.
         file_address : str
             directory address to create file in. defaults to requesting for user input.
+        incremental : bool
+            whether to append the changes made since the Review was last saved to, or opened from, the file as a journal segment, rather than rewriting the file. The file is rewritten if it has not been saved to or opened by the Review, if it has changed since, or if its journal grows larger than the limit set by set_journal_limit. Defaults to False.
+
+        Notes
+        -----
+        Incremental saves find changed results using the Results DataFrame's change tracker, so their cost depends on the number of changed rows: rows which have been added, marked as changed (see Results.mark_changed) or processed by formatting, and cells set with .loc, .iloc, .at, .iat or by assigning to columns, are saved. Objects changed in place (e.g. an Authors object which an author is added to) are not seen by the tracker: mark their rows with Results.mark_changed, or save with incremental=False. Entity summaries and the activity log are compared using fingerprints of the values they hold. Lazily loaded values which have not been formatted are saved as references to the parts of the file already holding them. If nothing has changed, nothing is written.
         """
         
+        global saved_states
+
         if new_file == True:
             
             if file_name == 'request_input':
@@ -2181,10 +3114,142 @@ class Review:
         if str(file_address).endswith('.review') == False:
             file_address = str(file_address) + str('.review')
         
+        file_path = os.path.abspath(file_address)
+        state = saved_states.get(self)
 
-        with open(file_address, 'wb') as f:
-            pickle.dump(self, f)
+        self.flush_results()
+        self.format_pending()
+
+        if (incremental == True) and (state is not None) and (state['file_path'] == file_path) and (os.path.exists(file_path) == True):
+
+            stat = os.stat(file_path)
+
+            if (stat.st_size, stat.st_mtime_ns) == state['stat']:
+
+                metadata = self.review_file_metadata(previous = state['manifest'].get('metadata'))
+                manifest = append_review_file(file_path, state['manifest'], iter_review_changes(self, state['snapshots']), metadata = metadata, lazy_columns = {'results': lazy_results_cols})
+
+                stat = os.stat(file_path)
+                state['manifest'] = manifest
+                state['stat'] = (stat.st_size, stat.st_mtime_ns)
+
+                pending = pending_sections.get(self, dict())
+                for name in review_sections:
+                    if (name in self.__dict__.keys()) and (name not in pending.keys()):
+                        state['snapshots'].update(snapshot_review_section(self, name, previous = state['snapshots']))
+
+                if journal_size(manifest) <= reviewfile.journal_limit * base_size(manifest):
+                    return
+
+        # Loading all sections first, as the Review may have been opened from the file being replaced
+        self.load_sections()
+
+        manifest = write_review_file(file_path, sections = iter_review_sections(self), metadata = self.review_file_metadata(), lazy_columns = {'results': lazy_results_cols})
+
+        stat = os.stat(file_path)
+        snapshots = dict()
+        for name in review_sections:
+            snapshots.update(snapshot_review_section(self, name))
+
+        saved_states[self] = {'file_path': file_path, 'stat': (stat.st_size, stat.st_mtime_ns), 'manifest': manifest, 'snapshots': snapshots}
+
+    def review_file_metadata(self, previous = None) -> dict:
+
+        """
+        Returns the metadata stored in the manifest of the Review's .review file: its properties and description, and details of its results and networks.
+
+        Parameters
+        ----------
+        previous : dict
+            the metadata of the file the Review was opened from, used for sections which have not been loaded. Defaults to None.
+        """
+
+        if previous is None:
+            previous = dict()
+
+        pending = pending_sections.get(self, dict())
+
+        metadata = {
+                    'properties': self.properties.to_dict(),
+                    'description': self.description,
+                    'sections': review_sections
+                    }
+
+        if ('results' in pending.keys()) and ('results' not in self.__dict__.keys()):
+            metadata['results'] = previous.get('results', dict())
+        else:
+            metadata['results'] = {'compact': self.results.__dict__.get('_compact', False) == True}
+
+        if ('networks' in pending.keys()) and ('networks' not in self.__dict__.keys()):
+            metadata['networks'] = previous.get('networks', dict())
+
+        else:
+            networks_metadata = dict()
+
+            for name, network in self.networks.__dict__.items():
+                if isinstance(network, Graph) == True:
+                    networks_metadata[name] = {'type': type(network).__name__, 'directed': network.is_directed(), 'vertices': network.vcount()}
+                else:
+                    networks_metadata[name] = {'type': type(network).__name__}
+            
+            metadata['networks'] = networks_metadata
+
+        return metadata
+
+    def compact(self):
+
+        """
+        Rewrites the .review file the Review was saved to or opened from, without the journal of changes appended by incremental saves (see Review.save).
+        """
+
+        file_path = self.properties.file_location
+
+        if (file_path is None) or (Path(file_path).suffix != '.review'):
+            raise ValueError('Review does not have a .review file to compact')
+
+        self.export_review(new_file=False, file_name=None, folder_address=file_path, incremental=False) # type: ignore
+
+    def export_database(self, new_file = True, file_name: str = 'request_input', folder_address:str = 'request_input'):
+
+        """
+        Exports the Review to an SQLite database (.db) file.
+
+        Results, entity summaries and the activity log are stored as tables, with indexes on their identifier columns (e.g. work IDs, DOIs and author IDs), so that Reviews opened from databases can be searched without loading them into memory (see Review.open_database). Formatted objects (e.g. Authors objects) are pickled cell by cell, alongside their text for searching.
+
+        Parameters
+        ----------
+        file_name : str
+            name of file to create. Defaults to requesting from user input.
+        file_address : str
+            directory address to create file in. defaults to requesting for user input.
+        """
+
+        if new_file == True:
+            
+            if file_name == 'request_input':
+                file_name = input('File name: ')
+            
+            if folder_address == 'request_input':
+                folder_address = input('Folder address: ')
+            
+            file_address = folder_address + '/' + file_name
+            
+        if new_file == False:
+            
+            if folder_address == 'request_input':
+                folder_address = input('File path: ')
+            
+            file_address = str(folder_address)
+        
+        if str(file_address).endswith('.db') == False:
+            file_address = str(file_address) + str('.db')
 
+        # Loading all sections first, as the Review may have been opened from the database being replaced
+        self.load_sections()
+        self.flush_results()
+        self.format_pending()
+
+        write_review_database(file_address, sections = iter_review_sections(self), metadata = self.review_file_metadata())
 
     def save_as(self,
                 filetype = 'review',
@@ -2218,7 +3283,9 @@ class Review:
         Options
         -------
         filetype:
-            * txt or
+            * review or .review (Default)
+            * db or .db (SQLite database)
+            * txt or .txt
         export_str_as:
             * txt or .txt (Default)
         export_dict_as:
@@ -2255,6 +3322,19 @@ class Review:
                     return
 
             self.export_review(new_file=True, file_name=file_name, folder_address=folder_address)
+
+        if (filetype == 'db') or (filetype == '.db'):
+
+            full_path = folder_address + '/' + file_name + '.db'
+            path_obj = Path(full_path)
+            
+            if path_obj.exists() == True:
+                warning_res = input(f'Warning: a file named {file_name}.db already exists in this location. Do you want to overwrite it? [Y]/N: ')
+
+                if (warning_res.lower() == 'n') or (warning_res.lower() == 'no'):
+                    return
+
+            self.export_database(new_file=True, file_name=file_name, folder_address=folder_address)
         
         if (filetype == 'txt') or (filetype == '.txt'):
 
@@ -2312,13 +3392,16 @@ class Review:
              export_str_as: str = 'txt', 
                       export_dict_as: str = 'json', 
                       export_pandas_as: str = 'csv', 
-                      export_network_as: str = 'graphML'):
+                      export_network_as: str = 'graphML',
+                      incremental: bool = True):
         
         """
         Saves the Review to the filepath stored in its Properties attribute.
         
         Parameters
         ----------
+        incremental : bool
+            for .review files, whether to append only the changes made since the Review was last saved or opened, rather than rewriting the file (see Review.export_review and Review.compact). Defaults to True.
         export_str_as : str 
             file type for exporting string objects. Defaults to 'txt'.
         export_dict_as : str 
@@ -2366,7 +3449,11 @@ class Review:
             if (file_type is not None) and (file_type !=''):
 
                 if file_type == '.review':
-                    self.export_review(new_file=False, file_name=None, folder_address=file_path)
+                    self.export_review(new_file=False, file_name=None, folder_address=file_path, incremental=incremental) # type: ignore
+                    return
+
+                if file_type == '.db':
+                    self.export_database(new_file=False, file_name=None, folder_address=file_path) # type: ignore
                     return
 
                 if file_type == '.txt':
@@ -2408,8 +3495,11 @@ class Review:
         if file_path == 'request_input':
             file_path = input('File address: ')
         
-        with open(file_path, 'rb') as f:
-            review = pickle.load(f)
+        if is_review_file(file_path) == True:
+            review = Review.from_review_file(file_path)
+        else:
+            with open(file_path, 'rb') as f:
+                review = pickle.load(f)
         
         results = review.results.copy(deep=True)
         authors = review.authors
@@ -2444,6 +3534,9 @@ class Review:
         if file_path == 'request_input':
             file_path = input('File address: ')
         
+        if is_review_file(file_path) == True:
+            return Review.from_review_file(file_path)
+
         with open(file_path, 'rb') as f:
             review = pickle.load(f)
         
@@ -2452,10 +3545,94 @@ class Review:
 
         return review
 
+    def from_review_file(file_path: str = 'request_input', lazy: bool = True): # type: ignore
+
+        """
+        Imports a Review from a sectioned .review file (see Review.export_review).
+
+        Parameters
+        ----------
+        file_path : str
+            directory path of .review file to import.
+        lazy : bool
+            whether to load the Review's sections when they are first accessed. The file is memory-mapped and only its properties are read when it is opened, so opening a Review to inspect its properties or search its results does not read its other sections. Defaults to True.
+        
+        Returns
+        -------
+        review : Review
+            a Review object.
+        """
+
+        global pending_sections, saved_states
+
+        if file_path == 'request_input':
+            file_path = input('File address: ')
+        
+        review_file = ReviewFile(file_path)
+        metadata = review_file.metadata
+
+        review = Review.__new__(Review)
+
+        properties = Properties()
+        properties.__dict__.update(metadata.get('properties', dict()))
+        review.properties = properties
+        review.description = metadata.get('description', '')
+
+        pending_sections[review] = {name: review_file for name in metadata.get('sections', review_sections)}
+
+        stat = os.stat(file_path)
+        saved_states[review] = {'file_path': os.path.abspath(file_path), 'stat': (stat.st_size, stat.st_mtime_ns), 'manifest': review_file.manifest, 'snapshots': dict()}
+
+        if lazy == False:
+            review.load_sections()
+
+        review.properties.file_location = file_path
+        review.properties.update_file_type()
+
+        return review
+
+    def open_database(file_path: str = 'request_input'): # type: ignore
+
+        """
+        Opens a Review stored in an SQLite database (see Review.export_database). Only the Review's properties are read when it is opened. Its sections are loaded when first accessed; until then, Review.search, Review.get_work, Review.filter_by_keyword_frequency and the works dictionaries (e.g. Review.author_works_dict) run as queries on the database, reading only the rows and columns they need.
+
+        Parameters
+        ----------
+        file_path : str
+            directory path of .db file to open.
+        
+        Returns
+        -------
+        review : Review
+            a Review object.
+        """
+
+        global pending_sections
+
+        if file_path == 'request_input':
+            file_path = input('File address: ')
+        
+        database = ReviewDatabase(file_path)
+        metadata = database.metadata
+
+        review = Review.__new__(Review)
+
+        properties = Properties()
+        properties.__dict__.update(metadata.get('properties', dict()))
+        review.properties = properties
+        review.description = metadata.get('description', '')
+
+        pending_sections[review] = {name: database for name in metadata.get('sections', review_sections)}
+
+        review.properties.file_location = file_path
+        review.properties.update_file_type()
+
+        return review
+
     def open(file_path: str = 'request_input'): # type: ignore
 
         """
-        Imports a Review from a .review or .txt file.
+        Imports a Review from a .review, .txt or .db file. Sectioned .review files and databases are opened lazily (see Review.from_review_file and Review.open_database); older .review files and .txt files are unpickled.
 
         Parameters
         ----------
@@ -2470,8 +3647,15 @@ class Review:
 
         if file_path == 'request_input':
             file_path = input('File address: ')
+
+        if is_review_database(file_path) == True:
+            return Review.open_database(file_path)
         
         if (file_path.endswith('.txt')) or (file_path.endswith('.review')):
+
+            if is_review_file(file_path) == True:
+                return Review.from_review_file(file_path)
+
             with open(file_path, 'rb') as f:
                 review = pickle.load(f)
                 review.properties.file_location = file_path
@@ -2618,7 +3802,7 @@ class Review:
             self.add_dataframe(df, drop_empty_rows=drop_empty_rows)
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=True)
         
         return df
 
@@ -2642,6 +3826,7 @@ class Review:
                 limit: int = None, # type: ignore
                 rate_limit: float = 0.05,
                 timeout = 60,
+                page_size: int = None, # type: ignore
                 add_to_results = False
                 ) -> pd.DataFrame:
         
@@ -2681,9 +3866,11 @@ class Review:
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see art.importers.crossref.set_search_page_size).
         add_to_results : bool
             whether to add search results to Review.
         filter : dict
@@ -2713,7 +3900,8 @@ class Review:
                 sample = sample,
                 limit = limit,
                 rate_limit = rate_limit,
-                timeout = timeout)
+                timeout = timeout,
+                page_size = page_size)
         
         df['repository'] = 'crossref'
 
@@ -3155,7 +4343,7 @@ class Review:
             self.activity_log.add_activity(type='data cleaning', activity='removed empty rows', location=list(drop_changes.keys()), changes_dict=drop_changes)
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         return self
 
@@ -3190,7 +4378,7 @@ class Review:
 
         return review
 
-    def lookup_dois(self, dois_list: list = [], rate_limit: float = 0.05, timeout = 60):
+    def lookup_dois(self, dois_list: list = [], rate_limit: float = 0.05, timeout = 60, max_workers: int = None, batch_size: int = None):
 
         """
         Looks up a list of DOIs using the CrossRef API. Returns a Pandas DataFrame.
@@ -3202,7 +4390,11 @@ class Review:
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+        max_workers : int
+            the maximum number of requests in flight at once. Defaults to None: the default is used (see art.importers.crossref.set_max_concurrent_requests).
+        batch_size : int
+            the number of DOIs per request. Defaults to None: the default is used (see art.importers.crossref.set_doi_batch_size).
 
         Returns
         -------
@@ -3210,12 +4402,12 @@ class Review:
             result of DOI lookups.
         """
 
-        return lookup_dois(dois_list=dois_list, rate_limit=rate_limit, timeout=timeout)
+        return lookup_dois(dois_list=dois_list, rate_limit=rate_limit, timeout=timeout, max_workers=max_workers, batch_size=batch_size)
     
-    def add_dois(self, dois_list: list = [], rate_limit: float = 0.05, timeout = 60, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False):
+    def add_dois(self, dois_list: list = [], rate_limit: float = 0.05, timeout = 60, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False, max_workers: int = None, batch_size: int = None):
         
         """
-        Looks up a list of DOIs using the CrossRef API and adds to Review's results dataset.
+        Looks up a list of DOIs using the CrossRef API and adds to Review's results dataset. DOIs are looked up concurrently; results are added in the order of dois_list.
 
         Parameters
         ----------
@@ -3224,7 +4416,11 @@ class Review:
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+        max_workers : int
+            the maximum number of requests in flight at once. Defaults to None: the default is used (see art.importers.crossref.set_max_concurrent_requests).
+        batch_size : int
+            the number of DOIs per request. Defaults to None: the default is used (see art.importers.crossref.set_doi_batch_size).
         drop_duplicates : bool
             whether to remove duplicated rows.
         drop_empty_rows : bool
@@ -3241,7 +4437,7 @@ class Review:
         """
 
         old_len = len(self.results)
-        self.results.add_dois(dois_list=dois_list, rate_limit=rate_limit, timeout=timeout) # type: ignore
+        self.results.add_dois(dois_list=dois_list, rate_limit=rate_limit, timeout=timeout, max_workers=max_workers, batch_size=batch_size) # type: ignore
         new_len = len(self.results)
 
         len_diff = new_len - old_len
@@ -3271,11 +4467,11 @@ class Review:
         
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         return self
     
-    def from_dois(dois_list: list = [], rate_limit: float = 0.05, timeout = 60, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False): # type: ignore
+    def from_dois(dois_list: list = [], rate_limit: float = 0.05, timeout = 60, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False, max_workers: int = None, batch_size: int = None): # type: ignore
 
         """
         Looks up a list of DOIs using the CrossRef API and returns as a Review object.
@@ -3287,7 +4483,11 @@ class Review:
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+        max_workers : int
+            the maximum number of requests in flight at once. Defaults to None: the default is used (see art.importers.crossref.set_max_concurrent_requests).
+        batch_size : int
+            the number of DOIs per request. Defaults to None: the default is used (see art.importers.crossref.set_doi_batch_size).
         drop_duplicates : bool
             whether to remove duplicated rows.
         drop_empty_rows : bool
@@ -3304,19 +4504,23 @@ class Review:
         """
 
         review = Review()
-        review.add_dois(dois_list = dois_list, rate_limit=rate_limit, timeout = timeout, update_formatting = update_formatting, update_entities=update_entities, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
+        review.add_dois(dois_list = dois_list, rate_limit=rate_limit, timeout = timeout, update_formatting = update_formatting, update_entities=update_entities, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows, max_workers=max_workers, batch_size=batch_size)
 
         return review
 
-    def update_from_dois(self, timeout: int = 60, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False):
+    def update_from_dois(self, timeout: int = 60, update_formatting: bool = True, update_entities = False, drop_empty_rows = False, drop_duplicates = False, max_workers: int = None, batch_size: int = None):
         
         """
-        Updates results entries that have DOIs associated using the CrossRef API.
+        Updates results entries that have DOIs associated using the CrossRef API. DOIs are looked up in batches, concurrently (see Results.update_from_dois).
 
         Parameters
         ----------
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        max_workers : int
+            the maximum number of requests in flight at once. Defaults to None: the default is used (see art.importers.crossref.set_max_concurrent_requests).
+        batch_size : int
+            the number of DOIs per request. Defaults to None: the default is used (see art.importers.crossref.set_doi_batch_size).
         drop_duplicates : bool
             whether to remove duplicated rows.
         drop_empty_rows : bool
@@ -3333,7 +4537,7 @@ class Review:
         """
 
         has_doi = len(self.results.has('doi')) # type: ignore
-        self.results.update_from_dois(timeout=timeout) # type: ignore
+        self.results.update_from_dois(timeout=timeout, max_workers=max_workers, batch_size=batch_size) # type: ignore
 
         changes = {'results': has_doi}
         self.activity_log.add_activity(type='API retrieval', activity='updated results data from Crossref using DOIs', location = ['results'], changes_dict = changes)
@@ -3360,7 +4564,7 @@ class Review:
             self.activity_log.add_activity(type='data cleaning', activity='removed empty rows', location=list(drop_changes.keys()), changes_dict=drop_changes)
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         return self
 
@@ -3465,7 +4669,8 @@ class Review:
                         sample: int = None, # type: ignore
                         limit: int = None, # type: ignore
                         rate_limit: float = 0.05,
-                        timeout = 60):
+                        timeout = 60,
+                        page_size: int = None): # type: ignore
         
         """
         Looks up a journal using the CrossRef API and returns associated entries as a Pandas DataFrame.
@@ -3479,9 +4684,11 @@ class Review:
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see art.importers.crossref.set_search_page_size).
         add_to_results : bool
             whether to add results to Review.
         filter : dict
@@ -3493,7 +4700,7 @@ class Review:
             journal entry records.
         """
 
-        return get_journal_entries(issn = issn, filter = filter, select = select, sample = sample, limit = limit, rate_limit = rate_limit, timeout = timeout)
+        return get_journal_entries(issn = issn, filter = filter, select = select, sample = sample, limit = limit, rate_limit = rate_limit, timeout = timeout, page_size = page_size)
     
     def search_journal_entries(
                         self,
@@ -3516,6 +4723,7 @@ class Review:
                         limit: int = None, # type: ignore
                         rate_limit: float = 0.05,
                         timeout: int = 60,
+                        page_size: int = None, # type: ignore
                         add_to_results: bool = False) -> pd.DataFrame:
             
             """
@@ -3556,9 +4764,11 @@ class Review:
             limit : int
                 optional: set a limit to the number of results returned.
             rate_limit : float
-                time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+                time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
             timeout : int
                 maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+            page_size : int
+                the number of results requested at a time. Defaults to None: the default is used (see art.importers.crossref.set_search_page_size).
             add_to_results : bool
                 whether to add search results to Review.
             filter : dict
@@ -3588,7 +4798,8 @@ class Review:
                                           sample=sample,
                                           limit=limit,
                                           rate_limit=rate_limit,
-                                          timeout=timeout
+                                          timeout=timeout,
+                                          page_size=page_size
                                           )
             
             if add_to_results == True:
@@ -3675,6 +4886,7 @@ class Review:
                         limit: int = None, # type: ignore
                         rate_limit: float = 0.05,
                         timeout: int = 60,
+                        page_size: int = None, # type: ignore
                         add_to_results: bool = False):
         
         """
@@ -3689,9 +4901,11 @@ class Review:
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see art.importers.crossref.set_search_page_size).
         add_to_results : bool
             whether to add results to Review.
         filter : dict
@@ -3703,7 +4917,7 @@ class Review:
             publication records.
         """
 
-        df = get_funder_works(funder_id=funder_id, filter=filter, select=select, sample=sample, limit=limit, rate_limit=rate_limit, timeout=timeout)
+        df = get_funder_works(funder_id=funder_id, filter=filter, select=select, sample=sample, limit=limit, rate_limit=rate_limit, timeout=timeout, page_size=page_size)
 
         if add_to_results == True:
                 self.results.add_dataframe(dataframe=df) # type: ignore
@@ -3731,6 +4945,7 @@ class Review:
                         limit: int = None, # type: ignore
                         rate_limit: float = 0.05,
                         timeout: int = 60,
+                        page_size: int = None, # type: ignore
                         add_to_results: bool = False):
 
         """
@@ -3771,9 +4986,11 @@ class Review:
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see art.importers.crossref.set_search_page_size).
         add_to_results : bool
             whether to add search results to Review.
         filter : dict
@@ -3804,7 +5021,8 @@ class Review:
                                 sample=sample,
                                 limit=limit,
                                 rate_limit=rate_limit,
-                                timeout=timeout)
+                                timeout=timeout,
+                                page_size=page_size)
             
         if add_to_results == True:
                 
@@ -4053,9 +5271,11 @@ class Review:
             if len(to_process) > 0:
 
                 rows = self.results.loc[to_process]
-                citations = rows['citations'].to_list()
+                citations = [materialize(i) for i in rows['citations'].to_list()]
                 
-                new_df = pd.DataFrame(dtype=object)
+                # Citations are staged and added to the results in batches (see Results.start_batch), rather than concatenated one set at a time
+                new_rows = Results()
+                new_rows.start_batch(drop_empty_rows = False, drop_duplicates = False, update_work_ids = False)
 
                 process_iteration = 0
 
@@ -4063,9 +5283,8 @@ class Review:
                     
                     if (type(i) == References) or (type(i) == Results) or (type(i) == pd.DataFrame):
 
-                        res = i.copy(deep=True)
-                        if len(res) > 0:
-                            new_df = pd.concat([new_df, res])
+                        if len(i) > 0:
+                            new_rows.stage_rows(i)
 
                     process_iteration += 1
 
@@ -4073,11 +5292,14 @@ class Review:
                         to_process = to_process[:process_iteration]
                         break
 
+                new_rows.end_batch()
+                new_df = pd.DataFrame(new_rows)
+
                 new_df_asstr = new_df.copy(deep=True).astype(str)
                 unique_indexes = new_df_asstr.drop_duplicates().index
                 new_df = new_df.loc[unique_indexes]
                 new_df = new_df.reset_index().drop('index', axis=1)
-                self.results.add_dataframe(dataframe=new_df, update_work_ids = False, format_authors = False) # type: ignore
+                self.results.add_dataframe(dataframe=new_df, update_work_ids = False) # type: ignore
 
             processed_indexes = processed_indexes + to_process
             len_diff = len(self.results) - original_len
@@ -4088,9 +5310,12 @@ class Review:
         final_len_diff = len(self.results) - original_len
         
 
-        self.results.update_work_ids() # type: ignore
-        df = self.results.drop_duplicates(subset=['work_id']).reset_index().drop('index', axis=1)
+        self.results.update_work_ids(changed_only=True) # type: ignore
+        df = self.results.drop_duplicates(subset=['work_id'])
+        tracker = self.results.change_tracker().relabel(df.index.to_list()) # type: ignore
+        df = df.reset_index().drop('index', axis=1)
         self.results = Results.from_dataframe(df) # type: ignore
+        self.results._changes = tracker # type: ignore
 
 
         self.activity_log.add_activity(type='citation crawl', activity=f'crawled stored citations and added to results', location=['results'])
@@ -4175,20 +5400,59 @@ class Review:
 
         return result
 
-    def citations_dict(self) -> dict:
+    def works_column(self, column: str, work_ids = None) -> tuple:
+
+        """
+        Returns the work IDs of the Review's results and the values of one of their columns, optionally only for results with the given work IDs. If the Review was opened from a database and its results have not been loaded, only these columns are read.
+
+        Parameters
+        ----------
+        column : str
+            name of the column.
+        work_ids : list
+            work IDs of results to include. Defaults to None (all results).
+
+        Returns
+        -------
+        result : tuple
+            a list of work IDs and a list of the column's values.
+        """
+
+        database = self.pending_database('results')
+
+        if database is not None:
+
+            if work_ids is None:
+                frame = database.select('results', columns = ['work_id', column])
+            else:
+                frame = database.select_keys('results', 'work_id', work_ids, columns = ['work_id', column])
+
+        else:
+            frame = self.results
+
+            if work_ids is not None:
+                frame = frame[frame['work_id'].isin(list(work_ids))]
+
+        return frame['work_id'].to_list(), frame[column].to_list() # type: ignore
+
+    def citations_dict(self, work_ids = None) -> dict:
         
         """
         Returns a dictionary containing Results entries and their citations. 
             * Keys: work_id
             * Values: References object containing citations
+
+        Parameters
+        ----------
+        work_ids : list
+            work IDs of results to include. Defaults to None (all results).
         """
 
         output = {}
 
-        for i in self.results.index:
-            data = self.results.loc[i]
-            work_id = data['work_id']
-            citations = data['citations']
+        for work_id, citations in zip(*self.works_column('citations', work_ids = work_ids)):
+
+            citations = materialize(citations)
 
             if type(citations) == References:
                 citations.update_work_ids()
@@ -4197,20 +5461,24 @@ class Review:
 
         return output
 
-    def author_works_dict(self) -> dict:
+    def author_works_dict(self, work_ids = None) -> dict:
 
         """
         Returns a dictionary containing Results entries and their associated authors. 
             * Keys: work_id
             * Values: authors data as a list or dictionary
+
+        Parameters
+        ----------
+        work_ids : list
+            work IDs of results to include. Defaults to None (all results).
         """
 
         output = {}
 
-        for i in self.results.index:
-            data = self.results.loc[i].copy(deep=True)
-            work_id = data['work_id']
-            auths = data['authors']
+        for work_id, auths in zip(*self.works_column('authors', work_ids = work_ids)):
+
+            auths = materialize(auths)
 
             if type(auths) == Authors:
                 auths.update_author_ids()
@@ -4230,12 +5498,7 @@ class Review:
 
         output = {}
 
-        auths = self.authors.summary.copy(deep=True)
-
-        for i in auths.index:
-            data = auths.loc[i]
-            auth_id = data['author_id']
-            affils = data['affiliations']
+        for auth_id, affils in zip(self.authors.summary['author_id'].to_list(), self.authors.summary['affiliations'].to_list()):
 
             if type(affils) == Affiliations:
                 affils.update_ids()
@@ -4245,20 +5508,24 @@ class Review:
 
         return output
 
-    def funder_works_dict(self) -> dict:
+    def funder_works_dict(self, work_ids = None) -> dict:
 
         """
         Returns a dictionary containing Results entries and their associated funders. 
             * Keys: work_id
             * Values: funders data as a list or dictionary
+
+        Parameters
+        ----------
+        work_ids : list
+            work IDs of results to include. Defaults to None (all results).
         """
 
         output = {}
 
-        for i in self.results.index:
-            data = self.results.loc[i].copy(deep=True)
-            work_id = data['work_id']
-            funders = data['funder']
+        for work_id, funders in zip(*self.works_column('funder', work_ids = work_ids)):
+
+            funders = materialize(funders)
 
             if type(funders) == Funders:
                 funders.update_ids()
@@ -4305,7 +5572,7 @@ class Review:
             self.authors.drop_empty_rows()
         
         if drop_duplicates == True:
-            self.authors.remove_duplicates(drop_empty_rows=drop_empty_rows)
+            self.authors.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=True)
 
         co_auths = self.get_coauthors(format=format, update_attrs=update_attrs, ignore_case=ignore_case)
 
@@ -4333,15 +5600,16 @@ class Review:
                         continue
 
                 auth_obj = self.authors.all[auth_id]
-                if 'publications' in auth_obj.__dict__.keys():
+                auth_attrs = auth_obj.attributes()
+                if 'publications' in auth_attrs.keys():
                     pubs = auth_obj.publications
                 else:
                     pubs = []
-                if 'affiliations' in auth_obj.__dict__.keys():
-                    affils = auth_obj.affiliations
+                if 'affiliations' in auth_attrs.keys():
+                    affils = auth_attrs['affiliations']
                 else:
                     affils = []
-                details = auth_obj.details
+                details = auth_obj.summary
 
                 for c in details.columns:
                     v[c] = details.loc[0, c]
@@ -4468,7 +5736,7 @@ class Review:
             self.results.drop_empty_rows() # type: ignore
         
         if drop_duplicates == True:
-            self.results.remove_duplicates(drop_empty_rows=drop_empty_rows) # type: ignore
+            self.results.remove_duplicates(drop_empty_rows=drop_empty_rows, changed_only=True) # type: ignore
 
         if add_citations_to_results == True:
             self.add_citations_to_results(update_formatting = format, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -4675,7 +5943,7 @@ class Review:
             self.authors.drop_empty_rows() # type: ignore
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if format == True:
             self.format(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -4729,7 +5997,7 @@ class Review:
             self.results.drop_empty_rows() # type: ignore
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if format == True:
             self.format(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -4783,7 +6051,7 @@ class Review:
             self.authors.drop_empty_rows()
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if format == True:
             self.format(drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -4836,7 +6104,7 @@ class Review:
             self.authors.drop_empty_rows() # type: ignore
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if format == True:
             self.format(update_entities=update_attrs, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
@@ -4921,7 +6189,7 @@ class Review:
             self.authors.drop_empty_rows() # type: ignore
         
         if drop_duplicates == True:
-            self.remove_duplicates(drop_empty_rows = drop_empty_rows)
+            self.remove_duplicates(drop_empty_rows = drop_empty_rows, changed_only = True)
 
         if format == True:
             self.format(update_entities=update_attrs, drop_duplicates=drop_duplicates, drop_empty_rows=drop_empty_rows)
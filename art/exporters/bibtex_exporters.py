@@ -0,0 +1,235 @@
+"""Functions for exporting Results data to Bibtex (.bib) bibliography files."""
+
+from ..utils.lazy import materialize
+
+import io
+
+import pandas as pd
+from pybtex.database import BibliographyData, Entry # type: ignore
+from pybtex.database.output.bibtex import Writer # type: ignore
+
+# Number of rows converted and written at a time by default
+default_write_size = 1000
+
+def row_to_pybtex(row: pd.Series) -> tuple:
+
+    """
+    Converts a row of a Results DataFrame to a Pybtex Entry object.
+
+    Parameters
+    ----------
+    row : pandas.Series
+        a row of a Results DataFrame.
+
+    Returns
+    -------
+    result : tuple
+        the entry's citation key and the Pybtex Entry object.
+    """
+
+    row = row.dropna()
+
+    if 'type' in row.index:
+        entry_type = row['type']
+    else:
+        entry_type = 'misc'
+    
+    if 'title' in row.index:
+        title = str(row['title'])
+    else:
+        title = ''
+    
+    if 'authors' in row.index:
+        authors = materialize(row['authors'])
+    else:
+        authors = ''
+    
+    if ('__dict__' in authors.__dir__()) and ('summary' in authors.__dict__.keys()):
+        if (type(authors.summary) == pd.DataFrame) and ('full_name' in authors.summary.columns):
+            authors_str = ', '.join(authors.summary['full_name'].to_list())
+        else:
+            authors_str = ''
+    
+    if type(authors) == list:
+        authors_str = ', '.join(authors)
+    else:
+        authors_str = ''
+    
+    if 'date' in row.index:
+        year = str(row['date'])
+    else:
+        year = ''
+    
+    if 'keywords' in row.index:
+        keywords = ', '.join(row['keywords'])
+    else:
+        keywords = ''
+
+    if 'doi' in row.index:
+        doi = str(row['doi'])
+    else:
+        doi = ''
+    
+    if 'publisher' in row.index:
+        publisher = str(row['publisher'])
+    else:
+        publisher = ''
+    
+    if 'link' in row.index:
+        link = str(row['link'])
+    else:
+        link = ''
+    
+    if 'isbn' in row.index:
+        isbn = str(row['isbn'])
+    else:
+        isbn = ''
+
+    if 'work_id' in row.index:
+        key = row['work_id']
+    else:
+        key = str(title).lower() + '_' + str(authors_str)[:10].lower() + '_' + str(year).lower()
+
+    entry_list = []
+
+    if (authors_str is not None) and (authors_str != '') and (type(authors_str) == str):
+        authors_tuple = ('author', authors_str)
+        entry_list.append(authors_tuple)
+    
+    if (title is not None) and (title != '') and (type(title) == str):
+        title_tuple = ('title', title)
+        entry_list.append(title_tuple)
+    
+    if (year is not None) and (year != '') and (type(year) == str):
+        year_tuple = ('year', year)
+        entry_list.append(year_tuple)
+    
+    if (doi is not None) and (doi != '') and (type(doi) == str):
+        doi_tuple = ('doi', doi)
+        entry_list.append(doi_tuple)
+    
+    if (publisher is not None) and (publisher != '') and (type(publisher) == str):
+        publisher_tuple = ('publisher', publisher)
+        entry_list.append(publisher_tuple)
+    
+    if (link is not None) and (link != '') and (type(link) == str):
+        link_tuple = ('url', link)
+        entry_list.append(link_tuple)
+    
+    if (isbn is not None) and (isbn != '') and (type(isbn) == str):
+        isbn_tuple = ('isbn', isbn)
+        entry_list.append(isbn_tuple)
+    
+    if (keywords is not None) and (keywords != '') and (type(keywords) == str):
+        keywords_tuple = ('keywords', keywords)
+        entry_list.append(keywords_tuple)
+    
+    if 'article' in entry_type:
+
+        entry_type = 'article'
+
+        if 'source' in row.index:
+            journal = row['source']
+            if (journal is not None) and (journal != '') and (type(journal) == str):
+                journal_tuple = ('journal', journal)
+                entry_list.append(journal_tuple)
+
+    if ('book' in entry_type) and ('chapter' in entry_type):
+
+        entry_type = 'incollection'
+
+        if 'source' in row.index:
+            booktitle = row['source']
+            if (booktitle is not None) and (booktitle != '') and (type(booktitle) == str):
+                booktitle_tuple = ('journal', booktitle)
+                entry_list.append(booktitle_tuple)
+    
+    if 'book' in entry_type:
+        entry_type = 'book'
+
+    entry = Entry(entry_type, entry_list)
+
+    return key, entry
+
+def iter_pybtex(df: pd.DataFrame, chunk_size: int = None):
+
+    """
+    Converts a Results DataFrame to Pybtex BibliographyData objects, chunk_size rows at a time. Entries whose citation keys have already been yielded are skipped.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        a Results DataFrame.
+    chunk_size : int
+        the number of rows per BibliographyData object. Defaults to 1000.
+
+    Yields
+    ------
+    bib_data : pybtex.BibliographyData
+        a Pybtex BibliographyData object.
+    """
+
+    global default_write_size
+
+    if chunk_size is None:
+        chunk_size = default_write_size
+
+    seen = set()
+
+    for start in range(0, len(df), chunk_size):
+
+        entries = {}
+
+        for i, row in df.iloc[start:start + chunk_size].iterrows():
+
+            key, entry = row_to_pybtex(row)
+
+            if key in seen:
+                continue
+
+            seen.add(key)
+            entries[key] = entry
+
+        yield BibliographyData(entries)
+
+def write_bibtex(df: pd.DataFrame, file, chunk_size: int = None):
+
+    """
+    Writes a Results DataFrame to a file in Bibtex (.bib) format, converting and writing chunk_size rows at a time so that the whole bibliography is never held in memory.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        a Results DataFrame.
+    file : file object
+        a file opened for writing in text mode.
+    chunk_size : int
+        the number of rows to write at a time. Defaults to 1000.
+
+    Returns
+    -------
+    count : int
+        the number of entries written.
+    """
+
+    writer = Writer()
+    count = 0
+
+    for bib_data in iter_pybtex(df, chunk_size = chunk_size):
+
+        if len(bib_data.entries) == 0:
+            continue
+
+        stream = io.StringIO()
+        writer.write_stream(bib_data, stream)
+
+        # Entries are separated by blank lines, as when written by Pybtex in one go
+        if count > 0:
+            file.write('\n')
+
+        bib = stream.getvalue()
+        file.write(bytes(bib, "utf-8").decode("unicode_escape"))
+
+        count += len(bib_data.entries)
+
+    return count
@@ -209,9 +209,15 @@ def art_class_to_folder(obj, folder_name = 'request_input', folder_address: str
 
         os.mkdir(obj_address)
 
-        for key in obj.__dict__.keys():
+        # Entity objects store their data in a shared EntityStore, so their attributes are retrieved using Entity.attributes()
+        if 'attributes' in obj.__dir__():
+            obj_attrs = obj.attributes()
+        else:
+            obj_attrs = obj.__dict__
+
+        for key in obj_attrs.keys():
             
-            attr = obj.__dict__[key]
+            attr = obj_attrs[key]
             attr_name = str(key).replace('A:','').replace('F:','').replace('AUTH:','')
 
             if (attr is not None) and (attr_name != 'data'):
@@ -1,9 +1,227 @@
 from ..utils.basics import results_cols
+from .chunked import get_chunk_size, read_fraction
+
+import os
 
 import pybtex # type: ignore
+from pybtex.database.input.bibtex import Parser # type: ignore
+from pybtex.database import BibliographyData # type: ignore
 import pandas as pd
 import numpy as np
 
+def entry_to_record(key, entry) -> dict:
+
+    """
+    Converts a Pybtex Entry object to a dictionary of Results columns and values.
+
+    Parameters
+    ----------
+    key : str
+        the entry's citation key.
+    entry : pybtex.database.Entry
+        the entry to convert.
+
+    Returns
+    -------
+    record : dict
+        a dictionary of Results column names and values. Columns without values are omitted.
+    """
+
+    fields = dict(entry.fields)
+    field_keys = fields.keys()
+
+    record = {'type': entry.type}
+
+    if 'title' in field_keys:
+        record['title'] = fields['title']
+
+    if 'year' in field_keys:
+        record['date'] = fields['year']
+
+    if 'url' in field_keys:
+        record['link'] = fields['url']
+
+    if 'doi' in field_keys:
+        record['doi'] = fields['doi']
+
+    if 'language' in field_keys:
+        record['language'] = fields['language']
+
+    if 'journal' in field_keys:
+        record['source'] = fields['journal']
+
+    if 'book' in field_keys:
+        record['source'] = fields['book']
+
+    if 'booktitle' in field_keys:
+        record['source'] = fields['booktitle']
+
+    if 'publisher' in field_keys:
+        record['publisher'] = fields['publisher']
+
+    if 'pmid' in field_keys:
+        record['pubmed_id'] = fields['pmid']
+
+    if 'issn' in field_keys:
+        record['issn'] = fields['issn']
+
+    if 'isbn' in field_keys:
+        record['isbn'] = fields['isbn']
+
+    if 'keywords' in field_keys:
+        record['keywords'] = fields['keywords'].split(',')
+
+    persons = dict(entry.persons)
+    persons_keys = persons.keys()
+
+    if 'author' in persons_keys:
+        auths = persons['author']
+        auths_list = []
+
+        for a in auths:
+            first = ''.join(a.first_names)
+            middle = ' '.join(a.middle_names)
+            last = ' '.join(a.last_names)
+
+            full_name = first + ' ' + middle + ' ' + last
+            full_name = full_name.strip()
+            auths_list.append(full_name)
+
+        record['authors'] = auths_list
+        record['authors_data'] = auths_list.copy()
+
+    return record
+
+def records_to_df(records: list, start: int = 0) -> pd.DataFrame:
+
+    """
+    Constructs a Pandas DataFrame with Results columns from a list of records (see entry_to_record).
+
+    Parameters
+    ----------
+    records : list
+        a list of dictionaries of Results column names and values.
+    start : int
+        the first index label. Defaults to 0.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        a Pandas DataFrame with one row for each record.
+    """
+
+    df = pd.DataFrame.from_records(records, columns = results_cols, index = pd.RangeIndex(start, start + len(records)))
+
+    return df.astype(object)
+
+def iter_bibtex_text(file, batch_size: int):
+
+    """
+    Splits the text of a Bibtex (.bib) file into blocks of (at most) batch_size entries, without reading the whole file. Blocks are only split at lines which begin with '@' outside of braces, so entries are never divided.
+
+    Parameters
+    ----------
+    file : file object
+        a Bibtex file opened in text mode.
+    batch_size : int
+        the number of entries per block.
+
+    Yields
+    ------
+    text : str
+        a block of Bibtex text.
+    """
+
+    lines = []
+    entries = 0
+    depth = 0
+
+    for line in file:
+
+        if (depth <= 0) and line.lstrip().startswith('@'):
+
+            depth = 0
+
+            if entries == batch_size:
+                yield ''.join(lines)
+                lines = []
+                entries = 0
+
+            entries += 1
+
+        lines.append(line)
+
+        # Braces are only counted inside entries: text between entries is a comment
+        if depth > 0 or line.lstrip().startswith('@'):
+            depth += line.count('{') - line.count('\\{') - line.count('}') + line.count('\\}')
+
+    if len(lines) > 0:
+        yield ''.join(lines)
+
+def read_bibtex_records(file_path, batch_size = None):
+
+    """
+    Reads a Bibtex (.bib) bibliography file in batches of entries, parsing each batch with Pybtex, so that the whole bibliography is never held in memory. @string macros apply across batches.
+
+    Parameters
+    ----------
+    file_path : str
+        directory address for .bib file to read.
+    batch_size : int
+        the number of entries to parse at a time. Defaults to the default chunk size (see art.importers.chunked.set_default_chunk_size).
+
+    Yields
+    ------
+    batch : tuple
+        a list of records (see entry_to_record), and the fraction of the file read so far.
+    """
+
+    batch_size = get_chunk_size(batch_size)
+    size = os.path.getsize(file_path)
+    parser = Parser()
+
+    parser.filename = file_path
+
+    with open(file_path, encoding = parser.encoding) as f:
+
+        for text in iter_bibtex_text(f, batch_size):
+
+            # Each batch is parsed into a fresh BibliographyData; the parser's macros persist
+            parser.data = BibliographyData()
+            bib = parser.parse_string(text)
+
+            records = [entry_to_record(key, entry) for key, entry in bib.entries.items()]
+
+            yield records, read_fraction(f.buffer, size)
+
+def read_bibtex_chunks(file_path, chunk_size = None):
+
+    """
+    Reads a Bibtex (.bib) bibliography file in chunks, in the same way as import_bibtex reads the whole file.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of file to read.
+    chunk_size : int
+        the number of entries to read at a time. Defaults to the default chunk size (see art.importers.chunked.set_default_chunk_size).
+
+    Yields
+    ------
+    chunk : tuple
+        a Pandas DataFrame of rows, and the fraction of the file read so far.
+    """
+
+    start = 0
+
+    for records, fraction in read_bibtex_records(file_path, batch_size = chunk_size):
+
+        if len(records) == 0:
+            continue
+
+        yield records_to_df(records, start = start), fraction
+        start += len(records)
+
 def import_bibtex(file_path = 'request_input'):
 
     """
@@ -13,91 +231,23 @@ def import_bibtex(file_path = 'request_input'):
     ----------
     file_path : str
         directory address for .bib file to read. Defaults to requesting from user input.
-    
+
     Returns
     -------
     df : pandas.DataFrame
         a Pandas DataFrame of the bibliographic data contained in the Bibtex file.
+
+    Notes
+    -----
+    The file is parsed in batches of entries (see read_bibtex_records) and the DataFrame is constructed once from all records.
     """
 
     if file_path == 'request_input':
         file_path = input('File path: ')
 
-    bib = pybtex.database.parse_file(file_path)
-
-    df = pd.DataFrame(columns=results_cols, dtype=object)
-
-    bib_keys = list(bib.entries.keys())
-
-    index = 0
-    for k in bib_keys:
-
-        entry = bib.entries.get(k)
-
-        fields = dict(entry.fields)
-        field_keys = fields.keys()
-
-        df.loc[index, 'type'] = entry.type
-
-        if 'title' in field_keys:
-            df.loc[index, 'title'] = fields['title']
-        
-        if 'year' in field_keys:
-            df.loc[index, 'date'] = fields['year']
-        
-        if 'url' in field_keys:
-            df.loc[index, 'link'] = fields['url']
-        
-        if 'doi' in field_keys:
-            df.loc[index, 'doi'] = fields['doi']
-
-        if 'language' in field_keys:
-            df.loc[index, 'language'] = fields['language']
-        
-        if 'journal' in field_keys:
-            df.loc[index, 'source'] = fields['journal']
-        
-        if 'book' in field_keys:
-            df.loc[index, 'source'] = fields['book']
-        
-        if 'booktitle' in field_keys:
-            df.loc[index, 'source'] = fields['booktitle']
-        
-        if 'publisher' in field_keys:
-            df.loc[index, 'publisher'] = fields['publisher']
-        
-        if 'pmid' in field_keys:
-            df.loc[index, 'pubmed_id'] = fields['pmid']
-
-        if 'issn' in field_keys:
-            df.loc[index, 'issn'] = fields['issn']
-        
-        if 'isbn' in field_keys:
-            df.loc[index, 'isbn'] = fields['isbn']
-        
-        if 'keywords' in field_keys:
-            df.at[index, 'keywords'] = fields['keywords'].split(',')
-        
-        persons = dict(entry.persons)
-        persons_keys = persons.keys()
-
-        if 'author' in persons_keys:
-            auths = persons['author']
-            auths_list = []
-
-            for a in auths:
-                first = ''.join(a.first_names)
-                middle = ' '.join(a.middle_names)
-                last = ' '.join(a.last_names)
-
-                full_name = first + ' ' + middle + ' ' + last
-                full_name = full_name.strip()
-                auths_list.append(full_name)
-
-            df.at[index, 'authors'] = auths_list
-            df.at[index, 'authors_data'] = auths_list
-        
-        index += 1
-
-
-    return df
\ No newline at end of file
+    records = []
+
+    for batch, fraction in read_bibtex_records(file_path):
+        records.extend(batch)
+
+    return records_to_df(records)
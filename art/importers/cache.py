@@ -0,0 +1,613 @@
+"""
+A persistent, on-disk cache of API responses, shared by ART's importers.
+
+Caching is off by default. Once enabled (see set_cache_enabled), successful responses are pickled to a SQLite database at ~/.cache/art/responses.db, or in the folder given by the ART_CACHE_DIR environment variable (see set_cache_path). Failed requests and empty responses are not cached.
+"""
+
+import os
+import time
+import json
+import hashlib
+import pickle
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+import pandas as pd
+
+# Whether API responses are cached. Off by default, so that responses are only written to disk once requested
+cache_enabled = False
+
+# Location of the cache database. Set the ART_CACHE_DIR environment variable to change the default folder
+cache_path = str(Path(os.environ.get('ART_CACHE_DIR', Path.home() / '.cache' / 'art')) / 'responses.db')
+
+# Time, in seconds, for which responses from each API are reused. 'default' applies to APIs without an entry
+cache_ttls = {
+                'default': 7 * 24 * 3600,
+                'crossref': 30 * 24 * 3600,
+                'orcid': 7 * 24 * 3600,
+                'scopus': 7 * 24 * 3600,
+                'wos': 7 * 24 * 3600
+                }
+
+# Maximum total size, in bytes, of cached responses. The least recently used responses are evicted first
+max_cache_size = 512 * 1024 ** 2
+
+# Hit and miss counts for each API since the counters were last reset
+counter_names = ['hits', 'misses', 'stores', 'evictions']
+counters = {}
+
+def set_cache_enabled(enabled: bool = True):
+
+    """
+    Sets whether importers cache API responses. Caching is off until enabled. Responses are stored at the cache path (see set_cache_path).
+
+    Parameters
+    ----------
+    enabled : bool
+        whether to cache responses. Defaults to True.
+    """
+
+    global cache_enabled
+    cache_enabled = enabled == True
+
+def set_cache_path(file_path: str):
+
+    """
+    Sets the location of the response cache database. Defaults to ~/.cache/art/responses.db, or responses.db in the folder given by the ART_CACHE_DIR environment variable.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of the cache database. Created when first used.
+    """
+
+    global cache_path
+    cache_path = str(Path(file_path).expanduser())
+
+def set_cache_ttl(ttl: float, api: str = 'default'):
+
+    """
+    Sets the time for which an API's responses are reused.
+
+    Parameters
+    ----------
+    ttl : float
+        time in seconds. Responses older than this are fetched again.
+    api : str
+        name of the API (e.g. 'crossref', 'orcid', 'scopus', 'wos'). Defaults to 'default': APIs without their own setting.
+    """
+
+    global cache_ttls
+
+    if float(ttl) < 0:
+        raise ValueError('ttl must not be negative')
+
+    cache_ttls[api] = float(ttl)
+
+def set_max_cache_size(size: int):
+
+    """
+    Sets the maximum total size of cached responses. The least recently used responses are evicted once it is exceeded.
+
+    Parameters
+    ----------
+    size : int
+        size in bytes.
+    """
+
+    global max_cache_size
+
+    if int(size) < 0:
+        raise ValueError('size must not be negative')
+
+    max_cache_size = int(size)
+
+def get_ttl(api: str) -> float:
+
+    """
+    Returns the time in seconds for which an API's responses are reused.
+    """
+
+    global cache_ttls
+
+    return cache_ttls.get(api, cache_ttls['default'])
+
+def count(api: str, name: str, n: int = 1):
+
+    """
+    Adds to one of an API's hit and miss counters. Counters are shared between threads: callers hold the cache's lock (see ResponseCache.count).
+    """
+
+    global counters
+
+    if api not in counters.keys():
+        counters[api] = {i: 0 for i in counter_names}
+
+    counters[api][name] += n
+
+def response_key(api: str, endpoint: str, params) -> str:
+
+    """
+    Returns the cache key for an API request: a hash of the API's name, the endpoint and the request parameters.
+
+    Parameters
+    ----------
+    api : str
+        name of the API.
+    endpoint : str
+        name of the endpoint or resource (e.g. 'works').
+    params : object
+        the request's parameters. Must be JSON-serialisable; other values are converted to strings.
+
+    Returns
+    -------
+    key : str
+        a SHA-256 hex digest.
+    """
+
+    request = json.dumps([api, endpoint, params], sort_keys = True, default = str)
+
+    return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+
+    """
+    This is a ResponseCache object. It stores successful API responses in a SQLite database, keyed by a hash of the API, endpoint and request parameters (see response_key). Responses are pickled and compressed. Entries record when they were stored and last used, so that expired responses are ignored and the least recently used are evicted first.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of the cache database. Created if it does not exist.
+
+    Attributes
+    ----------
+    file_path : str
+        directory path of the cache database.
+    connection : sqlite3.Connection
+        the database connection. Shared between threads.
+    lock : threading.Lock
+        lock held while the connection or the hit and miss counters are used.
+    total : int
+        the total size in bytes of cached responses, kept up to date as responses are stored and removed.
+    """
+
+    def __init__(self, file_path: str):
+
+        """
+        Initialises ResponseCache instance.
+
+        Parameters
+        ----------
+        file_path : str
+            directory path of the cache database. Created if it does not exist.
+        """
+
+        Path(file_path).parent.mkdir(parents = True, exist_ok = True)
+
+        self.file_path = str(file_path)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.file_path, timeout = 30, isolation_level = None, check_same_thread = False)
+
+        with self.lock:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, api TEXT, endpoint TEXT, negative INTEGER, stored REAL, used REAL, size INTEGER, data BLOB)')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS responses_used ON responses (used)')
+
+        self.total = self.size()
+
+    def get(self, key: str, api: str):
+
+        """
+        Retrieves a cached response.
+
+        Parameters
+        ----------
+        key : str
+            the request's cache key.
+        api : str
+            name of the API. Used to select the time to live.
+
+        Returns
+        -------
+        result : tuple
+            whether an unexpired response was found, and the response.
+        """
+
+        now = time.time()
+
+        with self.lock:
+            row = self.connection.execute('SELECT negative, stored, data FROM responses WHERE key = ?', (key,)).fetchone()
+
+            if row is None:
+                return False, None
+
+            negative, stored, data = row
+
+            # 'Not found' responses stored by earlier versions are removed
+            if (negative == 1) or (now - stored > get_ttl(api)):
+                self.connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self.total -= len(data)
+                return False, None
+
+            self.connection.execute('UPDATE responses SET used = ? WHERE key = ?', (now, key))
+
+        try:
+            value = pickle.loads(zlib.decompress(data))
+        except Exception:
+            return False, None
+
+        return True, value
+
+    def put(self, key: str, api: str, endpoint: str, value) -> bool:
+
+        """
+        Stores a successful response, then evicts the least recently used responses if the cache is larger than the maximum size (see set_max_cache_size).
+
+        Parameters
+        ----------
+        key : str
+            the request's cache key.
+        api : str
+            name of the API.
+        endpoint : str
+            name of the endpoint or resource.
+        value : object
+            the response. Empty responses (None), exceptions and responses which cannot be pickled are not stored.
+
+        Returns
+        -------
+        result : bool
+            whether the response was stored.
+        """
+
+        if (value is None) or isinstance(value, BaseException):
+            return False
+
+        try:
+            data = zlib.compress(pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return False
+
+        global max_cache_size
+
+        now = time.time()
+
+        with self.lock:
+            old = self.connection.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self.connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (key, api, endpoint, 0, now, now, len(data), data))
+            self.total += len(data) - (old[0] if old is not None else 0)
+
+        if self.total > max_cache_size:
+            self.evict()
+
+        return True
+
+    def count(self, api: str, name: str, n: int = 1):
+
+        """
+        Adds to one of an API's hit and miss counters while holding the cache's lock, so that counts from concurrent requests are not lost.
+        """
+
+        with self.lock:
+            count(api, name, n)
+
+    def size(self) -> int:
+
+        """
+        Returns the total size in bytes of cached responses.
+        """
+
+        with self.lock:
+            total = self.connection.execute('SELECT SUM(size) FROM responses').fetchone()[0]
+
+        return int(total or 0)
+
+    def evict(self, max_size: int = None) -> int:
+
+        """
+        Removes the least recently used responses until the cache is no larger than max_size.
+
+        Parameters
+        ----------
+        max_size : int
+            size in bytes. Defaults to the maximum cache size (see set_max_cache_size).
+
+        Returns
+        -------
+        evicted : int
+            the number of responses removed.
+        """
+
+        global max_cache_size
+
+        if max_size is None:
+            max_size = max_cache_size
+
+        # Other processes may share the database, so the total is recalculated before evicting
+        total = self.size()
+
+        with self.lock:
+            self.total = total
+
+        if total <= max_size:
+            return 0
+
+        # Evicts down to 90% of the maximum, so that eviction is not repeated for every new response
+        target = total - int(max_size * 0.9)
+        removed = 0
+        keys = []
+
+        with self.lock:
+            for key, api, size in self.connection.execute('SELECT key, api, size FROM responses ORDER BY used'):
+
+                if removed >= target:
+                    break
+
+                keys.append((key, api))
+                removed += size
+
+            self.connection.executemany('DELETE FROM responses WHERE key = ?', [(key,) for key, api in keys])
+            self.total -= removed
+
+            for key, api in keys:
+                count(api, 'evictions')
+
+        return len(keys)
+
+    def clear(self, api: str = None):
+
+        """
+        Removes cached responses.
+
+        Parameters
+        ----------
+        api : str
+            name of the API whose responses to remove. Defaults to None: all responses are removed.
+        """
+
+        with self.lock:
+            if api is None:
+                self.connection.execute('DELETE FROM responses')
+            else:
+                self.connection.execute('DELETE FROM responses WHERE api = ?', (api,))
+
+            self.connection.execute('VACUUM')
+
+        total = self.size()
+
+        with self.lock:
+            self.total = total
+
+    def __len__(self) -> int:
+
+        """
+        Returns the number of cached responses.
+        """
+
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def close(self):
+
+        """
+        Closes the database connection.
+        """
+
+        with self.lock:
+            self.connection.close()
+
+# The shared cache, opened when first used
+shared_cache = None
+shared_cache_lock = threading.Lock()
+
+def get_cache():
+
+    """
+    Returns the shared ResponseCache for the current cache path (see set_cache_path), opening it if necessary. Returns None if caching is disabled or the cache cannot be opened.
+    """
+
+    global shared_cache
+    global cache_enabled
+    global cache_path
+
+    if cache_enabled == False:
+        return None
+
+    with shared_cache_lock:
+
+        if (shared_cache is not None) and (shared_cache.file_path == cache_path):
+            return shared_cache
+
+        if shared_cache is not None:
+            shared_cache.close()
+            shared_cache = None
+
+        try:
+            shared_cache = ResponseCache(cache_path)
+        except (OSError, sqlite3.Error) as e:
+            print(f'Response cache could not be opened at {cache_path}: {e}. Responses will not be cached.')
+            cache_enabled = False
+
+        return shared_cache
+
+def fetch_cached(api: str, endpoint: str, params, fetch, cacheable = None, refresh: bool = False):
+
+    """
+    Returns an API response from the shared cache if an unexpired one is stored; otherwise, calls fetch to retrieve it and stores the result.
+
+    Only successful responses are stored: exceptions raised by fetch are passed on, and None responses are not cached, so both are requested again next time.
+
+    Parameters
+    ----------
+    api : str
+        name of the API (e.g. 'crossref').
+    endpoint : str
+        name of the endpoint or resource (e.g. 'works').
+    params : object
+        the request's parameters. Used, with the API and endpoint, to key the response.
+    fetch : callable
+        a function with no arguments which makes the request and returns the response.
+    cacheable : callable
+        optional: a function which takes a response and returns False if it should not be stored (e.g. error messages).
+    refresh : bool
+        whether to ignore any cached response and fetch it again. Defaults to False.
+
+    Returns
+    -------
+    result : tuple
+        the response, and whether it was retrieved from the cache.
+    """
+
+    cache = get_cache()
+
+    if cache is None:
+        return fetch(), False
+
+    key = response_key(api, endpoint, params)
+
+    if refresh == False:
+
+        found, value = cache.get(key, api)
+
+        if found == True:
+            cache.count(api, 'hits')
+            return value, True
+
+    cache.count(api, 'misses')
+
+    value = fetch()
+
+    if (cacheable is None) or (cacheable(value) == True):
+        if cache.put(key, api, endpoint, value):
+            cache.count(api, 'stores')
+
+    return value, False
+
+def get_cached(api: str, endpoint: str, params):
+
+    """
+    Retrieves an API response from the shared cache without making a request. Counts a hit or a miss.
+
+    Parameters
+    ----------
+    api : str
+        name of the API (e.g. 'crossref').
+    endpoint : str
+        name of the endpoint or resource (e.g. 'works').
+    params : object
+        the request's parameters.
+
+    Returns
+    -------
+    result : tuple
+        whether an unexpired response was found, and the response (None if not found).
+    """
+
+    cache = get_cache()
+
+    if cache is None:
+        return False, None
+
+    found, value = cache.get(response_key(api, endpoint, params), api)
+
+    if found == False:
+        cache.count(api, 'misses')
+        return False, None
+
+    cache.count(api, 'hits')
+
+    return True, value
+
+def store_cached(api: str, endpoint: str, params, value):
+
+    """
+    Stores an API response retrieved without fetch_cached (e.g. one of several records returned by a batched request) in the shared cache. Empty responses (None) are not stored.
+
+    Parameters
+    ----------
+    api : str
+        name of the API (e.g. 'crossref').
+    endpoint : str
+        name of the endpoint or resource (e.g. 'works').
+    params : object
+        the request's parameters.
+    value : object
+        the response.
+    """
+
+    cache = get_cache()
+
+    if cache is None:
+        return
+
+    if cache.put(response_key(api, endpoint, params), api, endpoint, value):
+        cache.count(api, 'stores')
+
+def cache_stats() -> pd.DataFrame:
+
+    """
+    Returns the response cache's hit, miss, store and eviction counts for each API since the counters were last reset (see reset_cache_stats).
+
+    Returns
+    -------
+    stats : pandas.DataFrame
+        a Pandas DataFrame with one row per API, and a 'hit_rate' column.
+    """
+
+    global counters
+
+    cache = shared_cache
+
+    if cache is not None:
+        with cache.lock:
+            snapshot = {api: dict(api_counts) for api, api_counts in counters.items()}
+    else:
+        snapshot = {api: dict(api_counts) for api, api_counts in counters.items()}
+
+    stats = pd.DataFrame.from_dict(snapshot, orient = 'index', columns = counter_names).fillna(0).astype(int)
+
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = (stats['hits'] / lookups.where(lookups > 0)).fillna(0.0)
+
+    return stats
+
+def reset_cache_stats():
+
+    """
+    Resets the response cache's hit and miss counters.
+    """
+
+    global counters
+    counters = {}
+
+def cache_info() -> dict:
+
+    """
+    Returns the response cache's location, number of stored responses and total size in bytes.
+    """
+
+    cache = get_cache()
+
+    if cache is None:
+        return {'path': cache_path, 'enabled': False, 'responses': 0, 'size': 0}
+
+    return {'path': cache.file_path, 'enabled': True, 'responses': len(cache), 'size': cache.size()}
+
+def clear_cache(api: str = None):
+
+    """
+    Removes cached API responses.
+
+    Parameters
+    ----------
+    api : str
+        name of the API whose responses to remove (e.g. 'crossref'). Defaults to None: all responses are removed.
+    """
+
+    cache = get_cache()
+
+    if cache is not None:
+        cache.clear(api = api)
@@ -0,0 +1,228 @@
+"""Functions for reading large CSV, JSON and Excel files in chunks."""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import numpy as np
+
+# File types which can be read in chunks
+chunked_file_types = ['xlsx', 'csv', 'json', 'jsonl', 'ndjson']
+
+# Number of rows read at a time by default
+default_chunk_size = 10000
+
+def set_default_chunk_size(chunk_size: int = 10000):
+
+    """
+    Sets the number of rows read at a time by chunked imports (e.g. Review.import_csv with chunk_size = 'default').
+
+    Parameters
+    ----------
+    chunk_size : int
+        the number of rows. Defaults to 10000.
+    """
+
+    global default_chunk_size
+
+    if int(chunk_size) < 1:
+        raise ValueError('chunk_size must be a positive integer')
+
+    default_chunk_size = int(chunk_size)
+
+def get_chunk_size(chunk_size = None) -> int:
+
+    """
+    Returns the number of rows to read at a time: the value of chunk_size if given; otherwise, the default.
+    """
+
+    global default_chunk_size
+
+    if (chunk_size is None) or (chunk_size == 'default'):
+        return default_chunk_size
+
+    if int(chunk_size) < 1:
+        raise ValueError('chunk_size must be a positive integer')
+
+    return int(chunk_size)
+
+def read_fraction(handle, size: int):
+
+    """
+    Returns the fraction of a file which has been read through a file handle, or None if the file is empty.
+    """
+
+    if size == 0:
+        return None
+
+    return min(handle.tell() / size, 1.0)
+
+def read_csv_chunks(file_path, chunk_size = None):
+
+    """
+    Reads a CSV (.csv) file in chunks, in the same way as Results.import_csv reads the whole file.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of file to read.
+    chunk_size : int
+        the number of rows to read at a time. Defaults to the default chunk size (see set_default_chunk_size).
+
+    Yields
+    ------
+    chunk : tuple
+        a Pandas DataFrame of rows, and the fraction of the file read so far.
+    """
+
+    chunk_size = get_chunk_size(chunk_size)
+    size = os.path.getsize(file_path)
+
+    with open(file_path, 'rb') as f:
+        for chunk in pd.read_csv(f, header = 0, index_col = 0, chunksize = chunk_size):
+            yield chunk.replace({np.nan: None, 'none': None}), read_fraction(f, size)
+
+def read_json_chunks(file_path, chunk_size = None):
+
+    """
+    Reads a JSON (.json) file in chunks, in the same way as Results.import_json reads the whole file. JSON Lines (.jsonl or .ndjson) files are streamed; other JSON files are parsed whole, then split into chunks.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of file to read.
+    chunk_size : int
+        the number of rows to read at a time. Defaults to the default chunk size (see set_default_chunk_size).
+
+    Yields
+    ------
+    chunk : tuple
+        a Pandas DataFrame of rows, and the fraction of the file read so far.
+    """
+
+    chunk_size = get_chunk_size(chunk_size)
+
+    if Path(file_path).suffix.lower() in ['.jsonl', '.ndjson']:
+
+        size = os.path.getsize(file_path)
+
+        with open(file_path, 'rb') as f:
+            with pd.read_json(f, lines = True, chunksize = chunk_size) as reader:
+                for chunk in reader:
+                    yield chunk, read_fraction(f, size)
+
+        return
+
+    json_import = pd.read_json(file_path)
+
+    for start in range(0, len(json_import), chunk_size):
+        end = min(start + chunk_size, len(json_import))
+        yield json_import.iloc[start:end], end / len(json_import)
+
+def read_excel_chunks(file_path, sheet_name = None, chunk_size = None):
+
+    """
+    Reads an Excel (.xlsx) file in chunks, in the same way as Results.import_excel reads the whole file. The sheet is streamed using openpyxl's read-only mode.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of file to read.
+    sheet_name : str
+        optional: name of Excel sheet to read. Defaults to the first sheet.
+    chunk_size : int
+        the number of rows to read at a time. Defaults to the default chunk size (see set_default_chunk_size).
+
+    Yields
+    ------
+    chunk : tuple
+        a Pandas DataFrame of rows, and the fraction of the sheet read so far (if known).
+    """
+
+    from openpyxl import load_workbook # type: ignore
+
+    chunk_size = get_chunk_size(chunk_size)
+
+    workbook = load_workbook(file_path, read_only = True, data_only = True)
+
+    try:
+        if (sheet_name is None) or (type(sheet_name) == int):
+            sheet = workbook.worksheets[sheet_name or 0]
+        else:
+            sheet = workbook[sheet_name]
+
+        rows = sheet.iter_rows(values_only = True)
+        header = next(rows, None)
+
+        if header is None:
+            return
+
+        # The first column holds the index, as with pandas.read_excel(index_col = 0)
+        columns = list(header[1:])
+        total = sheet.max_row - 1 if sheet.max_row is not None else None
+
+        records = []
+        labels = []
+        count = 0
+
+        for row in rows:
+
+            labels.append(row[0])
+            records.append(row[1:])
+            count += 1
+
+            if len(records) == chunk_size:
+                chunk = pd.DataFrame.from_records(records, columns = columns, index = labels)
+                yield chunk.replace({np.nan: None, 'none': None}), (min(count / total, 1.0) if total else None)
+                records = []
+                labels = []
+
+        if len(records) > 0:
+            chunk = pd.DataFrame.from_records(records, columns = columns, index = labels)
+            yield chunk.replace({np.nan: None, 'none': None}), 1.0
+
+    finally:
+        workbook.close()
+
+def read_file_chunks(file_path, sheet_name = None, chunk_size = None):
+
+    """
+    Reads a CSV, JSON or Excel file in chunks, determining its file type from its suffix.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of file to read.
+    sheet_name : str
+        optional: name of an Excel sheet to read (if one exists).
+    chunk_size : int
+        the number of rows to read at a time. Defaults to the default chunk size (see set_default_chunk_size).
+
+    Yields
+    ------
+    chunk : tuple
+        a Pandas DataFrame of rows, and the fraction of the file read so far.
+
+    Notes
+    -----
+    Can read:
+        * .xlsx
+        * .csv
+        * .json
+        * .jsonl
+    """
+
+    global chunked_file_types
+
+    suffix = Path(file_path).suffix.strip('.').lower()
+
+    if suffix not in chunked_file_types:
+        raise ValueError(f'Chunked imports cannot read {suffix} files')
+
+    if suffix == 'xlsx':
+        return read_excel_chunks(file_path, sheet_name = sheet_name, chunk_size = chunk_size)
+
+    if suffix == 'csv':
+        return read_csv_chunks(file_path, chunk_size = chunk_size)
+
+    return read_json_chunks(file_path, chunk_size = chunk_size)
@@ -3,10 +3,15 @@
 from ..utils.basics import results_cols
 from ..utils.cleaners import is_int
 from ..internet.webanalysis import is_url
+from ..utils.parallel import TokenBucket, thread_map
+from .cache import fetch_cached, get_cached, store_cached
 
+import re
+import random
 from time import sleep
 
-from crossref.restful import Works, Journals, Funders, Etiquette # type: ignore
+from requests import RequestException, HTTPError
+from crossref.restful import Works, Journals, Funders, Etiquette, build_url_endpoint # type: ignore
 import pandas as pd
 
 filters = ['alternative_id', 
@@ -92,138 +97,232 @@ filters = ['alternative_id',
 
 my_etiquette = Etiquette('Academic Review Tool (ART)', '1.10-beta', 'https://github.com/alan-turing-institute/academic_review_tool', 'academic_review_tool@outlook.com')
 
-def items_to_df(items: list) -> pd.DataFrame:
+# Maximum number of Crossref requests per second, shared by all concurrent DOI lookups
+rate_limiter = TokenBucket(rate = 10)
+
+# Maximum number of Crossref requests in flight at once
+max_concurrent_requests = 5
+
+# Number of times a request is retried after a 429 (too many requests) or 5xx response, and the initial backoff in seconds
+max_retries = 4
+retry_backoff = 1.0
+
+# Number of DOIs packed into each multi-DOI filter request by batched lookups
+doi_batch_size = 50
+
+# Number of items requested per page by searches (the CrossRef API's maximum is 1000)
+search_page_size = 1000
+
+def set_rate_limit(requests_per_second: float = 10, burst: float = None):
 
     """
-    Takes list containing items from CrossRef API call and returns as a Pandas DataFrame.
+    Sets the maximum rate of Crossref requests made by DOI lookups, shared by all threads.
+
+    Parameters
+    ----------
+    requests_per_second : float
+        the maximum number of requests per second. If None or zero, requests are not limited. Defaults to 10.
+    burst : float
+        the maximum number of requests made at once after a pause. Defaults to one second's worth of requests.
     """
 
-    global results_cols
-    df = pd.DataFrame(columns = results_cols)
+    global rate_limiter
+    rate_limiter.set_rate(rate = requests_per_second, capacity = burst)
 
-    for i in items:
-        
-        if 'title' in i.keys():
-            title = i['title']
-            if type(title) == list:
-                title = title[0]
-        else:
-            title = None
+def set_max_concurrent_requests(max_requests: int = 5):
 
-        if 'container-title' in i.keys():
-            source = i['container-title']
-            if type(source) == list:
-                source = source[0]
-        else:
-            source = None
+    """
+    Sets the maximum number of Crossref requests made by DOI lookups at once.
 
-        if 'published' in i.keys():
-            date = i['published']['date-parts'][0][0]
-        else:
-            date = None
+    Parameters
+    ----------
+    max_requests : int
+        the maximum number of requests in flight. Defaults to 5.
+    """
 
-        if 'abstract' in i.keys():
-            abstract = i['abstract']
-        else:
-            abstract = None
+    global max_concurrent_requests
 
-        if 'publisher' in i.keys():
-            publisher = i['publisher']
-        else:
-            publisher = None
+    if int(max_requests) < 1:
+        raise ValueError('max_requests must be a positive integer')
 
-        if 'funder' in i.keys():
-            funder = i['funder']
-        else:
-            funder = None
+    max_concurrent_requests = int(max_requests)
 
-        if 'doi' in i.keys():
-            doi = i['doi']
-        else:
-            doi = None
+def set_retries(retries: int = 4, backoff: float = 1.0):
 
-        if 'type' in i.keys():
-            entry_type = i['type']
-        else:
-            entry_type = None
+    """
+    Sets how DOI lookups retry requests which receive a 429 (too many requests) or 5xx response, or fail to connect.
 
-        if 'author' in i.keys():
-            authors_data = i['author']
-        else:
-            authors_data = []
+    Parameters
+    ----------
+    retries : int
+        the number of retries. Defaults to 4.
+    backoff : float
+        the initial wait in seconds, doubled for each retry and jittered. Defaults to 1.0.
+    """
 
-        if 'references-count' in i.keys():
-            citations_count = i['references-count']
-        else:
-            citations_count = None
+    global max_retries
+    global retry_backoff
 
-        if 'reference' in i.keys():
-            citations_data = i['reference']
-        else:
-            citations_data = None
+    max_retries = max(0, int(retries))
+    retry_backoff = max(0.0, float(backoff))
 
-        if 'is-referenced-by-count' in i.keys():
-            cited_by_count = i['is-referenced-by-count']
-        else:
-            cited_by_count = None
+def set_doi_batch_size(batch_size: int = 50):
 
-        if 'URL' in i.keys():
-            link = i['URL']
-        else:
-            link = None
-        
-        if 'score' in i.keys():
-            crossref_score = i['score']
-        else:
-            crossref_score = None
-        
-        if 'language' in i.keys():
-            language = i['language']
-        else:
-            language = None
-        
-        authors = []
-        for a in authors_data:
-            if 'given' in a.keys():
-                first_name = a['given']
-            else:
-                first_name = ''
-            
-            if 'family' in a.keys():
-                last_name = a['family']
-            else:
-                last_name = ''
-            
-            name = first_name + ' ' + last_name
+    """
+    Sets the number of DOIs packed into each Crossref request by batched DOI lookups (see resolve_dois).
 
-            authors.append(name)
-        
-        if doi == None:
-            if link != None:
-                if 'doi.org/' in link:
-                    doi = link.replace('https', '').replace('http', '').replace('://', '').replace('dx.', '').replace('www.', '').replace('doi.org/', '')
-
-        index = len(df)
-        df.loc[index, 'title'] = title
-        df.loc[index, 'source'] = source
-        df.loc[index, 'date'] = date
-        df.loc[index, 'publisher'] = publisher
-        df.loc[index, 'funder'] = funder
-        df.loc[index, 'abstract'] = abstract
-        df.loc[index, 'doi'] = doi
-        df.loc[index, 'type'] = entry_type
-        df.loc[index, 'authors_data'] = authors_data
-        df.at[index, 'authors'] = authors
-        df.at[index, 'language'] = language
-        df.at[index, 'citation_count'] = citations_count
-        df.at[index, 'citations_data'] = citations_data
-        df.at[index, 'cited_by_count'] = cited_by_count
-        df.at[index, 'crossref_score'] = crossref_score
-        df.loc[index, 'link'] = link
-    
-    return df
+    Parameters
+    ----------
+    batch_size : int
+        the number of DOIs per request. If 1, each DOI is requested individually. Defaults to 50. The maximum is 1000.
+    """
+
+    global doi_batch_size
+
+    if int(batch_size) < 1:
+        raise ValueError('batch_size must be a positive integer')
+
+    doi_batch_size = min(int(batch_size), 1000)
+
+def set_search_page_size(page_size: int = 1000):
+
+    """
+    Sets the number of items requested per page by CrossRef searches (e.g. search_works).
+
+    Parameters
+    ----------
+    page_size : int
+        the number of items per page. Defaults to 1000, the maximum allowed by the CrossRef API.
+    """
+
+    global search_page_size
+
+    if int(page_size) < 1:
+        raise ValueError('page_size must be a positive integer')
+
+    search_page_size = min(int(page_size), 1000)
+
+def clean_doi(doi) -> str:
+
+    """
+    Strips whitespace and any 'https://doi.org/' or 'doi:' prefix from a DOI.
+    """
+
+    doi = str(doi).strip()
+    doi = re.sub(r'^(https?://)?(dx\.)?(www\.)?doi\.org/', '', doi, flags = re.IGNORECASE)
+    doi = re.sub(r'^doi:\s*', '', doi, flags = re.IGNORECASE)
+
+    return doi.strip()
 
-def reference_to_df(reference: dict, update_from_doi = False) -> pd.DataFrame:
+def item_to_record(item: dict) -> dict:
+
+    """
+    Takes an item from a CrossRef API call and returns a dictionary of Results column names and values.
+    """
+
+    def get(key, first = False):
+        value = item.get(key)
+        if first and (type(value) == list):
+            value = value[0]
+        return value
+
+    if 'published' in item.keys():
+        date = item['published']['date-parts'][0][0]
+    else:
+        date = None
+
+    authors_data = item.get('author', [])
+
+    authors = []
+    for a in authors_data:
+        authors.append(a.get('given', '') + ' ' + a.get('family', ''))
+
+    link = get('URL')
+    doi = get('doi')
+
+    if doi == None:
+        if link != None:
+            if 'doi.org/' in link:
+                doi = link.replace('https', '').replace('http', '').replace('://', '').replace('dx.', '').replace('www.', '').replace('doi.org/', '')
+
+    return {
+            'title': get('title', first = True),
+            'source': get('container-title', first = True),
+            'date': date,
+            'publisher': get('publisher'),
+            'funder': get('funder'),
+            'abstract': get('abstract'),
+            'doi': doi,
+            'type': get('type'),
+            'authors_data': authors_data,
+            'authors': authors,
+            'language': get('language'),
+            'citation_count': get('references-count'),
+            'citations_data': get('reference'),
+            'cited_by_count': get('is-referenced-by-count'),
+            'crossref_score': get('score'),
+            'link': link
+            }
+
+def items_to_df(items: list, start: int = 0) -> pd.DataFrame:
+
+    """
+    Takes list containing items from CrossRef API call and returns as a Pandas DataFrame.
+
+    Parameters
+    ----------
+    items : list
+        items from a CrossRef API call.
+    start : int
+        the first index label. Defaults to 0.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        a Pandas DataFrame with Results columns and one row for each item.
+
+    Notes
+    -----
+    The DataFrame is constructed once, column by column, rather than row by row.
+    """
+
+    global results_cols
+
+    records = [item_to_record(i) for i in items]
+    index = pd.RangeIndex(start, start + len(records))
+
+    data = {}
+    if len(records) > 0:
+        for col in records[0].keys():
+            data[col] = pd.Series([r[col] for r in records], index = index, dtype = object)
+
+    df = pd.DataFrame(data, index = index)
+
+    return df.reindex(columns = results_cols).astype(object)
+
+def reference_dois(reference: dict) -> list:
+
+    """
+    Returns the DOIs which reference_to_df may look up for a reference (i.e. citation) dictionary from a CrossRef API result.
+    """
+
+    keys = list(reference.keys())
+    dois = []
+
+    if 'doi' in keys:
+        dois.append(reference['doi'])
+
+    if ('URL' in keys) and ('doi.org/' in str(reference['URL'])):
+        dois.append(reference['URL'])
+
+    if 'unstructured' in keys:
+        for i in str(reference['unstructured']).split('. '):
+            if ('doi.org/' in i) and (is_url(i) == True):
+                dois.append(i)
+
+    return dois
+
+def reference_to_df(reference: dict, update_from_doi = False, records: dict = None) -> pd.DataFrame:
 
     """
     Takes reference (i.e. citation) dictionary from CrossRef API result and returns as a Pandas DataFrame.
@@ -234,6 +333,8 @@ def reference_to_df(reference: dict, update_from_doi = False) -> pd.DataFrame:
         a dictionary containing data on a reference associated with a CrossRef API result.
     update_from_doi : bool
         whether to update the reference data using the CrossRef API. Defaults to False.
+    records : dict
+        optional: CrossRef records already retrieved for the reference's DOIs, keyed by cleaned, lowercase DOI (see resolve_dois). If given, these are used instead of looking up DOIs. Defaults to None.
     
     Returns
     -------
@@ -241,6 +342,18 @@ def reference_to_df(reference: dict, update_from_doi = False) -> pd.DataFrame:
         the reference formatted as a Pandas DataFrame.
     """
 
+    def lookup(doi):
+
+        if records is None:
+            return lookup_doi(doi)
+
+        record = records.get(clean_doi(doi).lower())
+
+        if record is None:
+            raise KeyError(f'{doi} was not resolved')
+
+        return items_to_df([record])
+
     keys = list(reference.keys())
 
     df_data = {}
@@ -251,7 +364,7 @@ def reference_to_df(reference: dict, update_from_doi = False) -> pd.DataFrame:
         if update_from_doi == True:
             try:
                 doi = reference['doi']
-                df = lookup_doi(doi)
+                df = lookup(doi)
                 return df
             
             except:
@@ -266,7 +379,7 @@ def reference_to_df(reference: dict, update_from_doi = False) -> pd.DataFrame:
 
             if update_from_doi == True:
                 try:
-                    df = lookup_doi(doi)
+                    df = lookup(doi)
                     return df
                 
                 except:
@@ -299,7 +412,7 @@ def reference_to_df(reference: dict, update_from_doi = False) -> pd.DataFrame:
 
         if (df_data['link'] != None) and ('doi.org/' in df_data['link']):
             try:
-                df = lookup_doi(df_data['link'])
+                df = lookup(df_data['link'])
                 return df
             
             except:
@@ -339,7 +452,7 @@ def reference_to_df(reference: dict, update_from_doi = False) -> pd.DataFrame:
 
     return df
 
-def references_to_df(references_list: list, update_from_doi = False) -> pd.DataFrame:
+def references_to_df(references_list: list, update_from_doi = False, batch_size: int = None) -> pd.DataFrame:
 
     """
     Takes a list of references (i.e. citations) from a CrossRef API result and returns as a Pandas DataFrame.
@@ -349,7 +462,9 @@ def references_to_df(references_list: list, update_from_doi = False) -> pd.DataF
     references : list
         a list containing data on references associated with a CrossRef API result.
     update_from_doi : bool
-        whether to update the reference data using the CrossRef API. Defaults to False.
+        whether to update the reference data using the CrossRef API. If True, all references' DOIs are looked up together, in batches (see resolve_dois). Defaults to False.
+    batch_size : int
+        the number of DOIs per request when updating from DOIs. Defaults to None: the default is used (see set_doi_batch_size).
     
     Returns
     -------
@@ -359,9 +474,25 @@ def references_to_df(references_list: list, update_from_doi = False) -> pd.DataF
 
     df = pd.DataFrame(columns = results_cols, dtype=object)
 
+    records = None
+
+    if update_from_doi == True:
+
+        dois = []
+        for i in references_list:
+            dois.extend(reference_dois(i))
+
+        dois = [doi for doi in dict.fromkeys(clean_doi(doi).lower() for doi in dois if (doi is not None) and (str(doi).strip() != '')) if doi != '']
+
+        items, unresolved = resolve_dois(dois, batch_size = batch_size, return_unresolved = True)
+        records = dict(zip(dois, items))
+
+        if len(unresolved) > 0:
+            print(f'{len(unresolved)} reference DOIs could not be resolved')
+
     for i in references_list:
 
-        row = reference_to_df(i, update_from_doi)
+        row = reference_to_df(i, update_from_doi, records = records)
         df = pd.concat([df, row])
     
     df = df.reset_index().drop('index', axis=1)
@@ -523,6 +654,328 @@ def query_builder(default_operator = 'AND',
     
     return query
    
+def apply_options(result, filter: dict = None, select: list = None):
+
+    """
+    Applies filters and field selections to a CrossRef API query (e.g. a crossref.restful.Works object) and returns the new query.
+
+    Parameters
+    ----------
+    result : crossref.restful.Endpoint
+        the query.
+    filter : dict
+        optional: filter names and values. Names which are not CrossRef filters (see filters) are ignored.
+    select : list
+        optional: names of fields to return.
+
+    Returns
+    -------
+    result : crossref.restful.Endpoint
+        the filtered query.
+    """
+
+    if filter != None:
+
+        global filters
+        filter_input = {f: filter[f] for f in filters if f in filter.keys()}
+
+        if len(filter_input) > 0:
+            result = result.filter(**filter_input)
+
+    if select != None:
+        result = result.select(*select)
+
+    return result
+
+def confirm_limit(count: int, limit: int = None):
+
+    """
+    If no limit is set and a search has found more than 1000 results, asks the user whether to set a limit. Returns the limit.
+    """
+
+    if (limit == None) or (limit < 1):
+        if count > 1000:
+            limit_decision = input(f'No limit set for the number of results to download, but {count} results found. Would you like to set a limit? (yes/no) ')
+
+            if limit_decision.lower().strip() == 'yes':
+                new_limit = input('New limit: ').strip()
+
+                if new_limit == '':
+                    new_limit = 1000
+                
+                limit = int(new_limit)
+            
+            if limit_decision.lower().strip() == 'no':
+                limit = None # type: ignore
+            
+            if limit_decision.lower().strip() == '':
+                limit = 1000
+
+    if (limit != None) and (limit < 1):
+        limit = None # type: ignore
+
+    return limit
+
+def iter_pages(result, limit: int = None, page_size: int = None, rate_limit: float = None, verbose: bool = True):
+
+    """
+    Retrieves the items matching a CrossRef API query page by page, using cursor-based deep paging, so that searches are not limited to the first 10,000 results. Requests are limited by the shared rate limiter (see set_rate_limit) and retried after 429 and 5xx responses (see request_with_retries).
+
+    Parameters
+    ----------
+    result : crossref.restful.Endpoint
+        the query (e.g. a crossref.restful.Works object).
+    limit : int
+        optional: the maximum number of items to retrieve. Defaults to None.
+    page_size : int
+        the number of items requested per page. Defaults to None: the default is used (see set_search_page_size).
+    rate_limit : float
+        optional: time delay in seconds per request. If given, requests are also limited to 1 / rate_limit per second. Defaults to None.
+    verbose : bool
+        whether to print the number of results found. Defaults to True.
+
+    Yields
+    ------
+    page : tuple
+        a list of items, and the total number of items to retrieve.
+    """
+
+    global search_page_size
+
+    if page_size is None:
+        page_size = search_page_size
+
+    page_size = min(max(int(page_size), 1), 1000)
+
+    limiter = None
+    if (rate_limit is not None) and (rate_limit > 0):
+        limiter = TokenBucket(rate = 1 / rate_limit, capacity = 1)
+
+    url = str(result.request_url)
+    params = dict(result.request_params)
+    sample = 'sample' in params.keys()
+
+    if sample == False:
+        params['cursor'] = '*'
+
+    retrieved = 0
+    total = None
+
+    while (limit == None) or (retrieved < limit):
+
+        if sample == False:
+            params['rows'] = page_size if limit == None else min(page_size, limit - retrieved)
+
+        response = request_with_retries(result, url, params = params, limiter = limiter, description = 'search')
+
+        if response is None:
+            return
+
+        message = response.json()['message']
+        items = message.get('items', [])
+
+        if total is None:
+            total = message.get('total-results', len(items))
+            if limit != None:
+                total = min(total, limit)
+
+            if verbose == True:
+                print(f"{message.get('total-results', len(items))} results found")
+
+        if limit != None:
+            items = items[:limit - retrieved]
+
+        if len(items) == 0:
+            return
+
+        retrieved += len(items)
+
+        yield items, total
+
+        next_cursor = message.get('next-cursor')
+
+        if sample or (next_cursor is None) or (retrieved >= total):
+            return
+
+        params['cursor'] = next_cursor
+
+def iter_chunks(result, limit: int = None, page_size: int = None, rate_limit: float = None, verbose: bool = True):
+
+    """
+    Retrieves the items matching a CrossRef API query page by page (see iter_pages), converting each page to a Pandas DataFrame.
+
+    Parameters
+    ----------
+    result : crossref.restful.Endpoint
+        the query (e.g. a crossref.restful.Works object).
+    limit : int
+        optional: the maximum number of items to retrieve. Defaults to None.
+    page_size : int
+        the number of items requested per page. Defaults to None: the default is used (see set_search_page_size).
+    rate_limit : float
+        optional: time delay in seconds per request. Defaults to None.
+    verbose : bool
+        whether to print the number of results found. Defaults to True.
+
+    Yields
+    ------
+    chunk : tuple
+        a Pandas DataFrame of results, and the fraction of the results retrieved so far.
+    """
+
+    start = 0
+
+    for items, total in iter_pages(result, limit = limit, page_size = page_size, rate_limit = rate_limit, verbose = verbose):
+
+        df = items_to_df(items, start = start)
+        start += len(items)
+
+        yield df, (min(start / total, 1.0) if total else None)
+
+def chunks_to_df(chunks) -> pd.DataFrame:
+
+    """
+    Concatenates chunks of results (see iter_chunks) into one Pandas DataFrame. If a request fails, prints an error and returns the results retrieved so far.
+    """
+
+    global results_cols
+
+    dfs = []
+
+    try:
+        for df, fraction in chunks:
+            dfs.append(df)
+
+    except Exception as e:
+        print(f'Search retrieval ran into an error. {e}')
+
+    if len(dfs) == 0:
+        return items_to_df([])
+
+    return pd.concat(dfs)
+
+def works_query(
+                bibliographic = None, # type: ignore
+                title: str = None, # type: ignore
+                author: str = None, # type: ignore
+                author_affiliation: str = None, # type: ignore
+                editor: str = None, # type: ignore
+                entry_type: str = None, # type: ignore
+                published_date: str = None, # type: ignore
+                doi: str = None, # type: ignore
+                issn: str = None, # type: ignore
+                publisher_name: str = None, # type: ignore
+                funder_name = None, # type: ignore
+                source: str = None, # type: ignore
+                link: str = None, # type: ignore
+                filter: dict = None, # type: ignore
+                select: list = None, # type: ignore
+                timeout = 60,
+                endpoint = None
+                ):
+
+    """
+    Builds a CrossRef API query for published works (see search_works). Returns the query.
+
+    Parameters
+    ----------
+    endpoint : crossref.restful.Endpoint
+        optional: the endpoint to query (e.g. a journal's works). Defaults to None: all works are queried.
+
+    Other parameters are as for search_works.
+    """
+
+    if bibliographic == None:
+        bibliographic = ''
+    
+    if title != None:
+        bibliographic = bibliographic + ', ' + str(title)
+
+    if entry_type != None:
+        bibliographic = bibliographic + ', ' + str(entry_type)
+
+    if doi != None:
+        bibliographic = bibliographic + ', ' + str(doi)
+
+    if issn != None:
+        bibliographic = bibliographic + ', ' + str(issn)
+    
+    if published_date != None:
+        bibliographic = bibliographic + ', ' + str(published_date)
+    
+    if funder_name != None:
+        bibliographic = bibliographic + ', ' + str(funder_name)
+    
+    if link != None:
+        bibliographic = bibliographic + ', ' + str(link)
+
+    if bibliographic == '':
+        bibliographic = None # type: ignore
+
+    if endpoint is None:
+        global my_etiquette
+        endpoint = Works(etiquette=my_etiquette, timeout=timeout)
+
+    result = endpoint.query(
+                        bibliographic = bibliographic,
+                        author = author,
+                        affiliation = author_affiliation,
+                        editor = editor,
+                        publisher_name = publisher_name,
+                        container_title = source
+                        )
+
+    return apply_options(result, filter = filter, select = select)
+
+def iter_search_works(
+                bibliographic = None, # type: ignore
+                title: str = None, # type: ignore
+                author: str = None, # type: ignore
+                author_affiliation: str = None, # type: ignore
+                editor: str = None, # type: ignore
+                entry_type: str = None, # type: ignore
+                published_date: str = None, # type: ignore
+                doi: str = None, # type: ignore
+                issn: str = None, # type: ignore
+                publisher_name: str = None, # type: ignore
+                funder_name = None, # type: ignore
+                source: str = None, # type: ignore
+                link: str = None, # type: ignore
+                filter: dict = None, # type: ignore
+                select: list = None, # type: ignore
+                limit: int = None, # type: ignore
+                rate_limit: float = None, # type: ignore
+                timeout = 60,
+                page_size: int = None # type: ignore
+                ):
+
+    """
+    Searches CrossRef API for published works, yielding one Results object for each page of results, so that large searches are never held in memory at once. Pages are retrieved using cursor-based deep paging (see iter_pages).
+
+    Parameters
+    ----------
+    limit : int
+        optional: set a limit to the number of results returned. Defaults to None: all results are returned.
+    rate_limit : float
+        optional: time delay in seconds per request. Defaults to None.
+    page_size : int
+        the number of results per page. Defaults to None: the default is used (see set_search_page_size).
+
+    Other parameters are as for search_works.
+
+    Yields
+    ------
+    chunk : tuple
+        a Results object, and the fraction of the results retrieved so far. Chunks can be added to a Results object using Results.import_chunks.
+    """
+
+    from ..classes.results import Results
+
+    result = works_query(bibliographic = bibliographic, title = title, author = author, author_affiliation = author_affiliation, editor = editor, entry_type = entry_type, published_date = published_date, doi = doi, issn = issn, publisher_name = publisher_name, funder_name = funder_name, source = source, link = link, filter = filter, select = select, timeout = timeout)
+
+    for df, fraction in iter_chunks(result, limit = limit, page_size = page_size, rate_limit = rate_limit):
+        yield Results.from_dataframe(df), fraction
+
 def search_works(
                 bibliographic = None, # type: ignore
                 title: str = None, # type: ignore
@@ -542,7 +995,8 @@ def search_works(
                 sample: int = None, # type: ignore
                 limit: int = 20,
                 rate_limit: float = 0.05,
-                timeout = 60
+                timeout = 60,
+                page_size: int = None # type: ignore
                 ) -> pd.DataFrame:
 
     """
@@ -581,9 +1035,11 @@ def search_works(
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see set_search_page_size).
         filter : dict
         select : list
         
@@ -591,121 +1047,271 @@ def search_works(
         -------
         df : pandas.DataFrame
             results from CrossRef API search.
+
+        Notes
+        -----
+        Results are retrieved in large pages using cursor-based deep paging (see iter_pages). To process large searches one page at a time, use iter_search_works.
+    """
+
+    result = works_query(bibliographic = bibliographic, title = title, author = author, author_affiliation = author_affiliation, editor = editor, entry_type = entry_type, published_date = published_date, doi = doi, issn = issn, publisher_name = publisher_name, funder_name = funder_name, source = source, link = link, filter = filter, select = select, timeout = timeout)
+
+    if (limit == None) or (limit < 1):
+        limit = confirm_limit(result.count(), limit)
+
+    df = chunks_to_df(iter_chunks(result, limit = limit, page_size = page_size, rate_limit = rate_limit))
+
+    return df
+
+def request_with_retries(works: Works, url: str, params: dict = {}, limiter: TokenBucket = None, description: str = ''):
+
+    """
+    Makes a GET request to the CrossRef API. Waits for the shared rate limiter (and limiter, if given) before each request, and retries 429 (too many requests) and 5xx responses and connection errors with jittered exponential backoff (see set_retries).
+
+    Parameters
+    ----------
+    works : crossref.restful.Works
+        a Crossref Works client.
+    url : str
+        the request's URL.
+    params : dict
+        the request's query parameters. Defaults to none.
+    limiter : TokenBucket
+        optional: an additional rate limiter. Defaults to None.
+    description : str
+        optional: a description of the request for error messages.
+
+    Returns
+    -------
+    response : requests.Response
+        the response, or None if a 404 (not found) response was received.
+    """
+
+    global rate_limiter
+    global max_retries
+    global retry_backoff
+
+    error = None
+
+    for attempt in range(max_retries + 1):
+
+        if attempt > 0:
+            sleep(wait)
+
+        rate_limiter.acquire()
+        if limiter is not None:
+            limiter.acquire()
+
+        wait = retry_backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+        try:
+            response = works.do_http_request('get', url, data = params, custom_header = works.custom_header, timeout = works.timeout)
+        except RequestException as e:
+            error = e
+            continue
+
+        if response.status_code == 404:
+            return None
+
+        if (response.status_code == 429) or (response.status_code >= 500):
+
+            error = HTTPError(f'{response.status_code} response from Crossref for {description}', response = response)
+
+            retry_after = response.headers.get('Retry-After')
+            if (retry_after is not None) and is_int(retry_after):
+                wait = max(wait, float(retry_after))
+
+            continue
+
+        response.raise_for_status()
+
+        return response
+
+    raise error
+
+def resolve_doi(works: Works, doi: str, limiter: TokenBucket = None):
+
+    """
+    Retrieves a DOI's record from the CrossRef API, retrying failed requests (see request_with_retries).
+
+    Parameters
+    ----------
+    works : crossref.restful.Works
+        a Crossref Works client.
+    doi : str
+        DOI to look up.
+    limiter : TokenBucket
+        optional: an additional rate limiter. Defaults to None.
+
+    Returns
+    -------
+    result : dict
+        the DOI's record, or None if the DOI was not found.
+    """
+
+    url = build_url_endpoint('/'.join([works.ENDPOINT, clean_doi(doi)]))
+
+    response = request_with_retries(works, url, limiter = limiter, description = doi)
+
+    if response is None:
+        return None
+
+    return response.json()['message']
+
+def resolve_doi_batch(works: Works, dois: list, limiter: TokenBucket = None) -> dict:
+
     """
+    Retrieves several DOIs' records from the CrossRef API in one request, using one 'doi:' filter per DOI. Retries failed requests (see request_with_retries).
+
+    Parameters
+    ----------
+    works : crossref.restful.Works
+        a Crossref Works client.
+    dois : list
+        DOIs to look up. DOIs must not contain commas, which separate filters.
+    limiter : TokenBucket
+        optional: an additional rate limiter. Defaults to None.
+
+    Returns
+    -------
+    result : dict
+        the records found, keyed by lowercase DOI. DOIs which were not found are omitted.
+    """
+
+    url = build_url_endpoint(works.ENDPOINT)
+    params = {
+            'filter': ','.join(['doi:' + clean_doi(doi) for doi in dois]),
+            'rows': len(dois)
+            }
+
+    response = request_with_retries(works, url, params = params, limiter = limiter, description = f'{len(dois)} DOIs')
+
+    if response is None:
+        return {}
 
-    if bibliographic == None:
-        bibliographic = ''
-    
-    if title != None:
-        bibliographic = bibliographic + ', ' + str(title)
+    items = response.json()['message']['items']
 
-    if entry_type != None:
-        bibliographic = bibliographic + ', ' + str(entry_type)
+    return {str(item['DOI']).lower(): item for item in items if 'DOI' in item.keys()}
 
-    if doi != None:
-        bibliographic = bibliographic + ', ' + str(doi)
+def resolve_dois(dois_list: list, timeout = 60, max_workers: int = None, rate_limit: float = None, batch_size: int = None, return_unresolved: bool = False):
 
-    if issn != None:
-        bibliographic = bibliographic + ', ' + str(issn)
-    
-    if published_date != None:
-        bibliographic = bibliographic + ', ' + str(published_date)
-    
-    if funder_name != None:
-        bibliographic = bibliographic + ', ' + str(funder_name)
-    
-    if link != None:
-        bibliographic = bibliographic + ', ' + str(link)
+    """
+    Retrieves DOIs' records from the CrossRef API, using cached responses where available (see art.importers.cache). DOIs which are not cached are packed into multi-DOI filter requests, which are made concurrently. Requests are limited by the shared rate limiter (see set_rate_limit) and retried after 429 and 5xx responses (see request_with_retries).
 
-    if bibliographic == '':
-        bibliographic = None # type: ignore
+    Parameters
+    ----------
+    dois_list : list
+        list of DOIs to look up.
+    timeout : int
+        maximum time in seconds to wait for a response before aborting each CrossRef API call. Defaults to 60 seconds.
+    max_workers : int
+        the maximum number of requests in flight at once. Defaults to None: the default is used (see set_max_concurrent_requests).
+    rate_limit : float
+        optional: time delay in seconds per request. If given, requests are also limited to 1 / rate_limit per second. Defaults to None.
+    batch_size : int
+        the number of DOIs per request. If 1, each DOI is requested individually. Defaults to None: the default is used (see set_doi_batch_size).
+    return_unresolved : bool
+        whether to also return the DOIs which were not resolved. Defaults to False.
 
-    global my_etiquette
-    works = Works(etiquette=my_etiquette, timeout=timeout)
-    result = works.query(
-                        bibliographic = bibliographic,
-                        author = author,
-                        affiliation = author_affiliation,
-                        editor = editor,
-                        publisher_name = publisher_name,
-                        container_title = source
-                        )
-    
-    if filter != None:
+    Returns
+    -------
+    result : list or tuple
+        the DOIs' records, in the order of dois_list. DOIs which were not found, or whose lookups failed, give None. If return_unresolved is True, a tuple of the records and a list of the unresolved DOIs.
+    """
 
-        filter_input = ''
+    global my_etiquette
+    global max_concurrent_requests
+    global doi_batch_size
 
-        global filters
-        for f in filters:
-            if f in filter.keys():
-                val = filter[f]
-                filter_input = filter_input + f'{f}="{val}", '
-        
-        filter_input = filter_input.strip(', ').strip()
-        
-        filter_code = f'result.filter({filter_input})'
-        result = exec(filter_code)
-    
-    if select != None:
+    if max_workers is None:
+        max_workers = max_concurrent_requests
 
-        select_input = ''
-        for i in select:
-            select_input = select_input + f'"{i}", '
-        select_input = select_input.strip(', ').strip()
+    if batch_size is None:
+        batch_size = doi_batch_size
 
-        select_code = f'result.select({select_input})'
-        result = exec(select_code)
+    batch_size = min(max(int(batch_size), 1), 1000)
 
-    print(f'{result.count()} results found') # type: ignore
+    limiter = None
+    if (rate_limit is not None) and (rate_limit > 0):
+        limiter = TokenBucket(rate = 1 / rate_limit, capacity = 1)
 
-    if (limit == None) or (limit < 1):
-        if result.count() > 1000: # type: ignore
-            limit_decision = input(f'No limit set for the number of results to download, but {result.count()} results found. Would you like to set a limit? (yes/no) ') # type: ignore
+    works = Works(etiquette=my_etiquette, timeout=timeout, throttle=False)
 
-            if limit_decision.lower().strip() == 'yes':
-                new_limit = input('New limit: ').strip()
+    # Each distinct DOI is looked up once, keyed by its cleaned, lowercase form
+    keys = []
+    for doi in dois_list:
+        if (doi is None) or (str(doi).strip() == ''):
+            keys.append(None)
+        else:
+            keys.append(clean_doi(doi).lower())
 
-                if new_limit == '':
-                    new_limit = 1000
-                
-                limit = int(new_limit)
-            
-            if limit_decision.lower().strip() == 'no':
-                limit = None # type: ignore
-            
-            if limit_decision.lower().strip() == '':
-                limit = 1000
+    records = {}
+    missing = []
 
+    for key in dict.fromkeys(k for k in keys if (k is not None) and (k != '')):
 
+        # Unreadable cache entries are treated as misses, so that the DOI is looked up again
+        try:
+            found, value = get_cached('crossref', 'works', {'doi': key})
+        except Exception:
+            found, value = False, None
 
+        if found == True:
+            records[key] = value
+        else:
+            missing.append(key)
 
-    items = []
-    if result != None:
+    def resolve(doi):
 
-        iteration = 1
         try:
-            for item in result: # type: ignore
-                try:
-                    if limit != None:
-                        if iteration > limit:
-                            break
+            result = resolve_doi(works, doi, limiter = limiter)
+            store_cached('crossref', 'works', {'doi': doi}, result)
+            return {doi: result}
+
+        except Exception as e:
+            print(f'DOI lookup for {doi} failed. {e}')
+            return {doi: None}
 
-                    items.append(item)
+    def resolve_batch(batch):
 
-                    iteration += 1
+        if len(batch) == 1:
+            return resolve(batch[0])
 
-                    sleep(rate_limit)
+        try:
+            found = resolve_doi_batch(works, batch, limiter = limiter)
 
-                except Exception as e:
-                    print(f'Search retrieval ran into an error. {e}')
-                    continue
-                
         except Exception as e:
-            print(f'Search retrieval ran into an error. {e}')
-    
-    df = items_to_df(items)
+            print(f'Batched lookup for {len(batch)} DOIs failed; looking them up individually. {e}')
+            results = {}
+            for doi in batch:
+                results.update(resolve(doi))
+            return results
+
+        # DOIs absent from the batch response (e.g. because their registered form differs) are looked up individually before being recorded as not found
+        results = {}
+        for doi in batch:
+            if found.get(doi) is None:
+                results.update(resolve(doi))
+            else:
+                results[doi] = found[doi]
+                store_cached('crossref', 'works', {'doi': doi}, results[doi])
 
-    return df
+        return results
+
+    # DOIs containing commas cannot be expressed as filters, so are requested individually
+    batchable = [doi for doi in missing if ',' not in doi]
+    batches = [batchable[i:i + batch_size] for i in range(0, len(batchable), batch_size)]
+    batches += [[doi] for doi in missing if ',' in doi]
+
+    for results in thread_map(resolve_batch, batches, workers = max_workers):
+        records.update(results)
+
+    items = [records.get(key) if key is not None else None for key in keys]
+
+    if return_unresolved == True:
+        unresolved = [doi for doi, item in zip(dois_list, items) if (item is None) and (doi is not None) and (str(doi).strip() != '')]
+        return items, unresolved
+
+    return items
 
 def lookup_doi(doi = 'request_input', timeout = 60):
 
@@ -729,9 +1335,9 @@ def lookup_doi(doi = 'request_input', timeout = 60):
         doi = input('doi: ')
 
     global my_etiquette
-    works = Works(etiquette=my_etiquette, timeout=timeout)
+    works = Works(etiquette=my_etiquette, timeout=timeout, throttle=False)
     
-    result = works.doi(doi)
+    result, hit = fetch_cached('crossref', 'works', {'doi': clean_doi(doi).lower()}, lambda: resolve_doi(works, doi))
 
     item = [result]
 
@@ -739,7 +1345,7 @@ def lookup_doi(doi = 'request_input', timeout = 60):
 
     return df
 
-def lookup_dois(dois_list: list = [], rate_limit: float = 0.05, timeout = 60):
+def lookup_dois(dois_list: list = [], rate_limit: float = 0.05, timeout = 60, max_workers: int = None, batch_size: int = None):
 
     """
         Looks up a list of DOIs using the CrossRef API. Returns a Pandas DataFrame.
@@ -751,24 +1357,30 @@ def lookup_dois(dois_list: list = [], rate_limit: float = 0.05, timeout = 60):
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers: requests are limited to 1 / rate_limit per second, as well as by the shared rate limit (see set_rate_limit). Defaults to 0.05 seconds.
+        max_workers : int
+            the maximum number of requests in flight at once. Defaults to None: the default is used (see set_max_concurrent_requests).
+        batch_size : int
+            the number of DOIs per request. If 1, each DOI is requested individually. Defaults to None: the default is used (see set_doi_batch_size).
 
         Returns
         -------
         result : pandas.DataFrame
-            result of DOI lookups.
+            result of DOI lookups, in the order of dois_list. DOIs which were not found are omitted, and listed in the DataFrame's attrs['unresolved_dois'].
+
+        Notes
+        -----
+        DOIs are looked up in batches, concurrently (see resolve_dois).
     """
 
-    items = []
+    items, unresolved = resolve_dois(dois_list, timeout = timeout, max_workers = max_workers, rate_limit = rate_limit, batch_size = batch_size, return_unresolved = True)
+    items = [i for i in items if i is not None]
 
-    global my_etiquette
-    works = Works(etiquette=my_etiquette, timeout=timeout)
-    for doi in dois_list:
-        result = works.doi(doi)
-        items.append(result)
-        sleep(rate_limit)
+    if len(unresolved) > 0:
+        print(f'{len(unresolved)} DOIs could not be resolved')
 
     df = items_to_df(items)
+    df.attrs['unresolved_dois'] = unresolved
 
     return df
 
@@ -795,7 +1407,7 @@ def lookup_journal(issn = 'request_input', timeout = 60):
 
     global my_etiquette
     journals = Journals(etiquette=my_etiquette, timeout=timeout)
-    result = journals.journal(issn)
+    result, hit = fetch_cached('crossref', 'journals', {'issn': str(issn).strip().lower()}, lambda: journals.journal(issn))
 
     return pd.DataFrame.from_dict(result, orient='index').T
 
@@ -823,10 +1435,12 @@ def lookup_journals(issns_list: list = [], rate_limit: float = 0.05, timeout = 6
     output = pd.DataFrame(dtype=object)
 
     for issn in issns_list:
-        result = journals.journal(issn)
+        result, hit = fetch_cached('crossref', 'journals', {'issn': str(issn).strip().lower()}, lambda: journals.journal(issn))
         df = pd.DataFrame.from_dict(result, orient='index').T
         output = pd.concat([output, df])
-        sleep(rate_limit)
+
+        if hit == False:
+            sleep(rate_limit)
 
     return output
 
@@ -883,7 +1497,8 @@ def get_journal_entries(issn = 'request_input',
                         sample: int = None, # type: ignore
                         limit: int = 20,
                         rate_limit: float = 0.05,
-                        timeout = 60):
+                        timeout = 60,
+                        page_size: int = None): # type: ignore
 
     """
         Looks up a journal using the CrossRef API and returns associated entries as a Pandas DataFrame.
@@ -897,9 +1512,11 @@ def get_journal_entries(issn = 'request_input',
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see set_search_page_size).
         filter : dict
         select : list
 
@@ -914,52 +1531,9 @@ def get_journal_entries(issn = 'request_input',
 
     global my_etiquette
     journals = Journals(etiquette=my_etiquette, timeout=timeout)
-    result = journals.works(issn)
-
-    if filter != None:
-
-        filter_input = ''
-
-        global filters
-        for f in filters:
-            if f in filter.keys():
-                val = filter[f]
-                filter_input = filter_input + f'{f}="{val}", '
-        
-        filter_input = filter_input.strip(', ').strip()
-        
-        filter_code = f'result.filter({filter_input})'
-        result = exec(filter_code)
-    
-    if select != None:
-
-        select_input = ''
-        for i in select:
-            select_input = select_input + f'"{i}", '
-        select_input = select_input.strip(', ').strip()
-
-        select_code = f'result.select({select_input})'
-        result = exec(select_code)
-
-    print(f'{result.count()} results found') # type: ignore
-
-    items = []
-    if result != None:
+    result = apply_options(journals.works(issn), filter = filter, select = select)
 
-        iteration = 1
-        for item in result: # type: ignore
-
-            if limit != None:
-                if iteration > limit:
-                    break
-
-            items.append(item)
-
-            iteration += 1
-
-            sleep(rate_limit)
-    
-    df = items_to_df(items)
+    df = chunks_to_df(iter_chunks(result, limit = limit, page_size = page_size, rate_limit = rate_limit))
 
     return df
 
@@ -981,7 +1555,8 @@ def search_journal_entries(issn = 'request_input',
                         sample: int = None, # type: ignore
                         limit: int = 1000,
                         rate_limit: float = 0.05,
-                        timeout = 60):
+                        timeout = 60,
+                        page_size: int = None): # type: ignore
     
     """
             Searches for journal entries and articles associated with an ISSN using the CrossRef API.
@@ -1021,9 +1596,11 @@ def search_journal_entries(issn = 'request_input',
             limit : int
                 optional: set a limit to the number of results returned.
             rate_limit : float
-                time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+                time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
             timeout : int
                 maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+            page_size : int
+                the number of results requested at a time. Defaults to None: the default is used (see set_search_page_size).
             filter : dict
             select : list
             
@@ -1036,89 +1613,12 @@ def search_journal_entries(issn = 'request_input',
     if issn == 'request_input':
         issn = input('Journal issn: ')
 
-    if bibliographic == None:
-        bibliographic = ''
-    
-    if title != None:
-        bibliographic = bibliographic + ', ' + str(title)
-
-    if entry_type != None:
-        bibliographic = bibliographic + ', ' + str(entry_type)
-
-    if doi != None:
-        bibliographic = bibliographic + ', ' + str(doi)
-
-    if published_date != None:
-        bibliographic = bibliographic + ', ' + str(published_date)
-    
-    if funder_name != None:
-        bibliographic = bibliographic + ', ' + str(funder_name)
-    
-    if link != None:
-        bibliographic = bibliographic + ', ' + str(link)
-
-    if bibliographic == '':
-        bibliographic = None  # type: ignore
-
     global my_etiquette
     journals = Journals(etiquette=my_etiquette, timeout=timeout)
-    result = journals.works(issn)
-
-    result = result.query(
-                        bibliographic = bibliographic,
-                        author = author,
-                        affiliation = author_affiliation,
-                        editor = editor,
-                        publisher_name = publisher_name,
-                        container_title = source
-                        )
-    
-    if filter != None:
-
-        filter_input = ''
-
-        global filters
-        for f in filters:
-            if f in filter.keys():
-                val = filter[f]
-                filter_input = filter_input + f'{f}="{val}", '
-        
-        filter_input = filter_input.strip(', ').strip()
-        
-        filter_code = f'result.filter({filter_input})'
-        result = exec(filter_code)
-    
-    if select != None:
-
-        select_input = ''
-        for i in select:
-            select_input = select_input + f'"{i}", '
-        select_input = select_input.strip(', ').strip()
-
-        select_code = f'result.select({select_input})'
-        result = exec(select_code)
-    try:
-        print(f'{result.count()} results found') # type: ignore
-    except:
-        pass
-
-    items = []
-    if result != None:
-
-        iteration = 1
-        for item in result:  # type: ignore
-
-            if limit != None:
-                if iteration > limit:
-                    break
 
-            items.append(item)
+    result = works_query(bibliographic = bibliographic, title = title, author = author, author_affiliation = author_affiliation, editor = editor, entry_type = entry_type, published_date = published_date, doi = doi, publisher_name = publisher_name, funder_name = funder_name, source = source, link = link, filter = filter, select = select, endpoint = journals.works(issn))
 
-            iteration += 1
-
-            sleep(rate_limit)
-    
-    df = items_to_df(items)
+    df = chunks_to_df(iter_chunks(result, limit = limit, page_size = page_size, rate_limit = rate_limit))
 
     return df
 
@@ -1145,7 +1645,7 @@ def lookup_funder(funder_id = 'request_input', timeout = 60):
 
     global my_etiquette
     funders = Funders(etiquette=my_etiquette, timeout=timeout)
-    result = funders.funder(funder_id)
+    result, hit = fetch_cached('crossref', 'funders', {'funder_id': str(funder_id).strip()}, lambda: funders.funder(funder_id))
 
     if (result != None) and (type(result) == dict):
         output = pd.DataFrame(columns = list(result.keys()), dtype=object)
@@ -1191,7 +1691,7 @@ def lookup_funders(funder_ids: list = [], rate_limit: float = 0.05, timeout = 60
 
     for id in funder_ids:
 
-        result = funders.funder(id)
+        result, hit = fetch_cached('crossref', 'funders', {'funder_id': str(id).strip()}, lambda: funders.funder(id))
         results = pd.DataFrame(columns = list(item.keys()), dtype=object)
         index = len(results)
 
@@ -1208,8 +1708,8 @@ def lookup_funders(funder_ids: list = [], rate_limit: float = 0.05, timeout = 60
         
         output = pd.concat([output, results])
         
-
-        sleep(rate_limit)
+        if hit == False:
+            sleep(rate_limit)
 
     output = output.reset_index().drop('index', axis=1)
 
@@ -1283,7 +1783,8 @@ def get_funder_works(funder_id = 'request_input',
                         sample: int = None, # type: ignore
                         limit: int = 1000,
                         rate_limit: float = 0.05,
-                        timeout = 60):
+                        timeout = 60,
+                        page_size: int = None): # type: ignore
 
     """
         Looks up a funder using the CrossRef API and returns associated publications as a Pandas DataFrame.
@@ -1297,9 +1798,11 @@ def get_funder_works(funder_id = 'request_input',
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see set_search_page_size).
         filter : dict
         select : list
 
@@ -1314,55 +1817,9 @@ def get_funder_works(funder_id = 'request_input',
 
     global my_etiquette
     funders = Funders(etiquette=my_etiquette, timeout=timeout)
-    result = funders.works(funder_id)
-
-    if filter != None:
-
-        filter_input = ''
-
-        global filters
-        for f in filters:
-            if f in filter.keys():
-                val = filter[f]
-                filter_input = filter_input + f'{f}="{val}", '
-        
-        filter_input = filter_input.strip(', ').strip()
-        
-        filter_code = f'result.filter({filter_input})'
-        result = exec(filter_code)
-    
-    if select != None:
-
-        select_input = ''
-        for i in select:
-            select_input = select_input + f'"{i}", '
-        select_input = select_input.strip(', ').strip()
-
-        select_code = f'result.select({select_input})'
-        result = exec(select_code)
-
-    try:
-        print(f'{result.count()} results found') # type: ignore
-    except:
-        pass
-
-    items = []
-    if result != None:
-
-        iteration = 1
-        for item in result: # type: ignore
-
-            if limit != None:
-                if iteration > limit:
-                    break
-
-            items.append(item)
-
-            iteration += 1
+    result = apply_options(funders.works(funder_id), filter = filter, select = select)
 
-            sleep(rate_limit)
-    
-    df = items_to_df(items)
+    df = chunks_to_df(iter_chunks(result, limit = limit, page_size = page_size, rate_limit = rate_limit))
 
     return df
 
@@ -1384,7 +1841,8 @@ def search_funder_works(funder_id = 'request_input',
                         sample: int = None, # type: ignore
                         limit: int = 1000,
                         rate_limit: float = 0.05,
-                        timeout = 60):
+                        timeout = 60,
+                        page_size: int = None): # type: ignore
     
     """
         Searches for publications associated with a funder using the CrossRef API.
@@ -1424,9 +1882,11 @@ def search_funder_works(funder_id = 'request_input',
         limit : int
             optional: set a limit to the number of results returned.
         rate_limit : float
-            time delay in seconds per result. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
+            time delay in seconds per request. Used to limit impact on CrossRef servers. Defaults to 0.05 seconds.
         timeout : int
             maximum time in seconds to wait for a response before aborting the CrossRef API call. Defaults to 60 seconds.
+        page_size : int
+            the number of results requested at a time. Defaults to None: the default is used (see set_search_page_size).
         filter : dict
         select : list
         
@@ -1439,89 +1899,11 @@ def search_funder_works(funder_id = 'request_input',
     if funder_id == 'request_input':
         funder_id = input('Funder ID: ')
 
-    if bibliographic == None:
-        bibliographic = ''
-    
-    if title != None:
-        bibliographic = bibliographic + ', ' + str(title)
-
-    if entry_type != None:
-        bibliographic = bibliographic + ', ' + str(entry_type)
-
-    if doi != None:
-        bibliographic = bibliographic + ', ' + str(doi)
-
-    if published_date != None:
-        bibliographic = bibliographic + ', ' + str(published_date)
-    
-    if funder_name != None:
-        bibliographic = bibliographic + ', ' + str(funder_name)
-    
-    if link != None:
-        bibliographic = bibliographic + ', ' + str(link)
-
-    if bibliographic == '':
-        bibliographic = None # type: ignore
-
     global my_etiquette
     funders = Funders(etiquette=my_etiquette, timeout=timeout)
-    result = funders.works(funder_id)
-
-    result = result.query(
-                        bibliographic = bibliographic,
-                        author = author,
-                        affiliation = author_affiliation,
-                        editor = editor,
-                        publisher_name = publisher_name,
-                        container_title = source
-                        )
-    
-    if filter != None:
-
-        filter_input = ''
-
-        global filters
-        for f in filters:
-            if f in filter.keys():
-                val = filter[f]
-                filter_input = filter_input + f'{f}="{val}", '
-        
-        filter_input = filter_input.strip(', ').strip()
-        
-        filter_code = f'result.filter({filter_input})'
-        result = exec(filter_code)
-    
-    if select != None:
-
-        select_input = ''
-        for i in select:
-            select_input = select_input + f'"{i}", '
-        select_input = select_input.strip(', ').strip()
-
-        select_code = f'result.select({select_input})'
-        result = exec(select_code)
 
-    try:
-        print(f'{result.count()} results found') # type: ignore
-    except:
-        pass
-
-    items = []
-    if result != None:
-
-        iteration = 1
-        for item in result: # type: ignore
-
-            if limit != None:
-                if iteration > limit:
-                    break
-
-            items.append(item)
-
-            iteration += 1
+    result = works_query(bibliographic = bibliographic, title = title, author = author, author_affiliation = author_affiliation, editor = editor, entry_type = entry_type, published_date = published_date, doi = doi, publisher_name = publisher_name, funder_name = funder_name, source = source, link = link, filter = filter, select = select, endpoint = funders.works(funder_id))
 
-            sleep(rate_limit)
-    
-    df = items_to_df(items)
+    df = chunks_to_df(iter_chunks(result, limit = limit, page_size = page_size, rate_limit = rate_limit))
 
     return df
@@ -1,13 +1,32 @@
 """Functions to load and parse JSTOR database files"""
 
 from ..utils.basics import results_cols
+from ..utils.lazy import LazyValue
+from .chunked import get_chunk_size, read_fraction
 
+import os
+import gzip
+import json
 import webbrowser
 from pathlib import Path
 
 import pandas as pd
 import numpy as np
 
+# Constellate dataset fields and the Results columns they are imported to. Fields which are not mapped are imported if they share a Results column's name
+jstor_cols = {
+                'id': 'other_ids',
+                'isPartOf': 'source',
+                'datePublished': 'date',
+                'docType': 'type',
+                'provider': 'repository',
+                'url': 'link',
+                'placeOfPublication': 'publisher_location',
+                'creator': 'authors',
+                'keyphrase': 'keywords',
+                'fullText': 'full_text'
+                }
+
 def access_jstor_database():
 
     """
@@ -82,7 +101,198 @@ def import_metadata(file_path = 'request_input',
     
     return output_df
 
-def import_full(file_path = 'request_input', 
+def load_full_text(location: tuple):
+
+    """
+    Reads a document's full text from a full text store created by a JSTOR import (see read_jstor_records).
+
+    Parameters
+    ----------
+    location : tuple
+        the store's file path and the byte offset of the document's line.
+
+    Returns
+    -------
+    full_text : object
+        the document's full text.
+    """
+
+    file_path, offset = location
+
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        line = f.readline()
+
+    return json.loads(line)['full_text']
+
+def split_names(value):
+
+    """
+    Lowercases and splits a JSTOR authors or keywords value, which may be a semicolon-separated string or a list.
+    """
+
+    if type(value) == str:
+        return value.lower().split(';')
+
+    if type(value) == list:
+        return [str(i).lower() for i in value]
+
+    return value
+
+def project_document(document: dict, full_text = True, store = None) -> dict:
+
+    """
+    Selects the fields of a Constellate document which are imported to Results columns and renames them, releasing the rest.
+
+    Parameters
+    ----------
+    document : dict
+        a Constellate document (i.e. one line of a dataset file).
+    full_text : bool or str
+        whether to import full texts: True to import them, False to skip them, or the file path of a full text store (see read_jstor_records). Defaults to True.
+    store : file object
+        the full text store's file handle, if full texts are spilled to a store.
+
+    Returns
+    -------
+    record : dict
+        a dictionary of Results column names and values.
+    """
+
+    global jstor_cols
+    global results_cols
+
+    record = {}
+
+    for field, value in document.items():
+
+        col = jstor_cols.get(field, field)
+
+        if col not in results_cols:
+            continue
+
+        if col == 'full_text':
+
+            if full_text == False:
+                continue
+
+            if (store is not None) and (value is not None):
+                offset = store.tell()
+                store.write(json.dumps({'other_ids': document.get('id'), 'full_text': value}).encode('utf-8') + b'\n')
+                value = LazyValue(load_full_text, (store.name, offset))
+
+        if value == 'untitled':
+            value = None
+
+        record[col] = value
+
+    if 'authors' in record.keys():
+        record['authors'] = split_names(record['authors'])
+        record['authors_data'] = record['authors'].copy() if type(record['authors']) == list else record['authors']
+
+    if 'keywords' in record.keys():
+        record['keywords'] = split_names(record['keywords'])
+
+    return record
+
+def read_jstor_records(file_path, batch_size = None, full_text = True):
+
+    """
+    Reads a JSON Lines dataset file outputted by JSTOR's Constellate portal in batches of documents. Each line is parsed and only the fields imported to Results columns are kept, so that peak memory depends on the batch size rather than the file size. Gzipped (.gz) files are decompressed as they are read.
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of file to read.
+    batch_size : int
+        the number of documents to read at a time. Defaults to the default chunk size (see art.importers.chunked.set_default_chunk_size).
+    full_text : bool or str
+        whether to import documents' full texts. If True, full texts are imported; if False, they are skipped; if a file path, they are written to a full text store at that path and read back from it when first accessed (see load_full_text). Defaults to True.
+
+    Yields
+    ------
+    batch : tuple
+        a list of records (see project_document), and the fraction of the file read so far.
+    """
+
+    batch_size = get_chunk_size(batch_size)
+    size = os.path.getsize(file_path)
+
+    store = None
+    if (full_text != True) and (full_text != False):
+        store = open(str(Path(full_text).absolute()), 'ab')
+
+    try:
+        with open(file_path, 'rb') as raw:
+
+            if Path(file_path).suffix.lower() == '.gz':
+                f = gzip.open(raw)
+            else:
+                f = raw
+
+            records = []
+
+            for line in f:
+
+                if line.strip() == b'':
+                    continue
+
+                records.append(project_document(json.loads(line), full_text = full_text, store = store))
+
+                if len(records) == batch_size:
+                    yield records, read_fraction(raw, size)
+                    records = []
+
+            if len(records) > 0:
+                yield records, read_fraction(raw, size)
+
+    finally:
+        if store is not None:
+            store.close()
+
+def records_to_df(records: list, start: int = 0) -> pd.DataFrame:
+
+    """
+    Constructs a Pandas DataFrame from a list of records (see project_document). Columns are ordered by first appearance; missing values are None.
+    """
+
+    columns = []
+    for record in records:
+        for col in record.keys():
+            if col not in columns:
+                columns.append(col)
+
+    rows = [[record.get(col) for col in columns] for record in records]
+
+    return pd.DataFrame(rows, columns = columns, index = pd.RangeIndex(start, start + len(records)), dtype = object)
+
+def read_jstor_chunks(file_path, chunk_size = None, full_text = True):
+
+    """
+    Reads a JSON Lines dataset file outputted by JSTOR's Constellate portal in chunks (see read_jstor_records).
+
+    Parameters
+    ----------
+    file_path : str
+        directory path of file to read.
+    chunk_size : int
+        the number of documents to read at a time. Defaults to the default chunk size (see art.importers.chunked.set_default_chunk_size).
+    full_text : bool or str
+        whether to import documents' full texts: True to import them, False to skip them, or the file path of a full text store. Defaults to True.
+
+    Yields
+    ------
+    chunk : tuple
+        a Pandas DataFrame of rows, and the fraction of the file read so far.
+    """
+
+    start = 0
+
+    for records, fraction in read_jstor_records(file_path, batch_size = chunk_size, full_text = full_text):
+        yield records_to_df(records, start = start), fraction
+        start += len(records)
+
+def import_full(file_path = 'request_input', full_text = True
                 # clean_results = True
                 ):
     
@@ -93,63 +303,54 @@ def import_full(file_path = 'request_input',
         ----------
         file_path : str
             directory path of file to import. Defaults to requesting from user input.
+        full_text : bool or str
+            whether to import documents' full texts. If True, full texts are imported; if False, they are skipped; if a file path, they are written to a full text store at that path and read back from it when first accessed. Defaults to True.
 
         Returns
         -------
         output_df : pandas.DataFrame
             a Pandas DataFrame containing JSTOR data.
+
+        Notes
+        -----
+        The file is read in batches of documents, keeping only the fields imported to Results columns (see read_jstor_records), and the DataFrame is constructed once from all records.
     """
 
     if file_path == 'request_input':
         file_path = input('File path: ')
-    
-    import_df = pd.read_json(file_path, lines=True).replace(np.nan, None)
-    import_df = import_df.rename(columns=
-                                        {'id': 'other_ids',
-                                         'isPartOf': 'source',
-                                        'datePublished': 'date',
-                                        'docType': 'type',
-                                        'provider': 'repository',
-                                        'url': 'link',
-                                        'placeOfPublication': 'publisher_location',
-                                        'creator': 'authors',
-                                        'keyphrase': 'keywords',
-                                        'fullText': 'full_text'
-                                            })
-    
-    import_df = import_df.dropna(axis='columns', how='all')
-
-    global results_cols
 
-    to_drop = []
-    for c in import_df.columns:
-        if c not in results_cols:
-            to_drop.append(c)
-    
-    output_df = import_df.drop(labels=to_drop, axis='columns')
-    output_df['authors'] = output_df['authors'].str.lower().str.split(';')
-    output_df['authors_data'] = output_df['authors'].copy(deep=True)
-    output_df['keywords'] = output_df['keywords'].str.lower().str.split(';')
+    records = []
 
-    output_df = output_df.replace(np.nan, None).replace('untitled', None)
-    
-    
-    # if clean_results == True:
-        
-    #     cleaning_list = ['book review:',
-    #                     '\[',
-    #                     'references',
-    #                      'index'
-    #                     ]
+    for batch, fraction in read_jstor_records(file_path, full_text = full_text):
+        records.extend(batch)
 
-    #     for item in cleaning_list:
-    #         instances = output_df[output_df['title'].str.contains(item) == True].index.to_list()
-    #         for i in instances:
-    #             output_df.loc[i, 'title'] = None
+    output_df = records_to_df(records)
+    output_df = output_df.dropna(axis='columns', how='all')
     
     return output_df
 
-def import_jstor(file_path = 'request_input') -> pd.DataFrame:
+def jstor_file_type(file_path) -> str:
+
+    """
+    Returns the type of a file outputted by JSTOR's Constellate portal: 'csv' for metadata files, or 'json' for JSON and JSON Lines (.json, .jsonl, or gzipped) dataset files. Raises a TypeError for other files.
+    """
+
+    suffixes = [i.strip('.').lower() for i in Path(file_path).suffixes]
+
+    if (len(suffixes) > 0) and (suffixes[-1] == 'gz'):
+        suffixes = suffixes[:-1]
+
+    if len(suffixes) > 0:
+
+        if suffixes[-1] == 'csv':
+            return 'csv'
+
+        if suffixes[-1] in ['json', 'jsonl']:
+            return 'json'
+
+    raise TypeError('File must be a CSV or JSON')
+
+def import_jstor(file_path = 'request_input', full_text = True) -> pd.DataFrame:
 
     """
         Reads a file outputted by JSTOR's Constellate portal and returns as a Pandas DataFrame.
@@ -158,6 +359,8 @@ def import_jstor(file_path = 'request_input') -> pd.DataFrame:
         ----------
         file_path : str
             directory path of file to import. Defaults to requesting from user input.
+        full_text : bool or str
+            for JSON files: whether to import documents' full texts. If True, full texts are imported; if False, they are skipped; if a file path, they are written to a full text store at that path. Defaults to True.
 
         Returns
         -------
@@ -169,21 +372,19 @@ def import_jstor(file_path = 'request_input') -> pd.DataFrame:
         Can read:
             * .csv
             * .json
+            * .jsonl
+            * .jsonl.gz
     """
 
     if file_path == 'request_input':
         file_path = input('File path: ')
     
-    path_obj = Path(file_path)
-    suffix = path_obj.suffix.strip('.')
-
-    if (suffix != 'csv') and (suffix != 'json'):
-        raise TypeError('File must be a CSV or JSON')
+    suffix = jstor_file_type(file_path)
 
     if suffix == 'csv':
         result = import_metadata(file_path=file_path)
     
     if suffix == 'json':
-        result = import_full(file_path=file_path)
+        result = import_full(file_path=file_path, full_text=full_text)
     
     return result
\ No newline at end of file
@@ -3,6 +3,7 @@
 from ..utils.basics import results_cols
 from ..utils.cleaners import is_int
 from ..internet.webanalysis import is_url
+from .cache import fetch_cached
 
 from time import sleep
 
@@ -43,9 +44,7 @@ def lookup_orcid(orcid_id = 'request_input'):
     orcid_id = str(orcid_id).replace('https://', '').replace('http://', '').replace('orcid.org/', '')
 
     try:
-        orcid = pyorcid.OrcidScrapper(orcid_id=orcid_id)
-
-        result = orcid.record_summary()
+        result, hit = fetch_cached('orcid', 'record_summary', {'orcid_id': orcid_id}, lambda: pyorcid.OrcidScrapper(orcid_id=orcid_id).record_summary())
         df = pd.DataFrame.from_dict(result, orient='index').T
         df.columns = df.columns.str.lower()
     except:
@@ -90,8 +89,7 @@ def get_author_works(orcid_id = 'request_input', output = 'dataframe'):
     if orcid_id == 'request_input':
         orcid_id = input('ORCID ID: ')
     
-    orcid = get_author(orcid_id=orcid_id)
-    works_tuple = orcid.works()
+    works_tuple, hit = fetch_cached('orcid', 'works', {'orcid_id': orcid_id}, lambda: get_author(orcid_id=orcid_id).works())
     if len(works_tuple) > 0:
         works_list = works_tuple[0]
     else:
@@ -134,7 +132,7 @@ def search(query: str = 'request_input', start: int = 0, limit: int = 1000, outp
     global public_access_token
     
     orcidSearch = OrcidSearch(orcid_access_token=public_access_token)
-    results = orcidSearch.search(query=query, start=start, rows=limit)
+    results, hit = fetch_cached('orcid', 'search', {'query': query, 'start': start, 'rows': limit}, lambda: orcidSearch.search(query=query, start=start, rows=limit), cacheable = lambda r: ('response-code' not in r.keys()) and ('error-code' not in r.keys()))
 
     error_msg = ''
     if 'response-code' in results.keys():
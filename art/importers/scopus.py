@@ -1,4 +1,5 @@
 from ..utils.basics import results_cols, blockPrint, enablePrint
+from .cache import fetch_cached
 
 import pandas as pd
 import numpy as np
@@ -377,7 +378,8 @@ def search(tile_abs_key_auth = None,
                     tile_abs_key_auth = tile_abs_key_auth
                     )
     
-    res = ScopusSearch(query=query, 
+    def fetch():
+        res = ScopusSearch(query=query, 
                        refresh=refresh,
                        view=view,
                        verbose=verbose,
@@ -385,12 +387,12 @@ def search(tile_abs_key_auth = None,
                        integrity_fields=integrity_fields,
                        integrity_action=integrity_action,
                        subscriber=subscriber)
-    
-    res_len = res._n
+        return res._n, res.results
 
-    print(f'{res_len} results returned') # type: ignore
+    params = {'query': query, 'view': view, 'download': download, 'integrity_fields': integrity_fields, 'integrity_action': integrity_action, 'subscriber': subscriber}
+    (res_len, res_list), hit = fetch_cached('scopus', 'search', params, fetch, refresh = (refresh == True))
 
-    res_list = res.results
+    print(f'{res_len} results returned') # type: ignore
     res_df = pd.DataFrame(data=res_list, dtype=object)
 
     res_df = res_df.rename(columns={
@@ -457,16 +459,20 @@ def lookup(uid: str = 'request_input',
     
     uid = uid.strip()
 
-    res = AbstractRetrieval(
+    def fetch():
+        res = AbstractRetrieval(
                             identifier=uid,
                             refresh=refresh,
                             view=view,
                             id_type=id_type
                             )
+        if type(res) == AbstractRetrieval:
+            return res._json
+
+    js, hit = fetch_cached('scopus', 'abstract', {'uid': uid, 'view': view, 'id_type': id_type}, fetch, refresh = (refresh == True))
     
-    if type(res) == AbstractRetrieval:
+    if type(js) == dict:
 
-        js = res._json
         js_keys = js.keys()
 
         if 'affiliation' in js_keys:
@@ -1,4 +1,5 @@
 from ..utils.basics import results_cols
+from .cache import fetch_cached
 
 import os
 import time
@@ -381,7 +382,8 @@ def search_engine(query: str = 'request_input',
 
         try:
             # Query Web of Science documents 
-            api_response = api_instance.documents_get(q=query, db=database, limit=limit, page=page, sort_field=sort_field, modified_time_span=modified_time_span, tc_modified_time_span=tc_modified_time_span, detail=detail)
+            params = {'q': query, 'db': database, 'limit': limit, 'page': page, 'sort_field': sort_field, 'modified_time_span': modified_time_span, 'tc_modified_time_span': tc_modified_time_span, 'detail': detail}
+            api_response, hit = fetch_cached('wos', 'documents', params, lambda: api_instance.documents_get(**params))
             return api_response
 
         except ApiException as e:
@@ -550,7 +552,7 @@ def journals_search_engine(issn: str = 'request_input'):
 
         try:
             # Query Web of Science documents 
-            api_response = api_instance.journals_get(issn=issn)
+            api_response, hit = fetch_cached('wos', 'journals', {'issn': issn}, lambda: api_instance.journals_get(issn=issn))
             return api_response
 
         except ApiException as e:
@@ -2,6 +2,7 @@
 
 from typing import List, Dict, Tuple
 import copy
+import zlib
 
 import numpy as np
 import pandas as pd
@@ -134,4 +135,175 @@ def inverse_normalised_levenshtein(first_string: str, second_string: str) -> flo
     # Calculating inverse
     inv_normalised = 1 - normalised_lev
     
-    return inv_normalised
\ No newline at end of file
+    return inv_normalised
+
+def shingle(text: str, k: int = 4) -> set:
+
+    """
+    Splits a string into the set of its overlapping character k-grams (shingles).
+    
+    Parameters
+    ----------
+    text : str
+        string to split.
+    k : int
+        length of shingles. Defaults to 4.
+    
+    Returns
+    -------
+    result : set
+        a set of shingles. Strings shorter than k are returned as a single shingle.
+    """
+
+    if len(text) <= k:
+        return {text}
+
+    return {text[i:i+k] for i in range(len(text) - k + 1)}
+
+
+def jaccard_similarity(first_set: set, second_set: set) -> float:
+
+    """
+    Calculates the Jaccard similarity (intersection over union) of two sets.
+    """
+
+    union = len(first_set | second_set)
+
+    if union == 0:
+        return 0.0
+
+    return len(first_set & second_set) / union
+
+
+def minhash_signatures(shingle_sets: List[set], num_perm: int = 128, seed: int = 1, chunk_size: int = 50000) -> np.ndarray:
+
+    """
+    Calculates MinHash signatures for a list of shingle sets.
+    
+    Parameters
+    ----------
+    shingle_sets : list
+        list of non-empty sets of strings.
+    num_perm : int
+        number of hash permutations to use. Defaults to 128.
+    seed : int
+        random seed for generating permutations. Defaults to 1.
+    chunk_size : int
+        approximate number of shingles to hash at once. Defaults to 50000.
+    
+    Returns
+    -------
+    result : numpy.ndarray
+        an array of shape (number of sets, num_perm). The share of matching values between two rows estimates the Jaccard similarity of their sets.
+    
+    Notes
+    -----
+    Shingles are hashed with CRC32 so that signatures are stable between sessions. Each permutation is a random odd multiply-add modulo 2**32 followed by an xor-shift, both of which are bijective on 32-bit integers.
+    """
+
+    generator = np.random.default_rng(seed)
+    a = (generator.integers(0, 2**31, size=num_perm, dtype=np.uint32) * 2 + 1)[:, None]
+    b = generator.integers(0, 2**32, size=num_perm, dtype=np.uint32)[:, None]
+    shift = np.uint32(16)
+
+    signatures = np.empty((len(shingle_sets), num_perm), dtype=np.uint32)
+
+    start = 0
+    while start < len(shingle_sets):
+
+        # Collecting a chunk of sets
+        hashes = []
+        offsets = []
+        count = 0
+        end = start
+        while (end < len(shingle_sets)) and ((count < chunk_size) or (end == start)):
+            offsets.append(count)
+            set_hashes = [zlib.crc32(s.encode('utf-8')) for s in shingle_sets[end]]
+            hashes.extend(set_hashes)
+            count += len(set_hashes)
+            end += 1
+
+        # Applying all permutations to the chunk and taking the minimum per set
+        x = np.array(hashes, dtype=np.uint32)[None, :]
+        permuted = a * x + b
+        permuted ^= permuted >> shift
+        signatures[start:end] = np.minimum.reduceat(permuted, offsets, axis=1).T
+
+        start = end
+
+    return signatures
+
+
+def lsh_bands(threshold: float, num_perm: int = 128) -> Tuple[int, int]:
+
+    """
+    Chooses the number of bands and rows per band for locality-sensitive hashing of MinHash signatures.
+    
+    Returns
+    -------
+    result : tuple
+        a (bands, rows) tuple. The similarity at which pairs become likely candidates, (1/bands)**(1/rows), is set a little below the threshold to favour recall.
+    """
+
+    target = threshold - 0.05
+    best = (num_perm, 1)
+
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= target:
+            best = (bands, rows)
+
+    return best
+
+
+def lsh_candidate_pairs(signatures: np.ndarray, threshold: float = 0.8, window: int = 50) -> np.ndarray:
+
+    """
+    Finds candidate pairs of similar sets by banding their MinHash signatures (locality-sensitive hashing).
+    
+    Parameters
+    ----------
+    signatures : numpy.ndarray
+        MinHash signatures, as returned by minhash_signatures.
+    threshold : float
+        Jaccard similarity threshold to tune the banding for. Defaults to 0.8.
+    window : int
+        maximum number of following bucket members each member is paired with. Prevents very large buckets from producing a quadratic number of pairs. Defaults to 50.
+    
+    Returns
+    -------
+    result : numpy.ndarray
+        an array of shape (number of pairs, 2) containing unique (i, j) row pairs, with i < j.
+    """
+
+    n, num_perm = signatures.shape
+    bands, rows = lsh_bands(threshold=threshold, num_perm=num_perm)
+
+    pairs = []
+
+    for band in range(bands):
+
+        # Hashing each band of each signature to a bucket
+        band_sig = np.ascontiguousarray(signatures[:, band*rows:(band+1)*rows])
+        band_keys = band_sig.view(np.dtype((np.void, band_sig.dtype.itemsize * rows))).ravel()
+        _, buckets = np.unique(band_keys, return_inverse=True)
+
+        order = np.argsort(buckets, kind='stable')
+        sorted_buckets = buckets[order]
+
+        # Pairing each member with the following members of the same bucket
+        for offset in range(1, window + 1):
+            if offset >= n:
+                break
+            same = sorted_buckets[offset:] == sorted_buckets[:-offset]
+            if not same.any():
+                break
+            pairs.append(np.stack([order[:-offset][same], order[offset:][same]], axis=1))
+
+    if len(pairs) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    pairs_arr = np.concatenate(pairs)
+    pairs_arr.sort(axis=1)
+
+    return np.unique(pairs_arr, axis=0)
@@ -7,6 +7,8 @@ import os
 import sys
 import pickle
 
+from .reviewfile import is_review_file
+
 results_cols = [
                             'work_id',
                             'title',
@@ -272,13 +274,24 @@ def stat_file_to_dict(self):
 def open_file(file_address: str = 'request_input'): # type: ignore
 
         """
-        Reads saved ART files and returns as a Review object. Reviews must be formatted as .review or pickled .txt files.
+        Reads saved ART files and returns as a Review object. Reviews must be formatted as .review files, pickled .txt files or .db databases.
         """
 
         if file_address == 'request_input':
             file_address = input('File address: ')
+
+        from .database import is_review_database
+
+        if is_review_database(file_address) == True:
+            from ..classes.review import Review
+            return Review.open(file_address)
         
         if (file_address.endswith('.txt')) or (file_address.endswith('.review')):
+
+            if is_review_file(file_address) == True:
+                from ..classes.review import Review
+                return Review.open(file_address)
+
             with open(file_address, 'rb') as f:
                 review = pickle.load(f)
 
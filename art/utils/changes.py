@@ -0,0 +1,541 @@
+"""Change tracking for ART dataframes."""
+
+from .reviewfile import row_fingerprints
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_scalar
+from pandas.core.indexing import _LocIndexer, _iLocIndexer, _AtIndexer, _iAtIndexer # type: ignore
+
+rehash_sources = False
+
+def set_rehash_sources(rehash: bool = True):
+
+    """
+    Sets whether passes check every row's source columns for changes when they run, rather than only the rows recorded as edited. Rehashing finds objects which have been changed in place (e.g. an Authors object which an author is added to) without being marked as changed, but fingerprints every object in the source columns.
+
+    Parameters
+    ----------
+    rehash : bool
+        whether to check every row. Defaults to True.
+    """
+
+    global rehash_sources
+    rehash_sources = rehash
+
+class ChangeTracker:
+
+    """
+    This is a ChangeTracker object. It records which rows of a dataframe have been added or modified since a processing pass (e.g. formatting, work ID generation, deduplication) last ran, so that passes can skip unchanged rows.
+
+    Parameters
+    ----------
+    key_column : str
+        name of a column identifying each row (e.g. 'work_id'). If a row's key no longer matches the key recorded when a pass last ran, the row is treated as changed. Defaults to None.
+    tracks_edits : bool
+        whether the tracked dataframe records its edits in the tracker (see ChangeTracker.record_edit). If so, passes only check edited rows for changes to their source columns. Defaults to False.
+
+    Attributes
+    ----------
+    versions : dict
+        a dictionary mapping row labels to the version at which they were last changed.
+    passes : dict
+        a dictionary mapping pass names to the version at which they last ran.
+    keys : dict
+        a dictionary of dictionaries. Keys: pass names. Values: dictionaries mapping row labels to the row keys recorded when the pass last ran.
+    hashes : dict
+        a dictionary of dictionaries. Keys: pass names. Values: dictionaries mapping row labels to fingerprints of the pass's source columns, recorded when the pass last ran. Used to find rows whose data has been changed in place.
+    counter : int
+        the current version.
+    edits : dict
+        a dictionary mapping the labels of edited rows to the edit number at which they were last edited and the names of the edited columns (None for all columns), ordered from least to most recently edited. Only dataframes which record their edits (e.g. Results DataFrames) fill it; see ChangeTracker.record_edit.
+    edit_counter : int
+        the current edit number.
+    stamps : dict
+        a dictionary mapping the names of passes and indexes to the edit number up to which they have seen edits.
+    """
+
+    def __init__(self, key_column = None, tracks_edits = False):
+
+        """
+        Initialises ChangeTracker instance.
+
+        Parameters
+        ----------
+        key_column : str
+            name of a column identifying each row (e.g. 'work_id'). Defaults to None.
+        tracks_edits : bool
+            whether the tracked dataframe records its edits in the tracker. Defaults to False.
+        """
+
+        self.key_column = key_column
+        self.tracks_edits = tracks_edits
+        self.versions = dict()
+        self.passes = dict()
+        self.keys = dict()
+        self.hashes = dict()
+        self.refs = dict()
+        self.checked = dict()
+        self.counter = 0
+        self.edits = dict()
+        self.edit_counter = 0
+        self.stamps = dict()
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how ChangeTracker objects are represented in string form.
+        """
+
+        return f'ChangeTracker of {len(self.versions)} rows: {self.passes}'
+
+    def get_keys(self, dataframe: pd.DataFrame) -> list:
+
+        """
+        Returns the dataframe's row keys as strings, or None if the tracker has no key column.
+        """
+
+        if (self.key_column is None) or (self.key_column not in dataframe.columns):
+            return None
+
+        return dataframe[self.key_column].map(str).to_list()
+
+    def get_hashes(self, dataframe: pd.DataFrame, columns: list):
+
+        """
+        Returns fingerprints of each row's values in the given columns, and references to the objects fingerprinted (see art.utils.reviewfile.row_fingerprints).
+        """
+
+        columns = [c for c in columns if c in dataframe.columns]
+
+        return row_fingerprints(dataframe[columns])
+
+    def mark(self, labels):
+
+        """
+        Marks rows as changed.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the changed rows.
+        """
+
+        self.counter += 1
+
+        for label in labels:
+            self.versions[label] = self.counter
+
+        return self
+
+    def record_edit(self, labels, columns = None):
+
+        """
+        Records that cells have been edited (e.g. with .loc, .at or by assigning to a column), so that passes, indexes and incremental saves can find the edited rows without comparing every row. Edits are recorded separately from row versions (see ChangeTracker.mark), so that a pass writing its results does not cause other passes to process every row again.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the edited rows.
+        columns : list
+            names of the edited columns. Defaults to None (all columns).
+        """
+
+        self.edit_counter += 1
+        edit = self.edit_counter
+
+        if columns is not None:
+            columns = frozenset(columns)
+
+        edits = self.edits
+
+        for label in labels:
+
+            # Re-inserting rows so that the dictionary stays ordered by edit number
+            previous = edits.pop(label, None)
+
+            if previous is None:
+                edits[label] = (edit, columns)
+            elif (previous[1] is None) or (columns is None):
+                edits[label] = (edit, None)
+            else:
+                edits[label] = (edit, previous[1] | columns)
+
+        return self
+
+    def edited(self, since: int, columns = None) -> list:
+
+        """
+        Returns the rows edited since an edit number.
+
+        Parameters
+        ----------
+        since : int
+            the edit number.
+        columns : list
+            names of columns. If given, only rows with edits to these columns are returned. Defaults to None.
+
+        Returns
+        -------
+        result : list
+            index labels of the edited rows, most recently edited first.
+        """
+
+        result = []
+
+        if since >= self.edit_counter:
+            return result
+
+        for label, (edit, edited_columns) in reversed(self.edits.items()):
+
+            if edit <= since:
+                break
+
+            if (columns is None) or (edited_columns is None) or (edited_columns.isdisjoint(columns) == False):
+                result.append(label)
+
+        return result
+
+    def pending(self, dataframe: pd.DataFrame, name: str, columns = None, rehash = None) -> list:
+
+        """
+        Returns the rows which have been added or changed since a pass last ran.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the tracked dataframe.
+        name : str
+            name of the pass.
+        columns : list
+            names of the columns the pass reads. If given, rows whose values in these columns have changed since the pass last ran (e.g. data edited in place) are also returned. If the dataframe records its edits, only rows edited in these columns and rows without fingerprints are checked. Defaults to None.
+        rehash : bool
+            whether to check every row's values in the columns, finding objects changed in place without being marked (see Results.mark_changed). Defaults to the module setting (see set_rehash_sources).
+
+        Returns
+        -------
+        result : list
+            index labels of rows to process, in dataframe order.
+        """
+
+        if name not in self.passes:
+            return dataframe.index.to_list()
+
+        if rehash is None:
+            global rehash_sources
+            rehash = rehash_sources
+
+        last_run = self.passes[name]
+        versions = self.versions
+        pass_keys = self.keys.get(name, dict())
+        keys = self.get_keys(dataframe)
+
+        if keys is None:
+            changed = [versions.get(label, np.inf) > last_run for label in dataframe.index]
+        else:
+            changed = [(versions.get(label, np.inf) > last_run) or (pass_keys.get(label) != key) for label, key in zip(dataframe.index, keys)]
+
+        if (columns is not None) and (name in self.hashes):
+
+            pass_hashes = self.hashes[name]
+            stamp = self.edit_counter
+
+            if (self.tracks_edits == True) and (rehash == False) and (name in self.stamps):
+
+                # Only rows edited in the source columns since the pass last ran, and rows without fingerprints, are fingerprinted
+                edited = set(self.edited(self.stamps[name], columns = columns))
+                rows = [label for label, c in zip(dataframe.index, changed) if (c == False) and ((label in edited) or (label not in pass_hashes))]
+                hashes, refs = self.get_hashes(dataframe.loc[rows], columns)
+                rehashed = dict(zip(rows, hashes.tolist()))
+                changed = [c or ((label in rehashed) and (pass_hashes.get(label) != rehashed[label])) for c, label in zip(changed, dataframe.index)]
+                unchanged = {label: rehashed.get(label, pass_hashes.get(label)) for label, c in zip(dataframe.index, changed) if c == False}
+                refs = self.refs.get(name, []) + refs
+
+            else:
+                hashes, refs = self.get_hashes(dataframe, columns)
+                changed = [c or (pass_hashes.get(label) != h) for c, label, h in zip(changed, dataframe.index, hashes.tolist())]
+                unchanged = {label: h for label, c, h in zip(dataframe.index, changed, hashes.tolist()) if c == False}
+
+            # Keeping the fingerprints of unchanged rows, so that the pass does not need to recompute them when it is done
+            self.checked[name] = (id(dataframe), self.counter, unchanged, refs, stamp)
+
+        return [label for label, c in zip(dataframe.index, changed) if c]
+
+    def done(self, dataframe: pd.DataFrame, name: str, columns = None):
+
+        """
+        Records that a pass has processed all rows of the dataframe.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the tracked dataframe.
+        name : str
+            name of the pass.
+        columns : list
+            names of the columns the pass reads. If given, their values are fingerprinted so that later in-place changes can be found. Defaults to None.
+        """
+
+        for label in dataframe.index:
+            if label not in self.versions:
+                self.versions[label] = self.counter
+
+        self.passes[name] = self.counter
+
+        keys = self.get_keys(dataframe)
+        if keys is not None:
+            self.keys[name] = dict(zip(dataframe.index, keys))
+
+        checked = self.checked.pop(name, None)
+
+        if columns is not None:
+
+            # Rows left unchanged when the pass checked for pending rows keep their fingerprints; others are fingerprinted again
+            if (checked is not None) and (checked[0] == id(dataframe)) and (checked[1] == self.counter):
+                _, _, unchanged, refs, stamp = checked
+                rows = [label for label in dataframe.index if label not in unchanged]
+                hashes, new_refs = self.get_hashes(dataframe.loc[rows], columns)
+                rehashed = dict(zip(rows, hashes.tolist()))
+                self.hashes[name] = {label: unchanged[label] if label in unchanged else rehashed[label] for label in dataframe.index}
+                self.refs[name] = refs + new_refs
+
+            else:
+                stamp = self.edit_counter
+                hashes, refs = self.get_hashes(dataframe, columns)
+                self.hashes[name] = dict(zip(dataframe.index, hashes.tolist()))
+                self.refs[name] = refs
+
+            # Edits made before the pass checked for pending rows have been seen
+            self.stamps[name] = stamp
+
+        return self
+
+    def drop(self, labels):
+
+        """
+        Stops tracking rows.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the rows to remove.
+        """
+
+        for label in labels:
+            self.versions.pop(label, None)
+            self.edits.pop(label, None)
+            for pass_keys in self.keys.values():
+                pass_keys.pop(label, None)
+            for pass_hashes in self.hashes.values():
+                pass_hashes.pop(label, None)
+
+        return self
+
+    def relabel(self, old_labels):
+
+        """
+        Relabels rows after a dataframe's index has been reset. Rows whose labels are not included are removed.
+
+        Parameters
+        ----------
+        old_labels : list
+            the rows' labels before the reset, in their new order. Row n is given the label n.
+        """
+
+        mapping = {old: new for new, old in enumerate(old_labels)}
+
+        if all(old == new for old, new in mapping.items()) and (len(mapping) == len(self.versions)):
+            return self
+
+        self.versions = {new: self.versions[old] for old, new in mapping.items() if old in self.versions}
+        self.edits = {mapping[old]: edit for old, edit in self.edits.items() if old in mapping}
+
+        for name in self.keys.keys():
+            pass_keys = self.keys[name]
+            self.keys[name] = {new: pass_keys[old] for old, new in mapping.items() if old in pass_keys}
+
+        for name in self.hashes.keys():
+            pass_hashes = self.hashes[name]
+            self.hashes[name] = {new: pass_hashes[old] for old, new in mapping.items() if old in pass_hashes}
+
+        # Rows given new labels are recorded as edited, as snapshots taken before the reset know them by their old labels
+        moved = [new for old, new in mapping.items() if old != new]
+        if len(moved) > 0:
+            self.record_edit(moved)
+
+        return self
+
+def set_column_values(dataframe: pd.DataFrame, column: str, labels: list, values: list):
+
+    """
+    Sets the values of a dataframe column for a subset of rows. Values are assigned as they are, so list-like objects (e.g. Authors, References) are not unpacked.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        dataframe to update.
+    column : str
+        name of column to update.
+    labels : list
+        index labels of rows to update.
+    values : list
+        new values, one per label.
+    """
+
+    if len(labels) == 0:
+        return dataframe
+
+    if column in dataframe.columns:
+        col_values = dataframe[column].to_numpy(dtype=object, copy=True)
+    else:
+        col_values = np.full(len(dataframe), None, dtype=object)
+
+    positions = dataframe.index.get_indexer(labels)
+
+    for pos, value in zip(positions, values):
+        col_values[pos] = value
+
+    dataframe[column] = pd.Series(col_values, index=dataframe.index, dtype=object)
+
+    return dataframe
+
+def same_value(old, new) -> bool:
+
+    """
+    Returns True if a cell's new value is the same as its old value: objects are compared by identity; strings, numbers and missing values by value.
+    """
+
+    if old is new:
+        return True
+
+    old_type = type(old)
+
+    if (old_type != type(new)) or (old_type not in [str, int, float, bool]):
+        return False
+
+    return (old == new) or ((old != old) and (new != new))
+
+def changed_labels(index: pd.Index, old_values, new_values) -> list:
+
+    """
+    Returns the labels of rows whose values differ between two arrays of a column's values (see same_value).
+
+    Parameters
+    ----------
+    index : pandas.Index
+        the column's index.
+    old_values : numpy.ndarray
+        the column's values before it was changed.
+    new_values : numpy.ndarray
+        the column's values after it was changed.
+    """
+
+    if len(old_values) != len(new_values):
+        return index.to_list()
+
+    changed = np.fromiter(map(same_value, old_values, new_values), dtype = bool, count = len(new_values)) == False
+
+    return index[changed].to_list()
+
+def edited_cells(dataframe: pd.DataFrame, key, positional: bool = False) -> tuple:
+
+    """
+    Returns the rows and columns set by an indexer (e.g. dataframe.loc[key] = value). If they cannot be found, every row and column is returned.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        the dataframe, after the cells were set.
+    key : object
+        the indexer's key.
+    positional : bool
+        whether the key gives positions (as with .iloc and .iat) rather than labels. Defaults to False.
+
+    Returns
+    -------
+    result : tuple
+        a list of index labels and a list of column names (None for all columns).
+    """
+
+    if type(key) == tuple:
+        rows = key[0]
+        columns = key[1] if len(key) > 1 else slice(None)
+    else:
+        rows = key
+        columns = slice(None)
+
+    try:
+
+        if callable(rows) == True:
+            rows = rows(dataframe)
+
+        if callable(columns) == True:
+            columns = columns(dataframe)
+
+        if positional == True:
+            labels = dataframe.index[rows]
+        elif is_scalar(rows) == True:
+            labels = [rows]
+        else:
+            positions = pd.Series(np.arange(len(dataframe)), index = dataframe.index).loc[rows]
+            labels = dataframe.index[np.asarray(positions, dtype = np.int64)]
+
+        if (type(columns) == slice) and (columns == slice(None)):
+            names = None
+        elif positional == True:
+            names = dataframe.columns[columns]
+        elif is_scalar(columns) == True:
+            names = [columns]
+        else:
+            names = pd.Series(0, index = dataframe.columns).loc[columns].index
+
+    except Exception:
+        return dataframe.index.to_list(), None
+
+    if is_scalar(labels) == True:
+        labels = [labels]
+
+    if (names is not None) and (is_scalar(names) == True):
+        names = [names]
+
+    return list(labels), (list(names) if names is not None else None)
+
+class TrackedLocIndexer(_LocIndexer):
+
+    """
+    A .loc indexer which records the cells it sets in its dataframe's change tracker (see ChangeTracker.record_edit).
+    """
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.obj.record_edit(*edited_cells(self.obj, key))
+
+class TrackedILocIndexer(_iLocIndexer):
+
+    """
+    An .iloc indexer which records the cells it sets in its dataframe's change tracker (see ChangeTracker.record_edit).
+    """
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.obj.record_edit(*edited_cells(self.obj, key, positional = True))
+
+class TrackedAtIndexer(_AtIndexer):
+
+    """
+    An .at indexer which records the cells it sets in its dataframe's change tracker (see ChangeTracker.record_edit).
+    """
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.obj.record_edit(*edited_cells(self.obj, key))
+
+class TrackedIAtIndexer(_iAtIndexer):
+
+    """
+    An .iat indexer which records the cells it sets in its dataframe's change tracker (see ChangeTracker.record_edit).
+    """
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.obj.record_edit(*edited_cells(self.obj, key, positional = True))
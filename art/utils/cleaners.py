@@ -2,6 +2,9 @@
 
 # Importing packages
 from .basics import blockPrint, enablePrint
+from .indexes import IdentifierIndex
+from .lazy import materialize
+from ..text.textanalysis import shingle, jaccard_similarity, minhash_signatures, lsh_candidate_pairs
 from ..datasets import stopwords, html_stopwords 
 
 from typing import List, Dict, Tuple
@@ -87,13 +90,15 @@ def strip_list_str(list_item: List[str]) -> list:
     """
     
     if type(list_item) == str:
-        
-        list_series = pd.Series(list_item)
-        list_series = list_series.str.replace('[', '', regex = False).str.replace(']', '', regex = False).str.replace('"', '', regex = False).str.replace("'", '', regex = False)
-        list_series = list_series.replace(np.nan, None).replace('NaN', None).replace('nan', None).replace('none', None).replace('None', None)
-        list_series = list_series.str.split(',')
-        clean_list = list_series[0]
-# 
+
+        # Cleaned with string methods rather than a Pandas Series, as this is run on every cell of imported columns
+        clean_str = list_item.replace('[', '').replace(']', '').replace('"', '').replace("'", '')
+
+        if clean_str in ['NaN', 'nan', 'none', 'None']:
+            return None # type: ignore
+
+        clean_list = clean_str.split(',')
+
         return clean_list
     
     else:
@@ -1295,17 +1300,199 @@ def correct_series_of_lists(series: pd.Series) -> pd.Series:
     
     return series
 
-def merge_duplicate_ids(dataframe, merge_on: str):
+merge_id_names = ['doi', 'isbn', 'issn', 'uri', 'orcid', 'crossref_id', 'crossref', 'scopus_id', 'scopus', 'wos_id', 'wos', 'pubmed_id', 'address', 'link', 'website']
+
+# Identifiers in merge_id_names which are unique to a work. Rows sharing any of these are grouped transitively; rows sharing other identifiers (e.g. ISSNs and websites, which many works can share) are merged one column at a time
+transitive_id_names = ['doi', 'isbn']
+
+def is_empty_cell(data) -> bool:
 
     """
-    Takes a DataFrame and merges rows with duplicate IDs.
+    Returns True if a dataframe cell contains no usable data (None, NaN, empty strings, empty lists or empty dictionaries).
+    """
+
+    dtype = type(data)
+
+    if (data is None) or (isinstance(data, float) and np.isnan(data)) or (data is pd.NA) or (data is pd.NaT):
+        return True
+
+    if (dtype == str) and (data in ['', '[]', 'None', 'none']):
+        return True
+
+    if (dtype == list) and (data == []):
+        return True
+
+    str_data = str(data)
+
+    return (str_data == '[]') or (str_data == '{}') or (str_data == 'nan')
+
+def is_nested_merge(data, data2) -> bool:
+
+    """
+    Returns True if merge_cells merges the second value into the first: that is, if the first value is a non-empty nested Results, or an Authors, Funders or Affiliations collection, and the second can be merged into it.
+    """
+
+    if is_empty_cell(data) == True:
+        return False
+
+    dtype_str = str(type(data))
+    dtype_str2 = str(type(data2))
+
+    if '.Results' in dtype_str:
+        return (type(data2) == pd.DataFrame) or ('.Results' in dtype_str2)
+
+    if ('.Authors' in dtype_str) or ('.Funders' in dtype_str) or ('.Affiliations' in dtype_str):
+        return ('.Authors' in dtype_str2) or ('.Funders' in dtype_str2) or ('.Affiliations' in dtype_str2)
+
+    return False
+
+def merge_cells(data, data2, copy_nested: bool = True):
+
+    """
+    Merges two values from the same column of duplicate rows. Empty values are replaced; nested Results are combined and deduplicated; Authors, Funders and Affiliations collections are merged. Otherwise, the first value is kept.
+
+    If copy_nested is True, nested objects are copied before they are merged into, so the objects passed in are not changed. Callers merging several values into an object they have already copied can pass False.
+    """
+
+    data = materialize(data)
+    data2 = materialize(data2)
+
+    if is_empty_cell(data) == True:
+        return data2
+
+    if is_nested_merge(data, data2) == False:
+        return data
+
+    if copy_nested == True:
+        data = copy.deepcopy(data)
+
+    if '.Results' in str(type(data)):
+        data2_copy = data2.copy(deep=True)
+        data.add_dataframe(data2_copy)
+        data.remove_duplicates()
+        return data
+
+    data.merge(data2)
+    data.summary = deduplicate(data.summary)
+
+    return data
+
+def group_pairs(pairs, length: int, keys = None) -> list:
+
+    """
+    Groups row positions connected by pairs, using a union-find. Groups are transitive: if rows A and B are paired, and rows B and C are paired, all three are grouped.
+
+    Parameters
+    ----------
+    pairs : iterable
+        (position, position) tuples.
+    length : int
+        number of rows.
+    keys : list
+        optional: a key for each row (e.g. its DOI), or None if the row has no key. If given, pairs which would group rows with different keys are skipped, so that no group contains more than one key. Defaults to None.
+    
+    Returns
+    -------
+    groups : list
+        a list of lists of row positions. Each list contains two or more rows, in ascending order.
+    """
+
+    parents = list(range(length))
+
+    # The key of each group, held by its root
+    if keys is not None:
+        root_keys = list(keys)
+
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for i, j in pairs:
+        root_i = find(i)
+        root_j = find(j)
+        if root_i != root_j:
+
+            if keys is not None:
+                key_i = root_keys[root_i]
+                key_j = root_keys[root_j]
+                if (key_i is not None) and (key_j is not None) and (key_i != key_j):
+                    continue
+                root_keys[min(root_i, root_j)] = key_i if key_i is not None else key_j
+
+            parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    groups = dict()
+    for pos in range(length):
+        root = find(pos)
+        if root in groups:
+            groups[root].append(pos)
+        else:
+            groups[root] = [pos]
+
+    return [g for g in groups.values() if len(g) > 1]
+
+def group_duplicate_ids(dataframe, id_names: list) -> list:
+
+    """
+    Groups the rows of a DataFrame which share an ID in any of the given columns. Groups are transitive: if row A shares a DOI with row B, and row B shares an ISBN with row C, all three are grouped.
 
     Parameters
     ----------
     dataframe : Results, References or pandas.DataFrame
         dataframe to process.
-    merge_on : str
-        name of column containing IDs to merge on.
+    id_names : list
+        names of columns containing IDs to group on.
+    
+    Returns
+    -------
+    groups : list
+        a list of lists of row positions. Each list contains two or more rows, in dataframe order.
+    """
+
+    pairs = []
+
+    for c in id_names:
+
+        if c not in dataframe.columns:
+            continue
+
+        col = dataframe[c].reset_index(drop=True)
+        col = col[~col.map(is_empty_cell)]
+
+        if len(col) < 2:
+            continue
+
+        # Grouping rows by ID value in a single pass
+        try:
+            codes, uniques = pd.factorize(col)
+            first_positions = dict()
+            for pos, code in zip(col.index, codes):
+                if code in first_positions:
+                    pairs.append((first_positions[code], pos))
+                else:
+                    first_positions[code] = pos
+
+        except TypeError:
+            id_index = IdentifierIndex(col.to_frame(), columns=[c], ignore_case=False)
+            for positions in id_index.duplicates(c):
+                for pos in positions[1:]:
+                    pairs.append((positions[0], pos))
+
+    return group_pairs(pairs, length = len(dataframe))
+
+def merge_duplicate_groups(dataframe, groups: list):
+
+    """
+    Merges groups of duplicate rows into the first row of each group. Columns are merged using merge_cells.
+
+    Parameters
+    ----------
+    dataframe : Results, References or pandas.DataFrame
+        dataframe to process.
+    groups : list
+        a list of lists of row positions, as returned by group_duplicate_ids.
     
     Returns
     -------
@@ -1314,96 +1501,70 @@ def merge_duplicate_ids(dataframe, merge_on: str):
     """
 
     df = dataframe.copy(deep=True)
-    
-    if merge_on in df.columns:
 
-        # sorting index to prioritise entries with real values
+    if len(groups) == 0:
+        return df
 
-        df = df.sort_values(merge_on)
+    columns = df.columns.to_list()
+    col_values = {c: df[c].to_numpy(dtype=object, copy=True) for c in columns}
+    changed = set()
+    drop_positions = set()
 
-        # Checking if there are valid IDs in the column (i.e., not None or NaN)
-        dropna_indexes = df[merge_on].dropna().index
+    for group in groups:
 
-        if len(dropna_indexes) > 0:
+        first_pos = group[0]
 
-            df_dropna = df.copy(deep=True).loc[dropna_indexes]
+        for c in columns:
 
-            try:
-                ids = set(df_dropna[merge_on].to_list())
-            except:
-                ids = set(df_dropna[merge_on].astype(str).to_list())
+            values = col_values[c]
+            data = values[first_pos]
+            merged = data
+            copied = False
 
-            for i in ids:
+            # Nested objects are copied once per group: later values are merged into the copy
+            for pos in group[1:]:
+                nested = is_nested_merge(materialize(merged), materialize(values[pos]))
+                merged = merge_cells(merged, values[pos], copy_nested = (copied == False))
+                copied = copied or nested
 
-                masked = df[df[merge_on]==i]
-                masked_indexes = masked.index.to_list()
-                masked = masked.reset_index().drop('index', axis=1)
-                len_masked = len(masked)
+            if merged is not data:
+                values[first_pos] = merged
+                changed.add(c)
 
-                if len_masked > 0:
+        drop_positions.update(group[1:])
 
-                    first_index = masked_indexes[0]
-                    duplicate_indexes = masked_indexes[1:]
-                    first_row = masked.loc[0]
+    for c in columns:
+        if c in changed:
+            new_col = pd.Series(col_values[c], index=df.index, name=c)
+            if df[c].dtype != object:
+                new_col = new_col.infer_objects()
+            df[c] = new_col
 
-                    for index in range(1, len_masked):
+    keep_positions = [i for i in range(len(df)) if i not in drop_positions]
 
-                        row = masked.loc[index]
+    return df.iloc[keep_positions]
 
-                        for c in first_row.index:
+def merge_duplicate_ids(dataframe, merge_on: str):
 
-                            data = first_row[c]
-                            dtype = type(data)
-                            dtype_str = str(dtype)
-                            str_data = str(data)
+    """
+    Takes a DataFrame and merges rows with duplicate IDs.
 
-                            if ((data is None) 
-                                or (data is np.nan) 
-                                or ((dtype == str) and (data == '')) 
-                                or ((dtype == str) and (data == '[]'))
-                                or ((dtype == str) and (data == '[]'))
-                                or  ((dtype == str) and (data == 'None'))
-                                or  ((dtype == str) and (data == 'none'))
-                                or ((dtype == list) and (data == []))
-                                or (str_data == '[]')
-                                or (str_data == '{}')
-                                ):
-                                    first_row[c] = row[c]
-                                    continue
-                            
-                            else:
-                                if '.Results' in dtype_str:
-                                    data2 = row[c]
-                                    dtype2 = type(data2)
-                                    dtype_str2 = str(dtype2)
-                                    if (dtype2 == pd.DataFrame) or ('.Results' in dtype_str2):
-                                        data2_copy = data2.copy(deep=True)
-                                        first_row[c].add_dataframe(data2_copy)
-                                        first_row[c].remove_duplicates()
-                                    continue
-
-                                if ('.Authors' in dtype_str) or ('.Funders' in dtype_str) or ('.Affiliations' in dtype_str):
-                                    data2 = row[c]
-                                    dtype2 = type(data2)
-                                    dtype_str2 = str(dtype2)
-
-                                    if ('.Authors' in dtype_str2) or ('.Funders' in dtype_str2) or ('.Affiliations' in dtype_str2):
-                                        concat_df = pd.concat([data.all, data2.all])
-                                        concat_df = deduplicate(concat_df)
-                                        first_row[c].all = concat_df
-                                    continue
-  
-                    try:
-                        first_row = pd.Series(first_row)
-                        df.loc[first_index] = first_row
-                    except:
-                        pass
+    Parameters
+    ----------
+    dataframe : Results, References or pandas.DataFrame
+        dataframe to process.
+    merge_on : str
+        name of column containing IDs to merge on.
+    
+    Returns
+    -------
+    dataframe : Results, References or pandas.DataFrame
+        processed DataFrame.
+    """
 
-                    df = df.drop(labels=duplicate_indexes)
-        
-        dataframe = df
+    groups = group_duplicate_ids(dataframe, id_names = [merge_on])
 
-    return dataframe
+    return merge_duplicate_groups(dataframe, groups)
 
 def merge_all_duplicate_ids(dataframe):
 
@@ -1423,21 +1584,31 @@ def merge_all_duplicate_ids(dataframe):
     Notes
     -----
     Bibliometric identifiers used to check for duplicate records: DOI, ISBN, ISSN, URI, ORCID, CrossRef ID, Scopus, Web of Science, PubMed, address, URL, website.
+    
+    Rows sharing a DOI or ISBN are grouped transitively in a single pass, and each group is merged once. Rows sharing other identifiers are then merged one column at a time.
     """
 
-    id_names = ['doi', 'isbn', 'issn', 'uri', 'orcid', 'crossref_id', 'crossref', 'scopus_id', 'scopus', 'wos_id', 'wos', 'pubmed_id', 'address', 'link', 'website']
-    df = dataframe.copy(deep=True)
+    global merge_id_names, transitive_id_names
+    id_names = [i for i in merge_id_names if i in dataframe.columns]
+    transitive = [i for i in id_names if i in transitive_id_names]
+
+    groups = group_duplicate_ids(dataframe, id_names = transitive)
+    dataframe = merge_duplicate_groups(dataframe, groups)
 
     for i in id_names:
-        if i in dataframe.columns:
-            dataframe = merge_duplicate_ids(dataframe, merge_on = i)
+        if i not in transitive:
+            groups = group_duplicate_ids(dataframe, id_names = [i])
+            if len(groups) > 0:
+                dataframe = merge_duplicate_groups(dataframe, groups)
     
     return dataframe
 
-def deduplicate(dataframe):
+def deduplicate(dataframe, reset_index: bool = True, compare_columns = None):
 
     """
     Deduplicates custom ART DataFrames (Results, References, Authors.summary, Funders.summary, Affiliations.summary) using unique identifiers.
+
+    If reset_index is False, the surviving rows keep their original index labels. Rows are compared on the columns given by compare_columns; if None, on all columns without empty cells.
     """
 
     ignore_cols = ['work_id',
@@ -1466,7 +1637,10 @@ def deduplicate(dataframe):
         df['doi'] = df['doi'].str.replace('https://', '', regex = False).str.replace('http://', '', regex = False).str.replace('dx.', '', regex = False).str.replace('doi.org/', '', regex = False).str.replace('doi/', '', regex = False)
 
     # Creating dataframe without empty columns; converting to string to avoid errors
-    df_dropna = df.dropna(axis=1).astype(str)
+    if compare_columns is None:
+        df_dropna = df.dropna(axis=1).astype(str)
+    else:
+        df_dropna = df[[c for c in compare_columns if c in df.columns]].astype(str)
 
     # Converting strings to lowercase to improve matching
     for c in df_dropna.columns:
@@ -1486,6 +1660,223 @@ def deduplicate(dataframe):
     # Checking for duplicate UIDs; merging rows that share UIDs
     df3 = merge_all_duplicate_ids(df2)
 
+    if reset_index == False:
+        return df3
+
     final_df = df3.reset_index().drop('index', axis=1)
 
-    return final_df
\ No newline at end of file
+    return final_df
+
+def deduplicate_changed(dataframe, changed: list):
+
+    """
+    Deduplicates custom ART DataFrames, comparing only rows which have changed and rows which share an identifier or name with a changed row. Assumes that the unchanged rows have already been deduplicated.
+
+    Parameters
+    ----------
+    dataframe : Results, References or pandas.DataFrame
+        dataframe to process.
+    changed : list
+        index labels of changed rows.
+    
+    Returns
+    -------
+    dataframe : Results, References or pandas.DataFrame
+        processed DataFrame. Surviving rows keep their original index labels and order.
+    """
+
+    if len(changed) == 0:
+        return dataframe.copy(deep=True)
+
+    global merge_id_names
+    match_cols = [c for c in merge_id_names + ['work_id', 'title', 'full_name', 'name'] if c in dataframe.columns]
+
+    # Selecting changed rows and rows sharing an identifier or name with them
+    candidates = dataframe.index.isin(changed)
+    for c in match_cols:
+        col = dataframe[c].map(lambda x: None if is_empty_cell(x) else str(x).strip().lower())
+        changed_values = set(col[dataframe.index.isin(changed)].dropna())
+        if len(changed_values) > 0:
+            candidates = candidates | col.isin(changed_values).to_numpy()
+
+    # Comparing the columns a full deduplication would compare: those without empty cells in the whole dataframe
+    compare_columns = dataframe.columns[dataframe.notna().all(axis=0).to_numpy()].to_list()
+
+    subset = dataframe[candidates]
+    deduplicated = deduplicate(subset, reset_index=False, compare_columns=compare_columns)
+
+    if len(deduplicated) == len(subset):
+        return dataframe.copy(deep=True)
+
+    dropped = set(subset.index).difference(set(deduplicated.index))
+    df = dataframe[~dataframe.index.isin(list(dropped))].copy(deep=True)
+
+    # Replacing surviving rows with their merged versions
+    labels = deduplicated.index.to_list()
+    positions = df.index.get_indexer(labels)
+    for c in df.columns:
+        if c not in deduplicated.columns:
+            continue
+        values = df[c].to_numpy(dtype=object, copy=True)
+        merged = deduplicated[c].to_numpy(dtype=object)
+        changed_col = False
+        for pos, value in zip(positions, merged):
+            if values[pos] is not value:
+                values[pos] = value
+                changed_col = True
+        if changed_col == True:
+            new_col = pd.Series(values, index=df.index, name=c)
+            if df[c].dtype != object:
+                new_col = new_col.infer_objects()
+            df[c] = new_col
+
+    return df
+
+def get_first_author_name(authors) -> str:
+
+    """
+    Returns the lowercased family name of the first author in an Authors object, list or string of author names. Returns an empty string if no name is found.
+    """
+
+    authors = materialize(authors)
+
+    if is_empty_cell(authors) == True:
+        return ''
+
+    if '.Authors' in str(type(authors)):
+        summary = authors.summary
+        if 'family_name' in summary.columns:
+            names = summary['family_name'].dropna()
+            names = names[names.astype(str).str.strip() != '']
+            if len(names) > 0:
+                return str(names.iloc[0]).strip().lower()
+        if ('full_name' in summary.columns) and (len(summary) > 0):
+            authors = summary['full_name'].iloc[0]
+        else:
+            return ''
+
+    if type(authors) == list:
+        authors = str(authors[0])
+
+    authors = str(authors).replace('[','').replace(']','').replace("'", "").replace('"', '')
+    first = authors.split(';')[0].split(',')[0].strip().lower()
+
+    if first == '':
+        return ''
+
+    return first.split(' ')[-1]
+
+def near_duplicate_texts(dataframe) -> pd.Series:
+
+    """
+    Returns normalised 'title first-author' strings used to compare records for near-duplicate detection. Punctuation and case are removed.
+    """
+
+    if 'title' in dataframe.columns:
+        titles = dataframe['title'].map(lambda x: '' if is_empty_cell(x) else str(x))
+        titles = titles.str.lower().str.replace(r'[^\w\s]', ' ', regex=True).str.replace(r'\s+', ' ', regex=True).str.strip()
+    else:
+        titles = pd.Series('', index=dataframe.index)
+
+    if 'authors' in dataframe.columns:
+        first_authors = dataframe['authors'].map(get_first_author_name).str.replace(r'[^\w\s]', '', regex=True)
+    else:
+        first_authors = pd.Series('', index=dataframe.index)
+
+    texts = (titles + ' ' + first_authors).str.strip()
+
+    # Records without titles are not compared
+    texts[titles == ''] = ''
+
+    return texts.reset_index(drop=True)
+
+def find_near_duplicate_pairs(dataframe, threshold: float = 0.8, num_perm: int = 128) -> list:
+
+    """
+    Finds pairs of rows with near-duplicate titles and first authors using MinHash locality-sensitive hashing.
+
+    Parameters
+    ----------
+    dataframe : Results, References or pandas.DataFrame
+        dataframe to process.
+    threshold : float
+        minimum Jaccard similarity of the rows' character shingles for them to count as near-duplicates. Defaults to 0.8.
+    num_perm : int
+        number of MinHash permutations. More permutations improve accuracy at the cost of speed. Defaults to 128.
+    
+    Returns
+    -------
+    pairs : list
+        a list of (position, position, similarity) tuples.
+    
+    Notes
+    -----
+    Candidate pairs are found in sub-quadratic time by banding MinHash signatures, then verified using the exact Jaccard similarity. Rows with different, non-empty DOIs are not treated as near-duplicates.
+    """
+
+    texts = near_duplicate_texts(dataframe)
+    positions = texts[texts != ''].index.to_numpy()
+
+    if len(positions) < 2:
+        return []
+
+    shingle_sets = [shingle(texts[pos]) for pos in positions]
+    signatures = minhash_signatures(shingle_sets, num_perm = num_perm)
+    candidates = lsh_candidate_pairs(signatures, threshold = threshold)
+
+    if 'doi' in dataframe.columns:
+        dois = dataframe['doi'].reset_index(drop=True).map(lambda x: None if is_empty_cell(x) else str(x).lower().strip())
+    else:
+        dois = pd.Series(None, index=texts.index, dtype=object)
+
+    pairs = []
+    for i, j in candidates:
+
+        similarity = jaccard_similarity(shingle_sets[i], shingle_sets[j])
+        if similarity < threshold:
+            continue
+
+        pos_i = int(positions[i])
+        pos_j = int(positions[j])
+        doi_i = dois[pos_i]
+        doi_j = dois[pos_j]
+        if (doi_i is not None) and (doi_j is not None) and (doi_i != doi_j):
+            continue
+
+        pairs.append((pos_i, pos_j, similarity))
+
+    return pairs
+
+def merge_near_duplicates(dataframe, threshold: float = 0.8, num_perm: int = 128):
+
+    """
+    Takes a DataFrame and merges rows with near-duplicate titles and first authors. Rows with different, non-empty DOIs are never merged, including through chains of near-duplicates.
+
+    Parameters
+    ----------
+    dataframe : Results, References or pandas.DataFrame
+        dataframe to process.
+    threshold : float
+        minimum Jaccard similarity of the rows' character shingles for them to be merged. Defaults to 0.8.
+    num_perm : int
+        number of MinHash permutations. Defaults to 128.
+    
+    Returns
+    -------
+    dataframe : Results, References or pandas.DataFrame
+        processed DataFrame.
+    """
+
+    pairs = find_near_duplicate_pairs(dataframe, threshold = threshold, num_perm = num_perm)
+
+    # Grouping the most similar pairs first; pairs which would put rows with different DOIs in the same group are skipped
+    pairs = sorted(pairs, key = lambda pair: pair[2], reverse = True)
+
+    if 'doi' in dataframe.columns:
+        dois = dataframe['doi'].map(lambda x: None if is_empty_cell(x) else str(x).lower().strip()).to_list()
+    else:
+        dois = None
+
+    groups = group_pairs([(i, j) for i, j, similarity in pairs], length = len(dataframe), keys = dois)
+
+    return merge_duplicate_groups(dataframe, groups)
@@ -0,0 +1,698 @@
+"""SQLite storage for ART Reviews."""
+
+import os
+import re
+import json
+import pickle
+import sqlite3
+import functools
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .lazy import materialize
+from .indexes import cell_to_text, tokenize_text, is_phrase_query
+from .cleaners import strip_list_str
+
+# The header of SQLite database files
+magic = b'SQLite format 3\x00'
+
+schema_version = 1
+
+# Names of the columns holding each row's position and index label
+position_col = 'art:position'
+label_col = 'art:label'
+
+# Columns which are indexed in each table, by section
+indexed_cols = {
+                'results': ['work_id', 'doi', 'isbn', 'issn', 'scopus_id', 'wos_id', 'pubmed_id', 'link'],
+                'authors/summary': ['author_id', 'orcid', 'full_name'],
+                'funders/summary': ['funder_id', 'crossref_id', 'name'],
+                'affiliations/summary': ['affiliation_id', 'crossref_id', 'name'],
+                }
+
+# Sections which can be searched (see ReviewDatabase.search). Their pickled objects' search text is stored alongside them
+searchable_sections = ['results', 'authors/summary', 'funders/summary', 'affiliations/summary']
+
+# The table of keywords associated with results, used for keyword frequencies
+keywords_table = 'results:keywords'
+
+# SQLite limits the number of parameters in a statement
+max_params = 500
+
+def is_review_database(file_path) -> bool:
+
+    """
+    Returns True if a file is an SQLite database.
+    """
+
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(magic)) == magic
+    except OSError:
+        return False
+
+def quote(name: str) -> str:
+
+    """
+    Quotes a table or column name for use in an SQL statement.
+    """
+
+    return '"' + str(name).replace('"', '""') + '"'
+
+def text_col(column: str) -> str:
+
+    """
+    Returns the name of the column holding the search text of an object column's pickled values.
+    """
+
+    return f'{column}:text'
+
+def encode_cell(value):
+
+    """
+    Encodes an object cell for storage: strings and None are stored as they are; other objects (including NaNs) are pickled.
+    """
+
+    value = materialize(value)
+
+    if (value is None) or (type(value) == str):
+        return value
+
+    return pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL)
+
+def decode_cell(value):
+
+    """
+    Decodes a stored object cell (see encode_cell).
+    """
+
+    if type(value) == bytes:
+        return pickle.loads(value)
+
+    return value
+
+@functools.lru_cache(maxsize = 256)
+def phrase_pattern(keyword: str, case_sensitive: bool):
+
+    """
+    Returns the regular expression used to match a phrase query (see KeywordIndex.match).
+    """
+
+    tokens = tokenize_text(keyword.strip()[1:-1])
+
+    if len(tokens) == 0:
+        return None
+
+    return re.compile(r'(?<!\w)' + r'\W+'.join(re.escape(t) for t in tokens) + r'(?!\w)', flags = 0 if case_sensitive == True else re.IGNORECASE)
+
+def match_text(value, keyword: str, case_sensitive) -> int:
+
+    """
+    Returns 1 if a stored value's text matches a search keyword, using the same rules as Results.search; otherwise, returns 0. Registered as the art_match SQL function.
+    """
+
+    text = cell_to_text(value)
+
+    if is_phrase_query(keyword) == True:
+        pattern = phrase_pattern(keyword, case_sensitive == True)
+        return int((pattern is not None) and (pattern.search(text) is not None))
+
+    if case_sensitive == True:
+        return int(keyword in text)
+
+    return int(keyword.lower() in text.lower())
+
+def contains_text(value, query: str) -> int:
+
+    """
+    Returns 1 if a stored value's lowercase text contains a query, as used by Entities.search; otherwise, returns 0. Registered as the art_contains SQL function.
+    """
+
+    if value is None:
+        return 0
+
+    return int(query in str(value).lower())
+
+def cell_keywords(value) -> list:
+
+    """
+    Returns the cleaned keywords in a keywords cell, as counted by Results.get_keywords.
+    """
+
+    value = materialize(value)
+
+    if type(value) == str:
+        value = strip_list_str(value)
+
+    if type(value) != list:
+        return []
+
+    output = []
+
+    for keyword in value:
+
+        if (keyword is None) or ((type(keyword) == float) and (keyword != keyword)):
+            continue
+
+        keyword = str(keyword).strip().lower()
+
+        if keyword != 'none':
+            output.append(keyword)
+
+    return output
+
+def encode_columns(dataframe: pd.DataFrame, searchable: bool = True):
+
+    """
+    Converts a dataframe's columns to lists of stored values.
+
+    Numeric columns are stored natively, with missing values as NULLs. Other columns are stored as object cells (see encode_cell). If the dataframe is searchable, object cells which are pickled have their search text stored alongside them, so that they can be searched without being unpickled.
+
+    Returns
+    -------
+    result : tuple
+        the table's column information and a list of columns of stored values.
+    """
+
+    info = []
+    values = []
+
+    for c in dataframe.columns:
+
+        series = dataframe[c]
+
+        if (type(series.dtype) == np.dtype) and (series.dtype.kind in 'iuf'):
+            column = [None if v != v else v for v in series.to_numpy().tolist()]
+            info.append({'name': str(c), 'dtype': series.dtype, 'native': True, 'text': False})
+            values.append(column)
+            continue
+
+        cells = [materialize(v) for v in series.astype(object).to_numpy()]
+        column = [encode_cell(v) for v in cells]
+        has_text = (searchable == True) and any(type(v) == bytes for v in column)
+
+        info.append({'name': str(c), 'dtype': series.dtype, 'native': False, 'text': has_text})
+        values.append(column)
+
+        if has_text == True:
+            values.append([cell_to_text(v) if type(e) == bytes else None for v, e in zip(cells, column)])
+
+    return info, values
+
+def write_table(connection, name: str, dataframe: pd.DataFrame, kind: str = 'frame') -> dict:
+
+    """
+    Writes a dataframe to a table in an SQLite database, with indexes on its identifier columns.
+
+    Returns
+    -------
+    info : dict
+        details of the table's columns, index and kind, used to read it (see ReviewDatabase.select).
+    """
+
+    global indexed_cols, searchable_sections
+
+    columns, values = encode_columns(dataframe, searchable = name in searchable_sections)
+
+    sql_cols = [quote(position_col) + ' INTEGER PRIMARY KEY', quote(label_col)]
+    for column in columns:
+        sql_cols.append(quote(column['name']))
+        if column['text'] == True:
+            sql_cols.append(quote(text_col(column['name'])) + ' TEXT')
+
+    connection.execute(f'CREATE TABLE {quote(name)} ({", ".join(sql_cols)})')
+
+    labels = [encode_cell(v) if type(v) not in (int, str) else v for v in dataframe.index.to_list()]
+    rows = zip(range(len(dataframe)), labels, *values)
+    placeholders = ', '.join(['?'] * (len(values) + 2))
+    connection.executemany(f'INSERT INTO {quote(name)} VALUES ({placeholders})', rows)
+
+    for i, c in enumerate(indexed_cols.get(name, [])):
+        if c in dataframe.columns:
+            connection.execute(f'CREATE INDEX {quote(name + ":index:" + str(i))} ON {quote(name)} ({quote(c)})')
+
+    if (name == 'results') and ('keywords' in dataframe.columns):
+
+        connection.execute(f'CREATE TABLE {quote(keywords_table)} (position INTEGER, keyword TEXT)')
+        rows = ((i, keyword) for i, value in enumerate(dataframe['keywords'].to_numpy()) for keyword in cell_keywords(value))
+        connection.executemany(f'INSERT INTO {quote(keywords_table)} VALUES (?, ?)', rows)
+        connection.execute(f'CREATE INDEX {quote(keywords_table + ":index")} ON {quote(keywords_table)} (keyword)')
+
+    return {
+            'kind': kind,
+            'columns': columns,
+            'index_name': dataframe.index.name,
+            'index_dtype': dataframe.index.dtype
+            }
+
+def write_review_database(file_path, sections, metadata = None):
+
+    """
+    Writes a Review's sections to an SQLite database (see Review.export_database). The database is written to a temporary file, which then replaces any existing file.
+
+    Parameters
+    ----------
+    file_path : str
+        path of the database file.
+    sections : iterable
+        (name, kind, value) sections, where kind is 'frame' (a dataframe, stored as a table), 'json' (a dataframe in pandas' 'split' orientation, stored as a table) or 'object' (pickled).
+    metadata : dict
+        JSON metadata to store with the sections (e.g. the Review's properties). Defaults to None.
+    """
+
+    if metadata is None:
+        metadata = dict()
+
+    temp_path = str(file_path) + '.tmp'
+
+    if os.path.exists(temp_path) == True:
+        os.remove(temp_path)
+
+    connection = sqlite3.connect(temp_path)
+
+    try:
+        # The database is only moved into place once complete, so journalling is not needed
+        connection.execute('PRAGMA journal_mode = OFF')
+        connection.execute('PRAGMA synchronous = OFF')
+
+        connection.execute('CREATE TABLE "art:metadata" (key TEXT PRIMARY KEY, value TEXT)')
+        connection.execute('CREATE TABLE "art:sections" (name TEXT PRIMARY KEY, position INTEGER, kind TEXT, data BLOB)')
+
+        for position, (name, kind, value) in enumerate(sections):
+
+            if kind == 'frame':
+                data = write_table(connection, name, value)
+
+            elif kind == 'json':
+                frame = pd.DataFrame(value['data'], index = value['index'], columns = value['columns'], dtype = object)
+                data = write_table(connection, name, frame, kind = 'json')
+
+            else:
+                data = value
+
+            connection.execute('INSERT INTO "art:sections" VALUES (?, ?, ?, ?)', (name, position, kind, pickle.dumps(data, protocol = pickle.HIGHEST_PROTOCOL)))
+
+        connection.execute('INSERT INTO "art:metadata" VALUES (?, ?)', ('version', json.dumps(schema_version)))
+        connection.execute('INSERT INTO "art:metadata" VALUES (?, ?)', ('metadata', json.dumps(metadata, default = str)))
+        connection.commit()
+
+    finally:
+        connection.close()
+
+    os.replace(temp_path, file_path)
+
+class ReviewDatabase:
+
+    """
+    This is a ReviewDatabase object. It provides access to a Review stored in an SQLite database (see Review.export_database). Sections are read in the same way as from sectioned .review files, and searches, lookups and keyword frequencies are run as SQL queries, so that only matching rows are read.
+
+    Parameters
+    ----------
+    file_path : str
+        path of the database file.
+
+    Attributes
+    ----------
+    file_path : str
+        path of the database file.
+    connection : sqlite3.Connection
+        a read-only connection to the database.
+    sections : dict
+        the database's sections. Keys: section names. Values: kinds ('frame', 'json' or 'object').
+    section_data : dict
+        the details of tables, and objects, which have been read from the database.
+    metadata : dict
+        the metadata stored with the sections.
+    """
+
+    def __init__(self, file_path):
+
+        """
+        Initialises ReviewDatabase instance.
+
+        Parameters
+        ----------
+        file_path : str
+            path of the database file.
+        """
+
+        global schema_version
+
+        self.file_path = str(file_path)
+        self.connection = sqlite3.connect(Path(file_path).absolute().as_uri() + '?mode=ro', uri = True)
+
+        self.connection.create_function('art_match', 3, match_text, deterministic = True)
+        self.connection.create_function('art_contains', 2, contains_text, deterministic = True)
+
+        values = dict(self.connection.execute('SELECT key, value FROM "art:metadata"').fetchall())
+
+        if json.loads(values.get('version', '1')) > schema_version:
+            raise ValueError('Database was written by a newer version of ART')
+
+        self.metadata = json.loads(values.get('metadata', '{}'))
+        self.sections = dict(self.connection.execute('SELECT name, kind FROM "art:sections" ORDER BY position').fetchall())
+        self.section_data = dict()
+
+    def __contains__(self, name) -> bool:
+
+        """
+        Returns True if the database has a section with the given name.
+        """
+
+        return name in self.sections.keys()
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how ReviewDatabase objects are represented in string form.
+        """
+
+        return f'ReviewDatabase({self.file_path!r}, sections: {len(self.sections)})'
+
+    def data(self, name: str):
+
+        """
+        Returns a section's stored data: details of its table, or the object stored. Data is read when first used.
+        """
+
+        if name not in self.section_data.keys():
+            data = self.connection.execute('SELECT data FROM "art:sections" WHERE name = ?', (name,)).fetchone()[0]
+            self.section_data[name] = pickle.loads(data)
+
+        return self.section_data[name]
+
+    def columns(self, name: str) -> list:
+
+        """
+        Returns the names of the columns of a table.
+        """
+
+        return [c['name'] for c in self.data(name)['columns']]
+
+    def select(self, name: str, columns = None, where: str = None, params = ()) -> pd.DataFrame: # type: ignore
+
+        """
+        Reads the rows of a table which meet a condition.
+
+        Parameters
+        ----------
+        name : str
+            name of the table's section.
+        columns : list
+            names of columns to read. Defaults to all columns.
+        where : str
+            an SQL condition. Defaults to None (all rows).
+        params : tuple
+            parameters for the condition.
+
+        Returns
+        -------
+        result : pandas.DataFrame
+            the matching rows, in the table's order.
+        """
+
+        return self.decode_rows(name, columns, self.fetch(name, columns = columns, where = where, params = params))
+
+    def column_info(self, name: str, columns = None) -> list:
+
+        """
+        Returns the stored details of a table's columns.
+        """
+
+        column_info = self.data(name)['columns']
+
+        if columns is not None:
+            column_info = [c for c in column_info if c['name'] in columns]
+
+        return column_info
+
+    def fetch(self, name: str, columns = None, where: str = None, params = ()) -> list: # type: ignore
+
+        """
+        Returns the stored rows of a table which meet a condition, in the table's order. Each row begins with its position and index label.
+        """
+
+        sql_cols = ', '.join([quote(position_col), quote(label_col)] + [quote(c['name']) for c in self.column_info(name, columns)])
+        statement = f'SELECT {sql_cols} FROM {quote(name)}'
+
+        if where is not None:
+            statement = statement + f' WHERE {where}'
+
+        return self.connection.execute(statement + f' ORDER BY {quote(position_col)}', tuple(params)).fetchall()
+
+    def decode_rows(self, name: str, columns, rows: list) -> pd.DataFrame:
+
+        """
+        Converts rows read from a table to a dataframe, restoring the types of its columns and index.
+        """
+
+        info = self.data(name)
+        column_info = self.column_info(name, columns)
+
+        values = list(zip(*rows)) if len(rows) > 0 else [[] for i in range(len(column_info) + 2)]
+        index = pd.Index([decode_cell(v) for v in values[1]], name = info['index_name'], dtype = object)
+
+        if info['index_dtype'] != object:
+            index = index.astype(info['index_dtype'])
+
+        columns = dict()
+
+        for c, column in zip(column_info, values[2:]):
+
+            if c['native'] == True:
+                series = pd.Series(column, index = index, dtype = object)
+            else:
+                series = pd.Series([decode_cell(v) for v in column], index = index, dtype = object)
+
+            if c['dtype'] != object:
+                series = series.astype(c['dtype'])
+
+            columns[c['name']] = series
+
+        frame = pd.DataFrame(columns, index = index)
+
+        # Keeping the table's column order when there are no rows
+        return frame.reindex(columns = [c['name'] for c in column_info])
+
+    def read(self, name: str):
+
+        """
+        Reads a section: tables as dataframes (or, for 'json' sections, dictionaries in pandas' 'split' orientation); other sections as the objects stored.
+        """
+
+        kind = self.sections[name]
+
+        if kind == 'frame':
+            return self.select(name)
+
+        if kind == 'json':
+            return self.select(name).to_dict(orient = 'split')
+
+        # Objects are only needed once, when their section is loaded
+        data = self.data(name)
+        del self.section_data[name]
+
+        return data
+
+    def search_expression(self, name: str, column: str) -> str:
+
+        """
+        Returns the SQL expression giving a column's search text: the stored value, or the search text of pickled values.
+        """
+
+        info = {c['name']: c for c in self.data(name)['columns']}[column]
+
+        if info['text'] == True:
+            return f'coalesce({quote(text_col(column))}, {quote(column)})'
+
+        return quote(column)
+
+    def search(self, name: str = 'results', fields = 'all', any_kwds = None, all_kwds = None, not_kwds = None, case_sensitive: bool = False) -> pd.DataFrame:
+
+        """
+        Searches a table for keywords, using the same rules as Results.search.
+
+        Parameters
+        ----------
+        name : str
+            name of the table's section. Defaults to 'results'.
+        fields : str or list
+            names of one or fields to search. Defaults to 'all'.
+        any_kwds : list
+            keywords to search for. Returns rows where *any* matches are found. Defaults to None.
+        all_kwds : list
+            keywords to search for. Returns rows where *all* matches are found. Defaults to None.
+        not_kwds : list
+            keywords to search for. Returns rows where *no* matches are found. Defaults to None.
+        case_sensitive : bool
+            whether to pay attention to the case of string data. Defaults to False.
+
+        Returns
+        -------
+        result : pandas.DataFrame
+            the matching rows.
+        """
+
+        table_cols = self.columns(name)
+
+        if fields == 'all':
+            fields = table_cols
+
+        if type(fields) == str:
+            fields = [fields]
+
+        expressions = [self.search_expression(name, c) for c in fields if c in table_cols]
+        params = []
+
+        def matching(keyword):
+            if len(expressions) == 0:
+                return '0'
+            params.extend([str(keyword), case_sensitive == True] * len(expressions))
+            return '(' + ' OR '.join([f'art_match({e}, ?, ?)' for e in expressions]) + ')'
+
+        conditions = []
+
+        if (any_kwds is not None) and (len(any_kwds) > 0):
+            conditions.append('(' + ' OR '.join([matching(k) for k in any_kwds]) + ')')
+
+        elif (all_kwds is None) or (len(all_kwds) == 0):
+            conditions.append('1')
+
+        if all_kwds is not None:
+            conditions = conditions + [matching(k) for k in all_kwds]
+
+        if len(conditions) == 0:
+            conditions.append('0')
+
+        if not_kwds is not None:
+            conditions = conditions + [f'NOT {matching(k)}' for k in not_kwds]
+
+        return self.select(name, where = ' AND '.join(conditions), params = params)
+
+    def search_entities(self, name: str, query: str) -> pd.DataFrame:
+
+        """
+        Searches an entities summary table for a string, using the same rules as Entities.search: queries joined by 'AND' or '&' must all match.
+
+        Parameters
+        ----------
+        name : str
+            name of the entities: 'authors', 'funders' or 'affiliations'.
+        query : str
+            a string to search for.
+
+        Returns
+        -------
+        result : pandas.DataFrame
+            the matching summary rows.
+        """
+
+        section = f'{name}/summary'
+        query = query.strip()
+
+        if 'AND' in query:
+            queries = [i.strip() for i in query.split('AND')]
+        elif '&' in query:
+            queries = [i.strip() for i in query.split('&')]
+        else:
+            queries = [query]
+
+        expressions = [self.search_expression(section, c) for c in self.columns(section)]
+        conditions = []
+        params = []
+
+        for q in queries:
+            if len(expressions) == 0:
+                conditions.append('0')
+                continue
+            conditions.append('(' + ' OR '.join([f'art_contains({e}, ?)' for e in expressions]) + ')')
+            params.extend([q.lower()] * len(expressions))
+
+        result = self.select(section, where = ' AND '.join(conditions), params = params)
+
+        return result[~result.astype(str).duplicated()]
+
+    def select_keys(self, name: str, column: str, keys, columns = None) -> pd.DataFrame:
+
+        """
+        Reads the rows of a table where a column equals one of a list of keys. Uses the column's index if it has one (e.g. for work IDs, DOIs and author IDs).
+
+        Parameters
+        ----------
+        name : str
+            name of the table's section.
+        column : str
+            name of the column to match.
+        keys : list
+            values to look up.
+        columns : list
+            names of columns to read. Defaults to all columns.
+
+        Returns
+        -------
+        result : pandas.DataFrame
+            the matching rows, in the table's order.
+        """
+
+        if column not in self.columns(name):
+            return self.select(name, columns = columns, where = '0')
+
+        keys = list(keys)
+        rows = []
+
+        for start in range(0, len(keys), max_params):
+            chunk = keys[start:start + max_params]
+            placeholders = ', '.join(['?'] * len(chunk))
+            rows.extend(self.fetch(name, columns = columns, where = f'{quote(column)} IN ({placeholders})', params = chunk))
+
+        # Restoring the table's order across chunks
+        rows.sort(key = lambda row: row[0])
+
+        return self.decode_rows(name, columns, rows)
+
+    def keyword_frequencies(self) -> pd.Series:
+
+        """
+        Returns a Pandas Series containing the frequencies of all keywords associated with results, as given by Results.keyword_frequencies.
+        """
+
+        if self.connection.execute("SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = ?", (keywords_table,)).fetchone()[0] == 0:
+            return pd.Series(dtype = 'int64', name = 'count')
+
+        rows = self.connection.execute(f'SELECT keyword, count(*) AS n FROM {quote(keywords_table)} GROUP BY keyword ORDER BY n DESC, min(rowid)').fetchall()
+
+        return pd.Series([n for k, n in rows], index = pd.Index([k for k, n in rows], name = 0), dtype = 'int64', name = 'count')
+
+    def filter_by_keyword_frequency(self, cutoff = 3):
+
+        """
+        Reads the results which match keywords that meet a frequency cutoff, as given by Results.filter_by_keyword_frequency.
+
+        Returns
+        -------
+        result : tuple
+            the matching rows, and a list of the keywords which meet the cutoff.
+        """
+
+        frequencies = self.keyword_frequencies()
+        frequent_kws = list(frequencies[frequencies.values > cutoff].index)
+
+        if len(frequent_kws) == 0:
+            return self.select('results', where = '0'), frequent_kws
+
+        output = self.search('results', any_kwds = frequent_kws)
+
+        if 'title' in output.columns:
+            output = output[~output['title'].astype(str).duplicated()]
+
+        return output, frequent_kws
+
+    def close(self):
+
+        """
+        Closes the database connection.
+        """
+
+        self.connection.close()
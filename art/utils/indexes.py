@@ -0,0 +1,1398 @@
+"""Index structures for fast lookups on ART dataframes."""
+
+import re
+import weakref
+
+import numpy as np
+import pandas as pd
+
+id_cols = [
+            'work_id',
+            'doi',
+            'isbn',
+            'issn',
+            'scopus_id',
+            'wos_id',
+            'pubmed_id',
+            'link'
+            ]
+
+class IdentifierIndex:
+
+    """
+    This is an IdentifierIndex object. It is a hash index mapping identifier values (e.g. work IDs, DOIs, ISBNs) to the rows of a dataframe that contain them.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        a dataframe to index. Defaults to None.
+    columns : list
+        names of identifier columns to index. Defaults to the work ID, DOI, ISBN, ISSN, Scopus ID, WoS ID, PubMed ID and link columns.
+    ignore_case : bool
+        whether to index identifiers as lowercase strings. If False, raw values are used as keys. Defaults to True.
+
+    Attributes
+    ----------
+    ids : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping identifier values to lists of row labels.
+    row_keys : dict
+        a dictionary mapping row labels to the (column, identifier) pairs indexed for that row.
+    row_count : int
+        the number of rows in the dataframe when the index was last stamped.
+    """
+
+    def __init__(self, dataframe = None, columns = None, ignore_case = True):
+
+        """
+        Initialises IdentifierIndex instance.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe to index. Defaults to None.
+        columns : list
+            names of identifier columns to index. Defaults to the work ID, DOI, ISBN, ISSN, Scopus ID, WoS ID, PubMed ID and link columns.
+        ignore_case : bool
+            whether to index identifiers as lowercase strings. If False, raw values are used as keys. Defaults to True.
+        """
+
+        if columns is None:
+            global id_cols
+            columns = id_cols
+
+        self.columns = list(columns)
+        self.ignore_case = ignore_case
+        self.ids = {c: dict() for c in self.columns}
+        self.row_keys = dict()
+        self.row_count = 0
+        self.frame_ref = None
+
+        if dataframe is not None:
+            self.build(dataframe)
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how IdentifierIndex objects are represented in string form.
+        """
+
+        counts = {c: len(self.ids[c]) for c in self.columns}
+        return f'IdentifierIndex of {len(self.row_keys)} rows: {counts}'
+
+    def __len__(self) -> int:
+
+        """
+        Returns the number of rows in the index.
+        """
+
+        return len(self.row_keys)
+
+    def make_key(self, value):
+
+        """
+        Converts an identifier value to an index key. Returns None if the value cannot be indexed.
+        """
+
+        if self.ignore_case == True:
+            key = str(value).lower()
+            if key == '':
+                return None
+            return key
+
+        try:
+            hash(value)
+        except TypeError:
+            return None
+
+        return value
+
+    def build(self, dataframe: pd.DataFrame):
+
+        """
+        Clears the index and indexes all rows of a dataframe.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the dataframe to index.
+        """
+
+        self.ids = {c: dict() for c in self.columns}
+        self.row_keys = dict()
+        self.add_rows(dataframe)
+        self.stamp(dataframe)
+
+        return self
+
+    def add_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Adds rows to the index. Rows are identified by their index labels.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the rows to index.
+        """
+
+        for c in self.columns:
+
+            if c not in dataframe.columns:
+                continue
+
+            col = dataframe[c]
+            col = col[~col.isna()]
+
+            if self.ignore_case == True:
+                col = col.map(str).str.lower()
+                col = col[col != '']
+
+            col_ids = self.ids[c]
+
+            for label, value in zip(col.index, col.values):
+
+                key = self.make_key(value) if self.ignore_case == False else value
+                if key is None:
+                    continue
+
+                if key in col_ids:
+                    col_ids[key].append(label)
+                else:
+                    col_ids[key] = [label]
+
+                if label in self.row_keys:
+                    self.row_keys[label].append((c, key))
+                else:
+                    self.row_keys[label] = [(c, key)]
+
+        for label in dataframe.index:
+            if label not in self.row_keys:
+                self.row_keys[label] = []
+
+        return self
+
+    def drop_rows(self, labels):
+
+        """
+        Removes rows from the index.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the rows to remove.
+        """
+
+        for label in labels:
+
+            if label not in self.row_keys:
+                continue
+
+            for c, key in self.row_keys[label]:
+                col_ids = self.ids[c]
+                if key in col_ids:
+                    remaining = [i for i in col_ids[key] if i != label]
+                    if len(remaining) > 0:
+                        col_ids[key] = remaining
+                    else:
+                        del col_ids[key]
+
+            del self.row_keys[label]
+
+        return self
+
+    def update_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Re-indexes rows whose identifiers have changed.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the updated rows.
+        """
+
+        self.drop_rows(dataframe.index.to_list())
+        self.add_rows(dataframe)
+
+        return self
+
+    def relabel(self, old_labels):
+
+        """
+        Relabels rows after a dataframe's index has been reset. Rows whose labels are not included are removed.
+
+        Parameters
+        ----------
+        old_labels : list
+            the rows' labels before the reset, in their new order. Row n is given the label n.
+        """
+
+        mapping = {old: new for new, old in enumerate(old_labels)}
+
+        if all(old == new for old, new in mapping.items()) and (len(mapping) == len(self.row_keys)):
+            return self
+
+        ids = {c: dict() for c in self.columns}
+        row_keys = dict()
+
+        for old, new in mapping.items():
+
+            keys = self.row_keys.get(old, [])
+            row_keys[new] = keys
+
+            for c, key in keys:
+                if key in ids[c]:
+                    ids[c][key].append(new)
+                else:
+                    ids[c][key] = [new]
+
+        for c in self.columns:
+            for key in ids[c].keys():
+                ids[c][key].sort()
+
+        self.ids = ids
+        self.row_keys = row_keys
+
+        return self
+
+    def lookup(self, value, columns = None) -> list:
+
+        """
+        Returns the rows containing an identifier value.
+
+        Parameters
+        ----------
+        value : object
+            an identifier to look up.
+        columns : list
+            names of identifier columns to search. Defaults to all indexed columns.
+
+        Returns
+        -------
+        result : list
+            a list of (column, label) tuples, ordered by column and then by row.
+        """
+
+        if columns is None:
+            columns = self.columns
+
+        key = self.make_key(value)
+        if key is None:
+            return []
+
+        result = []
+        for c in columns:
+            if c in self.ids:
+                for label in self.ids[c].get(key, []):
+                    result.append((c, label))
+
+        return result
+
+    def duplicates(self, column: str) -> list:
+
+        """
+        Returns groups of rows that share an identifier in a given column.
+
+        Parameters
+        ----------
+        column : str
+            name of identifier column.
+
+        Returns
+        -------
+        result : list
+            a list of lists of row labels. Each list contains two or more rows sharing an identifier.
+        """
+
+        if column not in self.ids:
+            return []
+
+        return [labels for labels in self.ids[column].values() if len(labels) > 1]
+
+    def stamp(self, dataframe: pd.DataFrame):
+
+        """
+        Records the dataframe's current state so that later changes can be detected.
+        """
+
+        self.row_count = len(dataframe)
+        self.frame_ref = weakref.ref(dataframe._mgr)
+
+        return self
+
+    def is_current(self, dataframe: pd.DataFrame) -> bool:
+
+        """
+        Returns True if the dataframe has not been rebuilt or resized since the index was last stamped.
+        """
+
+        if self.frame_ref is None:
+            return False
+
+        return (self.frame_ref() is dataframe._mgr) and (self.row_count == len(dataframe)) and (len(self.row_keys) == len(dataframe))
+
+text_cols = [
+                'title',
+                'abstract',
+                'keywords',
+                'source',
+                'authors',
+                'publisher'
+                ]
+
+def cell_to_text(value) -> str:
+
+    """
+    Converts a dataframe cell to the string used for keyword searches. Missing values are converted to an empty string.
+    """
+
+    if value is None:
+        return ''
+
+    if (type(value) == float) and (value != value):
+        return ''
+
+    if value is pd.NA:
+        return ''
+
+    return str(value)
+
+def tokenize_text(text: str) -> list:
+
+    """
+    Splits a string into word tokens.
+    """
+
+    return re.findall(r'\w+', text)
+
+def is_phrase_query(keyword: str) -> bool:
+
+    """
+    Returns True if a search keyword is a phrase query, i.e. is wrapped in double quotes.
+    """
+
+    keyword = keyword.strip()
+
+    return (len(keyword) > 1) and (keyword[0] == '"') and (keyword[-1] == '"')
+
+class KeywordIndex:
+
+    """
+    This is a KeywordIndex object. It is an inverted index mapping the word tokens in a dataframe's text columns (e.g. titles, abstracts, keywords) to the rows that contain them.
+
+    Keyword queries match substrings of a cell's text, as str.contains does. Queries wrapped in double quotes are phrase queries, which match whole words in sequence. The index is used to narrow a search to candidate rows, and candidates are checked against their text before being returned.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        a dataframe to index. Defaults to None.
+    columns : list
+        names of text columns to index. Defaults to the title, abstract, keywords, source, authors and publisher columns. Other columns are added when they are first searched.
+
+    Attributes
+    ----------
+    texts : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping row labels to their lowercase text.
+    values : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping row labels to the cell values that were indexed.
+    postings : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping tokens to sets of row labels.
+    """
+
+    def __init__(self, dataframe = None, columns = None):
+
+        """
+        Initialises KeywordIndex instance.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe to index. Defaults to None.
+        columns : list
+            names of text columns to index. Defaults to the title, abstract, keywords, source, authors and publisher columns.
+        """
+
+        if columns is None:
+            global text_cols
+            columns = text_cols
+
+        self.columns = []
+        self.texts = dict()
+        self.values = dict()
+        self.postings = dict()
+        self.term_cache = dict()
+
+        for c in columns:
+            self.add_column(c)
+
+        if dataframe is not None:
+            self.sync(dataframe)
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how KeywordIndex objects are represented in string form.
+        """
+
+        counts = {c: len(self.postings[c]) for c in self.columns}
+        return f'KeywordIndex of {len(self)} rows: {counts}'
+
+    def __len__(self) -> int:
+
+        """
+        Returns the number of rows in the index.
+        """
+
+        if len(self.columns) == 0:
+            return 0
+
+        return max(len(self.texts[c]) for c in self.columns)
+
+    def add_column(self, column: str):
+
+        """
+        Adds an empty column to the index. Its rows are indexed when the index is next synchronised.
+        """
+
+        if column not in self.columns:
+            self.columns.append(column)
+            self.texts[column] = dict()
+            self.values[column] = dict()
+            self.postings[column] = dict()
+            self.term_cache[column] = dict()
+
+        return self
+
+    def index_cell(self, column: str, label, value):
+
+        """
+        Adds a single cell to the index, replacing any existing entry for the row.
+        """
+
+        if label in self.texts[column]:
+            self.drop_cell(column, label)
+
+        text = cell_to_text(value).lower()
+        self.texts[column][label] = text
+        self.values[column][label] = value
+
+        postings = self.postings[column]
+        new_terms = False
+
+        for token in set(tokenize_text(text)):
+            if token in postings:
+                postings[token].add(label)
+            else:
+                postings[token] = {label}
+                new_terms = True
+
+        if new_terms == True:
+            self.term_cache[column] = dict()
+
+        return self
+
+    def drop_cell(self, column: str, label):
+
+        """
+        Removes a single cell from the index.
+        """
+
+        text = self.texts[column].pop(label, None)
+        self.values[column].pop(label, None)
+
+        if text is None:
+            return self
+
+        postings = self.postings[column]
+
+        for token in set(tokenize_text(text)):
+            labels = postings.get(token)
+            if labels is not None:
+                labels.discard(label)
+                if len(labels) == 0:
+                    del postings[token]
+
+        return self
+
+    def add_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Adds rows to the index. Rows are identified by their index labels.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the rows to index.
+        """
+
+        for c in self.columns:
+            if c in dataframe.columns:
+                for label, value in zip(dataframe.index, dataframe[c].to_numpy(dtype=object)):
+                    self.index_cell(c, label, value)
+
+        return self
+
+    def drop_rows(self, labels):
+
+        """
+        Removes rows from the index.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the rows to remove.
+        """
+
+        for c in self.columns:
+            for label in labels:
+                self.drop_cell(c, label)
+
+        return self
+
+    def update_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Re-indexes rows whose text has changed.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the updated rows.
+        """
+
+        self.drop_rows(dataframe.index.to_list())
+        self.add_rows(dataframe)
+
+        return self
+
+    def relabel(self, old_labels):
+
+        """
+        Relabels rows after a dataframe's index has been reset. Rows whose labels are not included are removed.
+
+        Parameters
+        ----------
+        old_labels : list
+            the rows' labels before the reset, in their new order. Row n is given the label n.
+        """
+
+        mapping = {old: new for new, old in enumerate(old_labels)}
+
+        if all(old == new for old, new in mapping.items()) and (len(mapping) == len(self)):
+            return self
+
+        for c in self.columns:
+
+            texts = self.texts[c]
+            values = self.values[c]
+
+            self.texts[c] = {new: texts[old] for old, new in mapping.items() if old in texts}
+            self.values[c] = {new: values[old] for old, new in mapping.items() if old in values}
+
+            postings = dict()
+            for token, labels in self.postings[c].items():
+                new_labels = {mapping[old] for old in labels if old in mapping}
+                if len(new_labels) > 0:
+                    postings[token] = new_labels
+
+            self.postings[c] = postings
+            self.term_cache[c] = dict()
+
+        return self
+
+    def sync(self, dataframe: pd.DataFrame, columns = None):
+
+        """
+        Brings the index up to date with a dataframe. New rows and cells whose values have changed since they were indexed are re-indexed, and rows no longer in the dataframe are removed.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the indexed dataframe.
+        columns : list
+            names of columns to synchronise. Columns which are not yet indexed are added. Defaults to all indexed columns.
+        """
+
+        if columns is None:
+            columns = self.columns
+
+        for c in columns:
+
+            if c not in dataframe.columns:
+                continue
+
+            self.add_column(c)
+
+            texts = self.texts[c]
+            values = self.values[c]
+            missing = object()
+
+            for label, value in zip(dataframe.index, dataframe[c].to_numpy(dtype=object)):
+
+                old = values.get(label, missing)
+
+                if old is value:
+                    continue
+
+                if (type(value) == str) and (type(old) == str) and (old == value):
+                    values[label] = value
+                    continue
+
+                self.index_cell(c, label, value)
+
+            if len(texts) > len(dataframe):
+                labels = set(dataframe.index)
+                for label in [i for i in texts.keys() if i not in labels]:
+                    self.drop_cell(c, label)
+
+        return self
+
+    def matching_terms(self, column: str, token: str) -> set:
+
+        """
+        Returns the indexed tokens in a column which contain a query token.
+        """
+
+        cache = self.term_cache[column]
+
+        if token not in cache:
+            cache[token] = {term for term in self.postings[column].keys() if token in term}
+
+        return cache[token]
+
+    def candidates(self, column: str, keyword: str):
+
+        """
+        Returns the rows in a column which may match a keyword, or None if the index cannot narrow the search (e.g. if the keyword contains no word characters).
+
+        Parameters
+        ----------
+        column : str
+            name of column to search.
+        keyword : str
+            a keyword. Keywords wrapped in double quotes are treated as phrases.
+
+        Returns
+        -------
+        result : set or None
+            a set of row labels.
+        """
+
+        phrase = is_phrase_query(keyword)
+        tokens = tokenize_text(keyword.lower())
+
+        if len(tokens) == 0:
+            return None
+
+        postings = self.postings[column]
+        result = None
+
+        for token in tokens:
+
+            if phrase == True:
+                labels = postings.get(token, set())
+            else:
+                labels = set()
+                for term in self.matching_terms(column, token):
+                    labels = labels | postings[term]
+
+            if result is None:
+                result = set(labels)
+            else:
+                result = result & labels
+
+            if len(result) == 0:
+                break
+
+        return result
+
+    def match(self, dataframe: pd.DataFrame, column: str, keyword: str, case_sensitive: bool = False) -> set:
+
+        """
+        Returns the rows in a column which match a keyword.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the indexed dataframe. Used to check case-sensitive matches.
+        column : str
+            name of column to search.
+        keyword : str
+            a keyword. Keywords wrapped in double quotes are treated as phrases.
+        case_sensitive : bool
+            whether to pay attention to the case of string data. Defaults to False.
+
+        Returns
+        -------
+        result : set
+            a set of row labels.
+        """
+
+        if column not in self.texts:
+            return set()
+
+        texts = self.texts[column]
+        candidates = self.candidates(column, keyword)
+
+        if candidates is None:
+            candidates = texts.keys()
+
+        if is_phrase_query(keyword) == True:
+            tokens = tokenize_text(keyword.strip()[1:-1])
+            if len(tokens) == 0:
+                return set()
+            pattern = re.compile(r'(?<!\w)' + r'\W+'.join(re.escape(t) for t in tokens) + r'(?!\w)', flags = 0 if case_sensitive == True else re.IGNORECASE)
+            check = lambda text: pattern.search(text) is not None
+        else:
+            query = keyword if case_sensitive == True else keyword.lower()
+            check = lambda text: query in text
+
+        if case_sensitive == True:
+            values = self.values[column]
+            return {label for label in candidates if check(cell_to_text(values[label])) == True}
+
+        return {label for label in candidates if check(texts[label]) == True}
+
+    def search(self, dataframe: pd.DataFrame, columns: list, any_kwds = None, all_kwds = None, not_kwds = None, case_sensitive: bool = False) -> list:
+
+        """
+        Searches one or more indexed columns for keywords.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the indexed dataframe. The index should already be up to date with its indexed columns (see KeywordIndex.sync).
+        columns : list
+            names of columns to search. Columns which are not yet indexed are added.
+        any_kwds : list
+            keywords to search for. Returns rows where *any* matches are found in any of the columns. Defaults to None.
+        all_kwds : list
+            keywords to search for. Returns rows where *all* keywords are found in one or more of the columns. Defaults to None.
+        not_kwds : list
+            keywords to search for. Excludes rows where any of the keywords are found in any of the columns. Defaults to None.
+        case_sensitive : bool
+            whether to pay attention to the case of string data. Defaults to False.
+
+        Returns
+        -------
+        result : list
+            labels of matching rows, in the order they appear in the dataframe.
+        """
+
+        columns = [c for c in columns if c in dataframe.columns]
+
+        # Indexed columns are kept up to date as the dataframe changes (see Results.refresh_index): only columns searched for the first time are added
+        new_columns = [c for c in columns if c not in self.columns]
+        if len(new_columns) > 0:
+            self.sync(dataframe, columns = new_columns)
+
+        def rows_matching(keyword):
+            labels = set()
+            for c in columns:
+                labels = labels | self.match(dataframe, c, keyword, case_sensitive = case_sensitive)
+            return labels
+
+        if (any_kwds is not None) and (len(any_kwds) > 0):
+            result = set()
+            for keyword in any_kwds:
+                result = result | rows_matching(keyword)
+
+        elif (all_kwds is not None) and (len(all_kwds) > 0):
+            result = None
+
+        else:
+            result = set(dataframe.index)
+
+        if all_kwds is not None:
+            for keyword in all_kwds:
+                if result is None:
+                    result = rows_matching(keyword)
+                else:
+                    result = result & rows_matching(keyword)
+
+        if result is None:
+            result = set()
+
+        if not_kwds is not None:
+            for keyword in not_kwds:
+                result = result - rows_matching(keyword)
+
+        positions = np.sort(dataframe.index.get_indexer(list(result)))
+
+        return dataframe.index[positions].to_list()
+
+class StringView:
+
+    """
+    This is a StringView object. It caches dataframe columns converted to strings, as astype(str) converts them, in original and lowercase form. It is used for substring and equality matching, so that columns are not converted to strings on every call.
+
+    Cached strings are refreshed lazily: when a column is requested, only cells whose values have changed since they were cached are converted again. As with the KeywordIndex, cells are compared by identity, so objects modified in place (e.g. lists) are not refreshed. If the view is not set to refresh, cached cells are not compared, and edited rows must be passed to StringView.update_rows (see Results.refresh_index).
+
+    Parameters
+    ----------
+    refresh : bool
+        whether to compare every cached cell with the dataframe when a column is requested. Defaults to True.
+
+    Attributes
+    ----------
+    refresh : bool
+        whether cached cells are compared with the dataframe when a column is requested.
+    values : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping row labels to the cell values that were converted.
+    strings : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping row labels to the cells' strings.
+    lower : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping row labels to the cells' lowercase strings.
+    series : dict
+        a dictionary mapping column names to the index, string series and lowercase string series last returned.
+    """
+
+    def __init__(self, refresh: bool = True):
+
+        """
+        Initialises StringView instance.
+
+        Parameters
+        ----------
+        refresh : bool
+            whether to compare every cached cell with the dataframe when a column is requested. Defaults to True.
+        """
+
+        self.refresh = refresh
+        self.values = dict()
+        self.strings = dict()
+        self.lower = dict()
+        self.series = dict()
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how StringView objects are represented in string form.
+        """
+
+        return f'StringView of {len(self)} rows: {list(self.values.keys())}'
+
+    def __len__(self) -> int:
+
+        """
+        Returns the number of rows cached.
+        """
+
+        if len(self.values) == 0:
+            return 0
+
+        return max(len(i) for i in self.values.values())
+
+    @property
+    def columns(self) -> list:
+
+        """
+        Returns the names of the cached columns.
+        """
+
+        return list(self.values.keys())
+
+    def convert_cells(self, column: str, labels, values, compare: bool = True) -> bool:
+
+        """
+        Converts cells to strings and caches them. Returns whether any cached strings changed.
+
+        Parameters
+        ----------
+        column : str
+            name of the column.
+        labels : iterable
+            the cells' row labels.
+        values : iterable
+            the cells' values.
+        compare : bool
+            whether to compare cached cells with their values. If False, only cells which are not cached are converted. Defaults to True.
+        """
+
+        cached_values = self.values[column]
+        strings = self.strings[column]
+        lower = self.lower[column]
+        missing = object()
+        changed = False
+
+        for label, value in zip(labels, values):
+
+            old = cached_values.get(label, missing)
+
+            if (old is value) or ((compare == False) and (old is not missing)):
+                continue
+
+            if (type(value) == str) and (type(old) == str) and (old == value):
+                cached_values[label] = value
+                continue
+
+            text = str(value)
+            cached_values[label] = value
+            strings[label] = text
+            lower[label] = text.lower()
+            changed = True
+
+        return changed
+
+    def column(self, dataframe: pd.DataFrame, column: str, ignore_case: bool = True) -> pd.Series:
+
+        """
+        Returns a dataframe column converted to strings, refreshing any cells which have changed since they were cached.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the dataframe.
+        column : str
+            name of the column.
+        ignore_case : bool
+            whether to return lowercase strings. Defaults to True.
+
+        Returns
+        -------
+        result : pandas.Series
+            the column's strings. The series is shared between calls and should not be modified.
+        """
+
+        if column not in self.values:
+            self.values[column] = dict()
+            self.strings[column] = dict()
+            self.lower[column] = dict()
+
+        values = self.values[column]
+        strings = self.strings[column]
+        lower = self.lower[column]
+        cached = self.series.get(column)
+
+        if (self.refresh == False) and (cached is not None) and (cached[0].equals(dataframe.index) == True):
+            changed = False
+        else:
+            changed = self.convert_cells(column, dataframe.index, dataframe[column].to_numpy(dtype=object), compare = self.refresh)
+
+        if len(values) > len(dataframe):
+            labels = set(dataframe.index)
+            self.drop_rows([i for i in values.keys() if i not in labels])
+            changed = True
+            cached = None
+
+        if (changed == True) or (cached is None) or (cached[0].equals(dataframe.index) == False):
+            index = dataframe.index
+            cached = (
+                        index,
+                        pd.Series([strings[i] for i in index], index=index, dtype=object, name=column),
+                        pd.Series([lower[i] for i in index], index=index, dtype=object, name=column)
+                        )
+            self.series[column] = cached
+
+        if ignore_case == True:
+            return cached[2]
+        else:
+            return cached[1]
+
+    def frame(self, dataframe: pd.DataFrame, columns = None, ignore_case: bool = True) -> pd.DataFrame:
+
+        """
+        Returns dataframe columns converted to strings, as a dataframe.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the dataframe.
+        columns : list
+            names of columns to return. Defaults to all columns.
+        ignore_case : bool
+            whether to return lowercase strings. Defaults to True.
+
+        Returns
+        -------
+        result : pandas.DataFrame
+            the columns' strings.
+        """
+
+        if columns is None:
+            columns = dataframe.columns.to_list()
+
+        return pd.DataFrame({c: self.column(dataframe, c, ignore_case=ignore_case) for c in columns}, index=dataframe.index, columns=columns)
+
+    def add_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Converts new rows in the cached columns. Other columns are converted when they are first requested.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the new rows.
+        """
+
+        for c in self.columns:
+            if c in dataframe.columns:
+                self.convert_cells(c, dataframe.index, dataframe[c].to_numpy(dtype=object))
+            self.series.pop(c, None)
+
+        return self
+
+    def update_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Converts rows whose values have changed in the cached columns, updating the cached series in place.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the updated rows.
+        """
+
+        labels = dataframe.index
+
+        for c in self.columns:
+
+            if c not in dataframe.columns:
+                continue
+
+            if self.convert_cells(c, labels, dataframe[c].to_numpy(dtype=object)) == False:
+                continue
+
+            cached = self.series.get(c)
+            if cached is None:
+                continue
+
+            positions = cached[0].get_indexer(labels)
+
+            if (positions < 0).any() == True:
+                self.series.pop(c)
+                continue
+
+            strings = self.strings[c]
+            lower = self.lower[c]
+            cached[1].iloc[positions] = [strings[i] for i in labels]
+            cached[2].iloc[positions] = [lower[i] for i in labels]
+
+        return self
+
+    def sync(self, dataframe: pd.DataFrame):
+
+        """
+        Brings the cached columns up to date with a dataframe, comparing every cached cell with its value.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the dataframe.
+        """
+
+        labels = set(dataframe.index)
+
+        for c in self.columns:
+
+            removed = [i for i in self.values[c].keys() if i not in labels]
+            if len(removed) > 0:
+                self.drop_rows(removed)
+
+            if c in dataframe.columns:
+                self.convert_cells(c, dataframe.index, dataframe[c].to_numpy(dtype=object))
+
+            self.series.pop(c, None)
+
+        return self
+
+    def drop_rows(self, labels):
+
+        """
+        Removes rows from the cache.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the rows to remove.
+        """
+
+        for c in self.values.keys():
+            for label in labels:
+                self.values[c].pop(label, None)
+                self.strings[c].pop(label, None)
+                self.lower[c].pop(label, None)
+            self.series.pop(c, None)
+
+        return self
+
+    def relabel(self, old_labels):
+
+        """
+        Relabels rows after a dataframe's index has been reset. Rows whose labels are not included are removed.
+
+        Parameters
+        ----------
+        old_labels : list
+            the rows' labels before the reset, in their new order. Row n is given the label n.
+        """
+
+        mapping = {old: new for new, old in enumerate(old_labels)}
+
+        if all(old == new for old, new in mapping.items()) and (len(mapping) == len(self)):
+            return self
+
+        for c in self.values.keys():
+            for attr in [self.values, self.strings, self.lower]:
+                cells = attr[c]
+                attr[c] = {new: cells[old] for old, new in mapping.items() if old in cells}
+
+        self.series = dict()
+
+        return self
+
+entity_key_cols = {
+                    'author_id': ['author_id', 'orcid', 'google_scholar', 'crossref', 'scopus', 'full_name'],
+                    'funder_id': ['funder_id', 'uri', 'crossref_id', 'website', 'name'],
+                    'affiliation_id': ['affiliation_id', 'name', 'uri', 'website']
+                    }
+
+def entity_keys(value, ignore_case: bool = True) -> list:
+
+    """
+    Converts an entity identifier (e.g. an author ID, ORCID, name or URI) to the keys used to look it up in an EntityIndex. Returns an empty list if the value cannot be indexed.
+
+    Values are stripped and, if ignore_case is True, lowercased. ORCID iDs and DOIs contained in URLs are also added as keys, so that (for example) 'https://orcid.org/0000-0002-1825-0097' and '0000-0002-1825-0097' match.
+    """
+
+    if value is None:
+        return []
+
+    if (type(value) == float) and (value != value):
+        return []
+
+    key = str(value).strip()
+    if ignore_case == True:
+        key = key.lower()
+
+    if key.lower() in ['', 'none', 'nan']:
+        return []
+
+    keys = [key]
+
+    orcid = re.search(r'\d{4}-\d{4}-\d{4}-\d{3}[\dxX]', key)
+    if (orcid is not None) and (orcid.group(0) != key):
+        keys.append(orcid.group(0))
+
+    if 'doi.org/' in key:
+        doi = key.split('doi.org/', 1)[1]
+        if doi != '':
+            keys.append(doi)
+
+    return keys
+
+class EntityIndex:
+
+    """
+    This is an EntityIndex object. It is an inverted index mapping the identifiers of entities (e.g. author IDs, ORCIDs, names) to the rows of a dataframe whose entity collections (e.g. Authors, Funders, Affiliations) contain them. It also maps each row to the entities it contains.
+
+    Unlike Entities.contains, identifiers are matched exactly (after stripping and, optionally, lowercasing), not as substrings.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        a series of entity collections to index (e.g. a Results DataFrame's 'authors' column). Defaults to None.
+    id_column : str
+        name of the column containing entity IDs. Defaults to 'author_id'.
+    key_columns : list
+        names of columns containing identifiers to index. Defaults to the identifier columns for the entity type.
+    ignore_case : bool
+        whether to ignore the case of identifiers. Defaults to True.
+
+    Attributes
+    ----------
+    keys : dict
+        a dictionary mapping identifier keys to lists of row labels.
+    row_entities : dict
+        a dictionary mapping row labels to lists of the entity IDs they contain.
+    row_data : dict
+        a dictionary mapping row labels to lists of their entity collections' summary dataframes.
+    """
+
+    def __init__(self, series = None, id_column: str = 'author_id', key_columns = None, ignore_case: bool = True):
+
+        """
+        Initialises EntityIndex instance.
+
+        Parameters
+        ----------
+        series : pandas.Series
+            a series of entity collections to index. Defaults to None.
+        id_column : str
+            name of the column containing entity IDs. Defaults to 'author_id'.
+        key_columns : list
+            names of columns containing identifiers to index. Defaults to the identifier columns for the entity type.
+        ignore_case : bool
+            whether to ignore the case of identifiers. Defaults to True.
+        """
+
+        if key_columns is None:
+            global entity_key_cols
+            key_columns = entity_key_cols.get(id_column, [id_column])
+
+        self.id_column = id_column
+        self.key_columns = list(key_columns)
+        self.ignore_case = ignore_case
+        self.keys = dict()
+        self.row_entities = dict()
+        self.row_data = dict()
+        self.row_order = []
+        self.row_positions = None
+
+        if series is not None:
+            self.build(series)
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how EntityIndex objects are represented in string form.
+        """
+
+        return f'EntityIndex of {len(self.row_entities)} rows and {len(self.keys)} identifiers'
+
+    def __len__(self) -> int:
+
+        """
+        Returns the number of rows in the index.
+        """
+
+        return len(self.row_entities)
+
+    def build(self, series: pd.Series):
+
+        """
+        Clears the index and indexes a series of entity collections in a single pass. Cells which are not entity collections (e.g. unformatted lists) are skipped.
+
+        Parameters
+        ----------
+        series : pandas.Series
+            a series of entity collections.
+        """
+
+        self.keys = dict()
+        self.row_entities = dict()
+        self.row_data = dict()
+        self.row_order = []
+        self.row_positions = None
+
+        for label, entities in zip(series.index, series.to_numpy(dtype=object)):
+
+            summary = getattr(entities, 'summary', None)
+            if type(summary) != pd.DataFrame:
+                continue
+
+            self.add_row(label, summary)
+
+        return self
+
+    def add_row(self, label, summary):
+
+        """
+        Indexes a single row's entities.
+
+        Parameters
+        ----------
+        label : object
+            the row's index label.
+        summary : pandas.DataFrame or list
+            the row's entity collection summary, or a list of summaries (e.g. the affiliations of each of a work's authors).
+        """
+
+        if type(summary) == list:
+            summaries = summary
+        else:
+            summaries = [summary]
+
+        keys = self.keys
+        row_keys = set()
+        row_entities = []
+
+        for summary in summaries:
+
+            for c in self.key_columns:
+                if c in summary.columns:
+                    for value in summary[c].to_numpy(dtype=object):
+                        for key in entity_keys(value, ignore_case = self.ignore_case):
+                            row_keys.add(key)
+
+            if self.id_column in summary.columns:
+                row_entities = row_entities + [i for i in summary[self.id_column].to_list() if (len(entity_keys(i)) > 0) and (i not in row_entities)]
+
+        for key in row_keys:
+            if key in keys:
+                keys[key].append(label)
+            else:
+                keys[key] = [label]
+
+        self.row_entities[label] = row_entities
+        self.row_data[label] = summaries
+        self.row_order.append(label)
+
+        return self
+
+    def lookup(self, values) -> list:
+
+        """
+        Returns the rows containing an entity that matches any of a set of identifiers.
+
+        Parameters
+        ----------
+        values : object or list
+            one or more identifiers (e.g. an author ID, ORCID and name).
+
+        Returns
+        -------
+        result : list
+            row labels, in the order the rows were indexed.
+        """
+
+        if type(values) != list:
+            values = [values]
+
+        labels = set()
+        for value in values:
+            for key in entity_keys(value, ignore_case = self.ignore_case):
+                labels.update(self.keys.get(key, []))
+
+        if len(labels) == 0:
+            return []
+
+        if len(labels) == 1:
+            return list(labels)
+
+        positions = self.positions()
+
+        return sorted(labels, key = lambda label: positions[label])
+
+    def positions(self) -> dict:
+
+        """
+        Returns a dictionary mapping row labels to the order in which they were indexed.
+        """
+
+        if (self.row_positions is None) or (len(self.row_positions) != len(self.row_order)):
+            self.row_positions = {label: pos for pos, label in enumerate(self.row_order)}
+
+        return self.row_positions
+
+    def entity_rows(self) -> pd.DataFrame:
+
+        """
+        Returns a dataframe combining all indexed rows' entity summaries, with a 'row' column giving the label of the row each entity came from.
+        """
+
+        frames = []
+        labels = []
+        for label in self.row_order:
+            for summary in self.row_data[label]:
+                if len(summary) > 0:
+                    frames.append(summary)
+                    labels.extend([label] * len(summary))
+
+        if len(frames) == 0:
+            return pd.DataFrame(columns = self.key_columns + ['row'], dtype=object)
+
+        result = pd.concat(frames, ignore_index = True)
+        result['row'] = pd.Series(labels, dtype=object)
+
+        return result
@@ -0,0 +1,202 @@
+"""Deferred formatting for ART dataframes."""
+
+import pandas as pd
+
+# Whether formatting is deferred until formatted data is first accessed by default
+lazy_default = False
+
+def set_lazy_default(lazy: bool = True):
+
+    """
+    Sets whether formatting is deferred by default, so that authors, funders, affiliations and citations data are only formatted when first accessed.
+
+    Parameters
+    ----------
+    lazy : bool
+        whether to defer formatting. Defaults to True.
+    """
+
+    global lazy_default
+    lazy_default = lazy
+
+def use_lazy(lazy = None) -> bool:
+
+    """
+    Returns whether to defer formatting: the value of lazy if given; otherwise, the default.
+    """
+
+    global lazy_default
+
+    if lazy is None:
+        return lazy_default == True
+
+    return lazy == True
+
+class LazyValue:
+
+    """
+    This is a LazyValue object. It holds unformatted data (e.g. authors data from an API response) and the function used to format it. The data is formatted when the object is first used, and the formatted object (e.g. an Authors object) is kept so that the data is only formatted once.
+
+    Attribute access and listing, indexing, iteration, len() and string conversion are passed to the formatted object. Use LazyValue.get() or materialize() where the formatted object itself is needed (e.g. for type checks).
+
+    Parameters
+    ----------
+    function : callable
+        the function used to format the data.
+    data : object
+        the unformatted data.
+    kwargs : dict
+        keyword arguments passed to the function. Defaults to None.
+
+    Attributes
+    ----------
+    function : callable
+        the function used to format the data.
+    data : object
+        the unformatted data. Released once formatted.
+    kwargs : dict
+        keyword arguments passed to the function.
+    formatted : bool
+        whether the data has been formatted.
+    value : object
+        the formatted object.
+    """
+
+    __slots__ = ('function', 'data', 'kwargs', 'formatted', 'value')
+
+    def __init__(self, function, data, kwargs = None):
+
+        """
+        Initialises LazyValue instance.
+
+        Parameters
+        ----------
+        function : callable
+            the function used to format the data.
+        data : object
+            the unformatted data.
+        kwargs : dict
+            keyword arguments passed to the function. Defaults to None.
+        """
+
+        if kwargs is None:
+            kwargs = dict()
+
+        self.function = function
+        self.data = data
+        self.kwargs = kwargs
+        self.formatted = False
+        self.value = None
+
+    def get(self):
+
+        """
+        Returns the formatted object, formatting the data if it has not yet been formatted.
+        """
+
+        if self.formatted == False:
+            self.value = self.function(self.data, **self.kwargs)
+            self.formatted = True
+            self.data = None
+
+        return self.value
+
+    def __getstate__(self):
+
+        """
+        Returns the LazyValue's state for pickling.
+        """
+
+        return (self.function, self.data, self.kwargs, self.formatted, self.value)
+
+    def __setstate__(self, state):
+
+        """
+        Restores the LazyValue's state when unpickling.
+        """
+
+        self.function, self.data, self.kwargs, self.formatted, self.value = state
+
+    def __getattr__(self, name):
+
+        """
+        Passes attribute access to the formatted object.
+        """
+
+        # Special and slot attributes are not passed on, so that copying and pickling do not format the data
+        if name.startswith('__') or (name in LazyValue.__slots__):
+            raise AttributeError(name)
+
+        return getattr(self.get(), name)
+
+    def __dir__(self):
+        return dir(self.get())
+
+    def __getitem__(self, key):
+        return self.get()[key]
+
+    def __iter__(self):
+        return iter(self.get())
+
+    def __len__(self) -> int:
+        return len(self.get())
+
+    def __repr__(self) -> str:
+        return repr(self.get())
+
+    def __str__(self) -> str:
+        return str(self.get())
+
+def is_lazy(value) -> bool:
+
+    """
+    Returns True if the value is a LazyValue.
+    """
+
+    return type(value) == LazyValue
+
+def materialize(value):
+
+    """
+    Returns a value's formatted object if it is a LazyValue; otherwise, returns the value unchanged.
+    """
+
+    if type(value) == LazyValue:
+        return value.get()
+
+    return value
+
+def materialize_column(dataframe: pd.DataFrame, column: str) -> pd.DataFrame:
+
+    """
+    Replaces a dataframe column's LazyValues with their formatted objects in place.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        the dataframe to update.
+    column : str
+        name of the column to update.
+
+    Returns
+    -------
+    dataframe : pandas.DataFrame
+        the updated dataframe.
+    """
+
+    if column not in dataframe.columns:
+        return dataframe
+
+    values = dataframe[column].to_numpy(dtype=object)
+    positions = [i for i, value in enumerate(values) if type(value) == LazyValue]
+
+    if len(positions) == 0:
+        return dataframe
+
+    values = values.copy()
+    for i in positions:
+        values[i] = values[i].get()
+
+    dataframe[column] = pd.Series(values, index=dataframe.index, dtype=object)
+
+    return dataframe
@@ -0,0 +1,269 @@
+"""Parallel processing for ART dataframes."""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+def get_workers(workers = None) -> int:
+
+    """
+    Returns the number of worker processes to use. If workers is None, returns 1 (i.e. no parallel processing); if workers is zero or negative, returns the number of CPUs.
+    """
+
+    if workers is None:
+        return 1
+
+    workers = int(workers)
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    return workers
+
+def partition(values: list, parts: int) -> list:
+
+    """
+    Splits a list into contiguous partitions of near-equal size, in order.
+
+    Parameters
+    ----------
+    values : list
+        the list to split.
+    parts : int
+        the number of partitions. Limited to the length of the list.
+
+    Returns
+    -------
+    result : list
+        a list of lists.
+    """
+
+    parts = max(1, min(parts, len(values)))
+    size, remainder = divmod(len(values), parts)
+
+    result = []
+    start = 0
+
+    for i in range(parts):
+        end = start + size + (1 if i < remainder else 0)
+        result.append(values[start:end])
+        start = end
+
+    return result
+
+def map_partition(function, values: list, kwargs = None) -> list:
+
+    """
+    Applies a function to each value in a partition. Used by worker processes.
+    """
+
+    if kwargs is None:
+        kwargs = dict()
+
+    return [function(value, **kwargs) for value in values]
+
+@contextmanager
+def worker_pool(workers = None, executor = None):
+
+    """
+    Provides an executor for parallel_map, so that several parallel steps can share one pool of worker processes. Yields the executor if one is given; otherwise, yields a new process pool if more than one worker is requested, or None.
+
+    Parameters
+    ----------
+    workers : int
+        the number of worker processes. Defaults to None (no parallel processing).
+    executor : concurrent.futures.Executor
+        an existing executor to use. Defaults to None.
+    """
+
+    if executor is not None:
+        yield executor
+        return
+
+    workers = get_workers(workers)
+
+    if workers <= 1:
+        yield None
+        return
+
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        yield pool
+
+def parallel_map(function, values, workers = None, executor = None, kwargs = None) -> list:
+
+    """
+    Applies a function to each value, partitioning the values across worker processes. Results are returned in the order of the values, so the output is the same as a serial map.
+
+    Parameters
+    ----------
+    function : callable
+        the function to apply. Must be importable by worker processes (i.e. defined at module level).
+    values : iterable
+        the values to process.
+    workers : int
+        the number of worker processes. If zero or negative, one per CPU is used. Defaults to None: values are processed serially unless an executor is given.
+    executor : concurrent.futures.Executor
+        an existing executor (e.g. a ProcessPoolExecutor) to submit partitions to. Defaults to None.
+    kwargs : dict
+        keyword arguments passed to the function. Defaults to None.
+
+    Returns
+    -------
+    result : list
+        the function's outputs, one per value.
+    """
+
+    values = list(values)
+
+    if len(values) == 0:
+        return []
+
+    if executor is None:
+
+        if (get_workers(workers) <= 1) or (len(values) == 1):
+            return map_partition(function, values, kwargs)
+
+        with worker_pool(workers = workers) as pool:
+            return parallel_map(function, values, workers = workers, executor = pool, kwargs = kwargs)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Splitting into several partitions per worker, so that uneven partitions do not leave workers idle
+    partitions = partition(values, get_workers(workers) * 4)
+    futures = [executor.submit(map_partition, function, p, kwargs) for p in partitions]
+
+    result = []
+    for future in futures:
+        result.extend(future.result())
+
+    return result
+
+def thread_map(function, values, workers: int = 1) -> list:
+
+    """
+    Applies a function to each value using a pool of threads, for I/O-bound work such as API requests. Results are returned in the order of the values.
+
+    Parameters
+    ----------
+    function : callable
+        the function to apply.
+    values : iterable
+        the values to process.
+    workers : int
+        the maximum number of values processed at once. Defaults to 1: values are processed serially.
+
+    Returns
+    -------
+    result : list
+        the function's outputs, one per value.
+    """
+
+    values = list(values)
+
+    if (workers is None) or (int(workers) <= 1) or (len(values) <= 1):
+        return [function(value) for value in values]
+
+    with ThreadPoolExecutor(max_workers = min(int(workers), len(values))) as pool:
+        return list(pool.map(function, values))
+
+class TokenBucket:
+
+    """
+    This is a TokenBucket object. It limits the rate at which threads can proceed (e.g. make API requests): tokens are added at a fixed rate up to a maximum, and each request waits until it can take one.
+
+    Parameters
+    ----------
+    rate : float
+        the number of tokens added per second. If None or zero, requests are not limited.
+    capacity : float
+        the maximum number of tokens held, i.e. the largest burst of requests allowed at once. Defaults to one second's worth of tokens.
+
+    Attributes
+    ----------
+    rate : float
+        the number of tokens added per second.
+    capacity : float
+        the maximum number of tokens held.
+    tokens : float
+        the number of tokens currently held.
+    updated : float
+        when the number of tokens was last updated (see time.monotonic).
+    lock : threading.Lock
+        lock held while tokens are counted.
+    """
+
+    def __init__(self, rate: float = None, capacity: float = None):
+
+        """
+        Initialises TokenBucket instance.
+
+        Parameters
+        ----------
+        rate : float
+            the number of tokens added per second. If None or zero, requests are not limited.
+        capacity : float
+            the maximum number of tokens held. Defaults to one second's worth of tokens.
+        """
+
+        self.lock = threading.Lock()
+        self.set_rate(rate = rate, capacity = capacity)
+
+    def set_rate(self, rate: float = None, capacity: float = None):
+
+        """
+        Changes the rate at which tokens are added and the maximum number held.
+
+        Parameters
+        ----------
+        rate : float
+            the number of tokens added per second. If None or zero, requests are not limited.
+        capacity : float
+            the maximum number of tokens held. Defaults to one second's worth of tokens.
+        """
+
+        if (rate is not None) and (float(rate) < 0):
+            raise ValueError('rate must not be negative')
+
+        with self.lock:
+
+            self.rate = float(rate) if rate else None
+
+            if capacity is None:
+                capacity = max(1.0, self.rate or 1.0)
+
+            self.capacity = float(capacity)
+            self.tokens = self.capacity
+            self.updated = time.monotonic()
+
+    def acquire(self, tokens: float = 1):
+
+        """
+        Waits until the requested number of tokens are available, then takes them.
+
+        Parameters
+        ----------
+        tokens : float
+            the number of tokens to take. Defaults to 1.
+        """
+
+        while True:
+
+            with self.lock:
+
+                if self.rate is None:
+                    return
+
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait)
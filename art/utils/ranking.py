@@ -0,0 +1,504 @@
+"""Relevance ranking for ART dataframes."""
+
+import re
+
+import numpy as np
+import pandas as pd
+from scipy import sparse # type: ignore
+
+rank_cols = [
+                'abstract',
+                'description',
+                'extract',
+                'full_text'
+                ]
+
+def cell_to_text(value) -> str:
+
+    """
+    Converts a dataframe cell to the string used for ranking. Missing values are converted to an empty string.
+    """
+
+    if value is None:
+        return ''
+
+    if (type(value) == float) and (value != value):
+        return ''
+
+    if value is pd.NA:
+        return ''
+
+    return str(value)
+
+class BM25Index:
+
+    """
+    This is a BM25Index object. It is a sparse term-frequency index over a dataframe's text columns (e.g. abstracts, full texts), used to rank rows by their relevance to a query with the Okapi BM25 scoring function.
+
+    Term frequencies are held as SciPy sparse matrices, one per column, with a row for each document and a column for each term. New and changed rows are appended to a small buffer which is merged into the main matrices when it grows large; rows which are changed or removed are marked as deleted, and their space is reclaimed on merging.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        a dataframe to index. Defaults to None.
+    columns : list
+        names of text columns to index. Defaults to the abstract, description, extract and full text columns.
+    k1 : float
+        BM25 term frequency saturation parameter. Defaults to 1.5.
+    b : float
+        BM25 document length normalisation parameter. Defaults to 0.75.
+    stopwords : list
+        words to ignore. Defaults to None.
+
+    Attributes
+    ----------
+    vocab : dict
+        a dictionary mapping terms to matrix columns.
+    label_rows : dict
+        a dictionary mapping dataframe row labels to matrix rows.
+    row_labels : list
+        the dataframe row label of each matrix row. Deleted rows are None.
+    values : dict
+        a dictionary of dictionaries. Keys: column names. Values: dictionaries mapping row labels to the cell values that were indexed.
+    matrices : dict
+        a dictionary mapping column names to sparse (CSC) term-frequency matrices of the merged rows.
+    lengths : dict
+        a dictionary mapping column names to lists of document lengths (in terms), one per matrix row.
+    """
+
+    def __init__(self, dataframe = None, columns = None, k1: float = 1.5, b: float = 0.75, stopwords = None):
+
+        """
+        Initialises BM25Index instance.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe to index. Defaults to None.
+        columns : list
+            names of text columns to index. Defaults to the abstract, description, extract and full text columns.
+        k1 : float
+            BM25 term frequency saturation parameter. Defaults to 1.5.
+        b : float
+            BM25 document length normalisation parameter. Defaults to 0.75.
+        stopwords : list
+            words to ignore. Defaults to None.
+        """
+
+        if columns is None:
+            global rank_cols
+            columns = rank_cols
+
+        if stopwords is None:
+            stopwords = []
+
+        self.columns = list(columns)
+        self.k1 = k1
+        self.b = b
+        self.stopwords = set(stopwords)
+
+        self.vocab = dict()
+        self.label_rows = dict()
+        self.row_labels = []
+        self.values = {c: dict() for c in self.columns}
+        self.matrices = {c: sparse.csc_matrix((0, 0), dtype=np.int32) for c in self.columns}
+        self.lengths = {c: [] for c in self.columns}
+        self.buffer = {c: {'indptr': [0], 'indices': [], 'data': []} for c in self.columns}
+        self.buffer_cache = dict()
+        self.merged_rows = 0
+
+        if dataframe is not None:
+            self.sync(dataframe)
+
+    def __repr__(self) -> str:
+
+        """
+        Defines how BM25Index objects are represented in string form.
+        """
+
+        return f'BM25Index of {len(self)} rows and {len(self.vocab)} terms: {self.columns}'
+
+    def __len__(self) -> int:
+
+        """
+        Returns the number of rows in the index.
+        """
+
+        return len(self.label_rows)
+
+    def tokenize(self, text: str) -> list:
+
+        """
+        Splits a string into lowercase word tokens, removing stopwords.
+        """
+
+        tokens = re.findall(r'\w+', text.lower())
+
+        if len(self.stopwords) > 0:
+            stopwords = self.stopwords
+            tokens = [t for t in tokens if t not in stopwords]
+
+        return tokens
+
+    def add_document(self, label, row: dict):
+
+        """
+        Adds a document to the index buffer, replacing any existing document for the row label.
+
+        Parameters
+        ----------
+        label : object
+            the row's index label.
+        row : dict
+            a dictionary mapping column names to cell values.
+        """
+
+        if label in self.label_rows:
+            self.drop_rows([label])
+
+        vocab = self.vocab
+        self.buffer_cache = dict()
+        row_id = len(self.row_labels)
+        self.row_labels.append(label)
+        self.label_rows[label] = row_id
+
+        for c in self.columns:
+
+            value = row.get(c)
+            self.values[c][label] = value
+
+            counts = dict()
+            tokens = self.tokenize(cell_to_text(value))
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+
+            buffer = self.buffer[c]
+            for token, count in counts.items():
+                term_id = vocab.get(token)
+                if term_id is None:
+                    term_id = len(vocab)
+                    vocab[token] = term_id
+                buffer['indices'].append(term_id)
+                buffer['data'].append(count)
+
+            buffer['indptr'].append(len(buffer['indices']))
+            self.lengths[c].append(len(tokens))
+
+        return self
+
+    def add_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Adds rows to the index. Rows are identified by their index labels.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the rows to index.
+        """
+
+        columns = [c for c in self.columns if c in dataframe.columns]
+        col_values = [dataframe[c].to_numpy(dtype=object) for c in columns]
+
+        for pos, label in enumerate(dataframe.index):
+            row = {c: values[pos] for c, values in zip(columns, col_values)}
+            self.add_document(label, row)
+
+        self.merge(force = False)
+
+        return self
+
+    def drop_rows(self, labels):
+
+        """
+        Removes rows from the index. The rows' matrix entries are deleted when the index is next merged.
+
+        Parameters
+        ----------
+        labels : list
+            index labels of the rows to remove.
+        """
+
+        for label in labels:
+
+            row_id = self.label_rows.pop(label, None)
+            if row_id is None:
+                continue
+
+            self.row_labels[row_id] = None
+            for c in self.columns:
+                self.values[c].pop(label, None)
+
+        return self
+
+    def update_rows(self, dataframe: pd.DataFrame):
+
+        """
+        Re-indexes rows whose text has changed.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            a dataframe containing the updated rows.
+        """
+
+        self.drop_rows(dataframe.index.to_list())
+        self.add_rows(dataframe)
+
+        return self
+
+    def relabel(self, old_labels):
+
+        """
+        Relabels rows after a dataframe's index has been reset. Rows whose labels are not included are removed.
+
+        Parameters
+        ----------
+        old_labels : list
+            the rows' labels before the reset, in their new order. Row n is given the label n.
+        """
+
+        mapping = {old: new for new, old in enumerate(old_labels)}
+
+        if all(old == new for old, new in mapping.items()) and (len(mapping) == len(self.label_rows)):
+            return self
+
+        self.drop_rows([label for label in self.label_rows.keys() if label not in mapping])
+
+        self.row_labels = [mapping.get(label) if label is not None else None for label in self.row_labels]
+        self.label_rows = {label: row_id for row_id, label in enumerate(self.row_labels) if label is not None}
+
+        for c in self.columns:
+            values = self.values[c]
+            self.values[c] = {new: values[old] for old, new in mapping.items() if old in values}
+
+        return self
+
+    def sync(self, dataframe: pd.DataFrame):
+
+        """
+        Brings the index up to date with a dataframe. New rows and rows whose text has changed since they were indexed are re-indexed, and rows no longer in the dataframe are removed.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the indexed dataframe.
+        """
+
+        missing = object()
+        changed = set()
+        labels = dataframe.index
+
+        for label in labels:
+            if label not in self.label_rows:
+                changed.add(label)
+
+        if len(self.label_rows) > len(labels) - len(changed):
+            current = set(labels)
+            self.drop_rows([label for label in self.label_rows.keys() if label not in current])
+
+        for c in self.columns:
+
+            values = self.values[c]
+
+            if c not in dataframe.columns:
+                col_values = np.full(len(dataframe), None, dtype=object)
+            else:
+                col_values = dataframe[c].to_numpy(dtype=object)
+
+            for label, value in zip(labels, col_values):
+
+                old = values.get(label, missing)
+
+                if old is value:
+                    continue
+
+                if (type(value) == str) and (type(old) == str) and (old == value):
+                    values[label] = value
+                    continue
+
+                if (old is None) and (cell_to_text(value) == ''):
+                    continue
+
+                changed.add(label)
+
+        if len(changed) > 0:
+            self.add_rows(dataframe.loc[[i for i in labels if i in changed]])
+
+        return self
+
+    def buffer_matrix(self, column: str):
+
+        """
+        Returns the buffered (unmerged) rows of a column as a sparse CSR matrix.
+        """
+
+        buffer = self.buffer[column]
+        shape = (len(buffer['indptr']) - 1, len(self.vocab))
+
+        matrix = self.buffer_cache.get(column)
+        if (matrix is None) or (matrix.shape != shape):
+            matrix = sparse.csr_matrix((np.asarray(buffer['data'], dtype=np.int32), np.asarray(buffer['indices'], dtype=np.int32), np.asarray(buffer['indptr'], dtype=np.int64)), shape = shape)
+            self.buffer_cache[column] = matrix
+
+        return matrix
+
+    def merge(self, force: bool = True):
+
+        """
+        Merges buffered rows into the main term-frequency matrices and removes deleted rows.
+
+        Parameters
+        ----------
+        force : bool
+            whether to merge regardless of the size of the buffer. If False, rows are only merged once the buffer holds more than 10,000 rows or a tenth of the index. Defaults to True.
+        """
+
+        buffered = len(self.row_labels) - self.merged_rows
+
+        if (force == False) and (buffered <= max(10000, self.merged_rows // 10)):
+            return self
+
+        keep = [row_id for row_id, label in enumerate(self.row_labels) if label is not None]
+        keep_all = len(keep) == len(self.row_labels)
+        n_terms = len(self.vocab)
+
+        for c in self.columns:
+
+            main = self.matrices[c]
+            main.resize((self.merged_rows, n_terms))
+            combined = sparse.vstack([main.tocsr(), self.buffer_matrix(c)], format = 'csr')
+
+            if keep_all == False:
+                combined = combined[keep]
+
+            self.matrices[c] = combined.tocsc()
+            self.buffer[c] = {'indptr': [0], 'indices': [], 'data': []}
+            self.buffer_cache.pop(c, None)
+
+            if keep_all == False:
+                lengths = self.lengths[c]
+                self.lengths[c] = [lengths[row_id] for row_id in keep]
+
+        if keep_all == False:
+            self.row_labels = [self.row_labels[row_id] for row_id in keep]
+            self.label_rows = {label: row_id for row_id, label in enumerate(self.row_labels)}
+
+        self.merged_rows = len(self.row_labels)
+
+        return self
+
+    def term_frequencies(self, column: str, term_ids: list):
+
+        """
+        Returns the frequencies of a set of terms in each row of a column, as a sparse CSC matrix with a row for each matrix row and a column for each term.
+        """
+
+        main = self.matrices[column]
+        if main.shape[1] < len(self.vocab):
+            main.resize((self.merged_rows, len(self.vocab)))
+
+        buffered = self.buffer_matrix(column)
+
+        return sparse.vstack([main[:, term_ids], buffered[:, term_ids]], format = 'csc')
+
+    def score(self, query: str, columns = None) -> pd.Series:
+
+        """
+        Scores all indexed rows against a query using BM25.
+
+        Parameters
+        ----------
+        query : str
+            a search query.
+        columns : list
+            names of columns to score. Their text is treated as a single document. Defaults to all indexed columns.
+
+        Returns
+        -------
+        result : pandas.Series
+            BM25 scores, indexed by row label. Only rows with a score above zero are included.
+        """
+
+        if columns is None:
+            columns = self.columns
+
+        columns = [c for c in columns if c in self.columns]
+        if len(columns) == 0:
+            raise ValueError(f'None of the requested fields are indexed. Indexed fields: {self.columns}')
+
+        tokens = list(dict.fromkeys(self.tokenize(query)))
+        term_ids = [self.vocab[t] for t in tokens if t in self.vocab]
+
+        if (len(term_ids) == 0) or (len(self.label_rows) == 0):
+            return pd.Series(dtype=float)
+
+        live = np.array([label is not None for label in self.row_labels], dtype=bool)
+
+        tf = None
+        lengths = np.zeros(len(self.row_labels), dtype=np.float64)
+        for c in columns:
+            col_tf = self.term_frequencies(c, term_ids)
+            tf = col_tf if tf is None else tf + col_tf
+            lengths += np.asarray(self.lengths[c], dtype=np.float64)
+
+        tf = tf.tocsc() # type: ignore
+        tf.eliminate_zeros()
+
+        doc_count = live.sum()
+        avg_length = lengths[live].mean()
+        if avg_length == 0:
+            avg_length = 1.0
+
+        norms = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        scores = np.zeros(len(self.row_labels), dtype=np.float64)
+
+        for j in range(len(term_ids)):
+
+            start, end = tf.indptr[j], tf.indptr[j + 1]
+            rows = tf.indices[start:end]
+            freqs = tf.data[start:end].astype(np.float64)
+
+            mask = live[rows]
+            rows = rows[mask]
+            freqs = freqs[mask]
+
+            doc_freq = len(rows)
+            if doc_freq == 0:
+                continue
+
+            idf = np.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+            scores[rows] += idf * freqs * (self.k1 + 1) / (freqs + norms[rows])
+
+        matched = np.flatnonzero(scores > 0)
+        labels = [self.row_labels[row_id] for row_id in matched]
+
+        return pd.Series(scores[matched], index = labels, dtype=float)
+
+    def top(self, query: str, columns = None, top_k: int = 10) -> pd.Series:
+
+        """
+        Returns the rows that best match a query, ranked by BM25 score.
+
+        Parameters
+        ----------
+        query : str
+            a search query.
+        columns : list
+            names of columns to score. Defaults to all indexed columns.
+        top_k : int
+            maximum number of rows to return. If None, returns all matching rows. Defaults to 10.
+
+        Returns
+        -------
+        result : pandas.Series
+            BM25 scores in descending order, indexed by row label.
+        """
+
+        scores = self.score(query, columns = columns)
+
+        if (top_k is not None) and (len(scores) > top_k):
+            top_positions = np.argpartition(-scores.to_numpy(), top_k - 1)[:top_k]
+            scores = scores.iloc[top_positions]
+
+        return scores.sort_values(ascending = False, kind = 'stable')
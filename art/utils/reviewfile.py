@@ -0,0 +1,1179 @@
+"""Versioned, sectioned file format for Reviews."""
+
+from .lazy import LazyValue, materialize
+
+import os
+import json
+import mmap
+import pickle
+import hashlib
+import struct
+import tempfile
+import uuid
+
+import numpy as np
+import pandas as pd
+
+# Marks the start and end of sectioned .review files. Files without it are pickled Reviews
+magic = b'ART.REVIEW\x00'
+
+# Version of the sectioned format written by this version of ART
+format_version = 2
+
+# Manifest length, stored before the closing magic bytes
+length_struct = struct.Struct('<Q')
+
+# Largest size of a .review file's journal, relative to the size of the rest of the file, before incremental saves rewrite the file
+journal_limit = 1.0
+
+def set_journal_limit(limit: float = 1.0):
+
+    """
+    Sets how large a .review file's journal of incremental saves can grow, relative to the size of the rest of the file, before the file is rewritten without it (see Review.compact).
+
+    Parameters
+    ----------
+    limit : float
+        the largest size of the journal, as a proportion of the size of the rest of the file. Defaults to 1.0.
+    """
+
+    global journal_limit
+    journal_limit = limit
+
+def get_pyarrow():
+
+    """
+    Returns the PyArrow module, or None if PyArrow is not installed.
+    """
+
+    try:
+        import pyarrow # type: ignore
+        import pyarrow.ipc # type: ignore
+    except ImportError:
+        return None
+
+    return pyarrow
+
+def is_review_file(file_path) -> bool:
+
+    """
+    Returns True if a file uses the sectioned .review format; returns False if it is a pickled Review (or any other file).
+    """
+
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(magic)) == magic
+    except OSError:
+        return False
+
+def is_plain_column(values) -> bool:
+
+    """
+    Returns True if every value in a column is a string or None, so that the column can be stored as an Arrow string column without changing its values.
+    """
+
+    for value in values:
+        if (value is not None) and (type(value) != str):
+            return False
+
+    return True
+
+def missing_code(value) -> int:
+
+    """
+    Returns the code used to record a lazily loaded cell's value in a table: 0 for None, 1 for NaN and 2 for any other value. Cells whose values are held by another section of the file are recorded as 3 (see lazy_reference).
+    """
+
+    if value is None:
+        return 0
+
+    if (type(value) == float) and (value != value):
+        return 1
+
+    return 2
+
+class PickledObjects:
+
+    """
+    This is a PickledObjects object. It holds pickled dataframe columns, which are unpickled together when a value is first requested. Objects shared between cells (e.g. lists referenced by several Authors objects) are therefore only stored and loaded once.
+
+    Parameters
+    ----------
+    data : bytes
+        a pickled dictionary of column names and lists of values.
+    source : tuple
+        the ID of the .review file and the name of the section the columns were read from. Defaults to None.
+    """
+
+    __slots__ = ('data', 'values', 'source')
+
+    def __init__(self, data, source = None):
+
+        """
+        Initialises PickledObjects instance.
+        """
+
+        self.data = data
+        self.values = None
+        self.source = source
+
+    def get(self, column: str, position: int):
+
+        """
+        Returns a column's value at a position, unpickling the columns if they have not yet been unpickled.
+        """
+
+        if self.values is None:
+            self.values = pickle.loads(self.data)
+            self.data = None
+
+        return self.values[column][position]
+
+    def __getstate__(self):
+        return (self.data, self.values, self.source)
+
+    def __setstate__(self, state):
+        self.data, self.values = state[:2]
+        self.source = state[2] if len(state) > 2 else None
+
+def load_object(key, objects = None):
+
+    """
+    Returns a lazily loaded cell's value. Used by LazyValue.
+
+    Parameters
+    ----------
+    key : tuple
+        the cell's column name and position.
+    objects : PickledObjects
+        the pickled columns holding the value.
+    """
+
+    column, position = key
+
+    return objects.get(column, position) # type: ignore
+
+def lazy_reference(value, source):
+
+    """
+    Returns the section and key holding a lazily loaded cell's value, if the value was loaded from a .review file and has not been formatted since; otherwise, returns None.
+
+    Parameters
+    ----------
+    value : object
+        the cell's value.
+    source : str
+        the ID of the file being written to. Values loaded from other files return None.
+    """
+
+    if (source is None) or (type(value) != LazyValue) or (value.formatted == True) or (value.function is not load_object):
+        return None
+
+    objects = value.kwargs.get('objects')
+
+    if (type(objects) != PickledObjects) or (objects.source is None) or (objects.source[0] != source):
+        return None
+
+    return (objects.source[1], value.data)
+
+def encode_frame(dataframe: pd.DataFrame, lazy_columns = None, source = None) -> list:
+
+    """
+    Encodes a dataframe as an Arrow IPC table of its columns which can be stored in Arrow format, and a pickle of its other object columns (e.g. columns of Authors objects, lists and NaNs). Object columns are pickled together rather than cell by cell, so that objects shared between cells are stored once. If PyArrow is not installed, the dataframe is pickled.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        the dataframe to encode.
+    lazy_columns : list
+        names of object columns to pickle separately, so that their values can be loaded when first used (see decode_frame). Defaults to None.
+    source : str
+        the ID of the .review file being appended to. Lazily loaded cells which were read from this file and have not been formatted are stored as references to the sections holding them, rather than being loaded and pickled again. Defaults to None.
+
+    Returns
+    -------
+    parts : list
+        (suffix, bytes, encoding, info) tuples: the table, followed by the pickled object columns, lazily loaded columns and references to lazily loaded cells if there are any. Suffixes are appended to the section name.
+    """
+
+    pa = get_pyarrow()
+
+    if pa is None:
+        return [('', pickle.dumps(dataframe, protocol = pickle.HIGHEST_PROTOCOL), 'pickle', dict())]
+
+    if lazy_columns is None:
+        lazy_columns = []
+
+    columns = dict()
+    objects = dict()
+    lazy = dict()
+    references = dict()
+
+    for c in dataframe.columns:
+
+        series = dataframe[c]
+
+        if (series.dtype != object) or (is_plain_column(series.to_numpy()) == True):
+            columns[str(c)] = series
+            continue
+
+        if c in lazy_columns:
+
+            codes = []
+            values = []
+            column_references = dict()
+
+            for i, value in enumerate(series.to_numpy()):
+
+                reference = lazy_reference(value, source)
+
+                if reference is not None:
+                    column_references[i] = reference
+                    codes.append(3)
+                    values.append(None)
+                else:
+                    value = materialize(value)
+                    codes.append(missing_code(value))
+                    values.append(value)
+
+            # The table records which cells are missing, so that they are not loaded lazily
+            columns[str(c)] = pd.Series(codes, index = dataframe.index, dtype = 'int8')
+            lazy[str(c)] = values
+
+            if len(column_references) > 0:
+                references[str(c)] = column_references
+
+        else:
+            objects[str(c)] = [materialize(value) for value in series.to_numpy()]
+
+    frame = pd.DataFrame(columns, index = dataframe.index)
+    table = pa.Table.from_pandas(frame, preserve_index = True)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    info = {
+            'columns': [str(c) for c in dataframe.columns],
+            'objects': list(objects.keys()),
+            'lazy': list(lazy.keys())
+            }
+
+    parts = [('', sink.getvalue().to_pybytes(), 'arrow', info)]
+
+    if len(objects) > 0:
+        parts.append(('.objects', pickle.dumps(objects, protocol = pickle.HIGHEST_PROTOCOL), 'pickle', dict()))
+
+    if len(lazy) > 0:
+        parts.append(('.lazy', pickle.dumps(lazy, protocol = pickle.HIGHEST_PROTOCOL), 'pickle', dict()))
+
+    if len(references) > 0:
+        parts.append(('.references', pickle.dumps(references, protocol = pickle.HIGHEST_PROTOCOL), 'pickle', dict()))
+
+    return parts
+
+def decode_frame(data, info: dict, objects = None, lazy = None, references = None, resolve = None) -> pd.DataFrame:
+
+    """
+    Decodes a dataframe encoded by encode_frame.
+
+    Parameters
+    ----------
+    data : bytes
+        the Arrow IPC table.
+    info : dict
+        the table's column names, object columns and lazily loaded columns.
+    objects : bytes
+        the pickled object columns. Defaults to None.
+    lazy : bytes or PickledObjects
+        the pickled lazily loaded columns. Their cells are LazyValues, and the columns are unpickled when a cell is first used. Defaults to None.
+    references : bytes
+        the pickled references to lazily loaded cells held by other sections. Defaults to None.
+    resolve : callable
+        a function returning the PickledObjects of a section, used to load referenced cells. Defaults to None.
+
+    Returns
+    -------
+    dataframe : pandas.DataFrame
+        the decoded dataframe.
+    """
+
+    pa = get_pyarrow()
+
+    if pa is None:
+        raise ImportError('PyArrow is required to read tables from this .review file')
+
+    dataframe = pa.ipc.open_file(pa.py_buffer(data)).read_all().to_pandas()
+
+    if objects is not None:
+        for c, values in pickle.loads(objects).items():
+            dataframe[c] = pd.Series(values, index = dataframe.index, dtype = object)
+
+    if lazy is not None:
+
+        lazy_objects = lazy if type(lazy) == PickledObjects else PickledObjects(lazy)
+        cell_references = pickle.loads(references) if references is not None else dict()
+
+        for c in info.get('lazy', []):
+
+            codes = dataframe[c].to_numpy()
+            column_references = cell_references.get(c, dict())
+            values = []
+
+            for i, code in enumerate(codes):
+                if code == 0:
+                    values.append(None)
+                elif code == 1:
+                    values.append(np.nan)
+                elif code == 3:
+                    section, key = column_references[i]
+                    values.append(LazyValue(load_object, key, {'objects': resolve(section)})) # type: ignore
+                else:
+                    values.append(LazyValue(load_object, (c, i), {'objects': lazy_objects}))
+
+            dataframe[c] = pd.Series(values, index = dataframe.index, dtype = object)
+
+    return dataframe[info['columns']]
+
+def encode_section(kind: str, value, lazy_columns = None, source = None) -> list:
+
+    """
+    Encodes a section's value.
+
+    Parameters
+    ----------
+    kind : str
+        how to store the value: 'frame' (a dataframe, stored as a table), 'json' (JSON-serialisable metadata) or 'object' (any other object, pickled).
+    value : object
+        the value to encode.
+    lazy_columns : list
+        for dataframes, names of object columns to load lazily. Defaults to None.
+    source : str
+        for dataframes, the ID of the .review file being appended to (see encode_frame). Defaults to None.
+
+    Returns
+    -------
+    parts : list
+        (suffix, bytes, encoding, info) tuples.
+    """
+
+    if kind == 'frame':
+        return encode_frame(value, lazy_columns = lazy_columns, source = source)
+
+    if kind == 'json':
+        return [('', json.dumps(value, default = str).encode(), 'json', dict())]
+
+    return [('', pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL), 'pickle', dict())]
+
+def write_parts(f, sections: dict, name: str, kind: str, value, lazy_columns = None, source = None):
+
+    """
+    Encodes a section and writes it to an open file, recording the position and encoding of each of its parts in a dictionary of sections.
+    """
+
+    for suffix, data, encoding, info in encode_section(kind, value, lazy_columns = lazy_columns, source = source):
+        sections[name + suffix] = {'offset': f.tell(), 'length': len(data), 'encoding': encoding, **info}
+        f.write(data)
+
+def write_manifest(f, manifest: dict):
+
+    """
+    Writes a manifest to an open file, followed by its length and the closing magic bytes.
+    """
+
+    manifest_data = json.dumps(manifest, default = str).encode()
+    f.write(manifest_data)
+    f.write(length_struct.pack(len(manifest_data)))
+    f.write(magic)
+
+def write_review_file(file_path, sections, metadata = None, lazy_columns = None) -> dict:
+
+    """
+    Writes sections to a sectioned .review file. The file is written to a temporary file which then replaces the target, so that an existing file is not left incomplete if writing fails.
+
+    Sections are written one at a time, followed by a JSON manifest giving each section's position and encoding, the format version, an ID which is kept by incremental saves and metadata.
+
+    Parameters
+    ----------
+    file_path : str
+        path of the file to write.
+    sections : iterable
+        (name, kind, value) tuples. See encode_section for kinds.
+    metadata : dict
+        JSON-serialisable metadata stored in the manifest (e.g. Review properties). Defaults to None.
+    lazy_columns : dict
+        names of table sections and lists of their object columns to load lazily. Defaults to None.
+
+    Returns
+    -------
+    manifest : dict
+        the file's manifest.
+    """
+
+    if metadata is None:
+        metadata = dict()
+
+    if lazy_columns is None:
+        lazy_columns = dict()
+
+    file_path = str(file_path)
+    folder = os.path.dirname(os.path.abspath(file_path))
+
+    manifest = {
+                'format': 'art.review',
+                'version': format_version,
+                'id': uuid.uuid4().hex,
+                'metadata': metadata,
+                'sections': dict(),
+                'journal': []
+                }
+
+    handle, temp_path = tempfile.mkstemp(dir = folder, suffix = '.tmp')
+
+    try:
+        with os.fdopen(handle, 'wb') as f:
+
+            f.write(magic)
+
+            for name, kind, value in sections:
+                write_parts(f, manifest['sections'], name, kind, value, lazy_columns = lazy_columns.get(name))
+
+            write_manifest(f, manifest)
+
+        os.replace(temp_path, file_path)
+
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return manifest
+
+def append_review_file(file_path, manifest: dict, changes, metadata = None, lazy_columns = None) -> dict:
+
+    """
+    Appends changes to a sectioned .review file as a journal segment, followed by an updated manifest. Existing sections are not rewritten, so the time taken depends on the size of the changes rather than the size of the file. The file's previous manifest is left in place, so the file can still be read as it was before if appending fails. If there are no changes and the metadata is unchanged, nothing is written.
+
+    Parameters
+    ----------
+    file_path : str
+        path of the file to append to.
+    manifest : dict
+        the file's current manifest.
+    changes : iterable
+        (name, mode, kind, value) tuples. Modes:
+            * 'replace': replaces (or creates) the section with value.
+            * 'rows': updates a table. Value is an (order, rows) tuple from TableSnapshot.diff.
+            * 'update': replaces rows of a table whose index is unchanged. Value is a dataframe of the changed rows from TableSnapshot.diff.
+            * 'append': appends records to a JSON table in 'split' orientation. Value is a dictionary of 'index' and 'data' lists.
+            * 'state': updates a pickled dictionary. Value is a diff from StateSnapshot.diff.
+            * 'delete': removes the section.
+    metadata : dict
+        JSON-serialisable metadata to replace the manifest's metadata. Defaults to None (unchanged).
+    lazy_columns : dict
+        names of table sections and lists of their object columns to load lazily. Defaults to None.
+
+    Returns
+    -------
+    manifest : dict
+        the updated manifest.
+    """
+
+    if lazy_columns is None:
+        lazy_columns = dict()
+
+    changes = list(changes)
+
+    if metadata is not None:
+        metadata = json.loads(json.dumps(metadata, default = str))
+
+    if (len(changes) == 0) and ((metadata is None) or (metadata == manifest.get('metadata'))):
+        return manifest
+
+    journal = list(manifest.get('journal', []))
+    position = len(journal)
+    source = manifest.get('id')
+
+    manifest = dict(manifest)
+    manifest['sections'] = dict(manifest['sections'])
+    segment = dict()
+
+    if metadata is not None:
+        manifest['metadata'] = metadata
+
+    # Journal segments may use parts of the format which files written by older versions do not
+    manifest['version'] = format_version
+
+    with open(str(file_path), 'r+b') as f:
+
+        f.seek(0, os.SEEK_END)
+
+        for name, mode, kind, value in changes:
+
+            key = f'journal/{position}/{name}'
+            segment[name] = mode
+
+            if mode == 'rows':
+                order, rows = value
+                write_parts(f, manifest['sections'], key + '/order', 'frame', order)
+                write_parts(f, manifest['sections'], key, 'frame', rows, lazy_columns = lazy_columns.get(name), source = source)
+
+            elif mode == 'update':
+                write_parts(f, manifest['sections'], key, 'frame', value, lazy_columns = lazy_columns.get(name), source = source)
+
+            elif mode == 'append':
+                write_parts(f, manifest['sections'], key, 'json', value)
+
+            elif mode == 'state':
+                write_parts(f, manifest['sections'], key, 'object', value)
+
+            elif mode == 'replace':
+                write_parts(f, manifest['sections'], key, kind, value, lazy_columns = lazy_columns.get(name), source = source)
+
+        if len(segment) > 0:
+            journal.append(segment)
+
+        manifest['journal'] = journal
+        write_manifest(f, manifest)
+
+    return manifest
+
+def journal_size(manifest: dict) -> int:
+
+    """
+    Returns the number of bytes of a manifest's sections which are held in its journal.
+    """
+
+    return sum(section['length'] for name, section in manifest['sections'].items() if name.startswith('journal/'))
+
+def base_size(manifest: dict) -> int:
+
+    """
+    Returns the number of bytes of a manifest's sections which are not held in its journal.
+    """
+
+    return sum(section['length'] for name, section in manifest['sections'].items() if name.startswith('journal/') == False)
+
+def object_fingerprint(value) -> int:
+
+    """
+    Returns a fingerprint for an object's content: a hash of its pickled bytes. Objects which cannot be pickled are fingerprinted by identity. Objects with a fingerprint_state method (e.g. Entities) are fingerprinted by the stand-in it returns.
+    """
+
+    if hasattr(type(value), 'fingerprint_state'):
+        value = value.fingerprint_state()
+
+    try:
+        data = pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return id(value)
+
+    return int.from_bytes(hashlib.blake2b(data, digest_size = 8).digest(), 'little', signed = True)
+
+def cell_fingerprint(value) -> int:
+
+    """
+    Returns a fingerprint for a value in an object column: strings, numbers and NaNs are fingerprinted by value; other objects by content (see object_fingerprint), so that objects changed in place (e.g. an Authors object which an author is added to) are detected. Unformatted lazy values are fingerprinted by identity.
+    """
+
+    value_type = type(value)
+
+    if value_type == float:
+        if value != value:
+            return 0
+        return hash(value)
+
+    if (value_type == str) or (value_type == int) or (value_type == bool):
+        return hash(value)
+
+    # Lazy values are fingerprinted by their formatted objects; unformatted ones hold data as loaded, and are fingerprinted by identity
+    if value_type == LazyValue:
+        if value.formatted == True:
+            return object_fingerprint(value.value)
+        return id(value)
+
+    return object_fingerprint(value)
+
+def row_fingerprints(dataframe: pd.DataFrame):
+
+    """
+    Returns a fingerprint for each row of a dataframe, used to find rows which have changed since a dataframe was saved.
+
+    Columns with Arrow-compatible types, and strings and numbers in object columns, are fingerprinted by value. Other objects (e.g. Authors objects and lists) are fingerprinted by their pickled content, so that objects which are changed in place (e.g. a list which is appended to) are detected.
+
+    Returns
+    -------
+    result : tuple
+        an array of row fingerprints and a list of copies of the dataframe's object columns. The copies keep objects which could only be fingerprinted by identity alive, so that their identities cannot be reused by new objects.
+    """
+
+    hashes = np.zeros(len(dataframe), dtype = np.uint64)
+    refs = []
+
+    for c in dataframe.columns:
+
+        series = dataframe[c]
+
+        if series.dtype == object:
+            values = series.to_numpy(dtype = object, copy = True)
+            refs.append(values)
+            column_hashes = pd.util.hash_array(np.fromiter(map(cell_fingerprint, values), dtype = np.int64, count = len(values)))
+        else:
+            column_hashes = pd.util.hash_pandas_object(series, index = False).to_numpy()
+
+        hashes = (hashes * np.uint64(1000003)) ^ column_hashes
+
+    return hashes, refs
+
+class TableSnapshot:
+
+    """
+    This is a TableSnapshot object. It records a dataframe's columns and index when it is saved, so that the rows which have since been added, changed, removed or reordered can be found.
+
+    Dataframes which record their edits in a change tracker (e.g. Results DataFrames; see ChangeTracker.record_edit) are compared using the tracker, so only their index is compared when nothing has been edited. Other dataframes are compared using row fingerprints.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        the saved dataframe.
+    tracker : ChangeTracker
+        the dataframe's change tracker, if it records the dataframe's edits. Defaults to None.
+    previous : TableSnapshot
+        the dataframe's previous snapshot. Fingerprints it computed when the dataframe was last compared to it are reused. Defaults to None.
+
+    Attributes
+    ----------
+    columns : list
+        the dataframe's column names.
+    index : pandas.Index
+        the dataframe's index.
+    tracker : ChangeTracker
+        the dataframe's change tracker, or None.
+    edit : int
+        the tracker's edit number when the snapshot was taken.
+    hashes : numpy.ndarray
+        the dataframe's row fingerprints, if it has no tracker.
+    refs : list
+        copies of the dataframe's object columns, if it has no tracker.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, tracker = None, previous = None):
+
+        """
+        Initialises TableSnapshot instance.
+        """
+
+        self.columns = [str(c) for c in dataframe.columns]
+        self.index = dataframe.index.copy()
+        self.tracker = tracker
+        self.edit = None
+        self.hashes = None
+        self.refs = None
+        self.compared = None
+
+        if tracker is not None:
+            self.edit = tracker.edit_counter
+
+        elif (previous is not None) and (previous.compared is not None) and (previous.compared[0] is dataframe):
+            _, self.hashes, self.refs = previous.compared
+
+        else:
+            self.hashes, self.refs = row_fingerprints(dataframe)
+
+        if previous is not None:
+            previous.compared = None
+
+    def diff(self, dataframe: pd.DataFrame, changed = None, tracker = None):
+
+        """
+        Compares a dataframe to the snapshot.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            the dataframe to compare.
+        changed : list
+            index labels of rows to treat as changed, regardless of their fingerprints (e.g. rows whose objects have been changed in place). Defaults to None.
+        tracker : ChangeTracker
+            the dataframe's change tracker, if it records the dataframe's edits. Rows edited since the snapshot was taken are treated as changed. Defaults to None.
+
+        Returns
+        -------
+        result : tuple or None
+            None if the dataframe is unchanged; ('replace', dataframe) if its columns have changed; ('update', rows) if only rows have changed, where rows holds the changed rows in order; otherwise, ('rows', (order, rows)). Order is a dataframe with the new index and a 'source' column giving each row's position in the snapshot, or -1 for rows which are new or changed. Rows holds the new or changed rows.
+        """
+
+        if [str(c) for c in dataframe.columns] != self.columns:
+            return ('replace', dataframe)
+
+        if changed is None:
+            changed = []
+
+        if self.tracker is not None:
+
+            # Snapshots of another tracker's dataframe (e.g. a dataframe which has been replaced) cannot be compared
+            if (tracker is not self.tracker) or (self.index.is_unique == False) or (dataframe.index.is_unique == False):
+                return ('replace', dataframe)
+
+            changed = list(changed) + tracker.edited(self.edit)
+
+            if (len(changed) == 0) and dataframe.index.equals(self.index):
+                return None
+
+            source = self.index.get_indexer(dataframe.index)
+
+        else:
+
+            hashes, refs = row_fingerprints(dataframe)
+            self.compared = (dataframe, hashes, refs)
+
+            positions = dict(zip(self.hashes.tolist(), range(len(self.hashes)))) # type: ignore
+            source = np.fromiter((positions.get(h, -1) for h in hashes.tolist()), dtype = np.int64, count = len(hashes))
+
+        if len(changed) > 0:
+            positions = dataframe.index.get_indexer(changed)
+            source[positions[positions >= 0]] = -1
+
+        unchanged = (source == np.arange(len(source))) | (source < 0)
+
+        if (len(source) == len(self.index)) and unchanged.all() and dataframe.index.equals(self.index):
+
+            if (source >= 0).all():
+                return None
+
+            # Rows have only been changed, so the index does not need to be saved again
+            return ('update', dataframe.iloc[np.flatnonzero(source < 0)])
+
+        order = pd.DataFrame({'source': source}, index = dataframe.index)
+        rows = dataframe.iloc[np.flatnonzero(source < 0)]
+
+        return ('rows', (order, rows))
+
+class StateSnapshot:
+
+    """
+    This is a StateSnapshot object. It records the attributes of a dictionary (e.g. an object's state) when it is saved, so that the attributes and items which have since changed can be found.
+
+    Dictionary attributes are compared item by item, and list attributes which have only been extended are compared by their new items. Other attributes, and items, are compared by identity and content (see object_fingerprint).
+
+    Parameters
+    ----------
+    state : dict
+        the saved dictionary.
+    previous : StateSnapshot
+        the dictionary's previous snapshot. Fingerprints it computed when the dictionary was last compared to it are reused for attributes and items which are the same objects. Defaults to None.
+    """
+
+    def __init__(self, state: dict, previous = None):
+
+        """
+        Initialises StateSnapshot instance.
+        """
+
+        self.attrs = dict()
+        self.compared = None
+
+        compared = dict()
+        if (previous is not None) and (previous.compared is not None):
+            compared = previous.compared
+            previous.compared = None
+
+        for attr, value in state.items():
+
+            reused = compared.get(attr)
+            if (reused is not None) and (reused[0] is not value):
+                reused = None
+
+            if type(value) == dict:
+                items = reused[1] if reused is not None else dict()
+                self.attrs[attr] = ('dict', value, {key: items[key] if (key in items) and (items[key][0] is item) else (item, object_fingerprint(item)) for key, item in value.items()})
+            elif type(value) == list:
+                self.attrs[attr] = ('list', value, (len(value), object_fingerprint(value)))
+            elif reused is not None:
+                self.attrs[attr] = ('value', value, reused[1])
+            else:
+                self.attrs[attr] = ('value', value, object_fingerprint(value))
+
+    def diff(self, state: dict):
+
+        """
+        Compares a dictionary to the snapshot.
+
+        Returns
+        -------
+        result : dict or None
+            None if the dictionary is unchanged; otherwise, a dictionary of changes: attributes to set ('set'), dictionary items to update ('update') or remove ('remove'), items to add to lists ('extend'), and attributes to delete ('delete').
+        """
+
+        changes = {'set': dict(), 'update': dict(), 'remove': dict(), 'extend': dict(), 'delete': []}
+        compared = dict()
+
+        for attr, value in state.items():
+
+            if attr not in self.attrs:
+                changes['set'][attr] = value
+                continue
+
+            kind, ref, saved = self.attrs[attr]
+
+            if (kind == 'dict') and (type(value) == dict):
+
+                items = {key: (item, object_fingerprint(item)) for key, item in value.items()}
+                compared[attr] = (value, items)
+
+                updated = {key: item for key, (item, fingerprint) in items.items() if (key not in saved) or (saved[key][0] is not item) or (saved[key][1] != fingerprint)}
+                removed = [key for key in saved.keys() if key not in value]
+
+                if len(updated) > 0:
+                    changes['update'][attr] = updated
+
+                if len(removed) > 0:
+                    changes['remove'][attr] = removed
+
+                continue
+
+            if (kind == 'list') and (value is ref) and (len(value) >= saved[0]) and (object_fingerprint(value[:saved[0]]) == saved[1]):
+
+                if len(value) > saved[0]:
+                    changes['extend'][attr] = value[saved[0]:]
+
+                continue
+
+            if (kind != 'value') or (value is not ref):
+                changes['set'][attr] = value
+                continue
+
+            fingerprint = object_fingerprint(value)
+            compared[attr] = (value, fingerprint)
+
+            if fingerprint != saved:
+                changes['set'][attr] = value
+
+        # Keeping the fingerprints, so that the next snapshot does not need to compute them again
+        self.compared = compared
+
+        changes['delete'] = [attr for attr in self.attrs.keys() if attr not in state]
+
+        if all(len(change) == 0 for change in changes.values()):
+            return None
+
+        return changes
+
+def apply_rows(previous: pd.DataFrame, order: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+
+    """
+    Applies a table update (see TableSnapshot.diff) to a dataframe.
+    """
+
+    source = order['source'].to_numpy()
+    new = source < 0
+
+    take = source.copy()
+    take[new] = len(previous) + np.arange(new.sum())
+
+    if len(rows) > 0:
+        combined = pd.concat([previous, rows])
+    else:
+        combined = previous
+
+    dataframe = combined.iloc[take]
+    dataframe.index = order.index
+
+    # Restoring categorical columns, which are converted to objects when combined with rows with other categories
+    for c in previous.columns:
+        if (isinstance(previous[c].dtype, pd.CategoricalDtype) == True) and (isinstance(dataframe[c].dtype, pd.CategoricalDtype) == False):
+            dataframe[c] = dataframe[c].astype('category')
+
+    return dataframe
+
+def apply_update(previous: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+
+    """
+    Applies a table update which only replaces rows (see TableSnapshot.diff) to a dataframe.
+    """
+
+    source = np.arange(len(previous))
+    source[previous.index.get_indexer(rows.index)] = -1
+
+    return apply_rows(previous, pd.DataFrame({'source': source}, index = previous.index), rows)
+
+def apply_state(previous: dict, changes: dict) -> dict:
+
+    """
+    Applies changes to a dictionary (see StateSnapshot.diff).
+    """
+
+    state = dict(previous)
+
+    for attr, value in changes['set'].items():
+        state[attr] = value
+
+    for attr, items in changes['update'].items():
+        state[attr].update(items)
+
+    for attr, keys in changes['remove'].items():
+        for key in keys:
+            state[attr].pop(key, None)
+
+    for attr, items in changes['extend'].items():
+        state[attr].extend(items)
+
+    for attr in changes['delete']:
+        state.pop(attr, None)
+
+    return state
+
+class ReviewFile:
+
+    """
+    This is a ReviewFile object. It opens a sectioned .review file for reading. The file is memory-mapped and only its manifest is read when opened; each section is read and decoded when requested, and any changes to it in the file's journal are applied.
+
+    Parameters
+    ----------
+    file_path : str
+        path of the file to open.
+
+    Attributes
+    ----------
+    file_path : str
+        path of the file.
+    manifest : dict
+        the file's manifest: format version, metadata, the position and encoding of each section and the journal of changes appended since the file was written.
+    """
+
+    def __init__(self, file_path):
+
+        """
+        Initialises ReviewFile instance.
+
+        Parameters
+        ----------
+        file_path : str
+            path of the file to open.
+        """
+
+        self.file_path = str(file_path)
+        self.file = open(self.file_path, 'rb')
+        self.objects = dict()
+
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+            self.manifest = self.read_manifest()
+        except BaseException:
+            self.close()
+            raise
+
+    def manifest_ending_at(self, end: int):
+
+        """
+        Returns the manifest whose footer ends at a position in the file, or None if there is no valid manifest there.
+        """
+
+        footer = length_struct.size + len(magic)
+
+        if (end < len(magic) + footer) or (self.map[end - len(magic) : end] != magic):
+            return None
+
+        manifest_length = length_struct.unpack(self.map[end - footer : end - len(magic)])[0]
+        manifest_start = end - footer - manifest_length
+
+        if manifest_start < len(magic):
+            return None
+
+        try:
+            manifest = json.loads(self.map[manifest_start : end - footer])
+        except ValueError:
+            return None
+
+        if type(manifest) != dict:
+            return None
+
+        return manifest
+
+    def read_manifest(self) -> dict:
+
+        """
+        Reads and validates the file's manifest. If the file ends with an incomplete journal segment (e.g. because saving was interrupted), the last complete manifest is used.
+        """
+
+        if self.map[:len(magic)] != magic:
+            raise ValueError(f'{self.file_path} is not a sectioned .review file')
+
+        end = len(self.map)
+        manifest = self.manifest_ending_at(end)
+
+        while manifest is None:
+
+            found = self.map.rfind(magic, len(magic), end - 1)
+
+            if found < 0:
+                raise ValueError(f'{self.file_path} is not a sectioned .review file')
+
+            end = found + len(magic)
+            manifest = self.manifest_ending_at(end)
+
+        version = manifest.get('version')
+
+        if (type(version) != int) or (version > format_version):
+            raise ValueError(f'{self.file_path} uses .review format version {version}, which is newer than this version of ART supports ({format_version}). Please update ART to open it.')
+
+        return manifest
+
+    @property
+    def metadata(self) -> dict:
+
+        """
+        The metadata stored in the file's manifest.
+        """
+
+        return self.manifest.get('metadata', dict())
+
+    @property
+    def sections(self) -> dict:
+
+        """
+        The file's sections and journal segments, with their positions and encodings.
+        """
+
+        return self.manifest['sections']
+
+    @property
+    def journal(self) -> list:
+
+        """
+        The file's journal segments. Each segment is a dictionary of the sections it changes and how they were changed.
+        """
+
+        return self.manifest.get('journal', [])
+
+    def __contains__(self, name) -> bool:
+
+        exists = name in self.sections
+
+        for segment in self.journal:
+            if name in segment.keys():
+                exists = segment[name] != 'delete'
+
+        return exists
+
+    def read_bytes(self, name: str) -> bytes:
+
+        """
+        Returns a section's encoded bytes.
+        """
+
+        section = self.sections[name]
+        start = section['offset']
+
+        return self.map[start : start + section['length']]
+
+    def lazy_objects(self, name: str) -> PickledObjects:
+
+        """
+        Returns the PickledObjects holding a section's lazily loaded columns. Each section's columns are only read once, so that cells referring to them (see encode_frame) share them.
+        """
+
+        if name not in self.objects:
+            self.objects[name] = PickledObjects(self.read_bytes(name), source = (self.manifest.get('id'), name))
+
+        return self.objects[name]
+
+    def read_section(self, name: str):
+
+        """
+        Reads and decodes a section as it was written, without applying the journal.
+        """
+
+        section = self.sections[name]
+        encoding = section['encoding']
+        data = self.read_bytes(name)
+
+        if encoding == 'arrow':
+
+            objects = None
+            lazy = None
+            references = None
+
+            if f'{name}.objects' in self.sections:
+                objects = self.read_bytes(f'{name}.objects')
+
+            if f'{name}.lazy' in self.sections:
+                lazy = self.lazy_objects(f'{name}.lazy')
+
+            if f'{name}.references' in self.sections:
+                references = self.read_bytes(f'{name}.references')
+
+            return decode_frame(data, section, objects = objects, lazy = lazy, references = references, resolve = self.lazy_objects)
+
+        if encoding == 'json':
+            return json.loads(data)
+
+        return pickle.loads(data)
+
+    def read(self, name: str):
+
+        """
+        Reads and decodes a section, applying any changes to it in the file's journal.
+
+        Parameters
+        ----------
+        name : str
+            name of the section.
+
+        Returns
+        -------
+        value : object
+            the section's value.
+        """
+
+        if name not in self:
+            raise KeyError(name)
+
+        value = None
+
+        if name in self.sections:
+            value = self.read_section(name)
+
+        for position, segment in enumerate(self.journal):
+
+            mode = segment.get(name)
+            key = f'journal/{position}/{name}'
+
+            if mode == 'replace':
+                value = self.read_section(key)
+
+            if mode == 'rows':
+                value = apply_rows(value, self.read_section(key + '/order'), self.read_section(key)) # type: ignore
+
+            if mode == 'update':
+                value = apply_update(value, self.read_section(key)) # type: ignore
+
+            if mode == 'append':
+                records = self.read_section(key)
+                value['index'] = value['index'] + records['index'] # type: ignore
+                value['data'] = value['data'] + records['data'] # type: ignore
+
+            if mode == 'state':
+                value = apply_state(value, self.read_section(key)) # type: ignore
+
+            if mode == 'delete':
+                value = None
+
+        return value
+
+    def close(self):
+
+        """
+        Closes the file.
+        """
+
+        if self.__dict__.get('map') is not None:
+            self.map.close()
+            self.map = None
+
+        if self.__dict__.get('file') is not None:
+            self.file.close()
+            self.file = None
+
+    def __repr__(self) -> str:
+        return f'ReviewFile({self.file_path!r}, version {self.manifest["version"]}, {len(self.sections)} sections, {len(self.journal)} journal segments)'
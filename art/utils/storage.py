@@ -0,0 +1,289 @@
+"""Compact typed storage for ART dataframes."""
+
+import numpy as np
+import pandas as pd
+
+# Columns with few distinct values, stored as categoricals
+category_cols = [
+                    'type',
+                    'repository',
+                    'language',
+                    'access_type'
+                    ]
+
+# Count columns, stored as nullable integers
+integer_cols = [
+                    'author_count',
+                    'citation_count',
+                    'cited_by_count'
+                    ]
+
+# Score columns, stored as nullable floats
+float_cols = [
+                'crossref_score'
+                ]
+
+# Text columns, stored as Arrow-backed strings if PyArrow is installed
+string_cols = [
+                'work_id',
+                'title',
+                'date',
+                'source',
+                'publisher',
+                'publisher_location',
+                'abstract',
+                'description',
+                'extract',
+                'full_text',
+                'doi',
+                'isbn',
+                'issn',
+                'pii',
+                'scopus_id',
+                'wos_id',
+                'pubmed_id',
+                'link'
+                ]
+
+# Whether new Results objects use compact storage by default
+compact_default = False
+
+def set_compact_default(compact: bool = True):
+
+    """
+    Sets whether new Results objects use compact storage by default.
+
+    Parameters
+    ----------
+    compact : bool
+        whether to use compact storage. Defaults to True.
+    """
+
+    global compact_default
+    compact_default = compact
+
+def get_string_dtype():
+
+    """
+    Returns the Arrow-backed string dtype used for text columns, or None if PyArrow is not installed.
+
+    Notes
+    -----
+    Where the installed version of Pandas supports it, missing values are represented as NaN rather than pd.NA, so that comparisons with missing values behave as they do in object columns.
+    """
+
+    try:
+        import pyarrow # type: ignore
+    except ImportError:
+        return None
+
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan) # type: ignore
+    except TypeError:
+        pass
+
+    try:
+        return pd.StringDtype('pyarrow_numpy') # type: ignore
+    except (TypeError, ValueError):
+        return pd.StringDtype('pyarrow')
+
+def is_text_column(series: pd.Series) -> bool:
+
+    """
+    Returns True if all non-missing values in a series are strings.
+    """
+
+    values = series.dropna()
+
+    if len(values) == 0:
+        return True
+
+    return values.map(type).eq(str).all() == True
+
+def compact_column(series: pd.Series, column: str) -> pd.Series:
+
+    """
+    Converts a dataframe column to its compact dtype. Returns the series unchanged if the column has no compact dtype or contains values that the compact dtype cannot hold.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        the column to convert.
+    column : str
+        name of the column.
+
+    Returns
+    -------
+    result : pandas.Series
+        the converted column.
+    """
+
+    global category_cols, integer_cols, float_cols, string_cols
+
+    # Counts and scores held as NumPy numbers (e.g. float64 counts with NaN for missing values) are converted to nullable dtypes
+    if (series.dtype != object) and (isinstance(series.dtype, np.dtype) == True) and (series.dtype.kind in 'iuf'):
+
+        if column in integer_cols:
+            if ((series.dropna() % 1) == 0).all() == True:
+                return series.astype('Int64')
+
+        if column in float_cols:
+            return series.astype('Float64')
+
+    if series.dtype != object:
+        return series
+
+    try:
+
+        if column in category_cols:
+            if is_text_column(series) == True:
+                return series.astype('category')
+
+        if column in integer_cols:
+            numeric = pd.to_numeric(series, errors='coerce')
+            if (numeric.isna() == series.isna()).all() and ((numeric.dropna() % 1) == 0).all():
+                return numeric.astype('Int64')
+
+        if column in float_cols:
+            numeric = pd.to_numeric(series, errors='coerce')
+            if (numeric.isna() == series.isna()).all():
+                return numeric.astype('Float64')
+
+        if column in string_cols:
+            string_dtype = get_string_dtype()
+            if (string_dtype is not None) and (is_text_column(series) == True):
+                return series.astype(string_dtype)
+
+    except (TypeError, ValueError):
+        pass
+
+    return series
+
+def compact_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
+
+    """
+    Converts a dataframe's columns to compact dtypes in place: categoricals for low-cardinality columns, nullable integers and floats for counts and scores, and Arrow-backed strings for text. Columns containing other data (e.g. lists, Authors objects) are left unchanged.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        the dataframe to convert.
+
+    Returns
+    -------
+    dataframe : pandas.DataFrame
+        the converted dataframe.
+    """
+
+    for c in dataframe.columns:
+        series = dataframe[c]
+        converted = compact_column(series, c)
+        if converted is not series:
+            dataframe[c] = converted
+
+    return dataframe
+
+def expand_column(series: pd.Series) -> pd.Series:
+
+    """
+    Converts a column back to object dtype, replacing missing values with None.
+    """
+
+    if series.dtype == object:
+        return series
+
+    values = series.to_numpy(dtype=object, na_value=None)
+
+    return pd.Series(values, index=series.index, dtype=object, name=series.name)
+
+def expand_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
+
+    """
+    Converts a dataframe's compact columns back to object dtype in place.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        the dataframe to convert.
+
+    Returns
+    -------
+    dataframe : pandas.DataFrame
+        the converted dataframe.
+    """
+
+    for c in dataframe.columns:
+        series = dataframe[c]
+        if series.dtype != object:
+            dataframe[c] = expand_column(series)
+
+    return dataframe
+
+def set_value(dataframe: pd.DataFrame, label, column: str, value):
+
+    """
+    Sets a single dataframe cell. If the column's compact dtype cannot hold the value (e.g. a new category, or a list in a string column), the column is first converted back to object dtype.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        dataframe to update.
+    label : object
+        index label of the row to update.
+    column : str
+        name of the column to update.
+    value : object
+        the new value.
+    """
+
+    try:
+        dataframe.at[label, column] = value
+    except (TypeError, ValueError):
+        dataframe[column] = expand_column(dataframe[column])
+        dataframe.at[label, column] = value
+
+    return dataframe
+
+def memory_report(dataframe: pd.DataFrame) -> pd.DataFrame:
+
+    """
+    Returns a report comparing each column's memory usage in object storage and in compact storage.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        the dataframe to report on.
+
+    Returns
+    -------
+    report : pandas.DataFrame
+        a dataframe indexed by column name, with the columns: 'object_dtype', 'compact_dtype', 'object_bytes', 'compact_bytes', 'saved_bytes', 'saved_pct'. The final row ('total') sums all columns.
+    """
+
+    rows = []
+
+    for c in dataframe.columns:
+
+        series = dataframe[c]
+        expanded = expand_column(series)
+        compacted = compact_column(expanded, c)
+
+        object_bytes = int(expanded.memory_usage(deep=True, index=False))
+        compact_bytes = int(compacted.memory_usage(deep=True, index=False))
+
+        rows.append({
+                    'column': c,
+                    'object_dtype': str(expanded.dtype),
+                    'compact_dtype': str(compacted.dtype),
+                    'object_bytes': object_bytes,
+                    'compact_bytes': compact_bytes
+                    })
+
+    report = pd.DataFrame(rows, columns = ['column', 'object_dtype', 'compact_dtype', 'object_bytes', 'compact_bytes']).set_index('column')
+    report.loc['total'] = [None, None, report['object_bytes'].sum(), report['compact_bytes'].sum()]
+    report['object_bytes'] = report['object_bytes'].astype(int)
+    report['compact_bytes'] = report['compact_bytes'].astype(int)
+    report['saved_bytes'] = report['object_bytes'] - report['compact_bytes']
+    report['saved_pct'] = (report['saved_bytes'] / report['object_bytes'].replace(0, np.nan) * 100).round(1).fillna(0)
+
+    return report